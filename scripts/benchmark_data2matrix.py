@@ -0,0 +1,68 @@
+"""Benchmark the NumPy heatmap grid builder against pandas ``pivot_table``."""
+
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from qplot.tools.general import data2matrix
+
+BENCHMARK_POINTS = (10_000, 1_000_000, 10_000_000)
+DUPLICATE_FRACTION = 0.05
+NAN_FRACTION = 0.01
+
+
+def _pandas_data2matrix(indep1, indep2, depvar):
+    df = pd.DataFrame({
+        "indep1": indep1,
+        "indep2": indep2,
+        "depvar": depvar,
+        })
+    return df.pivot_table(
+        index="indep1",
+        columns="indep2",
+        values="depvar",
+        fill_value=np.nan,
+        )
+
+
+def _scan_data(point_count, rng):
+    """Return a raster scan with some repeated points and missing values."""
+    columns = max(1, int(np.sqrt(point_count)))
+    index = np.arange(point_count)
+    repeated = rng.random(point_count) < DUPLICATE_FRACTION
+    index[repeated] = rng.integers(0, point_count, int(repeated.sum()))
+    indep1 = (index // columns).astype(float)
+    indep2 = (index % columns).astype(float) * 0.5
+    depvar = np.sin(indep1 / 10.0) + np.cos(indep2 / 10.0)
+    depvar += rng.normal(scale=0.01, size=point_count)
+    depvar[rng.random(point_count) < NAN_FRACTION] = np.nan
+    return indep1, indep2, depvar
+
+
+def _time(function, *args):
+    started = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - started
+
+
+def main(point_counts=BENCHMARK_POINTS):
+    rng = np.random.default_rng(0)
+    print(f"{'points':>12} {'grid':>15} {'pandas':>10} {'numpy':>10} {'speedup':>8}")
+    for point_count in point_counts:
+        data = _scan_data(point_count, rng)
+        expected, pandas_elapsed = _time(_pandas_data2matrix, *data)
+        matrix, numpy_elapsed = _time(data2matrix, *data)
+
+        pd.testing.assert_frame_equal(matrix, expected, rtol=1e-9)
+        grid = f"{matrix.shape[0]:,} x {matrix.shape[1]:,}"
+        print(
+            f"{point_count:>12,} {grid:>15} "
+            f"{pandas_elapsed:>9.3f}s {numpy_elapsed:>9.3f}s "
+            f"{pandas_elapsed / numpy_elapsed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or BENCHMARK_POINTS)
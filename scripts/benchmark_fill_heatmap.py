@@ -0,0 +1,72 @@
+"""Benchmark the NumPy heatmap gap filling against the per-line Python loop."""
+
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from qplot.tools.plot_tools import fill_heatmap
+
+BENCHMARK_SIZES = (500, 1_000, 4_000)
+NAN_FRACTION = 0.3
+MAX_DEPTH = 10
+
+
+def _looped_fill_heatmap(which, data, max_depth):
+    data = data.copy()
+    if which == "below":
+        lines = (data[:, column] for column in range(data.shape[1]))
+    else:
+        lines = (data[row, :] for row in range(data.shape[0]))
+
+    for line in lines:
+        position = 0
+        while position < len(line):
+            if not np.isnan(line[position]):
+                position += 1
+                continue
+
+            gap_start = position
+            while position < len(line) and np.isnan(line[position]):
+                position += 1
+
+            bounded = gap_start > 0 and position < len(line)
+            if bounded and position - gap_start <= max_depth:
+                line[gap_start:position] = line[gap_start - 1]
+    return data
+
+
+def _partially_filled_map(size, rng):
+    """Return a square map with scattered missing values and unmeasured rows."""
+    data = rng.normal(size=(size, size))
+    data[rng.random((size, size)) < NAN_FRACTION] = np.nan
+    data[size * 3 // 4:, :] = np.nan
+    return data
+
+
+def _time(function, *args):
+    started = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - started
+
+
+def main(sizes=BENCHMARK_SIZES):
+    rng = np.random.default_rng(0)
+    print(f"{'grid':>15} {'fill':>6} {'loop':>10} {'numpy':>10} {'speedup':>8}")
+    for size in sizes:
+        data = _partially_filled_map(size, rng)
+        for which in ("below", "right"):
+            expected, loop_elapsed = _time(_looped_fill_heatmap, which, data, MAX_DEPTH)
+            filled, numpy_elapsed = _time(fill_heatmap, which, {"z": data}, MAX_DEPTH)
+
+            np.testing.assert_array_equal(filled["z"], expected)
+            grid = f"{size:,} x {size:,}"
+            print(
+                f"{grid:>15} {which:>6} "
+                f"{loop_elapsed:>9.3f}s {numpy_elapsed:>9.3f}s "
+                f"{loop_elapsed / numpy_elapsed:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or BENCHMARK_SIZES)
@@ -0,0 +1,79 @@
+"""Benchmark populating, sorting and filtering the run table with many runs."""
+
+import os
+import sys
+from time import perf_counter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import QtCore
+from PyQt6 import QtWidgets as qtw
+
+from qplot.windows._widgets.treeWidgets import RunList
+
+BENCHMARK_SIZES = (10_000, 100_000)
+FILTER_KEYSTROKES = ("s", "sw", "swe", "sweep-1", "sweep-17", "sweep-17 size>50KB")
+
+
+def _runs(count):
+    return {
+        run_id: {
+            "run_timestamp": 1_700_000_000.0 + 60 * run_id,
+            "completed_timestamp": 1_700_000_030.0 + 60 * run_id,
+            "is_completed": run_id % 50 != 0,
+            "guid": f"{run_id:08x}-0000-0000-0000-000000000000",
+            "exp_name": f"experiment-{run_id % 13}",
+            "sample_name": f"sample-{run_id % 5}",
+            "name": f"sweep-{run_id % 101}",
+            "sweep_parameters": ["x", "y"],
+            "measure_parameters": ["current", "voltage"],
+            "setpoint_count": 100 * (run_id % 17 + 1),
+            "setpoint_shape": [10, 10 * (run_id % 17 + 1)],
+            "result_count": 100 * (run_id % 17 + 1),
+            "storage_bytes": (run_id * 7919) % 100_003,
+            }
+        for run_id in range(1, count + 1)
+        }
+
+
+def _time(function, *args):
+    started = perf_counter()
+    function(*args)
+    return perf_counter() - started
+
+
+def main(sizes=BENCHMARK_SIZES):
+    app = qtw.QApplication.instance() or qtw.QApplication([])
+    print(
+        f"{'runs':>9} {'populate':>10} {'sort ID':>10} {'sort Size':>10} "
+        f"{'sort Name':>10} {'filter':>10}"
+        )
+    for size in sizes:
+        runs = _runs(size)
+        run_list = RunList()
+        populate = _time(run_list.addRuns, runs)
+        timings = [
+            _time(
+                run_list.sortItems,
+                run_list.cols.index(column),
+                QtCore.Qt.SortOrder.DescendingOrder,
+                )
+            for column in ("ID", "Size", "Name")
+            ]
+        timings.append(max(
+            _time(run_list.set_search_text, text)
+            for text in FILTER_KEYSTROKES
+            ))
+        app.processEvents()
+        run_list.set_search_text("")
+
+        assert run_list.topLevelItemCount() == size
+        print(
+            f"{size:>9,} {populate:>9.3f}s "
+            + " ".join(f"{elapsed:>9.3f}s" for elapsed in timings)
+            )
+        run_list.deleteLater()
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or BENCHMARK_SIZES)
@@ -10,6 +10,7 @@ from qplot.diagnostics import (
     log_exception,
 )
 from qplot.windows import MainWindow
+from qplot.windows._warm_up import StartupWarmUp
 
 QT_OPTIONS_WITH_VALUES = {
     "-display",
@@ -100,6 +101,8 @@ def run(return_objects=False, database_path=None):
         if database_path is None:
             database_path = _database_path_from_arguments(sys.argv[1:])
         w = MainWindow(startup_database_path=database_path)
+        warm_up = StartupWarmUp()
+        warm_up.start()
         exit_code = app.exec()
     except Exception as err:
         log_exception("qPlot startup failed", err)
@@ -1,7 +1,6 @@
 from os.path import isfile
 
-from qcodes.dataset.sqlite.database import get_DB_location
-
+from qplot.datahandling.qcodes_compat import get_DB_location
 from qplot.datahandling.readonly import qcodes_read_only_connection
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 from string import Template
 
-import pyqtgraph as pg
+from PyQt6 import QtGui
 
 
 @dataclass(frozen=True)
@@ -507,10 +507,10 @@ def build_stylesheet(palette: ThemePalette) -> str:
 
 def color_list(names: list[str]) -> list:
     """
-    Converts pyqtgraph color names into reusable QColor instances.
+    Converts SVG color names into reusable QColor instances.
 
     """
-    return [pg.mkColor(color) for color in names]
+    return [QtGui.QColor(color) for color in names]
 
 
 class PlotTheme:
@@ -526,6 +526,8 @@ class PlotTheme:
 
     @classmethod
     def style_plotItem(cls, plot_win):
+        import pyqtgraph as pg
+
         plot_item = plot_win.plot
         plot_win.widget.setBackground(cls.plot_background)
 
@@ -540,6 +542,8 @@ class PlotTheme:
 
     @classmethod
     def set_line_colours(cls, plot_item):
+        import pyqtgraph as pg
+
         for index, line in enumerate(plot_item.listDataItems()):
             color = cls.colors[index % len(cls.colors)]
             line.setPen(pg.mkPen(color=color))
@@ -1,5 +1,3 @@
-import pyqtgraph as pg
-
 from ._base import PlotTheme, color_list
 
 
@@ -12,6 +10,8 @@ class blank(PlotTheme):
     
     @classmethod
     def style_plotItem(cls, plot_win):
+        import pyqtgraph as pg
+
         pg.setConfigOption('background', "w")
         pg.setConfigOption('foreground', "k")
         super().style_plotItem(plot_win)
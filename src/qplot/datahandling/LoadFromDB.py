@@ -14,6 +14,7 @@ from qcodes.dataset.sqlite.queries import (
     get_parameter_data_for_one_paramtree,
 )
 
+from qplot.datahandling.column_buffer import column_appendable
 from qplot.datahandling.qcodes_cache import (
     cache_data,
     cache_dataset_completed,
@@ -35,6 +36,7 @@ def append_shaped_parameter_data_to_existing_arrays(
     write_status,
     existing_data,
     new_data,
+    column_store=None,
 ):
     """
     Append datadict to an already existing datadict and return the merged
@@ -49,6 +51,9 @@ def append_shaped_parameter_data_to_existing_arrays(
           appended to.
         existing_data: Mapping from dependent parameter name to mapping
           from parameter name to numpy arrays of new data.
+        column_store: Optional ``ColumnStore`` of the viewer cache. Unshaped
+          trees are then appended into its growable buffers instead of being
+          copied by ``np.append``.
 
     Returns:
         Updated write and read status, and the updated ``data``
@@ -76,6 +81,19 @@ def append_shaped_parameter_data_to_existing_arrays(
             name: values.copy()
             for name, values in existing_data_1_tree.items()
             }
+    elif column_store is not None:
+        appended = _append_unshaped_tree(
+            column_store,
+            meas_parameter,
+            write_status.get(meas_parameter),
+            existing_data_1_tree,
+            new_data_1_tree,
+            )
+        if appended is not None:
+            (merged_data[meas_parameter], updated_write_status[meas_parameter]) = (
+                appended
+                )
+            return updated_write_status, merged_data
 
     (merged_data[meas_parameter], updated_write_status[meas_parameter]) = (
         _merge_data(
@@ -89,6 +107,66 @@ def append_shaped_parameter_data_to_existing_arrays(
     return updated_write_status, merged_data
 
 
+def _append_unshaped_tree(
+        column_store,
+        meas_parameter,
+        single_tree_write_status,
+        existing_tree,
+        new_tree,
+        ):
+    """
+    Mirror QCoDeS ``_merge_data`` for an unshaped tree using growable columns.
+
+    Returns None, leaving the merge to QCoDeS, when any column cannot be
+    appended in place.
+    """
+    if not set(new_tree).issubset(existing_tree):
+        return None
+
+    names = [meas_parameter]
+    names.extend(name for name in existing_tree if name != meas_parameter)
+    appended_names = {
+        name
+        for name in names
+        if (
+            existing_tree.get(name) is not None
+            and existing_tree[name].size != 0
+            and new_tree.get(name) is not None
+            and new_tree[name].size != 0
+            )
+        }
+    if not all(
+            column_appendable(existing_tree[name], new_tree[name])
+            for name in appended_names
+            ):
+        return None
+
+    merged_tree = {}
+    tree_write_status = 0
+    for name in names:
+        existing = existing_tree.get(name)
+        new = new_tree.get(name)
+        if name in appended_names:
+            merged = column_store.append(meas_parameter, name, existing, new)
+            written = None
+        elif existing is not None and existing.size != 0 and new is not None:
+            merged, written = existing, single_tree_write_status
+        elif new is not None:
+            merged = column_store.adopt(meas_parameter, name, new)
+            written = new.size
+        else:
+            merged, written = existing, single_tree_write_status
+
+        if merged is not None:
+            merged_tree[name] = merged
+        if name == meas_parameter:
+            tree_write_status = written if written is not None else 0
+        elif written is not None and written > tree_write_status:
+            tree_write_status = written
+
+    return merged_tree, tree_write_status
+
+
 def load_param_data_from_db_prep(
         cache : "qcodes.dataset.data_set_cache.DataSetCacheWithDBBackend",
         param : "qcodes.dataset.descriptions.param_spec.ParamSpec",
@@ -126,6 +204,7 @@ def load_param_data_from_db(
     read_status,
     existing_data,
     end: int | None = None,
+    column_store=None,
 ):
     # Data fetch
     updated_read_status: dict[str, int] = dict(read_status)
@@ -147,7 +226,12 @@ def load_param_data_from_db(
     # Data Update
     (updated_write_status, merged_data) = (
         append_shaped_parameter_data_to_existing_arrays(
-            rundescriber, meas_parameter, write_status, existing_data, new_data_dict
+            rundescriber,
+            meas_parameter,
+            write_status,
+            existing_data,
+            new_data_dict,
+            column_store=column_store,
         )
     )
     
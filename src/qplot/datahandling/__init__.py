@@ -1,10 +1,11 @@
-from .LoadFromDB import (
-    load_param_data_from_db,
-    load_param_data_from_db_prep,
-)
+from typing import TYPE_CHECKING
+
 from .readSQL import (
     find_new_runs,
+    get_completed_run_rowids,
+    get_result_counts,
     get_run_status,
+    get_run_statuses,
     get_runs_basic_via_sql,
     get_runs_via_sql,
     has_finished,
@@ -13,11 +14,20 @@ from .readSQL import (
     iter_run_storage_batches_via_sql,
 )
 
+if TYPE_CHECKING:
+    from .LoadFromDB import (
+        load_param_data_from_db,
+        load_param_data_from_db_prep,
+    )
+
 __all__ = [
     "get_runs_basic_via_sql",
     "get_runs_via_sql",
     "find_new_runs",
+    "get_completed_run_rowids",
+    "get_result_counts",
     "get_run_status",
+    "get_run_statuses",
     "has_finished",
     "iter_run_detail_batches_via_sql",
     "iter_run_shape_batches_via_sql",
@@ -25,3 +35,20 @@ __all__ = [
     "load_param_data_from_db_prep",
     "load_param_data_from_db",
     ]
+
+
+def __getattr__(name):
+    """
+    Import the QCoDeS cache loaders on first use.
+
+    LoadFromDB imports QCoDeS, which reading run metadata does not need.
+
+    """
+    if name in {"load_param_data_from_db", "load_param_data_from_db_prep"}:
+        from . import LoadFromDB
+
+        value = getattr(LoadFromDB, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,276 @@
+"""
+Shared background change detection for open databases.
+
+Every plot of one database registers with a single watcher, whose own timer
+runs at the shortest refresh interval of the plots still monitoring a live
+run. A tick first compares the main file and WAL sidecar metadata, which costs
+two ``stat`` calls on the GUI thread. Only when they changed does one
+background worker count the watched result tables, and the new counts are
+then fanned out to every interested plot.
+
+Plots keep their own refresh timers for per-plot work that involves no change
+check, such as committing a terminal display after their run completes.
+"""
+
+import threading
+import weakref
+from pathlib import Path
+from time import perf_counter
+
+from PyQt6 import QtCore
+
+from qplot.datahandling.database import _InterruptibleSqlWorker
+from qplot.datahandling.file_identity import logical_database_path
+from qplot.datahandling.readSQL import get_result_counts
+from qplot.diagnostics import log_exception
+
+_DATABASE_CHANGE_WATCHERS: "dict[str, DatabaseChangeWatcher]" = {}
+
+
+def database_change_signature(database_path):
+    """Return main-file and WAL metadata that changes with every commit."""
+    signature: list[tuple[int, int, int, int] | None] = []
+    for path in (Path(database_path), Path(f"{database_path}-wal")):
+        try:
+            stat_result = path.stat()
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((
+            stat_result.st_dev,
+            stat_result.st_ino,
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            ))
+    return tuple(signature)
+
+
+def database_change_watcher(database_path):
+    """Return the watcher shared by every plot of one database path."""
+    key = logical_database_path(database_path)
+    watcher = _DATABASE_CHANGE_WATCHERS.get(key)
+    if watcher is None:
+        watcher = DatabaseChangeWatcher(database_path)
+        _DATABASE_CHANGE_WATCHERS[key] = watcher
+    return watcher
+
+
+def release_database_change_watcher(database_path):
+    """Cancel and forget the watcher of a database that is being closed."""
+    watcher = _DATABASE_CHANGE_WATCHERS.pop(
+        logical_database_path(database_path),
+        None,
+        )
+    if watcher is not None:
+        watcher.cancel()
+
+
+class DatabaseChangeSignals(QtCore.QObject):
+    """Signals emitted by a background result-count check."""
+
+    finished = QtCore.pyqtSignal(object, object, object, object)
+
+
+class DatabaseChangeWorker(_InterruptibleSqlWorker, QtCore.QRunnable):
+    """Count watched result tables away from the GUI thread."""
+
+    def __init__(self, database_path, table_names, source_signature):
+        super().__init__()
+        self.signals = DatabaseChangeSignals()
+        self.database_path = database_path
+        self.table_names = frozenset(table_names)
+        self.source_signature = source_signature
+        self._cancelled = threading.Event()
+        self._init_sql_interrupt()
+
+
+    def cancel(self):
+        self._cancelled.set()
+        self._interrupt_sql()
+
+
+    def run(self):
+        counts = {}
+        error = None
+        try:
+            if not self._cancelled.is_set():
+                counts = get_result_counts(
+                    sorted(self.table_names),
+                    database_path=self.database_path,
+                    cancelled_callback=self._cancelled.is_set,
+                    connection_callback=self._set_sql_connection,
+                    )
+        except Exception as err:
+            if not self._cancelled.is_set():
+                log_exception("Database change check failed", err, __name__)
+            error = err
+
+        try:
+            self.signals.finished.emit(
+                self.table_names,
+                self.source_signature,
+                counts,
+                error,
+                )
+        except RuntimeError as err:
+            message = str(err)
+            if not ("wrapped C/C++ object" in message and "has been deleted" in message):
+                raise
+
+
+class DatabaseChangeWatcher(QtCore.QObject):
+    """
+    One background change check shared by every plot of a database.
+
+    Plots register with ``watch``. The watcher's timer polls at the
+    shortest ``_change_watch_interval()`` its plots report, and stops while
+    none reports one; plots call ``schedule`` when their interval or state
+    changes. Polls are coalesced: while a check runs, or within ``max_age``
+    seconds of the previous one, nothing new starts. An unchanged main file
+    and WAL skip SQLite altogether.
+
+    """
+
+    resultCountChanged = QtCore.pyqtSignal(str, int)
+    checkFinished = QtCore.pyqtSignal()
+
+    def __init__(self, database_path):
+        super().__init__()
+        self.database_path = database_path
+        self._subscribers: weakref.WeakSet[object] = weakref.WeakSet()
+        self._thread_pool = None
+        self._worker = None
+        self._result_counts = {}
+        self._source_signature = None
+        self._checked_tables: frozenset[str] = frozenset()
+        self._last_check_started = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self._tick)
+
+
+    def watch(self, subscriber, thread_pool):
+        """Register a plot whose ``_result_table_name`` should be counted."""
+        self._subscribers.add(subscriber)
+        if self._thread_pool is None:
+            self._thread_pool = thread_pool
+        self.schedule()
+
+
+    def poll_interval(self):
+        """Return the shortest interval in seconds any plot asks for, or None."""
+        intervals = []
+        for subscriber in list(self._subscribers):
+            interval = getattr(subscriber, "_change_watch_interval", None)
+            try:
+                interval = interval() if callable(interval) else None
+            except RuntimeError:
+                continue
+            if interval is not None and interval > 0:
+                intervals.append(interval)
+        return min(intervals, default=None)
+
+
+    def schedule(self):
+        """Start, retime or stop the polling timer to match the plots."""
+        interval = self.poll_interval()
+        if interval is None:
+            self._timer.stop()
+            return
+        interval_ms = max(1, round(interval * 1000))
+        if not self._timer.isActive() or self._timer.interval() != interval_ms:
+            self._timer.start(interval_ms)
+
+
+    def result_count(self, table_name):
+        """Return the last observed row count, or None before the first check."""
+        return self._result_counts.get(table_name)
+
+
+    def watched_tables(self):
+        tables = set()
+        for subscriber in list(self._subscribers):
+            can_refresh = getattr(subscriber, "_can_process_refresh", None)
+            try:
+                if callable(can_refresh) and not can_refresh():
+                    continue
+            except RuntimeError:
+                continue
+            table_name = getattr(subscriber, "_result_table_name", None)
+            if table_name:
+                tables.add(table_name)
+        return frozenset(tables)
+
+
+    def poll(self, max_age=0.0):
+        """
+        Start a background check unless a recent one makes it unnecessary.
+
+        Returns
+        -------
+        pending : bool
+            Whether a background check is running after this call, so that
+            ``checkFinished`` will follow.
+
+        """
+        if self._worker is not None:
+            return True
+        if self._thread_pool is None:
+            return False
+
+        tables = self.watched_tables()
+        if not tables:
+            return False
+
+        now = perf_counter()
+        if (
+                self._last_check_started is not None
+                and now - self._last_check_started < max(0.0, max_age)
+                ):
+            return False
+        self._last_check_started = now
+
+        source_signature = database_change_signature(self.database_path)
+        if (
+                source_signature == self._source_signature
+                and tables <= self._checked_tables
+                ):
+            return False
+
+        worker = DatabaseChangeWorker(
+            self.database_path,
+            tables,
+            source_signature,
+            )
+        worker.signals.finished.connect(self._check_finished)
+        self._worker = worker
+        self._thread_pool.start(worker)
+        return True
+
+
+    def cancel(self):
+        self._timer.stop()
+        worker = self._worker
+        if worker is not None:
+            worker.cancel()
+
+
+    def _tick(self):
+        self.poll()
+        self.schedule()
+
+
+    @QtCore.pyqtSlot(object, object, object, object)
+    def _check_finished(self, table_names, source_signature, counts, error):
+        self._worker = None
+        if error is not None:
+            # Retry on the next poll rather than trusting a partial result.
+            self._source_signature = None
+        else:
+            self._source_signature = source_signature
+            self._checked_tables = table_names
+            for table_name, count in counts.items():
+                if self._result_counts.get(table_name) == count:
+                    continue
+                self._result_counts[table_name] = count
+                self.resultCountChanged.emit(table_name, int(count))
+        self.checkFinished.emit()
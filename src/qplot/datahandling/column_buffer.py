@@ -0,0 +1,139 @@
+"""
+Growable column buffers for unshaped viewer caches.
+
+QCoDeS appends to an unshaped cache with ``np.append``, so every refresh
+copies the whole parameter tree. A run that grows steadily for hours then
+costs quadratic copying, and each append briefly holds two full copies.
+qPlot instead keeps each unshaped column in a buffer whose capacity doubles
+when it fills. The cache holds views of the filled prefix, so an append
+writes only the rows past every committed view and never changes them.
+
+The views stay writable, as the arrays QCoDeS returns from ``cache.data()``
+always were, so existing callers that modify them in place keep working.
+"""
+
+from threading import Lock
+
+import numpy as np
+
+MIN_COLUMN_CAPACITY = 1024
+
+
+class GrowableColumn:
+    """One column whose filled rows are exposed as prefix views."""
+
+    def __init__(self, values, capacity=None):
+        values = np.asarray(values)
+        size = values.shape[0]
+        capacity = size if capacity is None else max(size, int(capacity))
+        if capacity == size:
+            self._buffer = values
+        else:
+            self._buffer = np.empty((capacity, *values.shape[1:]), dtype=values.dtype)
+            self._buffer[:size] = values
+        self._size = size
+
+
+    @property
+    def capacity(self):
+        return self._buffer.shape[0]
+
+
+    def view(self):
+        return self._buffer[:self._size]
+
+
+    def holds(self, values):
+        """Return whether ``values`` is the current filled prefix of this column."""
+        buffer = self._buffer
+        return (
+            values.shape[0] == self._size
+            and values.shape[1:] == buffer.shape[1:]
+            and values.dtype == buffer.dtype
+            and (
+                self._size == 0
+                or (
+                    values.strides == buffer.strides
+                    and values.__array_interface__["data"][0]
+                    == buffer.__array_interface__["data"][0]
+                    )
+                )
+            )
+
+
+    def extend(self, values):
+        """Append rows, doubling the capacity when they do not fit."""
+        size = self._size
+        needed = size + values.shape[0]
+        if needed > self.capacity:
+            capacity = max(needed, 2 * self.capacity, MIN_COLUMN_CAPACITY)
+            buffer = np.empty(
+                (capacity, *self._buffer.shape[1:]),
+                dtype=self._buffer.dtype,
+                )
+            buffer[:size] = self._buffer[:size]
+            self._buffer = buffer
+        self._buffer[size:needed] = values
+        self._size = needed
+        return self.view()
+
+
+class ColumnStore:
+    """
+    Growable columns of one viewer cache, keyed by parameter tree and column.
+
+    Appending to a view that is no longer the column's filled prefix, for
+    example because a newer refresh lost its commit race, starts a new
+    column from that view. Views already handed out keep their buffer alive
+    and are never written again.
+
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._columns = {}
+
+
+    def adopt(self, tree, name, values):
+        """Start a column from freshly read values without copying them."""
+        column = GrowableColumn(values)
+        with self._lock:
+            self._columns[(tree, name)] = column
+            return column.view()
+
+
+    def append(self, tree, name, existing, new):
+        """
+        Return ``existing`` followed by ``new`` as a view of one buffer.
+
+        Returns
+        -------
+        merged : np.ndarray | None
+            The appended column, or None when the rows cannot share one
+            buffer because their dtype or row shape differ.
+
+        """
+        if not column_appendable(existing, new):
+            return None
+        with self._lock:
+            column = self._columns.get((tree, name))
+            if column is None or not column.holds(existing):
+                column = GrowableColumn(
+                    existing,
+                    capacity=2 * (existing.shape[0] + new.shape[0]),
+                    )
+                self._columns[(tree, name)] = column
+            return column.extend(new)
+
+
+def column_appendable(existing, new):
+    """Return whether ``new`` rows can extend ``existing`` in one buffer."""
+    return (
+        isinstance(existing, np.ndarray)
+        and isinstance(new, np.ndarray)
+        and existing.ndim >= 1
+        and new.ndim == existing.ndim
+        and new.shape[1:] == existing.shape[1:]
+        and new.dtype == existing.dtype
+        and existing.dtype.kind not in "OUS"
+        )
@@ -0,0 +1,412 @@
+"""
+Streaming exports of measurement columns to NPZ archives and CSV files.
+
+Loading a run through QCoDeS and flattening it into a pandas frame holds the
+whole run in memory, several times over once it is formatted as text. The
+exports here read the result table in rowid order, a fixed number of rows at a
+time, so peak memory stays at one chunk whatever the size of the run. Rows
+appended after an export starts are left out, so every column ends at the same
+committed row.
+
+The NPZ export appends each column to a raw spill file and then compresses the
+spill files into an ``.npz`` archive that ``numpy.load`` opens directly. It
+takes numeric parameters only. The CSV export writes the same rows and columns
+as the pandas frame did, and also takes text parameters. Array and complex
+parameters are stored as binary blobs that only QCoDeS can decode, so they
+still go through ``get_parameter_data``.
+"""
+
+import csv
+import math
+import os
+import tempfile
+import zipfile
+from collections.abc import Callable, Collection, Sequence
+from dataclasses import dataclass
+from itertools import zip_longest
+
+import numpy as np
+
+from qplot.datahandling.readonly import pooled_sqlite_read_only_connection
+
+COLUMN_EXPORT_CHUNK_ROWS = 65_536
+_COPY_BLOCK_BYTES = 1 << 20
+# Reading the table and compressing the spill files take similar time.
+_READ_PROGRESS_SHARE = 0.5
+
+
+class ColumnExportCancelled(Exception):
+    """Raised when a column export is cancelled between chunks."""
+
+
+@dataclass(frozen=True)
+class ExportedParameter:
+    """A measured parameter and the setpoint columns exported with it."""
+
+    name: str
+    setpoints: tuple[str, ...] = ()
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """The parameter followed by its setpoints, as QCoDeS orders them."""
+        return (self.name, *self.setpoints)
+
+
+class _ExportProgress:
+    """Cancellation checks and progress reports shared by both exports."""
+
+    def __init__(self, cancelled_callback, progress_callback):
+        self._cancelled_callback = cancelled_callback
+        self._progress_callback = progress_callback
+
+    def check_cancelled(self):
+        if self._cancelled_callback is not None and self._cancelled_callback():
+            raise ColumnExportCancelled("Export cancelled.")
+
+    def report(self, fraction):
+        if self._progress_callback is not None:
+            self._progress_callback(min(1.0, max(0.0, fraction)))
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _column_names(parameters):
+    """Return ``(column name, parameter index, column)`` in export order."""
+    prefix = len(parameters) > 1
+    return [
+        (f"{parameter.name}.{column}" if prefix else column, index, column)
+        for index, parameter in enumerate(parameters)
+        for column in parameter.columns
+        ]
+
+
+def _last_rowid(conn, table_name, columns):
+    """Check the exported columns exist and return the last rowid to export."""
+    rows = conn.execute(f"PRAGMA table_info({_quote(table_name)})").fetchall()
+    if not rows:
+        raise ValueError(f"Result table {table_name} does not exist.")
+    missing = set(columns) - {row[1] for row in rows}
+    if missing:
+        raise ValueError(
+            f"Result table {table_name} has no column {', '.join(sorted(missing))}."
+            )
+    return conn.execute(f"SELECT MAX(rowid) FROM {_quote(table_name)}").fetchone()[0] or 0
+
+
+def _open_export_connection(database_path, expected_database_identity):
+    return pooled_sqlite_read_only_connection(
+        database_path,
+        expected_database_identity=expected_database_identity,
+        )
+
+
+def _chunk_values(rows, columns):
+    try:
+        return np.array(rows, dtype=np.float64).reshape(len(rows), -1)
+    except (TypeError, ValueError) as err:
+        raise ValueError(
+            f"Columns {', '.join(columns)} hold values that are not numeric."
+            ) from err
+
+
+def _write_npy(archive, array_name, spill_path, length, progress):
+    header = {"descr": "<f8", "fortran_order": False, "shape": (length,)}
+    with archive.open(f"{array_name}.npy", "w", force_zip64=True) as entry:
+        np.lib.format.write_array_header_2_0(entry, header)
+        with open(spill_path, "rb") as spill:
+            while block := spill.read(_COPY_BLOCK_BYTES):
+                entry.write(block)
+                progress(len(block))
+
+
+def export_result_columns(
+        database_path: str,
+        table_name: str,
+        parameters: Sequence[ExportedParameter],
+        destination: str,
+        *,
+        chunk_rows: int = COLUMN_EXPORT_CHUNK_ROWS,
+        expected_database_identity=None,
+        cancelled_callback: Callable[[], bool] | None = None,
+        progress_callback: Callable[[float], object] | None = None,
+        ) -> dict[str, int]:
+    """
+    Writes the rows of each parameter to a compressed ``.npz`` archive.
+
+    Parameters
+    ----------
+    database_path : str
+        QCoDeS database holding the run.
+    table_name : str
+        Result table of the run.
+    parameters : Sequence[ExportedParameter]
+        Numeric parameters to export. Each is written from the rows where it
+        is not NULL, together with its setpoints. With several parameters the
+        array names are prefixed with the parameter name, as the columns of
+        the CSV export are.
+    destination : str
+        Path of the archive to write. An existing file is overwritten.
+    chunk_rows : int, optional
+        Rows read per query. The default is COLUMN_EXPORT_CHUNK_ROWS.
+    expected_database_identity : optional
+        File identity the database must still have when it is opened.
+    cancelled_callback : Callable[[], bool], optional
+        Checked between chunks. Returning True raises ColumnExportCancelled.
+    progress_callback : Callable[[float], object], optional
+        Called with the completed fraction of the export, from 0 to 1.
+
+    Returns
+    -------
+    dict[str, int]
+        Length of each exported array, by array name.
+
+    """
+    parameters = list(parameters)
+    if not parameters:
+        raise ValueError("No parameters to export.")
+    chunk_rows = max(1, int(chunk_rows))
+    progress = _ExportProgress(cancelled_callback, progress_callback)
+    arrays = _column_names(parameters)
+    columns = list(dict.fromkeys(column for _name, _index, column in arrays))
+    column_index = {column: index for index, column in enumerate(columns)}
+
+    conn = _open_export_connection(database_path, expected_database_identity)
+    spill_directory = tempfile.TemporaryDirectory(
+        prefix=".qplot-export-",
+        dir=os.path.dirname(os.path.abspath(destination)),
+        )
+    try:
+        max_rowid = _last_rowid(conn, table_name, columns)
+        # One query per chunk, in rowid order, holds the read transaction
+        # only for the chunk and keeps each step's memory bounded.
+        not_null = [f"{_quote(parameter.name)} IS NOT NULL" for parameter in parameters]
+        query = (
+            f"SELECT rowid, {', '.join(map(_quote, columns))}, "
+            f"{', '.join(not_null)} "
+            f"FROM {_quote(table_name)} "
+            f"WHERE rowid > ? AND rowid <= ? AND ({' OR '.join(not_null)}) "
+            f"ORDER BY rowid LIMIT ?"
+            )
+
+        spill_paths = [
+            os.path.join(spill_directory.name, f"{number}.f8")
+            for number in range(len(arrays))
+            ]
+        lengths = [0] * len(arrays)
+        spills = [open(path, "wb") for path in spill_paths]
+        try:
+            last_rowid = 0
+            while True:
+                progress.check_cancelled()
+                rows = conn.execute(query, (last_rowid, max_rowid, chunk_rows)).fetchall()
+                if not rows:
+                    break
+                last_rowid = rows[-1][0]
+                values = _chunk_values([row[1:1 + len(columns)] for row in rows], columns)
+                present = np.array(
+                    [row[1 + len(columns):] for row in rows],
+                    dtype=bool,
+                    ).reshape(len(rows), -1)
+                for number, (_name, index, column) in enumerate(arrays):
+                    selected = values[present[:, index], column_index[column]]
+                    selected.astype("<f8", copy=False).tofile(spills[number])
+                    lengths[number] += selected.shape[0]
+                progress.report(_READ_PROGRESS_SHARE * last_rowid / max(max_rowid, 1))
+                if len(rows) < chunk_rows:
+                    break
+        finally:
+            for spill in spills:
+                spill.close()
+        conn.close()
+        conn = None
+
+        total_bytes = max(1, 8 * sum(lengths))
+        written = 0
+
+        def report_written(count):
+            nonlocal written
+            written += count
+            progress.report(
+                _READ_PROGRESS_SHARE + (1 - _READ_PROGRESS_SHARE) * written / total_bytes
+                )
+            progress.check_cancelled()
+
+        with zipfile.ZipFile(
+                destination,
+                "w",
+                compression=zipfile.ZIP_DEFLATED,
+                allowZip64=True,
+                ) as archive:
+            for (name, _index, _column), path, length in zip(
+                    arrays,
+                    spill_paths,
+                    lengths,
+                    strict=True,
+                    ):
+                progress.check_cancelled()
+                _write_npy(archive, name, path, length, report_written)
+        progress.report(1.0)
+        return {
+            name: length
+            for (name, _index, _column), length in zip(arrays, lengths, strict=True)
+            }
+    finally:
+        if conn is not None:
+            conn.close()
+        spill_directory.cleanup()
+
+
+def _numeric_csv_value(value):
+    """Format a stored number as pandas writes it from a float array."""
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        raise ValueError("Array and complex values cannot be streamed to CSV.")
+    # QCoDeS stores NaN as the text "nan", and pandas writes NaN as an empty
+    # field.
+    value = float(value)
+    return "" if math.isnan(value) else repr(value)
+
+
+def _text_csv_value(value):
+    return "" if value is None else str(value)
+
+
+def _parameter_rows(
+        conn,
+        table_name,
+        parameter,
+        text_columns,
+        max_rowid,
+        chunk_rows,
+        progress,
+        position,
+        ):
+    """Yield the formatted rows of one parameter, one chunk query at a time."""
+    formats = [
+        _text_csv_value if column in text_columns else _numeric_csv_value
+        for column in parameter.columns
+        ]
+    query = (
+        f"SELECT rowid, {', '.join(map(_quote, parameter.columns))} "
+        f"FROM {_quote(table_name)} "
+        f"WHERE rowid > ? AND rowid <= ? AND {_quote(parameter.name)} IS NOT NULL "
+        f"ORDER BY rowid LIMIT ?"
+        )
+    last_rowid = 0
+    while True:
+        progress.check_cancelled()
+        rows = conn.execute(query, (last_rowid, max_rowid, chunk_rows)).fetchall()
+        if rows:
+            last_rowid = rows[-1][0]
+        position[0] = max_rowid if len(rows) < chunk_rows else last_rowid
+        for row in rows:
+            yield [
+                value_format(value)
+                for value_format, value in zip(formats, row[1:], strict=True)
+                ]
+        if len(rows) < chunk_rows:
+            return
+
+
+def export_result_csv(
+        database_path: str,
+        table_name: str,
+        parameters: Sequence[ExportedParameter],
+        destination: str,
+        *,
+        text_columns: Collection[str] = (),
+        chunk_rows: int = COLUMN_EXPORT_CHUNK_ROWS,
+        expected_database_identity=None,
+        cancelled_callback: Callable[[], bool] | None = None,
+        progress_callback: Callable[[float], object] | None = None,
+        ) -> int:
+    """
+    Writes the rows of each parameter to a CSV file.
+
+    The file has the layout of the CSV export of the pandas frame built from
+    ``get_parameter_data``. Each parameter contributes its value and setpoint
+    columns, the parameters are placed side by side, and shorter parameters
+    leave their remaining fields empty. Numbers are written at the precision
+    they are stored with, where QCoDeS rounds them to 15 significant digits.
+
+    Parameters
+    ----------
+    database_path : str
+        QCoDeS database holding the run.
+    table_name : str
+        Result table of the run.
+    parameters : Sequence[ExportedParameter]
+        Numeric or text parameters to export. With several parameters the
+        column names are prefixed with the parameter name.
+    destination : str
+        Path of the file to write. An existing file is overwritten.
+    text_columns : Collection[str], optional
+        Columns of text parameters. Other columns are written as numbers.
+    chunk_rows : int, optional
+        Rows read per query and parameter. The default is
+        COLUMN_EXPORT_CHUNK_ROWS.
+    expected_database_identity : optional
+        File identity the database must still have when it is opened.
+    cancelled_callback : Callable[[], bool], optional
+        Checked between chunks. Returning True raises ColumnExportCancelled.
+    progress_callback : Callable[[float], object], optional
+        Called with the completed fraction of the export, from 0 to 1.
+
+    Returns
+    -------
+    int
+        Number of data rows written.
+
+    """
+    parameters = list(parameters)
+    if not parameters:
+        raise ValueError("No parameters to export.")
+    chunk_rows = max(1, int(chunk_rows))
+    progress = _ExportProgress(cancelled_callback, progress_callback)
+    header = [name for name, _index, _column in _column_names(parameters)]
+
+    conn = _open_export_connection(database_path, expected_database_identity)
+    try:
+        max_rowid = _last_rowid(
+            conn,
+            table_name,
+            {column for parameter in parameters for column in parameter.columns},
+            )
+        positions = [[0] for _parameter in parameters]
+        readers = [
+            _parameter_rows(
+                conn,
+                table_name,
+                parameter,
+                set(text_columns),
+                max_rowid,
+                chunk_rows,
+                progress,
+                position,
+                )
+            for parameter, position in zip(parameters, positions, strict=True)
+            ]
+        fill = [[""] * len(parameter.columns) for parameter in parameters]
+        row_count = 0
+        with open(destination, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle, lineterminator=os.linesep)
+            writer.writerow(header)
+            for parts in zip_longest(*readers):
+                writer.writerow([
+                    value
+                    for part, empty in zip(parts, fill, strict=True)
+                    for value in (empty if part is None else part)
+                    ])
+                row_count += 1
+                if row_count % chunk_rows == 0:
+                    progress.report(
+                        sum(position[0] for position in positions)
+                        / (len(positions) * max(max_rowid, 1))
+                        )
+        progress.report(1.0)
+        return row_count
+    finally:
+        conn.close()
@@ -24,12 +24,14 @@ from qplot.datahandling.readonly import (
 )
 from qplot.datahandling.readSQL import (
     find_new_runs,
-    get_run_status,
+    get_completed_run_rowids,
+    get_run_statuses,
     get_runs_basic_via_sql,
     iter_run_detail_batches_via_sql,
     iter_run_shape_batches_via_sql,
     iter_run_storage_batches_via_sql,
 )
+from qplot.datahandling.run_catalog import run_catalog
 from qplot.diagnostics import log_exception
 
 DATABASE_ACCESS_TIMEOUT_SECONDS = 3
@@ -476,13 +478,15 @@ class _InterruptibleSqlWorker:
 
 
     def _interrupt_sql(self):
+        # Interrupt under the lock: once a read clears its connection, the
+        # connection may already serve another worker from the shared pool.
         with self._sql_connection_lock:
             connection = self._sql_connection
-        if connection is not None:
-            try:
-                connection.interrupt()
-            except Exception:
-                pass
+            if connection is not None:
+                try:
+                    connection.interrupt()
+                except Exception:
+                    pass
 
 
     def _set_sql_connection(self, connection):
@@ -530,18 +534,14 @@ class DatabaseRefreshWorker(_InterruptibleSqlWorker, QtCore.QRunnable):
                 cancelled_callback=self._cancelled.is_set,
                 connection_callback=self._set_sql_connection,
                 ) or {}
-            for guid in self.watched_runs:
-                if self._cancelled.is_set():
-                    return
-                status = get_run_status(
-                    guid,
+            if self.watched_runs and not self._cancelled.is_set():
+                statuses = get_run_statuses(
+                    self.watched_runs,
                     database_path=self.database_path,
                     include_storage_bytes=False,
                     cancelled_callback=self._cancelled.is_set,
                     connection_callback=self._set_sql_connection,
                     )
-                if status:
-                    statuses[guid] = status
         except Exception as err:
             if self._cancelled.is_set():
                 return
@@ -778,6 +778,43 @@ class _PrioritizedRunWorker(_InterruptibleSqlWorker, QtCore.QRunnable):
         return candidates[:max(1, int(batch_size or 1))]
 
 
+    def _run_catalog(self):
+        """
+        Return the database's run catalog and its completed runs.
+
+        The catalog is None when the database file has no stable identity.
+
+        """
+        catalog = run_catalog(self.database_path)
+        if catalog is None:
+            return None, {}
+        completed_runs = get_completed_run_rowids(
+            self.database_path,
+            self.run_ids,
+            cancelled_callback=self._is_cancelled,
+            connection_callback=self._set_sql_connection,
+            )
+        return catalog, completed_runs
+
+
+    def _emit_catalogued(self, catalog, completed_runs, section):
+        """
+        Emit one pass's catalogued fields and return the runs they cover.
+
+        """
+        if catalog is None:
+            return set()
+        cached = catalog.lookup(completed_runs, section)
+        rows = {
+            run_id: metadata
+            for run_id, metadata in cached.items()
+            if len(metadata) > 1
+            }
+        if rows:
+            self._emit_batch_ready(rows)
+        return set(cached)
+
+
     def _emit_status(self, message):
         try:
             self.signals.status.emit(self.generation, message)
@@ -819,6 +856,9 @@ class DatabaseDetailWorker(_PrioritizedRunWorker):
     """
     Loads cheap per-run metadata after the basic run table is visible.
 
+    Completed runs found unchanged in the run catalog are filled from it
+    instead of being read again.
+
     """
 
     def __init__(self, generation, database_path, run_ids, batch_size=1):
@@ -829,13 +869,15 @@ class DatabaseDetailWorker(_PrioritizedRunWorker):
     def run(self):
         total = len(self.run_ids)
         completed = 0
+        catalog = None
         try:
             if total == 0 or self._is_cancelled():
                 self._emit_finished(None)
                 return
 
-            self._emit_status(f"Loading run details... 0/{total}")
-            done = set()
+            catalog, completed_runs = self._run_catalog()
+            done = self._emit_catalogued(catalog, completed_runs, "details")
+            self._emit_status(f"Loading run details... {len(done)}/{total}")
             while len(done) < total:
                 if self._is_cancelled():
                     return
@@ -843,6 +885,7 @@ class DatabaseDetailWorker(_PrioritizedRunWorker):
                 batch = self._next_priority_batch(done, self.batch_size)
                 if not batch:
                     break
+                batch_details = {}
                 for details in iter_run_detail_batches_via_sql(
                         self.database_path,
                         batch,
@@ -857,8 +900,11 @@ class DatabaseDetailWorker(_PrioritizedRunWorker):
                     if self._is_cancelled():
                         return
                     if details:
+                        batch_details.update(details)
                         self._emit_batch_ready(details)
 
+                if catalog is not None:
+                    catalog.record(completed_runs, "details", batch, batch_details)
                 done.update(batch)
                 completed = len(done)
                 self._emit_status(
@@ -870,6 +916,9 @@ class DatabaseDetailWorker(_PrioritizedRunWorker):
             log_exception("Database detail worker failed", err, __name__)
             self._emit_finished(err)
             return
+        finally:
+            if catalog is not None:
+                catalog.save()
 
         self._emit_finished(None)
 
@@ -878,6 +927,8 @@ class DatabaseExpensiveDetailWorker(_PrioritizedRunWorker):
     """
     Loads expensive shape and storage metadata in priority order.
 
+    Completed runs found unchanged in the run catalog skip both passes.
+
     """
 
     def __init__(self, generation, database_path, run_ids, batch_size=10):
@@ -887,13 +938,15 @@ class DatabaseExpensiveDetailWorker(_PrioritizedRunWorker):
 
     def run(self):
         total = len(self.run_ids)
+        catalog = None
         try:
             if total == 0 or self._is_cancelled():
                 self._emit_finished(None)
                 return
 
-            shape_done = set()
-            self._emit_status(f"Loading setpoint shapes... 0/{total}")
+            catalog, completed_runs = self._run_catalog()
+            shape_done = self._emit_catalogued(catalog, completed_runs, "shapes")
+            self._emit_status(f"Loading setpoint shapes... {len(shape_done)}/{total}")
             while len(shape_done) < total:
                 if self._is_cancelled():
                     return
@@ -905,6 +958,7 @@ class DatabaseExpensiveDetailWorker(_PrioritizedRunWorker):
                 if not batch:
                     break
 
+                batch_shapes = {}
                 for shapes in iter_run_shape_batches_via_sql(
                         self.database_path,
                         batch,
@@ -916,16 +970,19 @@ class DatabaseExpensiveDetailWorker(_PrioritizedRunWorker):
                         return
 
                     if shapes:
+                        batch_shapes.update(shapes)
                         self._emit_batch_ready(shapes)
 
+                if catalog is not None:
+                    catalog.record(completed_runs, "shapes", batch, batch_shapes)
                 shape_done.update(batch)
                 self._emit_status(
                     f"Loading setpoint shapes... {len(shape_done)}/{total}"
                     )
 
-            storage_done = set()
+            storage_done = self._emit_catalogued(catalog, completed_runs, "storage")
             storage_batch_size = max(25, self.batch_size)
-            self._emit_status(f"Loading exact run sizes... 0/{total}")
+            self._emit_status(f"Loading exact run sizes... {len(storage_done)}/{total}")
             while len(storage_done) < total:
                 if self._is_cancelled():
                     return
@@ -937,6 +994,7 @@ class DatabaseExpensiveDetailWorker(_PrioritizedRunWorker):
                 if not batch:
                     break
 
+                batch_storage = {}
                 for storage in iter_run_storage_batches_via_sql(
                         self.database_path,
                         batch,
@@ -948,8 +1006,11 @@ class DatabaseExpensiveDetailWorker(_PrioritizedRunWorker):
                         return
 
                     if storage:
+                        batch_storage.update(storage)
                         self._emit_batch_ready(storage)
 
+                if catalog is not None:
+                    catalog.record(completed_runs, "storage", batch, batch_storage)
                 storage_done.update(batch)
                 self._emit_status(
                     f"Loading exact run sizes... {len(storage_done)}/{total}"
@@ -960,6 +1021,9 @@ class DatabaseExpensiveDetailWorker(_PrioritizedRunWorker):
             log_exception("Expensive database detail worker failed", err, __name__)
             self._emit_finished(err)
             return
+        finally:
+            if catalog is not None:
+                catalog.save()
 
         self._emit_finished(None)
 
@@ -7,6 +7,8 @@ QCoDeS upgrades have one place to adapt.
 """
 from threading import Lock, RLock
 
+from qplot.datahandling.column_buffer import ColumnStore
+
 _CACHE_LOCK_CREATION = Lock()
 
 
@@ -21,6 +23,17 @@ def cache_lock(cache):
         return lock
 
 
+def cache_column_store(cache):
+    """Return the growable column buffers backing this cache's unshaped data."""
+
+    with _CACHE_LOCK_CREATION:
+        store = getattr(cache, "_qplot_column_store", None)
+        if store is None:
+            store = ColumnStore()
+            cache._qplot_column_store = store
+        return store
+
+
 def cache_dataset(cache):
     return cache._dataset
 
@@ -1,6 +1,67 @@
-"""Compatibility helpers for QCoDeS dataset implementation details."""
+"""Compatibility helpers for QCoDeS dataset implementation details.
 
-from qcodes.dataset.data_set import DataSet
+Importing QCoDeS takes a noticeable part of qPlot's startup, and the main
+window does not need it until a database is opened. The helpers here import
+it when they are first called, so modules on the startup path can use them
+instead of importing ``qcodes`` themselves.
+"""
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from qcodes.dataset.data_set_protocol import DataSetProtocol
+    from qcodes.dataset.sqlite.connection import AtomicConnection
+
+
+def get_DB_location() -> str:
+    """Return QCoDeS' configured database location."""
+
+    from qcodes.dataset.sqlite.database import get_DB_location
+
+    return get_DB_location()
+
+
+def get_DB_debug() -> bool:
+    """Return whether QCoDeS traces the SQL of its connections."""
+
+    from qcodes.dataset.sqlite.database import get_DB_debug
+
+    return get_DB_debug()
+
+
+def set_DB_location(database_path: str) -> None:
+    """Point QCoDeS' configuration at ``database_path``."""
+
+    import qcodes
+
+    qcodes.config.core.db_location = database_path
+
+
+def connect(name: str, debug: bool = False, read_only: bool = False) -> "AtomicConnection":
+    """Open a QCoDeS connection with QCoDeS' ``connect``."""
+
+    from qcodes.dataset.sqlite.database import connect
+
+    return connect(name, debug, read_only=read_only)
+
+
+def load_by_guid(guid: str, conn: "AtomicConnection | None" = None) -> "DataSetProtocol":
+    """Load a dataset with QCoDeS' ``load_by_guid``."""
+
+    from qcodes.dataset import load_by_guid
+
+    return load_by_guid(guid, conn=conn)
+
+
+def load_by_id(run_id: int, conn: "AtomicConnection | None" = None) -> "DataSetProtocol":
+    """Load a dataset with QCoDeS' ``load_by_id``."""
+
+    from qcodes.dataset import load_by_id
+
+    return load_by_id(run_id, conn=conn)
 
 
 def result_owns_supplied_connection(result: object) -> bool:
@@ -11,4 +72,63 @@ def result_owns_supplied_connection(result: object) -> bool:
     do not. Keep this implementation-specific type knowledge in one place.
     """
 
+    from qcodes.dataset.data_set import DataSet
+
     return isinstance(result, DataSet)
+
+
+def connect_read_only_for_any_thread(
+        uri_path: str,
+        debug: bool = False,
+        ) -> "AtomicConnection":
+    """Open a read-only QCoDeS connection that any thread may use.
+
+    This mirrors QCoDeS' ``connect`` with ``read_only=True``: it registers the
+    array, numeric and complex converters, rejects unsupported schema
+    versions and runs the same initialisation checks. ``connect`` always binds
+    the connection to the thread that opened it, but pooled connections are
+    released and reused by different worker threads, so the connection is
+    opened here once without that check.
+    """
+
+    import qcodes.dataset.sqlite.database as qcodes_database
+    from qcodes.dataset.sqlite.connection import AtomicConnection
+
+    sqlite3.register_adapter(np.ndarray, qcodes_database._adapt_array)
+    sqlite3.register_converter("array", qcodes_database._convert_array)
+    conn = sqlite3.connect(
+        f"file:{uri_path}?mode=ro",
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        uri=True,
+        factory=AtomicConnection,
+    )
+    try:
+        latest_supported_version = qcodes_database._latest_available_version()
+        db_version = qcodes_database.get_user_version(conn)
+        if db_version > latest_supported_version:
+            raise RuntimeError(
+                f"Database {uri_path} is version {db_version} but this "
+                f"version of QCoDeS supports up to "
+                f"version {latest_supported_version}"
+            )
+        for numpy_int in qcodes_database.numpy_ints:
+            sqlite3.register_adapter(numpy_int, int)
+        sqlite3.register_converter("numeric", qcodes_database._convert_numeric)
+        for numpy_float in (float, *qcodes_database.numpy_floats):
+            sqlite3.register_adapter(numpy_float, qcodes_database._adapt_float)
+        for complex_type in qcodes_database.complex_types:
+            # Same typeshed limitation QCoDeS works around in ``connect``.
+            sqlite3.register_adapter(
+                complex_type,
+                qcodes_database._adapt_complex,  # type: ignore[arg-type]
+            )
+        sqlite3.register_converter("complex", qcodes_database._convert_complex)
+        if debug:
+            conn.set_trace_callback(print)
+        qcodes_database.init_db(conn)
+        qcodes_database.perform_db_upgrade(conn)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
@@ -1,11 +1,34 @@
+import functools
 import json
 import math
 import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Literal, NamedTuple
 
-from qcodes.dataset.sqlite.database import get_DB_location
-
-from qplot.datahandling.readonly import qcodes_read_only_connection
+import numpy as np
+
+from qplot.datahandling.file_identity import (
+    canonical_database_path,
+    database_file_identity,
+)
+from qplot.datahandling.qcodes_compat import get_DB_location
+from qplot.datahandling.readonly import pooled_qcodes_read_only_connection
+
+RUN_DESCRIPTION_CACHE_SIZE = 1024
+RESULT_COUNT_CACHE_SIZE = 256
+STORAGE_SIZE_CACHE_SIZE = 16
+SETPOINT_OBSERVER_CACHE_SIZE = 32
+SETPOINT_OBSERVER_MAX_CELLS = 1 << 24
+_SETPOINT_OBSERVER_FETCH_ROWS = 100_000
+_SQL_PARAMETER_BATCH_SIZE = 500
+_RESULT_COUNT_CACHE: "OrderedDict[tuple, _ResultCount]" = OrderedDict()
+_RESULT_COUNT_CACHE_LOCK = threading.Lock()
+_STORAGE_SIZE_CACHE: "OrderedDict[tuple, _StorageSizes]" = OrderedDict()
+_STORAGE_SIZE_CACHE_LOCK = threading.Lock()
+_SETPOINT_OBSERVERS: "OrderedDict[tuple, _SetpointObserver]" = OrderedDict()
+_SETPOINT_OBSERVERS_LOCK = threading.Lock()
 
 
 class _StorageSize(NamedTuple):
@@ -13,6 +36,42 @@ class _StorageSize(NamedTuple):
     accuracy: Literal["exact", "estimated", "unavailable"]
 
 
+@dataclass(slots=True)
+class _ResultCount:
+    """A result-table row count and the highest rowid it covers."""
+
+    count: int
+    max_rowid: int | None
+    setpoint_observation: dict | None = None
+
+
+@dataclass(slots=True)
+class _StorageSizes:
+    """
+    Table sizes from one ``dbstat`` pass, grown as live runs append rows.
+
+    The sizes of tables in ``estimated``, keyed to their run IDs, include a
+    share of the pages added since the pass, proportional to appended rows.
+    """
+
+    page_size: int
+    page_count: int
+    sizes: dict[str, int]
+    max_rowids: dict[str, int | None]
+    settled: frozenset[str]
+    estimated: dict[str, int]
+
+
+    def storage_size(self, table_name) -> "_StorageSize | None":
+        value = self.sizes.get(table_name)
+        if value is None:
+            return None
+        return _StorageSize(
+            value,
+            "estimated" if table_name in self.estimated else "exact",
+            )
+
+
 def _install_cancel_progress_handler(conn, cancelled_callback):
     if cancelled_callback is None:
         return
@@ -46,7 +105,7 @@ def get_runs_via_sql(
             run_id : {column_name: column_data}
 
     """
-    conn = qcodes_read_only_connection(database_path or get_DB_location())
+    conn = pooled_qcodes_read_only_connection(database_path or get_DB_location())
     try:
         _notify_connection(connection_callback, conn)
         _install_cancel_progress_handler(conn, cancelled_callback)
@@ -108,7 +167,7 @@ def iter_run_detail_batches_via_sql(
         return
 
     batch_size = max(1, int(batch_size or 1))
-    conn = qcodes_read_only_connection(database_path or get_DB_location())
+    conn = pooled_qcodes_read_only_connection(database_path or get_DB_location())
     try:
         _notify_connection(connection_callback, conn)
         _install_cancel_progress_handler(conn, cancelled_callback)
@@ -156,7 +215,7 @@ def iter_run_shape_batches_via_sql(
         return
 
     batch_size = max(1, int(batch_size or 1))
-    conn = qcodes_read_only_connection(database_path or get_DB_location())
+    conn = pooled_qcodes_read_only_connection(database_path or get_DB_location())
     try:
         _notify_connection(connection_callback, conn)
         _install_cancel_progress_handler(conn, cancelled_callback)
@@ -214,7 +273,7 @@ def iter_run_storage_batches_via_sql(
         return
 
     batch_size = max(1, int(batch_size or 1))
-    conn = qcodes_read_only_connection(database_path or get_DB_location())
+    conn = pooled_qcodes_read_only_connection(database_path or get_DB_location())
     try:
         _notify_connection(connection_callback, conn)
         _install_cancel_progress_handler(conn, cancelled_callback)
@@ -238,14 +297,14 @@ def iter_run_storage_batches_via_sql(
                 if not metadata:
                     continue
 
-                storage_bytes = sizes.get(metadata.get("result_table_name"))
-                if storage_bytes is None:
+                storage_size = sizes.get(metadata.get("result_table_name"))
+                if storage_size is None:
                     continue
 
                 rows[run_id] = {
                     "guid": metadata.get("guid"),
-                    "storage_bytes": storage_bytes,
-                    "storage_bytes_estimated": False,
+                    "storage_bytes": storage_size.bytes,
+                    "storage_bytes_estimated": storage_size.accuracy == "estimated",
                     }
             if rows:
                 yield rows
@@ -256,6 +315,72 @@ def iter_run_storage_batches_via_sql(
             conn.close()
 
 
+def get_completed_run_rowids(
+        database_path,
+        run_ids,
+        cancelled_callback=None,
+        connection_callback=None,
+        ):
+    """
+    Returns the GUID and highest result rowid of every completed run.
+
+    ``MAX(rowid)`` is answered from the end of a result table's rowid B-tree,
+    so this checks thousands of runs for appended rows without counting them.
+
+    Parameters
+    ----------
+    run_ids : iterable of int
+        The runs to look up. Runs that are not completed are omitted.
+
+    Returns
+    -------
+    completed : dict{int: tuple[str, int | None]}
+        ``(guid, max_rowid)`` for each completed run. ``max_rowid`` is None
+        for an empty result table.
+
+    """
+    run_ids = [run_id for run_id in run_ids if run_id is not None]
+    if not run_ids:
+        return {}
+
+    conn = pooled_qcodes_read_only_connection(database_path or get_DB_location())
+    try:
+        _notify_connection(connection_callback, conn)
+        _install_cancel_progress_handler(conn, cancelled_callback)
+        cursor = conn.cursor()
+        values = []
+        for offset in range(0, len(run_ids), _SQL_PARAMETER_BATCH_SIZE):
+            batch = run_ids[offset:offset + _SQL_PARAMETER_BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            cursor.execute(f"""
+              SELECT run_id, guid, result_table_name, completed_timestamp, is_completed
+              FROM runs
+              WHERE run_id IN ({placeholders})
+            """, tuple(batch))
+            values.extend(cursor.fetchall())
+
+        completed = {}
+        for run_id, guid, table_name, completed_timestamp, is_completed in values:
+            if not guid or not table_name or not _run_is_complete({
+                    "completed_timestamp": completed_timestamp,
+                    "is_completed": is_completed,
+                    }):
+                continue
+            try:
+                cursor.execute(f"SELECT MAX(rowid) FROM {_sqlite_identifier(table_name)}")
+            except Exception as err:
+                if _sql_was_interrupted(err):
+                    raise
+                continue
+            completed[run_id] = (guid, cursor.fetchone()[0])
+        return completed
+    finally:
+        try:
+            _notify_connection(connection_callback, None)
+        finally:
+            conn.close()
+
+
 def find_new_runs(
         last_run_id,
         database_path=None,
@@ -280,7 +405,7 @@ def find_new_runs(
         Has layout: 
             run_id : {column_name: column_data}
     """
-    conn = qcodes_read_only_connection(database_path or get_DB_location())
+    conn = pooled_qcodes_read_only_connection(database_path or get_DB_location())
 
     try:
         _notify_connection(connection_callback, conn)
@@ -359,28 +484,55 @@ def _fetch_run_rows(
 
 
 def _add_run_basic_fields(metadata):
-    run_description = _json_dict(metadata.get("run_description"))
+    run_description = metadata.get("run_description")
+    parameters = metadata.get("parameters")
+    # Cache only text and NULL columns. Other column values, such as BLOBs,
+    # are parsed without the cache rather than relying on them being hashable.
+    if all(
+            value is None or isinstance(value, str)
+            for value in (run_description, parameters)
+            ):
+        basic_fields = _cached_run_basic_fields(run_description, parameters)
+    else:
+        basic_fields = _run_basic_fields(run_description, parameters)
+    metadata.update(
+        (field, list(value) if isinstance(value, list) else value)
+        for field, value in basic_fields
+        )
+
+
+def _run_basic_fields(run_description_text, parameter_text):
+    """Parse one run description into its shape fields, once per text."""
+    run_description = _json_dict(run_description_text)
     measure_parameters, sweep_parameters = _parameter_roles(
         run_description,
-        metadata.get("parameters")
+        parameter_text,
         )
-
-    metadata["measure_parameters"] = measure_parameters
-    metadata["sweep_parameters"] = sweep_parameters
-    metadata["point_shape"] = _point_shape(run_description, measure_parameters)
-    metadata["setpoint_shape"] = metadata["point_shape"]
-    shape_source = "planned" if metadata["setpoint_shape"] else None
-    metadata["setpoint_shape_source"] = shape_source
+    point_shape = _point_shape(run_description, measure_parameters)
+    shape_source = "planned" if point_shape else None
     expected_results = _expected_results_from_shapes(
         run_description,
         measure_parameters,
         )
-    metadata["expected_results"] = expected_results
-    metadata["expected_results_source"] = (
-        "planned" if expected_results is not None else None
+    return (
+        ("measure_parameters", measure_parameters),
+        ("sweep_parameters", sweep_parameters),
+        ("point_shape", point_shape),
+        ("setpoint_shape", point_shape),
+        ("setpoint_shape_source", shape_source),
+        ("expected_results", expected_results),
+        (
+            "expected_results_source",
+            "planned" if expected_results is not None else None,
+        ),
+        ("setpoint_count", _shape_size(point_shape)),
+        ("setpoint_count_source", shape_source),
         )
-    metadata["setpoint_count"] = _shape_size(metadata["setpoint_shape"])
-    metadata["setpoint_count_source"] = shape_source
+
+
+_cached_run_basic_fields = functools.lru_cache(maxsize=RUN_DESCRIPTION_CACHE_SIZE)(
+    _run_basic_fields
+)
 
 
 def _add_run_detail_fields(
@@ -411,15 +563,15 @@ def _add_run_detail_fields(
                 _json_dict(metadata.get("run_description")),
                 measure_parameters,
                 sweep_parameters,
+                incremental=not _run_is_complete(metadata),
                 )
         metadata["read_setpoint_count"] = observed_setpoints["count"]
     if include_storage_bytes:
         table_name = metadata.get("result_table_name")
         if storage_bytes_by_table is not None:
-            storage_bytes = storage_bytes_by_table.get(table_name)
-            storage_size = _StorageSize(
-                storage_bytes,
-                "exact" if storage_bytes is not None else "unavailable",
+            storage_size = storage_bytes_by_table.get(
+                table_name,
+                _StorageSize(None, "unavailable"),
                 )
         else:
             storage_size = _table_storage_bytes(
@@ -452,16 +604,18 @@ def _add_storage_size_fields(metadata, storage_size):
         }[storage_size.accuracy]
 
 
-def _add_observed_shape_fields(cursor, metadata):
+def _add_observed_shape_fields(cursor, metadata, observed_setpoints=None):
     measure_parameters = metadata.get("measure_parameters") or []
     sweep_parameters = metadata.get("sweep_parameters") or []
-    observed_setpoints = _run_setpoint_observation(
-        cursor,
-        metadata.get("result_table_name"),
-        _json_dict(metadata.get("run_description")),
-        measure_parameters,
-        sweep_parameters,
-        )
+    if observed_setpoints is None:
+        observed_setpoints = _run_setpoint_observation(
+            cursor,
+            metadata.get("result_table_name"),
+            _json_dict(metadata.get("run_description")),
+            measure_parameters,
+            sweep_parameters,
+            incremental=not _run_is_complete(metadata),
+            )
     setpoint_shape = observed_setpoints["shape"]
     metadata["setpoint_shape"] = setpoint_shape
     metadata["point_shape"] = _point_shape_from_setpoint_shape(
@@ -611,6 +765,16 @@ def _shape_size(shape):
 
 
 def _database_modified_timestamp(cursor):
+    database_path = _main_database_path(cursor)
+    if not database_path:
+        return None
+    try:
+        return os.path.getmtime(database_path)
+    except OSError:
+        return None
+
+
+def _main_database_path(cursor):
     try:
         cursor.execute("PRAGMA database_list")
         databases = cursor.fetchall()
@@ -618,13 +782,8 @@ def _database_modified_timestamp(cursor):
         return None
 
     for database in databases:
-        if len(database) < 3 or database[1] != "main" or not database[2]:
-            continue
-        try:
-            return os.path.getmtime(database[2])
-        except OSError:
-            return None
-
+        if len(database) >= 3 and database[1] == "main" and database[2]:
+            return database[2]
     return None
 
 
@@ -719,8 +878,14 @@ def _run_setpoint_observation(
         run_description,
         measure_parameters,
         sweep_parameters,
+        incremental=False,
         ):
-    """Return a safe global shape and the largest per-dependent point count."""
+    """Return a safe global shape and the largest per-dependent point count.
+
+    With ``incremental``, for runs that are still being written, the distinct
+    setpoints are kept between calls by a ``_SetpointObserver`` that only
+    reads rows appended since the previous call.
+    """
     empty = {"shape": None, "count": None}
     if not table_name:
         return empty
@@ -729,6 +894,7 @@ def _run_setpoint_observation(
     columns = _result_table_columns(cursor, quoted_table_name)
     if not columns:
         return empty
+    observer_key = _database_cache_key(cursor) if incremental else None
 
     dependencies = _parameter_dependencies(run_description)
     observations = []
@@ -747,6 +913,7 @@ def _run_setpoint_observation(
                 setpoints,
                 columns,
                 dependent_parameter=parameter,
+                observer_key=observer_key,
                 )
             if observation["count"] is not None:
                 observations.append((tuple(setpoints), observation))
@@ -756,6 +923,7 @@ def _run_setpoint_observation(
             quoted_table_name,
             sweep_parameters,
             columns,
+            observer_key=observer_key,
             )
         if observation["count"] is not None:
             observations.append((tuple(sweep_parameters), observation))
@@ -784,6 +952,7 @@ def _setpoint_observation(
         sweep_parameters,
         columns,
         dependent_parameter=None,
+        observer_key=None,
         ):
     empty = {"shape": None, "count": None}
     required_columns = list(sweep_parameters)
@@ -792,6 +961,20 @@ def _setpoint_observation(
     if not required_columns or any(column not in columns for column in required_columns):
         return empty
 
+    if observer_key is not None:
+        observer = _setpoint_observer(
+            (*observer_key, quoted_table_name, tuple(sweep_parameters), dependent_parameter),
+            len(sweep_parameters),
+            )
+        observation = observer.observe(
+            cursor,
+            quoted_table_name,
+            sweep_parameters,
+            dependent_parameter,
+            )
+        if observation is not None:
+            return observation
+
     observed_count = _distinct_setpoint_count(
         cursor,
         quoted_table_name,
@@ -853,6 +1036,142 @@ def _distinct_setpoint_count(
     return count if count > 0 else None
 
 
+def _setpoint_observer(key, dimensions):
+    with _SETPOINT_OBSERVERS_LOCK:
+        observer = _SETPOINT_OBSERVERS.get(key)
+        if observer is None:
+            observer = _SetpointObserver(dimensions)
+            _SETPOINT_OBSERVERS[key] = observer
+        _SETPOINT_OBSERVERS.move_to_end(key)
+        while len(_SETPOINT_OBSERVERS) > SETPOINT_OBSERVER_CACHE_SIZE:
+            _SETPOINT_OBSERVERS.popitem(last=False)
+        return observer
+
+
+class _SetpointObserver:
+    """
+    Distinct setpoints of one result table, updated from appended rows.
+
+    Every setpoint column maps its distinct values to stable indices, and a
+    boolean grid over those indices marks the setpoint combinations seen so
+    far. Counting the combinations of new rows then only needs those rows,
+    and reading a row twice does not change the counts. Setpoints that are
+    not numeric, or too sparse for a grid of ``SETPOINT_OBSERVER_MAX_CELLS``
+    cells, are left to the full-table SQL queries.
+    """
+
+    def __init__(self, dimensions):
+        self._lock = threading.Lock()
+        self._dimensions = dimensions
+        self._reset()
+
+
+    def _reset(self):
+        self.last_rowid = 0
+        self.count = 0
+        self.exhausted = False
+        self._values: list[dict[float, int]] = [{} for _ in range(self._dimensions)]
+        self._seen = np.zeros((0, ) * self._dimensions, dtype=bool)
+
+
+    def observe(self, cursor, quoted_table_name, sweep_parameters, dependent_parameter):
+        """
+        Return the observation after reading the rows appended since last time.
+
+        Returns None when the setpoints cannot be observed incrementally.
+
+        """
+        with self._lock:
+            if self.exhausted:
+                return None
+            try:
+                cursor.execute(f"SELECT MAX(rowid) FROM {quoted_table_name}")
+                max_rowid = cursor.fetchone()[0] or 0
+                if max_rowid < self.last_rowid:
+                    self._reset()
+                if max_rowid > self.last_rowid:
+                    quoted_columns = ", ".join(
+                        _sqlite_identifier(parameter)
+                        for parameter in sweep_parameters
+                        )
+                    conditions = _setpoint_not_null_conditions(
+                        sweep_parameters,
+                        dependent_parameter=dependent_parameter,
+                        )
+                    cursor.execute(f"""
+                      SELECT {quoted_columns}
+                      FROM {quoted_table_name}
+                      WHERE rowid > ? AND rowid <= ? AND {conditions}
+                    """, (self.last_rowid, max_rowid))
+                    while rows := cursor.fetchmany(_SETPOINT_OBSERVER_FETCH_ROWS):
+                        if not self._add(rows):
+                            self.exhausted = True
+                            return None
+                    self.last_rowid = max_rowid
+            except Exception as err:
+                if _sql_was_interrupted(err):
+                    raise
+                return None
+            return self._observation()
+
+
+    def _add(self, rows):
+        setpoints = np.array(rows)
+        if setpoints.dtype.kind not in "biuf" or setpoints.ndim != 2:
+            return False
+
+        indices = []
+        for column, values in enumerate(self._values):
+            unique, inverse = np.unique(setpoints[:, column], return_inverse=True)
+            unique_indices = np.fromiter(
+                (values.setdefault(value, len(values)) for value in unique.tolist()),
+                dtype=np.int64,
+                count=unique.size,
+                )
+            indices.append(unique_indices[inverse.reshape(-1)])
+
+        shape = tuple(len(values) for values in self._values)
+        if math.prod(shape) > SETPOINT_OBSERVER_MAX_CELLS:
+            return False
+        if any(
+                size > capacity
+                for size, capacity in zip(shape, self._seen.shape, strict=True)
+                ):
+            self._grow(shape)
+
+        cells = np.unique(np.ravel_multi_index(tuple(indices), self._seen.shape))
+        seen = self._seen.reshape(-1)
+        new_cells = cells[~seen[cells]]
+        seen[new_cells] = True
+        self.count += int(new_cells.size)
+        return True
+
+
+    def _grow(self, shape):
+        """Enlarge the grid, doubling each axis that overflows while it fits."""
+        capacity = tuple(
+            size if size <= current else max(size, 2 * current)
+            for size, current in zip(shape, self._seen.shape, strict=True)
+            )
+        if math.prod(capacity) > SETPOINT_OBSERVER_MAX_CELLS:
+            capacity = tuple(
+                max(size, current)
+                for size, current in zip(shape, self._seen.shape, strict=True)
+                )
+        grown = np.zeros(capacity, dtype=bool)
+        grown[tuple(slice(0, size) for size in self._seen.shape)] = self._seen
+        self._seen = grown
+
+
+    def _observation(self):
+        if not self.count:
+            return {"shape": None, "count": None}
+        shape = [len(values) for values in self._values]
+        if _shape_size(shape) != self.count:
+            return {"shape": None, "count": self.count}
+        return {"shape": shape, "count": self.count}
+
+
 def _setpoint_not_null_conditions(sweep_parameters, dependent_parameter=None):
     parameters = list(sweep_parameters)
     if dependent_parameter is not None:
@@ -890,15 +1209,10 @@ def _table_storage_bytes(cursor, table_name, result_count=None):
     if not table_name:
         return _StorageSize(None, "unavailable")
 
-    try:
-        cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = ?", (table_name, ))
-        row = cursor.fetchone()
-        value = row[0] if row else None
-        if value is not None:
-            return _StorageSize(int(value), "exact")
-    except Exception as err:
-        if _sql_was_interrupted(err):
-            raise
+    sizes = _storage_sizes(cursor)
+    storage_size = None if sizes is None else sizes.storage_size(table_name)
+    if storage_size is not None:
+        return storage_size
 
     estimated_bytes = _estimated_table_storage_bytes(
         cursor,
@@ -942,36 +1256,220 @@ def _run_storage_tables(cursor, run_ids):
 
 
 def _table_storage_bytes_by_name(cursor, table_names):
-    table_names = sorted({name for name in table_names if name})
+    table_names = {name for name in table_names if name}
     if not table_names:
         return {}
 
-    placeholders = ", ".join("?" for _ in table_names)
+    sizes = _storage_sizes(cursor)
+    if sizes is None:
+        return {}
+    return {
+        name: storage_size
+        for name in table_names
+        if (storage_size := sizes.storage_size(name)) is not None
+        }
+
+
+def _storage_sizes(cursor):
+    """
+    Return the size in bytes of every table of the cursor's database.
+
+    ``dbstat`` walks every page of the database, whatever its ``WHERE``
+    clause, so all tables are sized in one pass. The result is cached per
+    database file instance. While the database only grows, the pages added
+    since are shared among the result tables of runs that appended rows, in
+    proportion to those rows, instead of walking the database again. Those
+    shares are estimates, so the database is walked again once a run whose
+    size was estimated completes.
+
+    Returns
+    -------
+    sizes : _StorageSizes | None
+        None when ``dbstat`` is unavailable.
+
+    """
     try:
-        cursor.execute(
-            f"""
-            SELECT name, SUM(pgsize)
-            FROM dbstat
-            WHERE name IN ({placeholders})
-            GROUP BY name
-            """,
-            tuple(table_names),
-            )
+        cursor.execute("PRAGMA page_size")
+        page_size = int(cursor.fetchone()[0])
+        cursor.execute("PRAGMA page_count")
+        page_count = int(cursor.fetchone()[0])
     except Exception as err:
         if _sql_was_interrupted(err):
             raise
-        return {}
+        return None
+
+    key = _database_cache_key(cursor)
+    cached = None
+    if key is not None:
+        with _STORAGE_SIZE_CACHE_LOCK:
+            cached = _STORAGE_SIZE_CACHE.get(key)
+    storage_sizes = None
+    if cached is not None and cached.page_size == page_size:
+        if cached.page_count == page_count:
+            if not _estimated_run_completed(cursor, cached):
+                return cached
+        elif cached.page_count < page_count:
+            storage_sizes = _grown_storage_sizes(cursor, cached, page_count)
+    if storage_sizes is None:
+        storage_sizes = _scanned_storage_sizes(cursor, page_size, page_count)
+    if storage_sizes is None:
+        return None
+
+    if key is not None:
+        with _STORAGE_SIZE_CACHE_LOCK:
+            _STORAGE_SIZE_CACHE[key] = storage_sizes
+            _STORAGE_SIZE_CACHE.move_to_end(key)
+            while len(_STORAGE_SIZE_CACHE) > STORAGE_SIZE_CACHE_SIZE:
+                _STORAGE_SIZE_CACHE.popitem(last=False)
+    return storage_sizes
+
+
+def _scanned_storage_sizes(cursor, page_size, page_count):
+    try:
+        try:
+            cursor.execute("SELECT name, pgsize FROM dbstat WHERE aggregate = 1")
+        except Exception as err:
+            if _sql_was_interrupted(err) or "aggregate" not in str(err):
+                raise
+            # SQLite before 3.31 has no aggregated dbstat rows.
+            cursor.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+        rows = cursor.fetchall()
+    except Exception as err:
+        if _sql_was_interrupted(err):
+            raise
+        return None
 
     sizes = {}
-    for name, value in cursor.fetchall():
-        if name not in table_names or value is None:
-            continue
+    for name, value in rows:
         try:
             sizes[name] = int(value)
         except (TypeError, ValueError):
             pass
 
-    return sizes
+    max_rowids = {}
+    settled = set()
+    for table_name, _run_id, completed in _result_table_completion(cursor) or ():
+        if completed:
+            settled.add(table_name)
+        else:
+            max_rowids[table_name] = _max_rowid(cursor, table_name)
+    return _StorageSizes(page_size, page_count, sizes, max_rowids, frozenset(settled), {})
+
+
+def _grown_storage_sizes(cursor, cached, page_count):
+    """
+    Share the pages added since ``cached`` among the tables that grew.
+
+    Tables of runs that had completed by the previous update cannot grow
+    and are skipped. Returns None if the runs table cannot be read, or if a
+    run whose size is or would become an estimate has completed, in which
+    case the database is scanned again.
+
+    """
+    tables = _result_table_completion(cursor)
+    if tables is None:
+        return None
+
+    max_rowids = dict(cached.max_rowids)
+    settled = set(cached.settled)
+    estimated = dict(cached.estimated)
+    appended = {}
+    for table_name, run_id, completed in tables:
+        if table_name in cached.settled:
+            continue
+        max_rowid = _max_rowid(cursor, table_name)
+        added_rows = (max_rowid or 0) - (max_rowids.get(table_name) or 0)
+        if completed and (added_rows > 0 or table_name in estimated):
+            # Settle finished runs with measured rather than shared pages.
+            return None
+        if added_rows > 0:
+            appended[table_name] = added_rows
+            estimated[table_name] = run_id
+        max_rowids[table_name] = max_rowid
+        if completed:
+            settled.add(table_name)
+
+    sizes = dict(cached.sizes)
+    added_bytes = (page_count - cached.page_count) * cached.page_size
+    total_rows = sum(appended.values())
+    for table_name, added_rows in appended.items():
+        share = added_bytes * added_rows // total_rows
+        sizes[table_name] = sizes.get(table_name, 0) + share
+    return _StorageSizes(
+        cached.page_size,
+        page_count,
+        sizes,
+        max_rowids,
+        frozenset(settled),
+        estimated,
+        )
+
+
+def _estimated_run_completed(cursor, cached):
+    """Return whether a run with an estimated table size has completed."""
+    if not cached.estimated:
+        return False
+    run_ids = list(cached.estimated.values())
+    placeholders = ", ".join("?" for _ in run_ids)
+    try:
+        cursor.execute(f"""
+          SELECT completed_timestamp, is_completed
+          FROM runs
+          WHERE run_id IN ({placeholders})
+        """, run_ids)
+        rows = cursor.fetchall()
+    except Exception as err:
+        if _sql_was_interrupted(err):
+            raise
+        return False
+
+    return any(
+        _run_is_complete({
+            "completed_timestamp": completed_timestamp,
+            "is_completed": is_completed,
+            })
+        for completed_timestamp, is_completed in rows
+        )
+
+
+def _result_table_completion(cursor):
+    try:
+        cursor.execute("""
+          SELECT result_table_name, run_id, completed_timestamp, is_completed
+          FROM runs
+          WHERE result_table_name IS NOT NULL
+        """)
+        rows = cursor.fetchall()
+    except Exception as err:
+        if _sql_was_interrupted(err):
+            raise
+        return None
+
+    return [
+        (table_name, run_id, _run_is_complete({
+            "completed_timestamp": completed_timestamp,
+            "is_completed": is_completed,
+            }))
+        for table_name, run_id, completed_timestamp, is_completed in rows
+        ]
+
+
+def _max_rowid(cursor, table_name):
+    try:
+        cursor.execute(f"SELECT MAX(rowid) FROM {_sqlite_identifier(table_name)}")
+        return cursor.fetchone()[0]
+    except Exception as err:
+        if _sql_was_interrupted(err):
+            raise
+        return None
+
+
+def _database_cache_key(cursor):
+    """Key cached table state to the database file the cursor reads."""
+    database_path = _main_database_path(cursor)
+    if not database_path:
+        return None
+    return _result_count_cache_key(database_path)
 
 
 def _estimated_table_storage_bytes(cursor, table_name, result_count=None):
@@ -1024,7 +1522,47 @@ def get_run_status(
     Returns completion and result count information for one run.
 
     """
-    conn = qcodes_read_only_connection(database_path or get_DB_location())
+    return get_run_statuses(
+        [guid],
+        database_path=database_path,
+        include_storage_bytes=include_storage_bytes,
+        cancelled_callback=cancelled_callback,
+        connection_callback=connection_callback,
+        ).get(guid, {})
+
+
+def get_run_statuses(
+        guids,
+        database_path=None,
+        include_storage_bytes=True,
+        cancelled_callback=None,
+        connection_callback=None,
+        ):
+    """
+    Returns completion and result count information for several runs.
+
+    Every run is read through one connection and one ``WHERE guid IN`` pass.
+    Result counts are carried over between calls, so a refresh only counts
+    rows appended since the previous one and reuses setpoint observations
+    while a run's results are unchanged.
+
+    Parameters
+    ----------
+    guids : iterable of str
+        The unique ids of the runs to look up.
+
+    Returns
+    -------
+    statuses : dict{str: dict}
+        Status for each GUID found in the database. Missing runs are omitted.
+
+    """
+    guids = list(dict.fromkeys(guid for guid in guids if guid))
+    if not guids:
+        return {}
+
+    database_path = database_path or get_DB_location()
+    conn = pooled_qcodes_read_only_connection(database_path)
     try:
         _notify_connection(connection_callback, conn)
         _install_cancel_progress_handler(conn, cancelled_callback)
@@ -1035,86 +1573,252 @@ def get_run_status(
             for column in optional_columns
             )
 
-        cursor.execute(f"""
-          SELECT
-              run_timestamp,
-              completed_timestamp,
-              is_completed,
-              result_table_name,
-              run_description,
-              parameters
-              {optional_select}
-          FROM runs
-          WHERE guid=?
-          LIMIT 1
-        """, (guid, ))
-        value = cursor.fetchone()
-        if value is None:
+        values = []
+        for offset in range(0, len(guids), _SQL_PARAMETER_BATCH_SIZE):
+            batch = guids[offset:offset + _SQL_PARAMETER_BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            cursor.execute(f"""
+              SELECT
+                  guid,
+                  run_timestamp,
+                  completed_timestamp,
+                  is_completed,
+                  result_table_name,
+                  run_description,
+                  parameters
+                  {optional_select}
+              FROM runs
+              WHERE guid IN ({placeholders})
+            """, tuple(batch))
+            values.extend(cursor.fetchall())
+        if not values:
             return {}
 
-        status = {
-            "run_timestamp": value[0],
-            "completed_timestamp": value[1],
-            "is_completed": value[2],
-            "result_count": _result_count(cursor, value[3]),
-            "database_modified_timestamp": _database_modified_timestamp(cursor),
-            }
-        if include_storage_bytes:
-            _add_storage_size_fields(
-                status,
-                _table_storage_bytes(
-                    cursor,
-                    value[3],
-                    result_count=status["result_count"],
-                    ),
+        count_cache_key = _result_count_cache_key(database_path)
+        database_modified_timestamp = _database_modified_timestamp(cursor)
+        statuses = {}
+        for value in values:
+            if cancelled_callback is not None and cancelled_callback():
+                raise InterruptedError("Database status read cancelled.")
+            if value[0] in statuses:
+                continue
+            statuses[value[0]] = _run_status(
+                cursor,
+                value[1:],
+                optional_columns,
+                count_cache_key,
+                database_modified_timestamp,
+                include_storage_bytes,
                 )
-        for index, column in enumerate(optional_columns, start=6):
-            status[column] = value[index]
-
-        shape_metadata = {
-            "completed_timestamp": value[1],
-            "is_completed": value[2],
-            "result_table_name": value[3],
-            "run_description": value[4],
-            "parameters": value[5],
-            "result_count": status["result_count"],
-            }
-        _add_run_basic_fields(shape_metadata)
-        observed_setpoints = None
-        if not shape_metadata["point_shape"]:
-            observed_setpoints = _add_observed_shape_fields(cursor, shape_metadata)
-        _add_completed_observed_result_count(shape_metadata)
-        for field in (
-                "point_shape",
-                "setpoint_shape",
-                "setpoint_shape_source",
-                "setpoint_count",
-                "setpoint_count_source",
-                "expected_results",
-                "expected_results_source",
-                ):
-            status[field] = shape_metadata.get(field)
+        return statuses
+    finally:
+        try:
+            _notify_connection(connection_callback, None)
+        finally:
+            conn.close()
 
-        if (
-                not bool(value[2])
-                or _is_keyboard_interrupt(status.get("measurement_exception"))
-                ):
-            if observed_setpoints is None:
-                observed_setpoints = _run_setpoint_observation(
-                    cursor,
-                    value[3],
-                    _json_dict(value[4]),
-                    shape_metadata["measure_parameters"],
-                    shape_metadata["sweep_parameters"],
-                    )
-            status["read_setpoint_count"] = observed_setpoints["count"]
 
-        return status
+def get_result_counts(
+        table_names,
+        database_path=None,
+        cancelled_callback=None,
+        connection_callback=None,
+        connection=None,
+        ):
+    """
+    Returns the row count of several result tables through one connection.
+
+    Counts share the incremental cache used by run statuses, so only rows
+    appended since the previous count are scanned.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection, optional
+        Count through this open read-only connection, for example the one
+        data was just loaded from, instead of borrowing one from the pool.
+        It is left open.
+
+    Returns
+    -------
+    counts : dict{str: int}
+        Row count for each result table that could be read.
+
+    """
+    table_names = list(dict.fromkeys(name for name in table_names if name))
+    if not table_names:
+        return {}
+
+    database_path = database_path or get_DB_location()
+    conn = connection
+    if conn is None:
+        conn = pooled_qcodes_read_only_connection(database_path)
+    try:
+        _notify_connection(connection_callback, conn)
+        if connection is None:
+            _install_cancel_progress_handler(conn, cancelled_callback)
+        cursor = conn.cursor()
+        count_cache_key = _result_count_cache_key(database_path)
+        counts = {}
+        for table_name in table_names:
+            if cancelled_callback is not None and cancelled_callback():
+                raise InterruptedError("Database result count read cancelled.")
+            result_count = _incremental_result_count(
+                cursor,
+                count_cache_key,
+                table_name,
+                )
+            if result_count is not None:
+                counts[table_name] = result_count.count
+        return counts
     finally:
         try:
             _notify_connection(connection_callback, None)
         finally:
-            conn.close()
+            if connection is None:
+                conn.close()
+
+
+def _run_status(
+        cursor,
+        value,
+        optional_columns,
+        count_cache_key,
+        database_modified_timestamp,
+        include_storage_bytes,
+        ):
+    result_count = _incremental_result_count(cursor, count_cache_key, value[3])
+    status = {
+        "run_timestamp": value[0],
+        "completed_timestamp": value[1],
+        "is_completed": value[2],
+        "result_count": None if result_count is None else result_count.count,
+        "database_modified_timestamp": database_modified_timestamp,
+        }
+    if include_storage_bytes:
+        _add_storage_size_fields(
+            status,
+            _table_storage_bytes(
+                cursor,
+                value[3],
+                result_count=status["result_count"],
+                ),
+            )
+    for index, column in enumerate(optional_columns, start=6):
+        status[column] = value[index]
+
+    shape_metadata = {
+        "completed_timestamp": value[1],
+        "is_completed": value[2],
+        "result_table_name": value[3],
+        "run_description": value[4],
+        "parameters": value[5],
+        "result_count": status["result_count"],
+        }
+    _add_run_basic_fields(shape_metadata)
+
+    def setpoint_observation():
+        if result_count is not None and result_count.setpoint_observation:
+            return result_count.setpoint_observation
+        observation = _run_setpoint_observation(
+            cursor,
+            value[3],
+            _json_dict(value[4]),
+            shape_metadata["measure_parameters"],
+            shape_metadata["sweep_parameters"],
+            incremental=not _run_is_complete(shape_metadata),
+            )
+        if result_count is not None:
+            result_count.setpoint_observation = observation
+        return observation
+
+    observed_setpoints = None
+    if not shape_metadata["point_shape"]:
+        observed_setpoints = _add_observed_shape_fields(
+            cursor,
+            shape_metadata,
+            setpoint_observation(),
+            )
+    _add_completed_observed_result_count(shape_metadata)
+    for field in (
+            "point_shape",
+            "setpoint_shape",
+            "setpoint_shape_source",
+            "setpoint_count",
+            "setpoint_count_source",
+            "expected_results",
+            "expected_results_source",
+            ):
+        status[field] = shape_metadata.get(field)
+
+    if (
+            not bool(value[2])
+            or _is_keyboard_interrupt(status.get("measurement_exception"))
+            ):
+        if observed_setpoints is None:
+            observed_setpoints = setpoint_observation()
+        status["read_setpoint_count"] = observed_setpoints["count"]
+
+    return status
+
+
+def _result_count_cache_key(database_path):
+    """Key cached result counts to one database file instance."""
+    try:
+        identity = database_file_identity(database_path)
+    except OSError:
+        return None
+    if identity is None:
+        return None
+    return canonical_database_path(database_path), identity
+
+
+def _incremental_result_count(cursor, cache_key, table_name):
+    """Count result rows, scanning only rows appended since the last count.
+
+    QCoDeS appends result rows under an ``INTEGER PRIMARY KEY``, so rows at or
+    below a previously counted rowid keep their count. A lower maximum rowid
+    means the table was rebuilt and is counted again in full.
+    """
+    if not table_name:
+        return None
+
+    quoted_table_name = _sqlite_identifier(table_name)
+    key = None if cache_key is None else (*cache_key, table_name)
+    cached = None
+    if key is not None:
+        with _RESULT_COUNT_CACHE_LOCK:
+            cached = _RESULT_COUNT_CACHE.get(key)
+    try:
+        cursor.execute(f"SELECT MAX(rowid) FROM {quoted_table_name}")
+        max_rowid = cursor.fetchone()[0]
+        if cached is not None and cached.max_rowid == max_rowid:
+            return cached
+        if (
+                cached is not None
+                and cached.max_rowid is not None
+                and max_rowid is not None
+                and max_rowid > cached.max_rowid
+                ):
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {quoted_table_name} WHERE rowid > ?",
+                (cached.max_rowid, ),
+                )
+            count = cached.count + cursor.fetchone()[0]
+        else:
+            cursor.execute(f"SELECT COUNT(*) FROM {quoted_table_name}")
+            count = cursor.fetchone()[0]
+    except Exception:
+        count = _result_count(cursor, table_name)
+        return None if count is None else _ResultCount(count, None)
+
+    result_count = _ResultCount(count, max_rowid)
+    if key is not None:
+        with _RESULT_COUNT_CACHE_LOCK:
+            _RESULT_COUNT_CACHE[key] = result_count
+            _RESULT_COUNT_CACHE.move_to_end(key)
+            while len(_RESULT_COUNT_CACHE) > RESULT_COUNT_CACHE_SIZE:
+                _RESULT_COUNT_CACHE.popitem(last=False)
+    return result_count
 
 
 def has_finished(guid) -> float | None:
@@ -1135,7 +1839,7 @@ def has_finished(guid) -> float | None:
         run is present but unfinished, or when no matching run exists.
 
     """
-    conn = qcodes_read_only_connection(get_DB_location())
+    conn = pooled_qcodes_read_only_connection(get_DB_location())
     
     try:
         cursor = conn.cursor()
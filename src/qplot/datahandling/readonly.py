@@ -1,32 +1,60 @@
+import functools
+import os
 import shutil
 import sqlite3
 import tempfile
 import threading
 import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
-import qcodes
-from qcodes.dataset import load_by_guid, load_by_id
-from qcodes.dataset.sqlite.database import connect, get_DB_debug, get_DB_location
-
 from qplot.datahandling.file_identity import (
     QPLOT_GENERATED_DATABASE_APPLICATION_ID,
     QPLOT_GENERATION_PROVENANCE_TABLE,
     QPLOT_GENERATION_PROVENANCE_TOKEN_BYTES,
     DatabaseFileIdentity,
+    DatabaseInstance,
+    canonical_database_path,
     database_file_identity,
     database_has_qplot_generation_marker,
+    database_instance,
+    database_instances_differ,
     database_publication_guard_path,
+    logical_database_path,
+)
+from qplot.datahandling.qcodes_compat import (
+    connect,
+    connect_read_only_for_any_thread,
+    get_DB_debug,
+    get_DB_location,
+    load_by_guid,
+    load_by_id,
+    result_owns_supplied_connection,
+    set_DB_location,
 )
-from qplot.datahandling.qcodes_compat import result_owns_supplied_connection
 
 SQLITE_READ_ONLY_CACHE_KIB = 16 * 1024
 WAL_SNAPSHOT_ATTEMPTS = 5
+WAL_SNAPSHOT_STORE_MAX_DATABASES = 4
+# Each stored database keeps at most this many idle main-file copies.
+WAL_SNAPSHOT_MAIN_COPIES = 2
+_SNAPSHOT_COPY_CHUNK_BYTES = 1024 * 1024
+_WAL_HEADER_BYTES = 32
+_WAL_FRAME_HEADER_BYTES = 24
+READ_ONLY_CONNECTION_POOL_SIZE = 8
+READ_ONLY_CONNECTION_POOL_PER_DATABASE = 2
 _DATABASE_INSTANCE_REGISTRY: dict[
     Path,
     tuple[DatabaseFileIdentity | None, bool],
 ] = {}
 _DATABASE_INSTANCE_REGISTRY_LOCK = threading.Lock()
+_WAL_SNAPSHOT_STORE: "OrderedDict[Path, _WalSnapshotEntry]" = OrderedDict()
+_WAL_SNAPSHOT_STORE_LOCK = threading.Lock()
+_READ_ONLY_CONNECTION_POOL: "OrderedDict[_PooledConnection, None]" = OrderedDict()
+_LEASED_READ_ONLY_CONNECTIONS: "set[_PooledConnection]" = set()
+_READ_ONLY_CONNECTION_POOL_LOCK = threading.Lock()
 
 
 class ReadOnlyDatabaseAccessError(RuntimeError):
@@ -41,13 +69,19 @@ class UnverifiableDatabaseWalError(ReadOnlyDatabaseAccessError):
     """Raised when a WAL cannot be proven to descend from its marked main."""
 
 
+class _SnapshotSourceChanged(Exception):
+    """Internal signal that the source moved while its private copy was updated."""
+
+
 class _ManagedSQLiteConnection(sqlite3.Connection):
     """SQLite connection that owns a temporary WAL snapshot, when needed."""
 
     _qplot_snapshot: tempfile.TemporaryDirectory | None = None
+    _qplot_wal_log_position: tuple | None = None
 
     def attach_snapshot(self, snapshot):
         self._qplot_snapshot = snapshot
+        self._qplot_wal_log_position = snapshot.log_position
 
     def close(self):
         try:
@@ -60,7 +94,7 @@ class _ManagedSQLiteConnection(sqlite3.Connection):
 
 def set_qcodes_database_location(database_path):
     """Point QCoDeS at a database without initialising or upgrading it."""
-    qcodes.config.core.db_location = str(database_path)
+    set_DB_location(str(database_path))
 
 
 def quarantine_wal_for_replaced_database(database_path):
@@ -87,6 +121,8 @@ def quarantine_wal_for_replaced_database(database_path):
     database_identity = database_file_identity(source_path)
     with _DATABASE_INSTANCE_REGISTRY_LOCK:
         _DATABASE_INSTANCE_REGISTRY[source_path] = (database_identity, True)
+    release_pooled_connections(source_path)
+    release_wal_snapshots(source_path)
     return database_identity is not None
 
 
@@ -172,6 +208,7 @@ def qcodes_read_only_connection(
         *,
         ignore_unpaired_wal=False,
         expected_database_identity=None,
+        check_same_thread=True,
         ):
     """Open a source-preserving, AtomicConnection-compatible database view.
 
@@ -190,11 +227,11 @@ def qcodes_read_only_connection(
         conn = None
         try:
             _require_publication_complete(source_path)
-            conn = connect(
-                _qcodes_uri_path(target_path, immutable=immutable),
-                get_DB_debug(),
-                read_only=True,
-                )
+            uri_path = _qcodes_uri_path(target_path, immutable=immutable)
+            if check_same_thread:
+                conn = connect(uri_path, get_DB_debug(), read_only=True)
+            else:
+                conn = connect_read_only_for_any_thread(uri_path, get_DB_debug())
             _require_publication_complete(source_path)
             _require_expected_database_instance(
                 source_path,
@@ -411,6 +448,274 @@ def probe_read_only_database(
         conn.close()
 
 
+@dataclass(slots=True, eq=False)
+class _PooledConnection:
+    """A pooled connection and the source state its read-only view reflects.
+
+    A private WAL snapshot view also records the WAL log position it was
+    built from. It stays reusable while the source WAL still ends there,
+    even though checkpoints and other writers change the source's file
+    signature.
+    """
+
+    key: tuple
+    instance: DatabaseInstance
+    source_state: tuple
+    connection: sqlite3.Connection
+    close: Callable[[], None]
+    reusable: bool = True
+    log_position: tuple | None = None
+
+
+def pooled_qcodes_read_only_connection(
+        database_path,
+        *,
+        ignore_unpaired_wal=False,
+        expected_database_identity=None,
+        ):
+    """Borrow an AtomicConnection-compatible view from the shared pool.
+
+    Closing the connection returns it to the pool instead of closing it, so a
+    later read of the unchanged source skips the open and snapshot work.
+    """
+    return _pooled_read_only_connection(
+        "qcodes",
+        database_path,
+        (ignore_unpaired_wal, ),
+        expected_database_identity,
+        lambda: qcodes_read_only_connection(
+            database_path,
+            ignore_unpaired_wal=ignore_unpaired_wal,
+            expected_database_identity=expected_database_identity,
+            check_same_thread=False,
+        ),
+    )
+
+
+def pooled_sqlite_read_only_connection(
+        database_path,
+        timeout=10,
+        *,
+        ignore_unpaired_wal=False,
+        expected_database_identity=None,
+        ):
+    """Borrow a direct SQLite view from the shared pool.
+
+    Closing the connection returns it to the pool instead of closing it, so a
+    later read of the unchanged source skips the open and snapshot work.
+    """
+    return _pooled_read_only_connection(
+        "sqlite",
+        database_path,
+        (ignore_unpaired_wal, ),
+        expected_database_identity,
+        lambda: sqlite_read_only_connection(
+            database_path,
+            timeout=timeout,
+            ignore_unpaired_wal=ignore_unpaired_wal,
+            expected_database_identity=expected_database_identity,
+            check_same_thread=False,
+        ),
+        timeout=timeout,
+    )
+
+
+def release_pooled_connections(database_path=None):
+    """Close idle pooled connections and retire borrowed ones on return.
+
+    Without a path, every pooled connection is released.
+    """
+    if database_path is None:
+        matches = None
+    else:
+        matches = {
+            logical_database_path(database_path),
+            canonical_database_path(database_path),
+        }
+    with _READ_ONLY_CONNECTION_POOL_LOCK:
+        released = [
+            record
+            for record in _READ_ONLY_CONNECTION_POOL
+            if _pooled_record_matches(record, matches)
+        ]
+        for record in released:
+            del _READ_ONLY_CONNECTION_POOL[record]
+        for record in _LEASED_READ_ONLY_CONNECTIONS:
+            if _pooled_record_matches(record, matches):
+                record.reusable = False
+    _close_pooled_records(released)
+
+
+def _pooled_record_matches(record, paths):
+    return paths is None or not paths.isdisjoint(
+        (record.instance.logical_path, record.instance.resolved_path)
+    )
+
+
+def _pooled_read_only_connection(
+        kind,
+        database_path,
+        options,
+        expected_database_identity,
+        open_connection,
+        *,
+        timeout=None,
+        ):
+    """Reuse an idle view of the same unchanged database instance, or open one.
+
+    A view is reusable only while the source signature and WAL quarantine
+    decision it was opened under still hold. Any other view of the same path
+    whose instance differs, which proves a replacement, is closed here.
+    """
+    source_path = _resolved_database_path(database_path)
+    _require_publication_complete(source_path)
+    instance = database_instance(database_path)
+    key = (kind, instance, options)
+    if (
+            expected_database_identity is None
+            or instance.identity == expected_database_identity
+            ):
+        record = _checkout_pooled_connection(key, source_path)
+        if record is not None:
+            if timeout is not None:
+                try:
+                    record.connection.execute(
+                        f"PRAGMA busy_timeout = {int(timeout * 1000)}"
+                    )
+                except sqlite3.Error:
+                    record.reusable = False
+            return record.connection
+
+    source_state = _pooled_source_state(source_path)
+    connection = open_connection()
+    record = _PooledConnection(
+        key,
+        instance,
+        source_state,
+        connection,
+        connection.close,
+        log_position=getattr(connection, "_qplot_wal_log_position", None),
+    )
+    record.reusable = (
+        _pooled_state_current(record, source_path, _pooled_source_state(source_path))
+        and not database_instances_differ(
+            database_instance(database_path),
+            instance,
+        )
+    )
+    connection.close = functools.partial(_return_pooled_connection, record)
+    connection.interrupt = functools.partial(
+        _interrupt_pooled_connection,
+        record,
+    )
+    with _READ_ONLY_CONNECTION_POOL_LOCK:
+        _LEASED_READ_ONLY_CONNECTIONS.add(record)
+    return connection
+
+
+def _pooled_source_state(source_path):
+    return (
+        _source_signature(source_path),
+        replacement_wal_is_quarantined(source_path),
+    )
+
+
+def _pooled_state_current(record, source_path, source_state):
+    """Return whether a pooled view still reflects the source's content."""
+    if record.log_position is None:
+        return record.source_state == source_state
+    return record.source_state[1] == source_state[1] and _wal_log_unchanged(
+        source_path,
+        record.log_position,
+    )
+
+
+def _checkout_pooled_connection(key, source_path):
+    instance = key[1]
+    source_state = _pooled_source_state(source_path)
+    with _READ_ONLY_CONNECTION_POOL_LOCK:
+        stale = [
+            record
+            for record in _READ_ONLY_CONNECTION_POOL
+            if record.instance.logical_path == instance.logical_path
+            and (
+                database_instances_differ(record.instance, instance)
+                or not _pooled_state_current(record, source_path, source_state)
+            )
+        ]
+        for record in stale:
+            del _READ_ONLY_CONNECTION_POOL[record]
+        borrowed = next(
+            (
+                record
+                for record in reversed(_READ_ONLY_CONNECTION_POOL)
+                if record.key == key
+            ),
+            None,
+        )
+        if borrowed is not None:
+            del _READ_ONLY_CONNECTION_POOL[borrowed]
+            _LEASED_READ_ONLY_CONNECTIONS.add(borrowed)
+    _close_pooled_records(stale)
+    return borrowed
+
+
+def _interrupt_pooled_connection(record):
+    """Interrupt a borrowed connection and keep it out of later reuse."""
+    record.reusable = False
+    sqlite3.Connection.interrupt(record.connection)
+
+
+def _return_pooled_connection(record):
+    """Reset and keep a borrowed connection; ``close()`` is idempotent."""
+    closed = []
+    with _READ_ONLY_CONNECTION_POOL_LOCK:
+        if record not in _LEASED_READ_ONLY_CONNECTIONS:
+            return
+        _LEASED_READ_ONLY_CONNECTIONS.discard(record)
+        if record.reusable and _reset_pooled_connection(record):
+            _READ_ONLY_CONNECTION_POOL[record] = None
+            same_key = [
+                idle
+                for idle in _READ_ONLY_CONNECTION_POOL
+                if idle.key == record.key
+            ]
+            closed.extend(
+                same_key[:-READ_ONLY_CONNECTION_POOL_PER_DATABASE]
+            )
+            for idle in closed:
+                del _READ_ONLY_CONNECTION_POOL[idle]
+            while len(_READ_ONLY_CONNECTION_POOL) > READ_ONLY_CONNECTION_POOL_SIZE:
+                closed.append(_READ_ONLY_CONNECTION_POOL.popitem(last=False)[0])
+        else:
+            closed.append(record)
+    _close_pooled_records(closed)
+
+
+def _reset_pooled_connection(record):
+    """Clear per-borrower callbacks and any open read transaction."""
+    connection = record.connection
+    try:
+        connection.set_progress_handler(None, 0)
+        connection.set_trace_callback(
+            print if record.key[0] == "qcodes" and get_DB_debug() else None
+        )
+        connection.row_factory = None
+        if connection.in_transaction:
+            connection.rollback()
+    except sqlite3.Error:
+        return False
+    return True
+
+
+def _close_pooled_records(records):
+    for record in records:
+        try:
+            record.close()
+        except sqlite3.Error:
+            pass
+
+
 def _qcodes_uri_path(database_path, *, immutable):
     """Build the URI path expected by QCoDeS' URI-constructing helper.
 
@@ -512,7 +817,10 @@ def _require_matching_generated_wal_provenance(database_path, snapshot_path):
             uri=True,
         )
         main_provenance = _generation_provenance(main_connection)
-        snapshot_connection = sqlite3.connect(snapshot_path)
+        snapshot_connection = sqlite3.connect(
+            sqlite_read_only_uri(snapshot_path),
+            uri=True,
+        )
         snapshot_provenance = _generation_provenance(snapshot_connection)
     except (sqlite3.Error, ValueError) as error:
         raise _unverifiable_generated_wal_error(
@@ -539,13 +847,598 @@ def _require_matching_generated_wal_provenance(database_path, snapshot_path):
         )
 
 
+def _link_count(path):
+    try:
+        return path.stat().st_nlink
+    except FileNotFoundError:
+        return 0
+
+
+def _link_or_copy(source_path, target_path):
+    """Share an immutable private file with a view, copying if links fail."""
+    try:
+        os.link(source_path, target_path)
+    except OSError:
+        shutil.copyfile(source_path, target_path)
+
+
+def _copy_file_range(source_file, target_file, start, stop):
+    """Copy ``[start, stop)`` from an open source to the target's position."""
+    source_file.seek(start)
+    remaining = stop - start
+    while remaining > 0:
+        chunk = source_file.read(min(_SNAPSHOT_COPY_CHUNK_BYTES, remaining))
+        if not chunk:
+            raise _SnapshotSourceChanged
+        target_file.write(chunk)
+        remaining -= len(chunk)
+
+
+def _patch_changed_blocks(source_path, target_path, size):
+    """Rewrite only the blocks of a private main copy that differ from source.
+
+    Returns the number of bytes written so callers can tell a checkpoint that
+    touched a few pages from a wholesale rewrite.
+    """
+    written = 0
+    with open(source_path, "rb") as source, open(target_path, "r+b") as target:
+        offset = 0
+        while offset < size:
+            chunk = source.read(min(_SNAPSHOT_COPY_CHUNK_BYTES, size - offset))
+            if not chunk:
+                raise _SnapshotSourceChanged
+            target.seek(offset)
+            if target.read(len(chunk)) != chunk:
+                target.seek(offset)
+                target.write(chunk)
+                written += len(chunk)
+            offset += len(chunk)
+        target.truncate(size)
+    return written
+
+
+def _patch_pages(source_path, target_path, size, page_size, pages):
+    """Rewrite the listed 1-based pages of a private main copy from source."""
+    written = 0
+    with open(source_path, "rb") as source, open(target_path, "r+b") as target:
+        for page in sorted(pages):
+            offset = (page - 1) * page_size
+            if offset >= size:
+                continue
+            source.seek(offset)
+            chunk = source.read(min(page_size, size - offset))
+            if not chunk:
+                raise _SnapshotSourceChanged
+            target.seek(offset)
+            target.write(chunk)
+            written += len(chunk)
+        target.truncate(size)
+    return written
+
+
+def _wal_frames(wal_file, start, frame_bytes, salts, stop=None):
+    """Yield ``(offset, page)`` for consecutive frames carrying ``salts``."""
+    offset = start
+    while stop is None or offset + frame_bytes <= stop:
+        wal_file.seek(offset)
+        header = wal_file.read(_WAL_FRAME_HEADER_BYTES)
+        if len(header) < _WAL_FRAME_HEADER_BYTES or header[8:16] != salts:
+            return
+        yield offset, int.from_bytes(header[:4], "big")
+        offset += frame_bytes
+
+
+def _wal_log_end(wal_file, header, start, stop):
+    """Return where the log started by ``header`` ends, scanning from ``start``.
+
+    After a restart SQLite overwrites the old log from the beginning, so the
+    file can end in frames of the previous log that SQLite ignores.
+    """
+    frame_bytes = _WAL_FRAME_HEADER_BYTES + int.from_bytes(header[8:12], "big")
+    end = start
+    for offset, _page in _wal_frames(wal_file, start, frame_bytes, header[16:24], stop):
+        end = offset + frame_bytes
+    return end
+
+
+@dataclass(slots=True)
+class _SnapshotMainCopy:
+    """One private copy of a source main file and the signature it mirrors."""
+
+    path: Path
+    signature: tuple | None = None
+
+
+def _wal_log_position(wal_file, header, end):
+    """Return what identifies the committed log ending at ``end``.
+
+    Frame headers carry the salts and cumulative checksums, so the WAL
+    header and the last frame header identify every frame before ``end``.
+    """
+    last_frame = b""
+    if len(header) == _WAL_HEADER_BYTES and end > _WAL_HEADER_BYTES:
+        frame_bytes = _WAL_FRAME_HEADER_BYTES + int.from_bytes(header[8:12], "big")
+        wal_file.seek(end - frame_bytes)
+        last_frame = wal_file.read(_WAL_FRAME_HEADER_BYTES)
+    return header, end, last_frame
+
+
+def _wal_log_unchanged(source_path, log_position):
+    """Return whether the source WAL still holds exactly ``log_position``."""
+    header, end, _last_frame = log_position
+    if len(header) != _WAL_HEADER_BYTES:
+        return False
+    try:
+        with open(_wal_path(source_path), "rb") as wal_file:
+            wal_file.seek(0)
+            if wal_file.read(_WAL_HEADER_BYTES) != header:
+                return False
+            if _wal_log_position(wal_file, header, end) != log_position:
+                return False
+            return _wal_log_end(wal_file, header, end, None) == end
+    except FileNotFoundError:
+        return False
+
+
+class _WalSnapshotView:
+    """One connection's lease on a persistent WAL snapshot.
+
+    ``log_position`` identifies the source WAL content the view reflects.
+    """
+
+    def __init__(self, entry, directory, log_position):
+        self._entry = entry
+        self._directory = directory
+        self.log_position = log_position
+        self._released = False
+        self._lock = threading.Lock()
+
+    def cleanup(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        try:
+            self._directory.cleanup()
+        finally:
+            self._entry.release_view()
+
+
+class _WalSnapshotEntry:
+    """Persistent private copy of one live database instance.
+
+    Each connection opens its own view directory holding hard links to a
+    stored main copy and WAL copy, so SQLite builds a private ``-shm`` index
+    for it. SQLite shares that index between connections on the same main
+    inode, so a main copy is only ever linked into one open view at a time;
+    another open view gets an idle copy brought up to date by rewriting the
+    blocks that differ. Stored files are modified in place only while no view
+    links them and are otherwise replaced, leaving open views untouched.
+
+    While the source WAL keeps the header copied last time, it can only have
+    grown: SQLite rewrites the header, including its salts, whenever it
+    restarts the log. Frames checkpointed into the source main file meanwhile
+    are all still present in that WAL, so the stored main state stays valid
+    and only the new WAL tail is copied.
+
+    SQLite only restarts the log once every frame has been checkpointed, so
+    after a single restart the source main differs from the stored one only
+    in pages named by the old log's frames: those copied last time plus any
+    old-salted frames still past them in the source file. Only those pages
+    are rewritten. When that cannot be proven, for example after several
+    restarts or a truncating checkpoint, every block is compared instead.
+
+    Disk use is bounded by ``WAL_SNAPSHOT_STORE_MAX_DATABASES`` databases,
+    each holding a WAL copy and ``WAL_SNAPSHOT_MAIN_COPIES`` main copies,
+    plus one more main copy for each view open at the same time.
+    """
+
+    def __init__(self, database_identity):
+        self.database_identity = database_identity
+        self.directory = tempfile.TemporaryDirectory(prefix="qplot-readonly-")
+        self.lock = threading.Lock()
+        self._opened_views = 0
+        # Views are released from connection finalizers, which the garbage
+        # collector may run on a thread that already holds ``lock``. Releases
+        # therefore only append here, an atomic list operation, and
+        # ``open_view`` folds them into the count under the lock.
+        self._released_views: list[None] = []
+        self.discarded = False
+        self._serial = 0
+        self._main_copies: list[_SnapshotMainCopy] = []
+        self._main_signature: tuple | None = None
+        self._copied_from_source: _SnapshotMainCopy | None = None
+        self._wal_path: Path | None = None
+        self._wal_header = b""
+        self._wal_size = 0
+
+    @property
+    def views(self):
+        return max(0, self._opened_views - len(self._released_views))
+
+    def open_view(self, source_path):
+        """Return a private database path and the source signature it matches.
+
+        The signature is sampled under ``lock`` so readers queued behind a
+        concurrent refresh compare against the source as it is when their
+        turn comes, not as it was when they started waiting.
+        """
+        with self.lock:
+            if self.discarded:
+                raise _SnapshotSourceChanged
+            released = len(self._released_views)
+            del self._released_views[:released]
+            self._opened_views = max(0, self._opened_views - released)
+            source_signature = _source_signature(source_path)
+            if source_signature[0] is None:
+                raise FileNotFoundError(source_path)
+            if source_signature[1] is None:
+                raise _SnapshotSourceChanged
+            try:
+                self._synchronise(source_path, source_signature)
+                if _source_signature(source_path) != source_signature:
+                    raise _SnapshotSourceChanged
+            except BaseException:
+                self._invalidate()
+                raise
+            main = self._idle_main_copy()
+            view = tempfile.TemporaryDirectory(prefix="qplot-readonly-")
+            view_path = Path(view.name) / "database.db"
+            stored_wal_path = self._wal_path
+            assert stored_wal_path is not None
+            try:
+                _link_or_copy(main.path, view_path)
+                _link_or_copy(stored_wal_path, _wal_path(view_path))
+                with open(stored_wal_path, "rb") as wal_file:
+                    log_position = _wal_log_position(
+                        wal_file,
+                        self._wal_header,
+                        self._wal_size,
+                        )
+            except BaseException:
+                view.cleanup()
+                raise
+            self._opened_views += 1
+            self._prune_main_copies()
+        return (
+            view_path,
+            _WalSnapshotView(self, view, log_position),
+            source_signature,
+            )
+
+    def release_view(self):
+        """Record a closed view without taking ``lock``; see ``__init__``."""
+        self._released_views.append(None)
+
+    def discard(self):
+        with self.lock:
+            self.discarded = True
+            self._main_copies.clear()
+            self._main_signature = None
+            self._wal_path = None
+            self.directory.cleanup()
+
+    def _next_path(self, name):
+        self._serial += 1
+        return Path(self.directory.name) / f"{self._serial}-{name}"
+
+    def _invalidate(self):
+        """Forget any copy that may be torn so the next open rebuilds it."""
+        self._wal_header = b""
+        if self._copied_from_source is not None:
+            self._copied_from_source.signature = None
+            self._copied_from_source = None
+        if not any(
+                main.signature == self._main_signature
+                for main in self._main_copies
+                ):
+            self._main_signature = None
+
+    def _synchronise(self, source_path, source_signature):
+        main_signature, wal_signature = source_signature
+        wal_size = wal_signature[2]
+        self._copied_from_source = None
+        with open(_wal_path(source_path), "rb") as wal_file:
+            if self._wal_extends(wal_file, wal_size):
+                self._extend_wal(wal_file, wal_size)
+                return
+            self._copy_source_main(
+                source_path,
+                main_signature,
+                self._checkpointed_pages(wal_file),
+                )
+            wal_file.seek(0)
+            header = wal_file.read(_WAL_HEADER_BYTES)
+            if len(header) == _WAL_HEADER_BYTES:
+                wal_size = _wal_log_end(wal_file, header, _WAL_HEADER_BYTES, wal_size)
+            wal_path = self._next_path("database.db-wal")
+            try:
+                with open(wal_path, "wb") as target:
+                    _copy_file_range(wal_file, target, 0, wal_size)
+            except BaseException:
+                wal_path.unlink(missing_ok=True)
+                raise
+        if self._wal_path is not None:
+            self._wal_path.unlink(missing_ok=True)
+        self._wal_path = wal_path
+        self._wal_header = header
+        self._wal_size = wal_size
+
+    def _wal_extends(self, wal_file, wal_size):
+        """Return whether the source WAL is the stored WAL plus new frames."""
+        if (
+                self._main_signature is None
+                or self._wal_path is None
+                or len(self._wal_header) != _WAL_HEADER_BYTES
+                or wal_size < self._wal_size
+                ):
+            return False
+        wal_file.seek(0)
+        if wal_file.read(_WAL_HEADER_BYTES) != self._wal_header:
+            return False
+        frame_bytes = (
+            _WAL_FRAME_HEADER_BYTES
+            + int.from_bytes(self._wal_header[8:12], "big")
+        )
+        copied_frame_bytes = self._wal_size - _WAL_HEADER_BYTES
+        if copied_frame_bytes % frame_bytes:
+            return False
+        if copied_frame_bytes == 0:
+            return True
+        # Frame headers carry the salts and cumulative checksums, so an
+        # unchanged last frame header proves every earlier frame is unchanged.
+        last_frame = self._wal_size - frame_bytes
+        wal_file.seek(last_frame)
+        source_frame = wal_file.read(_WAL_FRAME_HEADER_BYTES)
+        with open(self._wal_path, "rb") as stored:
+            stored.seek(last_frame)
+            return stored.read(_WAL_FRAME_HEADER_BYTES) == source_frame
+
+    def _extend_wal(self, wal_file, wal_size):
+        stored_path = self._wal_path
+        assert stored_path is not None
+        wal_size = _wal_log_end(wal_file, self._wal_header, self._wal_size, wal_size)
+        if wal_size == self._wal_size:
+            return
+        wal_path = stored_path
+        if _link_count(stored_path) > 1:
+            wal_path = self._next_path("database.db-wal")
+            shutil.copyfile(stored_path, wal_path)
+        # Mark the copy unusable until the append is known to be complete.
+        self._wal_header, header = b"", self._wal_header
+        try:
+            with open(wal_path, "r+b") as target:
+                target.seek(self._wal_size)
+                _copy_file_range(wal_file, target, self._wal_size, wal_size)
+        except BaseException:
+            if wal_path != stored_path:
+                wal_path.unlink(missing_ok=True)
+            raise
+        if wal_path != stored_path:
+            stored_path.unlink(missing_ok=True)
+        self._wal_path = wal_path
+        self._wal_header = header
+        self._wal_size = wal_size
+
+    def _checkpointed_pages(self, wal_file):
+        """Return ``(page_size, pages)`` the source main may have changed in.
+
+        Returns None unless the source WAL restarted exactly once since the
+        stored copy and every frame of the previous log is still accounted for.
+        """
+        old_header = self._wal_header
+        if (
+                self._main_signature is None
+                or self._wal_path is None
+                or len(old_header) != _WAL_HEADER_BYTES
+                ):
+            return None
+        wal_file.seek(0)
+        header = wal_file.read(_WAL_HEADER_BYTES)
+        if len(header) != _WAL_HEADER_BYTES or header[8:12] != old_header[8:12]:
+            return None
+        checkpoint = int.from_bytes(old_header[12:16], "big")
+        if int.from_bytes(header[12:16], "big") != (checkpoint + 1) % 2**32:
+            return None
+
+        page_size = int.from_bytes(header[8:12], "big")
+        frame_bytes = _WAL_FRAME_HEADER_BYTES + page_size
+        copied_end = self._wal_size
+
+        # The new log overwrites the old one from the start. Old frames past
+        # the copied ones survive only while the new log has not reached them.
+        end = _wal_log_end(wal_file, header, _WAL_HEADER_BYTES, None)
+        wal_file.seek(0, os.SEEK_END)
+        if end > copied_end or wal_file.tell() <= end:
+            return None
+        pages = {
+            page
+            for _offset, page in _wal_frames(
+                wal_file,
+                copied_end,
+                frame_bytes,
+                old_header[16:24],
+                )
+            }
+        if _wal_log_end(wal_file, header, _WAL_HEADER_BYTES, None) > copied_end:
+            return None
+        with open(self._wal_path, "rb") as stored:
+            pages.update(
+                page
+                for _offset, page in _wal_frames(
+                    stored,
+                    _WAL_HEADER_BYTES,
+                    frame_bytes,
+                    old_header[16:24],
+                    stop=copied_end,
+                    )
+                )
+        return page_size, pages
+
+    def _copy_source_main(self, source_path, main_signature, changed_pages=None):
+        """Make sure one stored main copy mirrors the source main file."""
+        previous_signature = self._main_signature
+        self._main_signature = main_signature
+        if any(main.signature == main_signature for main in self._main_copies):
+            return
+        idle = [
+            candidate
+            for candidate in self._main_copies
+            if _link_count(candidate.path) == 1
+        ]
+        # Only a copy of the previous main state can be patched page by page.
+        main = next(
+            (
+                candidate
+                for candidate in idle
+                if changed_pages is not None
+                and candidate.signature == previous_signature
+            ),
+            None,
+        )
+        if main is None:
+            changed_pages = None
+            main = idle[0] if idle else None
+        if main is None:
+            main = _SnapshotMainCopy(self._next_path("database.db"))
+            self._main_copies.append(main)
+        self._copied_from_source = main
+        self._write_main_copy(main, source_path, main_signature, changed_pages)
+
+    def _idle_main_copy(self):
+        """Return a copy of the current main state that no open view links."""
+        current = [
+            main
+            for main in self._main_copies
+            if main.signature == self._main_signature
+        ]
+        for main in current:
+            if _link_count(main.path) == 1:
+                return main
+        reference = current[0].path
+        idle = next(
+            (
+                candidate
+                for candidate in self._main_copies
+                if _link_count(candidate.path) == 1
+            ),
+            None,
+        )
+        if idle is None:
+            idle = _SnapshotMainCopy(self._next_path("database.db"))
+            self._main_copies.append(idle)
+        self._write_main_copy(idle, reference, self._main_signature)
+        return idle
+
+    def _write_main_copy(
+            self,
+            main,
+            reference_path,
+            main_signature,
+            changed_pages=None,
+            ):
+        main.signature = None
+        if main.path.exists() and changed_pages is not None:
+            page_size, pages = changed_pages
+            _patch_pages(
+                reference_path,
+                main.path,
+                main_signature[2],
+                page_size,
+                pages,
+                )
+        elif main.path.exists():
+            _patch_changed_blocks(reference_path, main.path, main_signature[2])
+        else:
+            with (
+                    open(reference_path, "rb") as source,
+                    open(main.path, "wb") as target,
+                    ):
+                _copy_file_range(source, target, 0, main_signature[2])
+        main.signature = main_signature
+
+    def _prune_main_copies(self):
+        """Delete idle copies beyond the spare budget once views close."""
+        for main in list(self._main_copies):
+            if len(self._main_copies) <= WAL_SNAPSHOT_MAIN_COPIES:
+                return
+            if _link_count(main.path) == 1 and (
+                    main.signature != self._main_signature
+                    or sum(
+                        other.signature == self._main_signature
+                        for other in self._main_copies
+                    ) > 1
+                    ):
+                main.path.unlink(missing_ok=True)
+                self._main_copies.remove(main)
+
+
+def _wal_snapshot_entry(database_path, database_identity):
+    """Return the persistent snapshot for one database path and identity."""
+    discarded = []
+    with _WAL_SNAPSHOT_STORE_LOCK:
+        entry = _WAL_SNAPSHOT_STORE.get(database_path)
+        if entry is not None and entry.database_identity != database_identity:
+            discarded.append(_WAL_SNAPSHOT_STORE.pop(database_path))
+            entry = None
+        if entry is None:
+            entry = _WalSnapshotEntry(database_identity)
+            _WAL_SNAPSHOT_STORE[database_path] = entry
+        _WAL_SNAPSHOT_STORE.move_to_end(database_path)
+        while len(_WAL_SNAPSHOT_STORE) > WAL_SNAPSHOT_STORE_MAX_DATABASES:
+            # The requested entry is the most recent and never evicted, even
+            # when every older database still has open views.
+            others = [
+                path
+                for path in _WAL_SNAPSHOT_STORE
+                if path != database_path
+            ]
+            idle = next(
+                (
+                    path
+                    for path in others
+                    if _WAL_SNAPSHOT_STORE[path].views == 0
+                ),
+                others[0],
+            )
+            discarded.append(_WAL_SNAPSHOT_STORE.pop(idle))
+    for stale in discarded:
+        stale.discard()
+    return entry
+
+
+def release_wal_snapshots(database_path=None):
+    """Delete qPlot's persistent private WAL copies.
+
+    Open connections keep their own views and are unaffected. Without a path,
+    every stored database copy is released.
+    """
+    with _WAL_SNAPSHOT_STORE_LOCK:
+        if database_path is None:
+            released = list(_WAL_SNAPSHOT_STORE.values())
+            _WAL_SNAPSHOT_STORE.clear()
+        else:
+            entry = _WAL_SNAPSHOT_STORE.pop(
+                _resolved_database_path(database_path),
+                None,
+            )
+            released = [] if entry is None else [entry]
+    for entry in released:
+        entry.discard()
+
+
 def _prepare_read_target(
         database_path,
         *,
         ignore_unpaired_wal=False,
         expected_database_identity=None,
     ):
-    """Select immutable static access or make a stable private WAL snapshot."""
+    """Select immutable static access or a stable private WAL snapshot.
+
+    WAL snapshots come from a persistent per-database store, so a refresh
+    copies only WAL frames written since the previous read rather than the
+    whole main file.
+    """
     _require_publication_complete(database_path)
     if not database_path.is_file():
         raise FileNotFoundError(database_path)
@@ -610,16 +1503,12 @@ def _prepare_read_target(
                 False,
             )
 
-        snapshot = tempfile.TemporaryDirectory(prefix="qplot-readonly-")
-        snapshot_path = Path(snapshot.name) / "database.db"
+        entry = _wal_snapshot_entry(database_path, prepared_database_identity)
         try:
-            shutil.copyfile(database_path, snapshot_path)
-            shutil.copyfile(wal_path, _wal_path(snapshot_path))
-        except FileNotFoundError:
-            snapshot.cleanup()
+            snapshot_path, snapshot, before = entry.open_view(database_path)
+        except (FileNotFoundError, _SnapshotSourceChanged):
             continue
         except OSError as err:
-            snapshot.cleanup()
             raise ReadOnlyDatabaseAccessError(
                 f"Could not copy a read-only view of {database_path}: {err}"
                 ) from err
@@ -696,3 +1585,4 @@ def _attach_snapshot_cleanup(conn, snapshot):
 
     conn.close = close_snapshot
     conn._qplot_snapshot_finalizer = finalizer
+    conn._qplot_wal_log_position = snapshot.log_position
@@ -0,0 +1,284 @@
+"""
+Persistent catalog of the derived metadata of completed runs.
+
+Opening a database fills the run table in background passes that count
+result rows, infer setpoint shapes from the result columns and sum storage
+pages with ``dbstat``. Completed runs never change, so the fields these passes
+derive are also kept in one qPlot-owned JSON file per database under
+``~/.qplot/run_catalog``. The database itself is never written.
+
+Entries are keyed by run GUID and hold the fields of each pass separately.
+A catalog belongs to one database file instance and is emptied when the file
+at its path is replaced. An entry is only used while its run is completed and
+the highest rowid of its result table is unchanged. That rowid is the cheap
+stand-in for the result count, which would otherwise need the very
+``COUNT(*)`` the catalog avoids.
+
+The run table keeps the token dictionaries of its search index in a companion
+file next to the catalog, which is evicted together with it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from qplot.datahandling.file_identity import (
+    canonical_database_path,
+    database_file_identity,
+)
+from qplot.diagnostics import get_logger
+
+RUN_CATALOG_VERSION = 1
+RUN_CATALOG_MAX_FILES = 32
+RUN_CATALOG_SUFFIX = ".json"
+RUN_SEARCH_INDEX_SUFFIX = ".index.npz"
+RUN_CATALOG_FIELDS = (
+    "result_count",
+    "expected_results",
+    "expected_results_source",
+    "read_setpoint_count",
+    "point_shape",
+    "setpoint_shape",
+    "setpoint_shape_source",
+    "setpoint_count",
+    "setpoint_count_source",
+    "storage_bytes",
+    "storage_bytes_estimated",
+    )
+
+_catalogs: "dict[str, RunCatalog]" = {}
+_catalogs_lock = threading.Lock()
+
+
+def default_run_catalog_directory() -> Path:
+    """
+    Returns qPlot's default run catalog directory.
+
+    """
+    return Path.home() / ".qplot" / "run_catalog"
+
+
+def run_catalog(database_path) -> "RunCatalog | None":
+    """
+    Returns the process-wide catalog of a database file.
+
+    Workers of one database share the catalog, so the passes they record end
+    up in the same file.
+
+    Returns
+    -------
+    catalog : RunCatalog | None
+        None when the file has no stable identity, in which case nothing is
+        cached.
+
+    """
+    identity = database_file_identity(database_path)
+    if identity is None:
+        return None
+
+    path = canonical_database_path(database_path)
+    with _catalogs_lock:
+        catalog = _catalogs.get(path)
+        if catalog is None or catalog.database_identity != list(identity):
+            catalog = RunCatalog(default_run_catalog_directory(), path, identity)
+            _catalogs[path] = catalog
+        return catalog
+
+
+class RunCatalog:
+    """
+    Derived metadata of one database's completed runs.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding the catalog files. It is created on the first save.
+    database_path : str
+        Canonical path of the database. It names the catalog file.
+    database_identity : tuple
+        Identity of the database file instance the entries belong to.
+
+    """
+
+    def __init__(self, directory, database_path, database_identity):
+        self.directory = Path(directory)
+        self.database_path = str(database_path)
+        self.database_identity = list(database_identity)
+        key = f"{RUN_CATALOG_VERSION}\0{self.database_path}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        self.path = self.directory / f"{digest}{RUN_CATALOG_SUFFIX}"
+        self.index_path = self.directory / f"{digest}{RUN_SEARCH_INDEX_SUFFIX}"
+        self._lock = threading.Lock()
+        self._runs: dict[str, dict] | None = None
+        self._dirty = False
+
+
+    def lookup(self, completed_runs, section) -> dict:
+        """
+        Return the fields one pass recorded for runs that are still unchanged.
+
+        Parameters
+        ----------
+        completed_runs : dict{int: tuple[str, int | None]}
+            ``(guid, max_rowid)`` of the completed runs, as returned by
+            ``get_completed_run_rowids``.
+        section : str
+            The pass, such as ``"details"``, ``"shapes"`` or ``"storage"``.
+
+        Returns
+        -------
+        cached : dict{int: dict}
+            The run's GUID and recorded fields for every catalogued run. A
+            run whose pass derived nothing maps to just its GUID.
+
+        """
+        cached = {}
+        with self._lock:
+            runs = self._loaded_runs()
+            for run_id, (guid, max_rowid) in completed_runs.items():
+                entry = runs.get(guid)
+                if entry is None or entry.get("max_rowid") != max_rowid:
+                    continue
+                fields = entry.get(section)
+                if isinstance(fields, dict):
+                    cached[run_id] = {"guid": guid, **fields}
+        return cached
+
+
+    def record(self, completed_runs, section, run_ids, rows) -> None:
+        """
+        Keep the fields a pass derived for the completed runs among ``run_ids``.
+
+        Runs without a row in ``rows`` are recorded as having no fields, so the
+        pass is skipped for them next time as well.
+
+        """
+        with self._lock:
+            runs = self._loaded_runs()
+            for run_id in run_ids:
+                completed = completed_runs.get(run_id)
+                if completed is None:
+                    continue
+                guid, max_rowid = completed
+                entry = runs.get(guid)
+                if entry is None or entry.get("max_rowid") != max_rowid:
+                    entry = {"max_rowid": max_rowid}
+                    runs[guid] = entry
+                metadata = rows.get(run_id) or {}
+                entry[section] = {
+                    field: metadata[field]
+                    for field in RUN_CATALOG_FIELDS
+                    if field in metadata
+                    }
+                self._dirty = True
+
+
+    def save(self) -> bool:
+        """
+        Write recorded entries to disk atomically.
+
+        Write failures are logged and otherwise ignored.
+
+        Returns
+        -------
+        saved : bool
+            Whether the file was written.
+
+        """
+        with self._lock:
+            if not self._dirty or self._runs is None:
+                return False
+            payload = json.dumps({
+                "version": RUN_CATALOG_VERSION,
+                "database_path": self.database_path,
+                "database_identity": self.database_identity,
+                "runs": self._runs,
+                })
+            self._dirty = False
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(
+                dir=self.directory,
+                prefix=".catalog-",
+                suffix=".tmp",
+                )
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as file:
+                    file.write(payload)
+                os.replace(temp_name, self.path)
+            except BaseException:
+                _remove(Path(temp_name))
+                raise
+        except (OSError, ValueError) as error:
+            get_logger(__name__).warning(
+                "Could not save the run catalog of %s: %s",
+                self.database_path,
+                error,
+                )
+            return False
+
+        self.evict()
+        return True
+
+
+    def _loaded_runs(self) -> dict[str, dict]:
+        """Read the catalog file once, keeping it only for this file instance."""
+        if self._runs is not None:
+            return self._runs
+
+        self._runs = {}
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                stored = json.load(file)
+        except FileNotFoundError:
+            return self._runs
+        except (OSError, ValueError):
+            _remove(self.path)
+            return self._runs
+
+        if (
+                isinstance(stored, dict)
+                and stored.get("version") == RUN_CATALOG_VERSION
+                and stored.get("database_path") == self.database_path
+                and stored.get("database_identity") == self.database_identity
+                and isinstance(stored.get("runs"), dict)
+                ):
+            self._runs = stored["runs"]
+        return self._runs
+
+
+    def evict(self) -> None:
+        """
+        Remove the least recently saved databases' files beyond the file limit.
+
+        A catalog and its search index count as one database.
+
+        """
+        databases: dict[str, tuple[float, list[Path]]] = {}
+        try:
+            for item in os.scandir(self.directory):
+                for suffix in (RUN_SEARCH_INDEX_SUFFIX, RUN_CATALOG_SUFFIX):
+                    if item.name.endswith(suffix):
+                        digest = item.name.removesuffix(suffix)
+                        mtime, paths = databases.get(digest, (0.0, []))
+                        paths.append(Path(item.path))
+                        databases[digest] = (max(mtime, item.stat().st_mtime), paths)
+                        break
+        except OSError:
+            return
+
+        entries = sorted(databases.values(), key=lambda entry: entry[0], reverse=True)
+        for _mtime, paths in entries[RUN_CATALOG_MAX_FILES:]:
+            for path in paths:
+                _remove(path)
+
+
+def _remove(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
@@ -20,9 +20,6 @@ from pathlib import Path
 from time import perf_counter
 
 import numpy as np
-from qcodes.dataset import Measurement, new_experiment
-from qcodes.dataset.sqlite.database import connect
-from qcodes.parameters import ManualParameter
 
 from qplot.datahandling.file_identity import (
     QPLOT_GENERATED_DATABASE_APPLICATION_ID,
@@ -385,6 +382,8 @@ def _qcodes_uri_name(database_path):
 
 def _connect_writable_exact_path(database_path):
     """Open an exact generator-owned path with QCoDeS' writable connector."""
+    from qcodes.dataset.sqlite.database import connect
+
     return connect(_qcodes_uri_name(database_path))
 
 
@@ -586,6 +585,9 @@ def _write_run(
         random_generator,
         cancelled_callback=None,
         ):
+    from qcodes.dataset import Measurement
+    from qcodes.parameters import ManualParameter
+
     _raise_if_cancelled(cancelled_callback)
     v_sd = ManualParameter("V_SD", label="Source-drain voltage", unit="V")
     measured = ManualParameter(
@@ -1084,6 +1086,8 @@ def generate_database(
         publication_callback=None,
         ):
     """Generate a database and optionally observe its publication boundary."""
+    from qcodes.dataset import new_experiment
+
     specifications = list(specifications)
     if not specifications:
         raise SpecificationError("At least one run specification is required")
@@ -1,13 +1,41 @@
-from .general import (
-    data2matrix,
-    unpack_param,
-)
-from .worker import (
-    loader,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .general import (
+        data2matrix,
+        unpack_param,
+    )
+    from .worker import (
+        loader,
+    )
 
 __all__ = [
     "data2matrix",
     "unpack_param",
     "loader",
-    ]
\ No newline at end of file
+    ]
+
+_EXPORT_MODULES = {
+    "data2matrix": "general",
+    "unpack_param": "general",
+    "loader": "worker",
+    }
+
+
+def __getattr__(name):
+    """
+    Import the data tools on first use.
+
+    They import pandas and QCoDeS, while the lightweight tool modules of this
+    package are also used by the main window at startup.
+
+    """
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,136 @@
+"""
+Size-bounded directories of ``.npz`` cache files.
+
+The preview cache and the heatmap pyramid cache both keep one ``.npz`` file
+per entry under ``~/.qplot``. ``NpzDiskCache`` owns what they share: atomic
+writes through a temporary file, the running total of file sizes, and
+least-recently-used eviction once that total exceeds ``max_bytes``. Readers
+touch a file's modification time when they use it, which is the recency the
+eviction order follows.
+"""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+NPZ_DISK_CACHE_EVICT_RATIO = 0.9
+NPZ_DISK_CACHE_SUFFIX = ".npz"
+
+
+def qplot_cache_directory(name: str) -> Path:
+    """
+    Returns the directory of one of qPlot's caches under ``~/.qplot``.
+
+    """
+    return Path.home() / ".qplot" / name
+
+
+class NpzDiskCache:
+    """
+    Directory of ``.npz`` files evicted least recently used first.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding the cache files. It is created on the first write.
+    max_bytes : int
+        Total file size above which the least recently used files are removed.
+
+    """
+
+    temp_prefix = ".cache-"
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+
+    def write_entry(self, path: Path, arrays) -> None:
+        """Write ``arrays`` to ``path`` atomically, then evict if over budget."""
+        self._account(self._write(path, arrays))
+
+
+    def touch(self, path: Path) -> None:
+        """Mark an entry as recently used."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+    def _write(self, path: Path, arrays) -> int:
+        """Write ``arrays`` to ``path`` atomically and return the size change."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = 0
+
+        handle, temp_name = tempfile.mkstemp(
+            dir=self.directory,
+            prefix=self.temp_prefix,
+            suffix=".tmp",
+            )
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temp_name, path)
+        except BaseException:
+            self._remove(Path(temp_name))
+            raise
+        return path.stat().st_size - previous
+
+
+    def _account(self, written: int) -> None:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _mtime, size, _path in self._entries())
+            else:
+                self._total_bytes += written
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until below the eviction target."""
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, size, _path in entries)
+        target = self.max_bytes * NPZ_DISK_CACHE_EVICT_RATIO
+        for _mtime, size, path in entries:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+        self._total_bytes = total
+
+
+    def _entries(self):
+        try:
+            scanned = list(os.scandir(self.directory))
+        except OSError:
+            return []
+
+        entries = []
+        for item in scanned:
+            if not item.name.endswith(NPZ_DISK_CACHE_SUFFIX):
+                continue
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+        return entries
+
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+        except OSError:
+            return False
+        return True
@@ -9,34 +9,62 @@ def data2matrix(indep1 : ArrayLike,
                 depvar : ArrayLike,
                 ):
     """
-    Converts 3 numpy.ndarry into a datagrid via pandas.DataFrame.
+    Converts 3 numpy.ndarry into a datagrid held in a pandas.DataFrame.
     This is used for producing a data grid to be passed to a heatmap, also 
     handles numpy.Nan values in depvar and duplicates
 
+    The grid matches ``DataFrame.pivot_table`` with its default mean
+    aggregation: duplicate points are averaged, NaN values are ignored, NaN
+    coordinates are dropped, and rows or columns with no non-NaN value are
+    omitted. It is built with ``np.unique`` and ``np.bincount`` rather than
+    pandas' groupby machinery.
+
     Parameters
     ----------
     indep1 : np.array
-        Array to be placed in the pandas.DataFrame index column.
+        Values that become the DataFrame index.
     indep2 : np.array
-        Array to be placed in the pandas.DataFrame header row.
+        Values that become the DataFrame columns.
     depvar : np.array
-        Array to take up the .
+        Values averaged into each (indep1, indep2) cell.
 
     Returns
     -------
     matrix : pandas.DataFrame
-        The data frame containing all 3 inputted arrays as a dataframe.
+        Grid of float values with sorted unique indep1 as its index and 
+        sorted unique indep2 as its columns. Empty cells are numpy.NaN.
 
     """
-    # convert to 3 column dataframe
-    df = pd.DataFrame({
-        'indep1': indep1,
-        'indep2': indep2,
-        'depvar': depvar
-    })
-    # convert dataframe to grid
-    matrix = df.pivot_table(index='indep1', columns='indep2', values='depvar', fill_value=np.nan)
-    return matrix
+    indep1 = np.asarray(indep1).ravel()
+    indep2 = np.asarray(indep2).ravel()
+    depvar = np.asarray(depvar, dtype=float).ravel()
+
+    keep = ~np.isnan(depvar)
+    for keys in (indep1, indep2):
+        if keys.dtype.kind in "fc":
+            keep &= ~np.isnan(keys)
+    if not keep.all():
+        indep1 = indep1[keep]
+        indep2 = indep2[keep]
+        depvar = depvar[keep]
+
+    rows, row_index = np.unique(indep1, return_inverse=True)
+    columns, column_index = np.unique(indep2, return_inverse=True)
+    cell_index = row_index * columns.size + column_index
+    cell_count = rows.size * columns.size
+
+    sums = np.bincount(cell_index, weights=depvar, minlength=cell_count)
+    counts = np.bincount(cell_index, minlength=cell_count)
+    grid = np.full(cell_count, np.nan)
+    filled = counts > 0
+    np.divide(sums, counts, out=grid, where=filled)
+
+    return pd.DataFrame(
+        grid.reshape(rows.size, columns.size),
+        index=pd.Index(rows, name='indep1'),
+        columns=pd.Index(columns, name='indep2'),
+        copy=False,
+        )
 
 
 def unpack_param(dataset : dataset.data_set.DataSet, paramName : str):
@@ -0,0 +1,345 @@
+"""
+Rectangle statistics over heatmap grids.
+
+The heatmap marquee reports the count, mean, standard deviation and range of
+the finite cells it covers, and can zoom the colour scale to that range.
+Reducing the selected block on every drag update touches millions of cells on
+large maps. The heatmap window builds a :class:`GridStats` on the first
+marquee query after its grid changes, so refreshes without a marquee do not
+pay for it. It keeps summed-area tables of the finite count, sum and sum of
+squares, and a sparse table of tile minima and maxima. A rectangle query then
+combines a few table lookups with a direct reduction of the cells along its
+edges that do not fill a whole tile.
+
+Table memory is bounded. Grids with more than ``GRID_STATS_MAX_TABLE_CELLS``
+cells sum over 2x2 tiles or larger, and ranges always use
+``GRID_STATS_RANGE_TILE`` square tiles, so the edge cells a query reduces
+grow with the rectangle's perimeter rather than its area.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+GRID_STATS_MAX_TABLE_CELLS = 1 << 22
+GRID_STATS_RANGE_TILE = 32
+# Blocks this small are reduced directly, which is exact and just as fast.
+GRID_STATS_DIRECT_CELLS = 1 << 14
+
+
+@dataclass(frozen=True)
+class BlockStats:
+    """
+    Summary of the finite cells in one grid block.
+
+    The ``mean``, ``std``, ``max`` and ``min`` methods mirror the array
+    reductions the marquee summary formats, so either can be passed to it.
+    """
+
+    shape: tuple[int, int]
+    size: int
+    average: float
+    deviation: float
+    low: float
+    high: float
+
+
+    @classmethod
+    def from_values(cls, shape: tuple[int, int], values: np.ndarray) -> "BlockStats | None":
+        """Summarise finite ``values`` directly, or return None without any."""
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return None
+        return cls(
+            shape,
+            int(values.size),
+            float(values.mean()),
+            float(values.std()),
+            float(values.min()),
+            float(values.max()),
+            )
+
+
+    def mean(self) -> float:
+        return self.average
+
+
+    def std(self) -> float:
+        return self.deviation
+
+
+    def min(self) -> float:
+        return self.low
+
+
+    def max(self) -> float:
+        return self.high
+
+
+class GridStats:
+    """
+    Summed-area and range tables of one 2D grid.
+
+    Parameters
+    ----------
+    grid : array_like
+        The heatmap values, indexed ``[row, column]``. Non-finite cells are
+        left out of every statistic. The tables keep their own copy, so later
+        changes to ``grid`` do not reach them.
+
+    """
+
+    def __init__(self, grid: npt.ArrayLike) -> None:
+        self.source = grid
+        values = np.array(grid, dtype=float)
+        if values.ndim != 2:
+            raise ValueError("Grid statistics need a 2D grid.")
+        self.grid = values
+        finite = np.isfinite(values)
+
+        # Sums are taken about the grid mean so that sums of squares of maps
+        # with a large offset keep their precision.
+        self.offset = float(values[finite].mean()) if finite.any() else 0.0
+        self.sum_tile = 1
+        while values.size > GRID_STATS_MAX_TABLE_CELLS * self.sum_tile**2:
+            self.sum_tile *= 2
+        centred = np.where(finite, values - self.offset, 0.0)
+        self._count = _summed_area(_tile_reduce(finite.astype(np.int64), self.sum_tile, np.add))
+        self._sum = _summed_area(_tile_reduce(centred, self.sum_tile, np.add))
+        self._squares = _summed_area(_tile_reduce(np.square(centred), self.sum_tile, np.add))
+        del centred
+
+        tile = GRID_STATS_RANGE_TILE
+        self._low = _sparse_table(
+            _tile_reduce(np.where(finite, values, np.inf), tile, np.minimum, np.inf),
+            np.minimum,
+            )
+        self._high = _sparse_table(
+            _tile_reduce(np.where(finite, values, -np.inf), tile, np.maximum, -np.inf),
+            np.maximum,
+            )
+
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        rows, columns = self.grid.shape
+        return rows, columns
+
+
+    def matches(self, grid: object) -> bool:
+        """Return whether the tables were built from exactly this grid."""
+        return self.source is grid
+
+
+    def block(self, rows: slice, columns: slice) -> BlockStats | None:
+        """
+        Return statistics of the finite cells in ``grid[rows, columns]``.
+
+        Returns
+        -------
+        stats : BlockStats | None
+            The block summary, or None for a block without finite cells.
+
+        Raises
+        ------
+        ValueError
+            If either slice has a step other than one.
+
+        """
+        row_start, row_stop = _bounds(rows, self.grid.shape[0])
+        column_start, column_stop = _bounds(columns, self.grid.shape[1])
+        shape = (row_stop - row_start, column_stop - column_start)
+        if shape[0] * shape[1] <= GRID_STATS_DIRECT_CELLS:
+            return BlockStats.from_values(
+                shape,
+                self.grid[row_start:row_stop, column_start:column_stop],
+                )
+
+        count, total, squares = self._sums(row_start, row_stop, column_start, column_stop)
+        if count == 0:
+            return None
+        low, high = self._range(row_start, row_stop, column_start, column_stop)
+        mean = total / count
+        variance = max(squares / count - mean * mean, 0.0)
+        return BlockStats(
+            shape,
+            count,
+            self.offset + mean,
+            float(np.sqrt(variance)),
+            low,
+            high,
+            )
+
+
+    def _sums(
+            self,
+            row_start: int,
+            row_stop: int,
+            column_start: int,
+            column_stop: int,
+            ) -> tuple[int, float, float]:
+        count = 0
+        total = 0.0
+        squares = 0.0
+        inner, edges = _split_block(
+            row_start,
+            row_stop,
+            column_start,
+            column_stop,
+            self.sum_tile,
+            )
+        if inner is not None:
+            count += int(_area(self._count, *inner))
+            total += float(_area(self._sum, *inner))
+            squares += float(_area(self._squares, *inner))
+        for edge in edges:
+            values = self.grid[edge]
+            values = values[np.isfinite(values)] - self.offset
+            count += int(values.size)
+            total += float(values.sum())
+            squares += float(np.square(values).sum())
+        return count, total, squares
+
+
+    def _range(
+            self,
+            row_start: int,
+            row_stop: int,
+            column_start: int,
+            column_stop: int,
+            ) -> tuple[float, float]:
+        inner, edges = _split_block(
+            row_start,
+            row_stop,
+            column_start,
+            column_stop,
+            GRID_STATS_RANGE_TILE,
+            )
+        low = np.inf
+        high = -np.inf
+        if inner is not None:
+            low = _sparse_query(self._low, np.minimum, *inner)
+            high = _sparse_query(self._high, np.maximum, *inner)
+        for edge in edges:
+            values = self.grid[edge]
+            values = values[np.isfinite(values)]
+            if values.size:
+                low = min(low, float(values.min()))
+                high = max(high, float(values.max()))
+        return float(low), float(high)
+
+
+def _bounds(index: slice, length: int) -> tuple[int, int]:
+    start, stop, step = index.indices(length)
+    if step != 1:
+        raise ValueError("Grid statistics need contiguous slices.")
+    return start, max(start, stop)
+
+
+def _tile_reduce(
+        values: np.ndarray,
+        tile: int,
+        reduce: np.ufunc,
+        fill: float = 0,
+        ) -> np.ndarray:
+    if tile == 1:
+        return values
+    rows, columns = values.shape
+    padded_shape = (-(-rows // tile) * tile, -(-columns // tile) * tile)
+    if padded_shape != values.shape:
+        padded = np.full(padded_shape, fill, dtype=values.dtype)
+        padded[:rows, :columns] = values
+        values = padded
+    tiles = values.reshape(padded_shape[0] // tile, tile, padded_shape[1] // tile, tile)
+    # Reducing across rows first keeps the inner loops long and contiguous.
+    return reduce.reduce(reduce.reduce(tiles, axis=1), axis=2)
+
+
+def _summed_area(values: np.ndarray) -> np.ndarray:
+    table = np.zeros((values.shape[0] + 1, values.shape[1] + 1), dtype=values.dtype)
+    np.cumsum(values, axis=0, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+    return table
+
+
+def _area(table: np.ndarray, row_start: int, row_stop: int, column_start: int, column_stop: int):
+    return (
+        table[row_stop, column_stop]
+        - table[row_start, column_stop]
+        - table[row_stop, column_start]
+        + table[row_start, column_start]
+        )
+
+
+def _sparse_table(values: np.ndarray, reduce: np.ufunc) -> list[list[np.ndarray]]:
+    """Return ``table[a][b]``, the reduction over ``2**a x 2**b`` tile blocks."""
+    table = []
+    rows = values
+    while True:
+        row = [rows]
+        columns = rows
+        step = 1
+        while columns.shape[1] > step:
+            columns = reduce(columns[:, :-step], columns[:, step:])
+            row.append(columns)
+            step *= 2
+        table.append(row)
+        step = 1 << (len(table) - 1)
+        if rows.shape[0] <= step:
+            return table
+        rows = reduce(rows[:-step], rows[step:])
+
+
+def _sparse_query(
+        table: list[list[np.ndarray]],
+        reduce: np.ufunc,
+        row_start: int,
+        row_stop: int,
+        column_start: int,
+        column_stop: int,
+        ) -> float:
+    row_level = (row_stop - row_start).bit_length() - 1
+    column_level = (column_stop - column_start).bit_length() - 1
+    level = table[row_level][column_level]
+    row_end = row_stop - (1 << row_level)
+    column_end = column_stop - (1 << column_level)
+    return float(reduce.reduce([
+        level[row_start, column_start],
+        level[row_end, column_start],
+        level[row_start, column_end],
+        level[row_end, column_end],
+        ]))
+
+
+def _split_block(
+        row_start: int,
+        row_stop: int,
+        column_start: int,
+        column_stop: int,
+        tile: int,
+        ) -> tuple[tuple[int, int, int, int] | None, list[tuple[slice, slice]]]:
+    """
+    Split a block into whole tiles and the edge cells around them.
+
+    Returns the inner tile rectangle as ``(row_start, row_stop, column_start,
+    column_stop)`` in tile units, or None when no tile fits, and the cell
+    slices of the edges. Without whole tiles the block is one edge.
+    """
+    inner_rows = (-(-row_start // tile), row_stop // tile)
+    inner_columns = (-(-column_start // tile), column_stop // tile)
+    if inner_rows[0] >= inner_rows[1] or inner_columns[0] >= inner_columns[1]:
+        return None, [(slice(row_start, row_stop), slice(column_start, column_stop))]
+
+    top, bottom = inner_rows[0] * tile, inner_rows[1] * tile
+    left, right = inner_columns[0] * tile, inner_columns[1] * tile
+    edges = [
+        (slice(row_start, top), slice(column_start, column_stop)),
+        (slice(bottom, row_stop), slice(column_start, column_stop)),
+        (slice(top, bottom), slice(column_start, left)),
+        (slice(top, bottom), slice(right, column_stop)),
+        ]
+    return (*inner_rows, *inner_columns), [
+        edge for edge in edges
+        if edge[0].start < edge[0].stop and edge[1].start < edge[1].stop
+        ]
@@ -7,7 +7,6 @@ centres, while the derived edges are pixel boundaries.
 
 import math
 import operator
-from bisect import bisect_left, bisect_right
 from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
@@ -19,7 +18,6 @@ _DEFAULT_SINGLETON_SPAN = 1.0
 _DEFAULT_UNIFORM_REL_TOL = 1e-9
 
 
-@dataclass(frozen=True, slots=True, init=False)
 class AxisGeometry:
     """Immutable geometry for one strictly increasing heatmap axis.
 
@@ -27,6 +25,11 @@ class AxisGeometry:
     indices must remain aligned with the corresponding dimension of the data
     grid.  A caller that receives descending data must reverse both together.
 
+    Coordinates are held in read-only arrays, ``centre_array`` and
+    ``edge_array``, so axes with millions of cells are validated and searched
+    without per-cell Python work.  ``centres`` and ``edges`` return the same
+    values as tuples, built on first access.
+
     Parameters
     ----------
     centres:
@@ -38,9 +41,27 @@ class AxisGeometry:
         Tolerances used only when classifying an axis as uniform.
     """
 
-    centres: tuple[float, ...]
-    edges: tuple[float, ...]
+    __slots__ = (
+        "centre_array",
+        "edge_array",
+        "is_uniform",
+        "_bounds",
+        "_singleton_span",
+        "_uniform_rel_tol",
+        "_uniform_abs_tol",
+        "_centres",
+        "_edges",
+    )
+
+    centre_array: npt.NDArray[np.float64]
+    edge_array: npt.NDArray[np.float64]
     is_uniform: bool
+    _bounds: tuple[float, float]
+    _singleton_span: float
+    _uniform_rel_tol: float
+    _uniform_abs_tol: float
+    _centres: tuple[float, ...] | None
+    _edges: tuple[float, ...] | None
 
     def __init__(
             self,
@@ -50,14 +71,14 @@ class AxisGeometry:
             uniform_rel_tol: float = _DEFAULT_UNIFORM_REL_TOL,
             uniform_abs_tol: float = 0.0,
             ) -> None:
-        values = tuple(float(value) for value in centres)
+        values = _centre_values(centres)
         span = float(singleton_span)
         rel_tol = float(uniform_rel_tol)
         abs_tol = float(uniform_abs_tol)
 
-        if not values:
+        if not values.size:
             raise ValueError("A heatmap axis requires at least one centre.")
-        if not all(math.isfinite(value) for value in values):
+        if not np.isfinite(values).all():
             raise ValueError("Heatmap axis centres must all be finite.")
         if not math.isfinite(span) or span <= 0.0:
             raise ValueError("singleton_span must be positive and finite.")
@@ -66,89 +87,125 @@ class AxisGeometry:
         if not math.isfinite(abs_tol) or abs_tol < 0.0:
             raise ValueError("uniform_abs_tol must be non-negative and finite.")
 
-        deltas = tuple(
-            right - left
-            for left, right in zip(values[:-1], values[1:], strict=True)
-        )
-        if deltas and all(delta < 0.0 for delta in deltas):
+        deltas = np.diff(values)
+        if deltas.size and (deltas < 0.0).all():
             raise ValueError(
                 "descending heatmap axes are not supported; reverse both the "
                 "axis centres and the corresponding data dimension."
             )
-        if any(delta <= 0.0 for delta in deltas):
+        if (deltas <= 0.0).any():
             raise ValueError("Heatmap axis centres must be strictly increasing.")
 
-        derived_edges: tuple[float, ...]
-        if len(values) == 1:
+        if values.size == 1:
             half_span = span / 2.0
-            derived_edges = (values[0] - half_span, values[0] + half_span)
+            derived_edges = np.array([values[0] - half_span, values[0] + half_span])
         else:
-            interior_edges = tuple(
-                left / 2.0 + right / 2.0
-                for left, right in zip(values[:-1], values[1:], strict=True)
-            )
-            derived_edges = (
-                values[0] - (interior_edges[0] - values[0]),
-                *interior_edges,
-                values[-1] + (values[-1] - interior_edges[-1]),
-            )
+            derived_edges = _derived_edges(values)
+        _check_edges(derived_edges)
 
-        if not all(math.isfinite(edge) for edge in derived_edges):
-            raise ValueError("Derived heatmap axis edges must all be finite.")
-        if any(
-                right <= left
-                for left, right in zip(
-                    derived_edges[:-1],
-                    derived_edges[1:],
-                    strict=True,
-                    )
+        uniform = deltas.size <= 1 or bool(
+            _is_close(deltas[1:], deltas[0], rel_tol, abs_tol).all()
+        )
+
+        self._set(values, derived_edges, uniform, span, rel_tol, abs_tol)
+
+    def _set(
+            self,
+            centres: npt.NDArray[np.float64],
+            edges: npt.NDArray[np.float64],
+            uniform: bool,
+            singleton_span: float,
+            uniform_rel_tol: float,
+            uniform_abs_tol: float,
+            ) -> None:
+        centres.flags.writeable = False
+        edges.flags.writeable = False
+        for name, value in (
+                ("centre_array", centres),
+                ("edge_array", edges),
+                ("is_uniform", uniform),
+                ("_bounds", (float(edges[0]), float(edges[-1]))),
+                ("_singleton_span", singleton_span),
+                ("_uniform_rel_tol", uniform_rel_tol),
+                ("_uniform_abs_tol", uniform_abs_tol),
+                ("_centres", None),
+                ("_edges", None),
                 ):
-            raise ValueError(
-                "Heatmap cell edges collapse at floating-point precision."
-                )
-
-        uniform = len(deltas) <= 1 or all(
-            math.isclose(
-                delta,
-                deltas[0],
-                rel_tol=rel_tol,
-                abs_tol=abs_tol,
-            )
-            for delta in deltas[1:]
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"AxisGeometry is immutable; cannot set {name!r}.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AxisGeometry):
+            return NotImplemented
+        return (
+            self.is_uniform == other.is_uniform
+            and np.array_equal(self.centre_array, other.centre_array)
+            and np.array_equal(self.edge_array, other.edge_array)
         )
 
-        object.__setattr__(self, "centres", values)
-        object.__setattr__(self, "edges", derived_edges)
-        object.__setattr__(self, "is_uniform", uniform)
+    def __hash__(self) -> int:
+        return hash((self.count, self.bounds, self.is_uniform))
+
+    def __repr__(self) -> str:
+        return (
+            f"AxisGeometry(count={self.count}, bounds={self.bounds}, "
+            f"is_uniform={self.is_uniform})"
+        )
+
+    @property
+    def centres(self) -> tuple[float, ...]:
+        """Cell-centre coordinates as a tuple."""
+
+        values = self._centres
+        if values is None:
+            values = tuple(self.centre_array.tolist())
+            object.__setattr__(self, "_centres", values)
+        return values
+
+    @property
+    def edges(self) -> tuple[float, ...]:
+        """Cell-edge coordinates as a tuple, one more than the centres."""
+
+        values = self._edges
+        if values is None:
+            values = tuple(self.edge_array.tolist())
+            object.__setattr__(self, "_edges", values)
+        return values
 
     @property
     def count(self) -> int:
         """Number of cells along this axis."""
 
-        return len(self.centres)
+        return int(self.centre_array.size)
 
     @property
     def bounds(self) -> tuple[float, float]:
         """Inclusive outer coordinate bounds of the axis."""
 
-        return self.edges[0], self.edges[-1]
+        return self._bounds
 
     @property
     def span(self) -> float:
         """Positive distance between the outer axis edges."""
 
-        return self.edges[-1] - self.edges[0]
+        lower, upper = self._bounds
+        return upper - lower
 
     def centre(self, index: int) -> float:
         """Return the recorded centre coordinate of one cell."""
 
-        return self.centres[self._checked_index(index)]
+        return float(self.centre_array[self._checked_index(index)])
 
     def cell_bounds(self, index: int) -> tuple[float, float]:
         """Return the lower and upper boundary of one cell."""
 
         checked_index = self._checked_index(index)
-        return self.edges[checked_index], self.edges[checked_index + 1]
+        return (
+            float(self.edge_array[checked_index]),
+            float(self.edge_array[checked_index + 1]),
+        )
 
     def index_at(self, value: float, *, clamp: bool = False) -> int | None:
         """Return the cell containing ``value``.
@@ -171,13 +228,13 @@ class AxisGeometry:
         if coordinate == upper:
             return self.count - 1
 
-        return bisect_right(self.edges, coordinate) - 1
+        return int(self.edge_array.searchsorted(coordinate, side="right")) - 1
 
     def snap_interval(self, low: float, high: float) -> tuple[float, float]:
         """Expand an interval to the cell edges that contain it."""
 
         start, stop = self._cell_interval(low, high)
-        return self.edges[start], self.edges[stop]
+        return float(self.edge_array[start]), float(self.edge_array[stop])
 
     def slice_for_interval(self, low: float, high: float) -> slice:
         """Return the cells covered by an interval as a NumPy-style slice."""
@@ -185,6 +242,64 @@ class AxisGeometry:
         start, stop = self._cell_interval(low, high)
         return slice(start, stop)
 
+    def grown(self, centres: Iterable[float]) -> "AxisGeometry":
+        """Return geometry for ``centres`` with the same tolerances.
+
+        When ``centres`` only append cells to this axis, as a live sweep
+        does, just the new cells are validated and the recorded edges are
+        reused.  Any other change builds the axis from scratch, so the result
+        and the errors raised always match a new :class:`AxisGeometry`.
+        """
+
+        values = _centre_values(centres)
+        known = self.centre_array
+        if (
+                known.size < 2
+                or values.size < known.size
+                or not np.array_equal(values[:known.size], known)
+                ):
+            return AxisGeometry(
+                values,
+                singleton_span=self._singleton_span,
+                uniform_rel_tol=self._uniform_rel_tol,
+                uniform_abs_tol=self._uniform_abs_tol,
+            )
+        if values.size == known.size:
+            return self
+
+        added = values[known.size:]
+        if not np.isfinite(added).all():
+            raise ValueError("Heatmap axis centres must all be finite.")
+        deltas = np.diff(values[known.size - 1:])
+        if (deltas <= 0.0).any():
+            raise ValueError("Heatmap axis centres must be strictly increasing.")
+
+        # Interior edges are unchanged; the old upper edge was extrapolated
+        # from the last step and is replaced by the new cells' edges.
+        added_edges = _derived_edges(values[known.size - 1:])[1:]
+        _check_edges(added_edges)
+        edges = np.concatenate((self.edge_array[:-1], added_edges))
+        _check_edges(edges[known.size - 1:known.size + 1])
+
+        uniform = self.is_uniform and bool(
+            _is_close(
+                deltas,
+                known[1] - known[0],
+                self._uniform_rel_tol,
+                self._uniform_abs_tol,
+            ).all()
+        )
+        geometry = AxisGeometry.__new__(AxisGeometry)
+        geometry._set(
+            values,
+            edges,
+            uniform,
+            self._singleton_span,
+            self._uniform_rel_tol,
+            self._uniform_abs_tol,
+        )
+        return geometry
+
     def _cell_interval(self, low: float, high: float) -> tuple[int, int]:
         low_value = float(low)
         high_value = float(high)
@@ -196,9 +311,9 @@ class AxisGeometry:
         low_value = min(max(low_value, lower_bound), upper_bound)
         high_value = min(max(high_value, lower_bound), upper_bound)
 
-        start = bisect_right(self.edges, low_value) - 1
+        start = int(self.edge_array.searchsorted(low_value, side="right")) - 1
         start = min(max(start, 0), self.count - 1)
-        stop = bisect_left(self.edges, high_value)
+        stop = int(self.edge_array.searchsorted(high_value, side="left"))
         stop = min(max(stop, start + 1), self.count)
         return start, stop
 
@@ -215,6 +330,53 @@ class AxisGeometry:
         return checked_index
 
 
+def _centre_values(centres: Iterable[float]) -> npt.NDArray[np.float64]:
+    """Return a private float copy of axis centres."""
+
+    if not isinstance(centres, (np.ndarray, list, tuple)):
+        centres = list(centres)
+    values = np.array(centres, dtype=float)
+    if values.ndim != 1:
+        raise TypeError("heatmap axis centres must be a flat sequence of numbers")
+    return values
+
+
+def _derived_edges(values: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Return midpoint edges of two or more centres, extrapolating the ends."""
+
+    edges = np.empty(values.size + 1)
+    interior = edges[1:-1]
+    np.divide(values[:-1], 2.0, out=interior)
+    interior += values[1:] / 2.0
+    edges[0] = values[0] - (interior[0] - values[0])
+    edges[-1] = values[-1] + (values[-1] - interior[-1])
+    return edges
+
+
+def _check_edges(edges: npt.NDArray[np.float64]) -> None:
+    if not np.isfinite(edges).all():
+        raise ValueError("Derived heatmap axis edges must all be finite.")
+    if (np.diff(edges) <= 0.0).any():
+        raise ValueError(
+            "Heatmap cell edges collapse at floating-point precision."
+        )
+
+
+def _is_close(
+        values: npt.NDArray[np.float64],
+        reference: float,
+        rel_tol: float,
+        abs_tol: float,
+        ) -> npt.NDArray[np.bool_]:
+    """Vectorized :func:`math.isclose` of ``values`` against one reference."""
+
+    tolerance = np.maximum(
+        rel_tol * np.maximum(np.abs(values), abs(reference)),
+        abs_tol,
+    )
+    return np.abs(values - reference) <= tolerance
+
+
 @dataclass(frozen=True, slots=True)
 class HeatmapGeometry:
     """Immutable two-dimensional rectilinear heatmap geometry."""
@@ -250,6 +412,21 @@ class HeatmapGeometry:
             ),
         )
 
+    def grown(
+            self,
+            x_centres: Iterable[float],
+            y_centres: Iterable[float],
+            ) -> "HeatmapGeometry":
+        """Return geometry for new centres, reusing axes they only extend.
+
+        See :meth:`AxisGeometry.grown`.
+        """
+
+        return HeatmapGeometry(
+            x=self.x.grown(x_centres),
+            y=self.y.grown(y_centres),
+        )
+
     @property
     def shape(self) -> tuple[int, int]:
         """Expected data-grid shape in NumPy row-major order: ``(Y, X)``."""
@@ -260,13 +437,15 @@ class HeatmapGeometry:
     def bounds(self) -> tuple[float, float, float, float]:
         """Return ``(left, bottom, right, top)`` outer cell boundaries."""
 
-        return self.x.edges[0], self.y.edges[0], self.x.edges[-1], self.y.edges[-1]
+        left, right = self.x.bounds
+        bottom, top = self.y.bounds
+        return left, bottom, right, top
 
     @property
     def rect(self) -> tuple[float, float, float, float]:
         """Return a Qt-free ``(left, bottom, width, height)`` rectangle."""
 
-        return self.x.edges[0], self.y.edges[0], self.x.span, self.y.span
+        return self.x.bounds[0], self.y.bounds[0], self.x.span, self.y.span
 
     @property
     def is_uniform(self) -> bool:
@@ -320,7 +499,11 @@ def canonicalize_heatmap_data(
             npt.NDArray[np.float64],
             npt.NDArray[Any],
             ]:
-    """Return increasing axes while preserving their grid-value mapping."""
+    """Return increasing axes while preserving their grid-value mapping.
+
+    Decreasing axes are reversed as views, so the returned grid may share
+    memory with ``data_grid``.
+    """
 
     x_values = np.asarray(x_centres, dtype=float)
     y_values = np.asarray(y_centres, dtype=float)
@@ -336,11 +519,11 @@ def canonicalize_heatmap_data(
             )
 
     if x_values.size > 1 and np.all(np.diff(x_values) < 0.0):
-        x_values = x_values[::-1].copy()
-        grid = np.flip(grid, axis=1).copy()
+        x_values = x_values[::-1]
+        grid = np.flip(grid, axis=1)
     if y_values.size > 1 and np.all(np.diff(y_values) < 0.0):
-        y_values = y_values[::-1].copy()
-        grid = np.flip(grid, axis=0).copy()
+        y_values = y_values[::-1]
+        grid = np.flip(grid, axis=0)
 
     AxisGeometry(x_values)
     AxisGeometry(y_values)
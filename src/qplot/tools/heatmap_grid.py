@@ -0,0 +1,253 @@
+"""Incremental heatmap grids for live, unshaped 2D runs.
+
+This module has no Qt dependencies. ``IncrementalHeatmapGrid`` keeps the
+per-cell sums and counts of an append-only point list, so each refresh only
+places the points appended since the previous one. Its grids follow the
+semantics of :func:`qplot.tools.general.data2matrix`: duplicates are averaged,
+NaN values and coordinates are ignored, and rows or columns are only created
+for coordinates with at least one non-NaN value.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+
+import numpy as np
+import numpy.typing as npt
+
+MIN_AXIS_CAPACITY = 64
+
+
+class IncrementalHeatmapGrid:
+    """Running mean grid of one plot's unshaped 2D data.
+
+    ``update`` is given the full, append-only point arrays on every refresh
+    and absorbs only those beyond ``point_count``. The grid is rebuilt from
+    scratch when ``key`` changes, when the arrays shrink, or when the last
+    absorbed point no longer matches, since any of those means the arrays
+    are not a continuation of the absorbed points.
+
+    Row and column axes are kept sorted in buffers whose capacity doubles
+    when they fill. New coordinates shift the cells after them within those
+    buffers, so setpoints that jitter and add a coordinate on every refresh
+    only reallocate the grid once per doubling. The buffers are never handed
+    out: callers get copies, so a later update cannot change a grid that is
+    already on screen.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+
+    def reset(self, key: Hashable = None) -> None:
+        self.key = key
+        self.point_count = 0
+        self._last_point: npt.NDArray[np.float64] | None = None
+        self._rows = np.empty(0)
+        self._columns = np.empty(0)
+        self._row_count = 0
+        self._column_count = 0
+        self._sums = np.zeros((0, 0))
+        self._counts = np.zeros((0, 0), dtype=np.int64)
+        self._means = np.zeros((0, 0))
+
+
+    @property
+    def rows(self) -> npt.NDArray[np.float64]:
+        return self._rows[:self._row_count]
+
+
+    @property
+    def columns(self) -> npt.NDArray[np.float64]:
+        return self._columns[:self._column_count]
+
+
+    def update(
+            self,
+            key: Hashable,
+            row_values: npt.ArrayLike,
+            column_values: npt.ArrayLike,
+            values: npt.ArrayLike,
+            check_cancelled: Callable[[], None] | None = None,
+            ) -> tuple[
+                npt.NDArray[np.float64],
+                npt.NDArray[np.float64],
+                npt.NDArray[np.float64],
+                ]:
+        """
+        Absorb newly appended points and return the current grid.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the dataset, parameter and axes the points belong to.
+        row_values, column_values, values : np.array
+            Every point read so far, in the order they were appended.
+        check_cancelled : Callable[[], None] | None
+            Called between the steps of placing new points. Whatever it
+            raises interrupts the update, and the grid is reset so that the
+            next update rebuilds it.
+
+        Returns
+        -------
+        rows, columns, grid : np.ndarray
+            Sorted row and column coordinates and the mean grid of shape
+            ``(rows.size, columns.size)``, copied from the grid's buffers so
+            that later updates leave them unchanged.
+
+        """
+        row_values = np.asarray(row_values, dtype=float).ravel()
+        column_values = np.asarray(column_values, dtype=float).ravel()
+        values = np.asarray(values, dtype=float).ravel()
+        if not row_values.size == column_values.size == values.size:
+            raise ValueError("Heatmap point arrays must have the same length.")
+
+        with self._lock:
+            if not self._continues(key, row_values, column_values, values):
+                self.reset(key)
+
+            start = self.point_count
+            if start < values.size:
+                try:
+                    self._insert(
+                        row_values[start:],
+                        column_values[start:],
+                        values[start:],
+                        check_cancelled,
+                        )
+                except BaseException:
+                    # A partly placed batch cannot be told apart from the
+                    # absorbed points, so start over on the next update.
+                    self.reset()
+                    raise
+                self.point_count = values.size
+                self._last_point = np.array([
+                    row_values[-1],
+                    column_values[-1],
+                    values[-1],
+                    ])
+
+            return (
+                self.rows.copy(),
+                self.columns.copy(),
+                self._means[:self._row_count, :self._column_count].copy(),
+                )
+
+
+    def _continues(self, key, row_values, column_values, values) -> bool:
+        if key != self.key or values.size < self.point_count:
+            return False
+        if self._last_point is None:
+            return True
+        index = self.point_count - 1
+        return np.array_equal(
+            self._last_point,
+            (row_values[index], column_values[index], values[index]),
+            equal_nan=True,
+            )
+
+
+    def _insert(self, row_values, column_values, values, check_cancelled=None) -> None:
+        keep = ~(np.isnan(row_values) | np.isnan(column_values) | np.isnan(values))
+        if not keep.all():
+            row_values = row_values[keep]
+            column_values = column_values[keep]
+            values = values[keep]
+        if values.size == 0:
+            return
+
+        for axis, coordinates in ((0, row_values), (1, column_values)):
+            if check_cancelled is not None:
+                check_cancelled()
+            self._grow_axis(axis, np.unique(coordinates))
+        if check_cancelled is not None:
+            check_cancelled()
+
+        row_index = np.searchsorted(self.rows, row_values)
+        column_index = np.searchsorted(self.columns, column_values)
+        cells, cell_index = np.unique(
+            row_index * self._sums.shape[1] + column_index,
+            return_inverse=True,
+            )
+        sums = self._sums.reshape(-1)
+        counts = self._counts.reshape(-1)
+        means = self._means.reshape(-1)
+        sums[cells] += np.bincount(cell_index, weights=values)
+        counts[cells] += np.bincount(cell_index)
+        means[cells] = sums[cells] / counts[cells]
+
+
+    def _grow_axis(self, axis: int, coordinates) -> None:
+        """Merge new sorted coordinates into one axis, moving existing cells."""
+        current = self.rows if axis == 0 else self.columns
+        new = coordinates[~np.isin(coordinates, current, assume_unique=True)]
+        if new.size == 0:
+            return
+
+        size = current.size
+        capacity = self._sums.shape[axis]
+        if size + new.size > capacity:
+            self._reserve(
+                axis,
+                max(size + new.size, 2 * capacity, MIN_AXIS_CAPACITY),
+                )
+
+        # Existing coordinates between two insertion points move up by the
+        # number of new coordinates before them. Moving the last run first
+        # never overwrites cells that have not moved yet.
+        insert_at = np.searchsorted(current, new)
+        bounds = np.concatenate(([0], insert_at, [size]))
+        for shift in np.flatnonzero(np.diff(bounds))[::-1]:
+            if shift == 0:
+                break
+            self._move(axis, slice(bounds[shift], bounds[shift + 1]), int(shift))
+
+        positions = insert_at + np.arange(new.size)
+        line = self._line(axis, positions)
+        self._sums[line] = 0.0
+        self._counts[line] = 0
+        self._means[line] = np.nan
+        if axis == 0:
+            self._rows[positions] = new
+            self._row_count += new.size
+        else:
+            self._columns[positions] = new
+            self._column_count += new.size
+
+
+    def _line(self, axis: int, index) -> tuple:
+        """Index cells of the filled grid along one axis."""
+        if axis == 0:
+            return index, slice(0, self._column_count)
+        return slice(0, self._row_count), index
+
+
+    def _move(self, axis: int, source: slice, shift: int) -> None:
+        target = slice(source.start + shift, source.stop + shift)
+        coordinates = self._rows if axis == 0 else self._columns
+        coordinates[target] = coordinates[source]
+        for grid in (self._sums, self._counts, self._means):
+            grid[self._line(axis, target)] = grid[self._line(axis, source)]
+
+
+    def _reserve(self, axis: int, capacity: int) -> None:
+        """Reallocate one axis with room for ``capacity`` coordinates."""
+        shape = list(self._sums.shape)
+        shape[axis] = capacity
+        filled = (slice(0, self._row_count), slice(0, self._column_count))
+
+        sums = np.zeros(shape)
+        counts = np.zeros(shape, dtype=np.int64)
+        means = np.full(shape, np.nan)
+        sums[filled] = self._sums[filled]
+        counts[filled] = self._counts[filled]
+        means[filled] = self._means[filled]
+        self._sums, self._counts, self._means = sums, counts, means
+
+        coordinates = np.empty(capacity)
+        if axis == 0:
+            coordinates[:self._row_count] = self.rows
+            self._rows = coordinates
+        else:
+            coordinates[:self._column_count] = self.columns
+            self._columns = coordinates
@@ -0,0 +1,566 @@
+"""Mean/min/max pyramids of large unshaped heatmaps.
+
+This module has no Qt dependencies. ``HeatmapPyramid`` keeps the per-cell
+sums, counts, minima and maxima of a base grid that the plot worker
+aggregates once with SQL, at up to ``HEATMAP_PYRAMID_BASE_SIDE`` cells per
+axis. Coarser levels merge aligned blocks of ``2 ** level`` base cells. The
+x and y levels are chosen independently, so long, narrow scans keep their
+short axis. Because blocks are aligned, the cells drawn for a view are one
+rectangular tile of one level: zooming or panning a large heatmap is a slice
+instead of a table scan. Each level is derived from the nearest finer level
+the first time it is needed.
+
+Pyramids of completed runs are stored under ``~/.qplot/heatmap_pyramids`` by
+``HeatmapPyramidCache``. Live runs extend their pyramid in memory with the
+groups of the rows appended since the previous refresh.
+"""
+
+import hashlib
+import json
+import threading
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from qplot.diagnostics import get_logger
+
+from .disk_cache import NPZ_DISK_CACHE_SUFFIX, NpzDiskCache, qplot_cache_directory
+
+HEATMAP_PYRAMID_VERSION = 1
+HEATMAP_PYRAMID_BASE_SIDE = 2048
+HEATMAP_PYRAMID_BASE_CELLS = 1 << 20
+HEATMAP_PYRAMID_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+_shared_cache: "HeatmapPyramidCache | None" = None
+_shared_cache_lock = threading.Lock()
+
+PyramidArrays = tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    ]
+
+
+def default_heatmap_pyramid_directory() -> Path:
+    """
+    Returns qPlot's default heatmap pyramid cache directory.
+
+    """
+    return qplot_cache_directory("heatmap_pyramids")
+
+
+def shared_heatmap_pyramid_cache() -> "HeatmapPyramidCache":
+    """
+    Returns the process-wide heatmap pyramid cache in the default directory.
+
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HeatmapPyramidCache(default_heatmap_pyramid_directory())
+        return _shared_cache
+
+
+class PyramidAxis:
+    """Base cells along one heatmap axis.
+
+    Parameters
+    ----------
+    centres : np.ndarray
+        Increasing base cell centres.
+    lower_edge, scale : float | None
+        For binned axes, the lower edge of the first cell and the inverse
+        cell width. Exact axes have one cell per distinct coordinate and
+        neither value.
+    """
+
+    def __init__(
+            self,
+            centres: npt.ArrayLike,
+            lower_edge: float | None = None,
+            scale: float | None = None,
+            ) -> None:
+        self.centres = np.asarray(centres, dtype=float)
+        self.lower_edge = None if lower_edge is None else float(lower_edge)
+        self.scale = None if scale is None else float(scale)
+        self._level_centres: dict[int, npt.NDArray[np.float64]] = {0: self.centres}
+
+
+    @classmethod
+    def binned(
+            cls,
+            lower: float,
+            upper: float,
+            source_count: int,
+            bin_count: int,
+            ) -> "PyramidAxis":
+        """Split the range of ``source_count`` coordinates into equal cells.
+
+        The outer cells extend half a source step beyond the first and last
+        coordinate, so evenly spaced setpoints fall into evenly filled cells.
+        """
+        if source_count <= 1 or bin_count <= 1 or lower == upper:
+            return cls([lower], lower, 1.0)
+
+        source_step = (upper - lower) / (source_count - 1)
+        lower_edge = lower - source_step / 2
+        width = (upper - lower + source_step) / bin_count
+        centres = lower_edge + (np.arange(bin_count, dtype=float) + 0.5) * width
+        return cls(centres, lower_edge, 1.0 / width)
+
+
+    @property
+    def exact(self) -> bool:
+        return self.scale is None
+
+
+    @property
+    def size(self) -> int:
+        return int(self.centres.size)
+
+
+    def covers(self, low: float, high: float) -> bool:
+        """Return whether coordinates in ``[low, high]`` map onto existing cells."""
+        if self.exact:
+            return True
+        assert self.lower_edge is not None and self.scale is not None
+        upper_edge = self.lower_edge + self.size / self.scale
+        return self.lower_edge <= low and high < upper_edge
+
+
+    def indices(self, groups: npt.ArrayLike) -> npt.NDArray[np.int64]:
+        """Return the base cells of grouped coordinates, -1 where none exists.
+
+        Groups of exact axes are coordinates; groups of binned axes are
+        already cell indices.
+        """
+        groups = np.asarray(groups, dtype=float)
+        if not self.exact:
+            indices = groups.astype(np.int64)
+            indices[(indices < 0) | (indices >= self.size)] = -1
+            return indices
+
+        indices = np.searchsorted(self.centres, groups)
+        found = indices < self.size
+        found[found] = self.centres[indices[found]] == groups[found]
+        return np.where(found, indices, -1).astype(np.int64)
+
+
+    def visible(self, axis_range: tuple[float, float] | None) -> tuple[int, int]:
+        """Return the span of base cells whose centres lie within ``axis_range``."""
+        if axis_range is None:
+            return 0, self.size
+        low, high = axis_range
+        return (
+            int(np.searchsorted(self.centres, low, side="left")),
+            int(np.searchsorted(self.centres, high, side="right")),
+            )
+
+
+    def level_centres(self, level: int) -> npt.NDArray[np.float64]:
+        """Return the mean base centre of every cell of ``level``."""
+        centres = self._level_centres.get(level)
+        if centres is None:
+            starts = np.arange(0, self.size, 1 << level)
+            sizes = np.diff(np.append(starts, self.size))
+            centres = np.add.reduceat(self.centres, starts) / sizes
+            self._level_centres[level] = centres
+        return centres
+
+
+@dataclass(frozen=True)
+class HeatmapPyramidView:
+    """Cells of one pyramid level covering a visible range.
+
+    ``mean``, ``minimum`` and ``maximum`` are NaN in cells without source
+    rows. ``unique_counts`` estimates the distinct source x and y
+    coordinates in view.
+    """
+
+    x: npt.NDArray[np.float64]
+    y: npt.NDArray[np.float64]
+    mean: npt.NDArray[np.float64]
+    minimum: npt.NDArray[np.float64]
+    maximum: npt.NDArray[np.float64]
+    counts: npt.NDArray[np.int64]
+    level: tuple[int, int]
+    unique_counts: tuple[int, int]
+
+
+class HeatmapPyramid:
+    """Mean/min/max pyramid of one heatmap parameter.
+
+    Parameters
+    ----------
+    x_axis, y_axis : PyramidAxis
+        Base cells along each axis.
+    sums, counts, minima, maxima : np.ndarray
+        Base grid statistics, indexed ``[row, column]``. Empty cells have a
+        count of zero and infinite extrema.
+    bounds : dict[str, tuple[float, float]]
+        Smallest and largest source coordinate along ``"x"`` and ``"y"``.
+    unique_counts : tuple[int, int]
+        Distinct source x and y coordinates when the pyramid was built. Live
+        extensions keep the counts of binned axes, which then underestimate.
+    key : tuple | None
+        Identifies the run, parameter and axes the pyramid was built for.
+    result_count, last_rowid : int | None
+        Run result count and largest result rowid the pyramid was built from.
+    """
+
+    def __init__(
+            self,
+            x_axis: PyramidAxis,
+            y_axis: PyramidAxis,
+            sums: npt.ArrayLike,
+            counts: npt.ArrayLike,
+            minima: npt.ArrayLike,
+            maxima: npt.ArrayLike,
+            *,
+            bounds: dict[str, tuple[float, float]],
+            unique_counts: tuple[int, int],
+            key: tuple | None = None,
+            result_count: int | None = None,
+            last_rowid: int | None = None,
+            ) -> None:
+        base = (
+            np.asarray(sums, dtype=float),
+            np.asarray(counts, dtype=np.int64),
+            np.asarray(minima, dtype=float),
+            np.asarray(maxima, dtype=float),
+            )
+        shape = (y_axis.size, x_axis.size)
+        if any(array.shape != shape for array in base):
+            raise ValueError("Pyramid statistics must match its axes.")
+
+        self.x_axis = x_axis
+        self.y_axis = y_axis
+        self.bounds = {
+            axis: (float(bounds[axis][0]), float(bounds[axis][1]))
+            for axis in ("x", "y")
+            }
+        self.unique_counts = (int(unique_counts[0]), int(unique_counts[1]))
+        self.key = None if key is None else tuple(key)
+        self.result_count = None if result_count is None else int(result_count)
+        self.last_rowid = None if last_rowid is None else int(last_rowid)
+        self._levels: dict[tuple[int, int], PyramidArrays] = {(0, 0): base}
+        self._lock = threading.Lock()
+
+
+    @classmethod
+    def from_groups(
+            cls,
+            x_axis: PyramidAxis,
+            y_axis: PyramidAxis,
+            groups: tuple[npt.ArrayLike, ...],
+            **kwargs: Any,
+            ) -> "HeatmapPyramid":
+        """Build a pyramid from SQL groups.
+
+        ``groups`` holds the x group, y group, sum, count, minimum and
+        maximum of every non-empty base cell.
+        """
+        shape = (y_axis.size, x_axis.size)
+        pyramid = cls(
+            x_axis,
+            y_axis,
+            np.zeros(shape),
+            np.zeros(shape, dtype=np.int64),
+            np.full(shape, np.inf),
+            np.full(shape, -np.inf),
+            **kwargs,
+            )
+        if not pyramid._place(groups):
+            raise ValueError("Grouped cells fall outside the pyramid axes.")
+        return pyramid
+
+
+    def extended(
+            self,
+            groups: tuple[npt.ArrayLike, ...],
+            *,
+            bounds: dict[str, tuple[float, float]],
+            result_count: int | None,
+            last_rowid: int | None,
+            ) -> "HeatmapPyramid | None":
+        """Return a copy that includes the groups of appended rows.
+
+        Returns None when a group falls outside the base cells, in which case
+        the pyramid has to be rebuilt.
+        """
+        merged_bounds = {
+            axis: (
+                min(self.bounds[axis][0], bounds[axis][0]),
+                max(self.bounds[axis][1], bounds[axis][1]),
+                )
+            for axis in ("x", "y")
+            }
+        if not (
+                self.x_axis.covers(*merged_bounds["x"])
+                and self.y_axis.covers(*merged_bounds["y"])
+                ):
+            return None
+
+        pyramid = type(self)(
+            self.x_axis,
+            self.y_axis,
+            *(array.copy() for array in self.base),
+            bounds=merged_bounds,
+            unique_counts=self.unique_counts,
+            key=self.key,
+            result_count=result_count,
+            last_rowid=last_rowid,
+            )
+        return pyramid if pyramid._place(groups) else None
+
+
+    @property
+    def base(self) -> PyramidArrays:
+        return self._levels[(0, 0)]
+
+
+    @property
+    def exact(self) -> bool:
+        """Whether base cells are the distinct source coordinates."""
+        return self.x_axis.exact and self.y_axis.exact
+
+
+    @property
+    def row_count(self) -> int:
+        return int(self.base[1].sum())
+
+
+    def _place(self, groups: tuple[npt.ArrayLike, ...]) -> bool:
+        x_groups, y_groups, sums, counts, minima, maxima = groups
+        columns = self.x_axis.indices(x_groups)
+        rows = self.y_axis.indices(y_groups)
+        if np.any(columns < 0) or np.any(rows < 0):
+            return False
+
+        cells = (rows, columns)
+        base_sums, base_counts, base_minima, base_maxima = self.base
+        np.add.at(base_sums, cells, np.asarray(sums, dtype=float))
+        np.add.at(base_counts, cells, np.asarray(counts, dtype=np.int64))
+        np.minimum.at(base_minima, cells, np.asarray(minima, dtype=float))
+        np.maximum.at(base_maxima, cells, np.asarray(maxima, dtype=float))
+        return True
+
+
+    def level(self, x_level: int, y_level: int) -> PyramidArrays:
+        """Return the statistics of one level, deriving it on first use."""
+        with self._lock:
+            arrays = self._levels.get((x_level, y_level))
+            if arrays is not None:
+                return arrays
+
+            source = max(
+                (
+                    key for key in self._levels
+                    if key[0] <= x_level and key[1] <= y_level
+                    ),
+                key=sum,
+                )
+            arrays = _merge_blocks(self._levels[source], x_level - source[0], axis=1)
+            arrays = _merge_blocks(arrays, y_level - source[1], axis=0)
+            self._levels[(x_level, y_level)] = arrays
+            return arrays
+
+
+    def visible_cells(
+            self,
+            axis_ranges: dict[str, tuple[float, float]] | None,
+            ) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Return the base cell spans along x and y within ``axis_ranges``."""
+        axis_ranges = axis_ranges or {}
+        return (
+            self.x_axis.visible(axis_ranges.get("x")),
+            self.y_axis.visible(axis_ranges.get("y")),
+            )
+
+
+    def source_rows(self, cells: tuple[tuple[int, int], tuple[int, int]]) -> int:
+        """Return the number of source rows in a span of base cells."""
+        (x_start, x_stop), (y_start, y_stop) = cells
+        return int(self.base[1][y_start:y_stop, x_start:x_stop].sum())
+
+
+    def view(
+            self,
+            cells: tuple[tuple[int, int], tuple[int, int]],
+            shape: tuple[int, int],
+            ) -> HeatmapPyramidView:
+        """
+        Return the tile of the finest level that fits a display grid.
+
+        Parameters
+        ----------
+        cells : tuple
+            Base cell spans along x and y, from ``visible_cells``.
+        shape : tuple[int, int]
+            Largest number of display columns and rows.
+
+        """
+        (x_start, x_stop), (y_start, y_stop) = cells
+        x_level = _level_for(x_start, x_stop, shape[0])
+        y_level = _level_for(y_start, y_stop, shape[1])
+        columns = slice(x_start >> x_level, -(-x_stop >> x_level))
+        rows = slice(y_start >> y_level, -(-y_stop >> y_level))
+        if x_stop <= x_start or y_stop <= y_start:
+            columns = rows = slice(0, 0)
+
+        level_sums, level_counts, level_minima, level_maxima = self.level(x_level, y_level)
+        sums = level_sums[rows, columns]
+        counts = level_counts[rows, columns].astype(np.int64, copy=False)
+        minima = level_minima[rows, columns]
+        maxima = level_maxima[rows, columns]
+        filled = counts > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(filled, sums / counts, np.nan)
+        return HeatmapPyramidView(
+            x=self.x_axis.level_centres(x_level)[columns],
+            y=self.y_axis.level_centres(y_level)[rows],
+            mean=mean,
+            minimum=np.where(filled, minima, np.nan),
+            maximum=np.where(filled, maxima, np.nan),
+            counts=counts,
+            level=(x_level, y_level),
+            unique_counts=(
+                _visible_unique_count(self.x_axis, x_start, x_stop, self.unique_counts[0]),
+                _visible_unique_count(self.y_axis, y_start, y_stop, self.unique_counts[1]),
+                ),
+            )
+
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Return the base grid and header as arrays for ``np.savez``."""
+        sums, counts, minima, maxima = self.base
+        header = {
+            "x": _axis_header(self.x_axis),
+            "y": _axis_header(self.y_axis),
+            "bounds": self.bounds,
+            "unique_counts": self.unique_counts,
+            "key": self.key,
+            "result_count": self.result_count,
+            "last_rowid": self.last_rowid,
+            }
+        return {
+            "header": np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8),
+            "x_centres": self.x_axis.centres,
+            "y_centres": self.y_axis.centres,
+            "sums": sums,
+            "counts": counts,
+            "minima": minima,
+            "maxima": maxima,
+            }
+
+
+    @classmethod
+    def from_arrays(cls, arrays) -> "HeatmapPyramid":
+        header = json.loads(bytes(arrays["header"]).decode("utf-8"))
+        return cls(
+            PyramidAxis(arrays["x_centres"], *header["x"]),
+            PyramidAxis(arrays["y_centres"], *header["y"]),
+            arrays["sums"],
+            arrays["counts"],
+            arrays["minima"],
+            arrays["maxima"],
+            bounds={axis: tuple(header["bounds"][axis]) for axis in ("x", "y")},
+            unique_counts=tuple(header["unique_counts"]),
+            key=header["key"],
+            result_count=header["result_count"],
+            last_rowid=header["last_rowid"],
+            )
+
+
+class HeatmapPyramidCache(NpzDiskCache):
+    """
+    Pyramids of completed runs stored as one ``.npz`` file per cache key.
+
+    Only the base grid is stored; coarser levels are derived again after
+    loading.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding the cache files. It is created on the first store.
+    max_bytes : int
+        Total file size above which the least recently used files are removed.
+
+    """
+
+    temp_prefix = ".pyramid-"
+
+    def __init__(self, directory, max_bytes=HEATMAP_PYRAMID_CACHE_MAX_BYTES):
+        super().__init__(directory, max_bytes)
+
+
+    def path_for(self, key: tuple) -> Path:
+        text = "\0".join(str(part) for part in (HEATMAP_PYRAMID_VERSION, *key))
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{NPZ_DISK_CACHE_SUFFIX}"
+
+
+    def load(self, key: tuple) -> HeatmapPyramid | None:
+        """Return the stored pyramid for ``key``, or None on a miss.
+
+        Entries that cannot be read are deleted.
+        """
+        path = self.path_for(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                pyramid = HeatmapPyramid.from_arrays(entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            self._remove(path)
+            return None
+
+        self.touch(path)
+        return pyramid
+
+
+    def store(self, key: tuple, pyramid: HeatmapPyramid) -> bool:
+        """Write a pyramid, logging and otherwise ignoring write failures."""
+        try:
+            self.write_entry(self.path_for(key), pyramid.to_arrays())
+        except (OSError, ValueError, TypeError) as error:
+            get_logger(__name__).warning("Could not cache heatmap pyramid: %s", error)
+            return False
+        return True
+
+
+def _merge_blocks(arrays: PyramidArrays, levels: int, axis: int) -> PyramidArrays:
+    """Merge aligned blocks of ``2 ** levels`` cells along ``axis``."""
+    if levels == 0:
+        return arrays
+    sums, counts, minima, maxima = arrays
+    starts = np.arange(0, sums.shape[axis], 1 << levels)
+    return (
+        np.add.reduceat(sums, starts, axis=axis),
+        np.add.reduceat(counts, starts, axis=axis),
+        np.minimum.reduceat(minima, starts, axis=axis),
+        np.maximum.reduceat(maxima, starts, axis=axis),
+        )
+
+
+def _level_for(start: int, stop: int, limit: int) -> int:
+    """Return the finest level whose blocks over ``[start, stop)`` fit ``limit``."""
+    level = 0
+    while -(-stop >> level) - (start >> level) > max(1, limit):
+        level += 1
+    return level
+
+
+def _visible_unique_count(axis: PyramidAxis, start: int, stop: int, total: int) -> int:
+    if axis.exact or axis.size == 0:
+        return max(0, stop - start)
+    return max(1, round(total * (stop - start) / axis.size))
+
+
+def _axis_header(axis: PyramidAxis) -> list[float | None]:
+    return [axis.lower_edge, axis.scale]
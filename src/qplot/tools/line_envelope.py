@@ -0,0 +1,177 @@
+"""Min/max envelope pyramids for drawing very long 1D traces.
+
+This module has no Qt dependencies. ``LineEnvelope`` is built once per
+refresh by the plot worker. It keeps, for bins of ``ENVELOPE_FACTOR ** level``
+consecutive samples, the indices of each bin's smallest and largest value.
+A query for the visible x range and the plot's pixel width then returns at
+most a few points per pixel column. Each bin contributes both its extremes
+in sample order, so peaks and single-sample glitches stay visible at every
+zoom level while the drawing cost is bounded by the screen width.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+ENVELOPE_FACTOR = 4
+ENVELOPE_MIN_POINTS = 50_000
+ENVELOPE_BINS_PER_PIXEL = 1
+
+
+class LineEnvelope:
+    """Decimation pyramid of one trace.
+
+    Parameters
+    ----------
+    x, y : np.ndarray
+        The full trace in sample order. They are kept by reference and must
+        not be modified while the envelope is in use.
+
+    Notes
+    -----
+    Visible-range clipping needs sorted x values. Increasing and decreasing
+    sweeps are both clipped. Other traces are decimated over their whole
+    length.
+    """
+
+    def __init__(self, x: npt.ArrayLike, y: npt.ArrayLike) -> None:
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("Envelope x and y must be 1D arrays of one length.")
+
+        steps = np.diff(self.x)
+        if np.all(steps >= 0):
+            self._order = 1
+        elif np.all(steps <= 0):
+            self._order = -1
+        else:
+            self._order = 0
+
+        self.levels: list[tuple[npt.NDArray[np.integer], npt.NDArray[np.integer]]] = []
+        if self.size == 0:
+            return
+
+        index_type = np.int32 if self.size < np.iinfo(np.int32).max else np.int64
+        nan = np.isnan(self.y)
+        low_keys = np.where(nan, np.inf, self.y)
+        high_keys = np.where(nan, -np.inf, self.y)
+        lows = _first_level(low_keys, np.argmin, index_type)
+        highs = _first_level(high_keys, np.argmax, index_type)
+        self.levels.append((lows, highs))
+        while lows.size > 1:
+            lows = _reduce(lows, low_keys, np.argmin)
+            highs = _reduce(highs, high_keys, np.argmax)
+            self.levels.append((lows, highs))
+
+
+    @property
+    def size(self) -> int:
+        return int(self.y.size)
+
+
+    def visible_span(self, x_range: tuple[float, float] | None) -> tuple[int, int]:
+        """Return the sample index range drawn for ``x_range``.
+
+        One sample beyond each edge is kept so the line continues to the
+        border of the view.
+        """
+        if x_range is None or self._order == 0 or self.size == 0:
+            return 0, self.size
+
+        low, high = sorted(float(value) for value in x_range)
+        if self._order > 0:
+            start = np.searchsorted(self.x, low, side="left") - 1
+            stop = np.searchsorted(self.x, high, side="right") + 1
+        else:
+            reversed_x = self.x[::-1]
+            start = self.size - np.searchsorted(reversed_x, high, side="right") - 1
+            stop = self.size - np.searchsorted(reversed_x, low, side="left") + 1
+        return max(0, int(start)), min(self.size, int(stop))
+
+
+    def query(
+            self,
+            x_range: tuple[float, float] | None,
+            pixel_width: int,
+            ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Return the points to draw for a view.
+
+        Parameters
+        ----------
+        x_range : tuple[float, float] | None
+            The visible x range, or None for the whole trace.
+        pixel_width : int
+            Width of the view in device pixels.
+
+        Returns
+        -------
+        x, y : np.ndarray
+            Raw samples when the view holds only a few per pixel column,
+            otherwise the min/max envelope of the coarsest pyramid level
+            that still has ``ENVELOPE_BINS_PER_PIXEL`` bins per column.
+
+        """
+        start, stop = self.visible_span(x_range)
+        budget = max(1, int(pixel_width)) * ENVELOPE_BINS_PER_PIXEL
+        if stop - start <= 2 * budget:
+            return self.x[start:stop], self.y[start:stop]
+
+        level = 0
+        bin_size = ENVELOPE_FACTOR
+        while (
+                level + 1 < len(self.levels)
+                and (stop - start) / (bin_size * ENVELOPE_FACTOR) >= budget
+                ):
+            level += 1
+            bin_size *= ENVELOPE_FACTOR
+
+        lows, highs = self.levels[level]
+        first = start // bin_size
+        last = -(-stop // bin_size)
+        lows = lows[first:last]
+        highs = highs[first:last]
+        indices = np.empty(2 * lows.size, dtype=lows.dtype)
+        indices[0::2] = np.minimum(lows, highs)
+        indices[1::2] = np.maximum(lows, highs)
+        return self.x[indices], self.y[indices]
+
+
+def _first_level(keys, pick, index_type):
+    """Bin raw samples without gathering them through an index array."""
+    remainder = keys.size % ENVELOPE_FACTOR
+    if remainder:
+        keys = np.concatenate((keys, np.full(ENVELOPE_FACTOR - remainder, keys[-1])))
+    chosen = pick(keys.reshape(-1, ENVELOPE_FACTOR), axis=1).astype(index_type)
+    # Padding repeats the last sample, and argmin/argmax return the first
+    # occurrence, so a padded position is never chosen.
+    chosen += np.arange(0, keys.size, ENVELOPE_FACTOR, dtype=index_type)
+    return chosen
+
+
+def _reduce(indices, keys, pick):
+    """Combine ``ENVELOPE_FACTOR`` neighbouring bins into one."""
+    remainder = indices.size % ENVELOPE_FACTOR
+    if remainder:
+        indices = np.concatenate((
+            indices,
+            np.full(ENVELOPE_FACTOR - remainder, indices[-1], dtype=indices.dtype),
+            ))
+    groups = indices.reshape(-1, ENVELOPE_FACTOR)
+    chosen = pick(keys[groups], axis=1)
+    return groups[np.arange(groups.shape[0]), chosen]
+
+
+def line_envelope(x: npt.ArrayLike, y: npt.ArrayLike) -> LineEnvelope | None:
+    """Return an envelope for traces long enough to need one, else None."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if (
+            x.ndim != 1
+            or x.shape != y.shape
+            or y.size < ENVELOPE_MIN_POINTS
+            or x.dtype.kind not in "biuf"
+            or y.dtype.kind not in "biuf"
+            ):
+        return None
+    return LineEnvelope(x, y)
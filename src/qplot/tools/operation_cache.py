@@ -0,0 +1,142 @@
+"""
+In-memory cache of operated plot data.
+
+Refreshing a plot whose data has not changed, for example after a forced
+refresh, a colormap change or reopening a window, would otherwise run the whole
+operation chain again. The cache keeps the output of each chain for a given
+data version. A chain that extends a cached one, such as after an operation is
+toggled back on, resumes from the longest cached prefix and runs only the
+remaining operations.
+
+Cached arrays are read-only and shared between the plots that use them.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+OPERATION_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_shared_cache: "OperationResultCache | None" = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_operation_cache() -> "OperationResultCache":
+    """
+    Returns the process-wide cache of operated plot data.
+
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = OperationResultCache()
+        return _shared_cache
+
+
+def _frozen(values):
+    """Return values as an array that cannot be written through."""
+    if values is None:
+        return None
+    values = np.asarray(values)
+    if values.flags.writeable:
+        values.flags.writeable = False
+    return values
+
+
+def _entry_bytes(arrays):
+    return sum(int(values.nbytes) for values in arrays if values is not None)
+
+
+class OperationResultCache:
+    """
+    Least recently used operation outputs, bounded by their total size.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Total array size above which the least recently used outputs are
+        dropped. Outputs larger than this are not cached.
+
+    """
+
+    def __init__(self, max_bytes=OPERATION_CACHE_MAX_BYTES):
+        self.max_bytes = max(0, int(max_bytes))
+        self.total_bytes = 0
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+    def longest_prefix(self, data_key, operation_keys):
+        """
+        Return the longest cached prefix of an operation chain.
+
+        Parameters
+        ----------
+        data_key : tuple
+            Identifies the data version the chain runs on.
+        operation_keys : Sequence[tuple]
+            Keys of the operations in the order they run.
+
+        Returns
+        -------
+        length : int
+            Number of leading operations whose output is cached, 0 on a miss.
+        arrays : tuple[np.ndarray | None, np.ndarray | None, np.ndarray | None] | None
+            The read-only ``x``, ``y`` and ``z`` after those operations.
+
+        """
+        operation_keys = tuple(operation_keys)
+        with self._lock:
+            for length in range(len(operation_keys), 0, -1):
+                key = (data_key, operation_keys[:length])
+                arrays = self._entries.get(key)
+                if arrays is not None:
+                    self._entries.move_to_end(key)
+                    return length, arrays
+        return 0, None
+
+
+    def store(self, data_key, operation_keys, x, y, z):
+        """
+        Cache the output of an operation chain.
+
+        Arrays that the caller may still write to must be copies. Every array
+        is marked read-only and returned in that form.
+
+        Returns
+        -------
+        x, y, z : np.ndarray | None
+            The arrays as cached.
+
+        """
+        arrays = (_frozen(x), _frozen(y), _frozen(z))
+        size = _entry_bytes(arrays)
+        key = (data_key, tuple(operation_keys))
+        with self._lock:
+            self._drop(key)
+            if size > self.max_bytes:
+                return arrays
+
+            self._entries[key] = arrays
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return arrays
+
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+    def _drop(self, key):
+        arrays = self._entries.pop(key, None)
+        if arrays is not None:
+            self.total_bytes = max(0, self.total_bytes - _entry_bytes(arrays))
@@ -12,37 +12,90 @@ from qplot.tools.plot_tools import (
     differentiate,
     fill_heatmap,
     pass_filter,
+    pass_filter_kernel,
     subtract_mean,
 )
 
 
 @dataclass(frozen=True)
 class OperationSpec:
+    """
+    An operation offered on a plot surface.
+
+    ``in_place`` operations accept ``in_place=True`` and then overwrite the
+    floating point dependent data (``z``, or ``y`` for line plots) instead of
+    allocating a result. ``elementwise`` builds, from the user input, a
+    ``kernel(values, out)`` that computes the operation value by value, so
+    consecutive elementwise operations can run in one pass over the data.
+    """
+
     name: str
     func: Callable
     input_type: object
     default: object = ""
     derivative_axis: str | None = None
+    in_place: bool = False
+    elementwise: Callable | None = None
 
 
 @dataclass(frozen=True)
 class OperationCall:
-    """A configured operation and the metadata needed after it succeeds."""
+    """
+    A configured operation and the metadata needed after it succeeds.
+
+    ``key`` identifies the operation and its input, such as
+    ``("Fill Below", 10)``. Chains whose operations all have a key can have
+    their output cached.
+    """
 
     name: str
     func: Callable
     derivative_axis: str | None = None
     cooperative: bool = False
+    in_place: bool = False
+    elementwise: Callable | None = None
+    key: tuple | None = None
 
     def __call__(self, data):
         return self.func(data)
 
-    def execute(self, data, cancelled_callback):
+    def execute(self, data, cancelled_callback, in_place=False):
         """Run qPlot operations cooperatively while retaining one-arg calls."""
 
+        options = {}
         if self.cooperative:
-            return self.func(data, cancelled_callback=cancelled_callback)
-        return self.func(data)
+            options["cancelled_callback"] = cancelled_callback
+        if in_place and self.in_place:
+            options["in_place"] = True
+        return self.func(data, **options)
+
+
+def plan_operations(operations):
+    """
+    Group an operation chain into the steps of its execution plan.
+
+    Consecutive operations with an elementwise kernel share one step, so they
+    are applied together in a single pass over the data. Every other
+    operation is a step of its own.
+
+    Parameters
+    ----------
+    operations : list[OperationCall | callable]
+        The operations in the order they run.
+
+    Returns
+    -------
+    steps : list[list[OperationCall | callable]]
+
+    """
+    steps: list[list] = []
+    for operation in operations:
+        fusable = getattr(operation, "elementwise", None) is not None
+        if fusable and steps and getattr(steps[-1][0], "elementwise", None) is not None:
+            steps[-1].append(operation)
+        else:
+            steps.append([operation])
+    return steps
 
 
 class OperationValidationError(ValueError):
@@ -60,6 +113,7 @@ COMMON_OPERATION_SPECS = (
             "low", limit, data, cancelled_callback=cancelled_callback
             ),
         float,
+        elementwise=lambda limit: pass_filter_kernel("low", limit),
         ),
     OperationSpec(
         "Limit Minimum",
@@ -67,6 +121,7 @@ COMMON_OPERATION_SPECS = (
             "high", limit, data, cancelled_callback=cancelled_callback
             ),
         float,
+        elementwise=lambda limit: pass_filter_kernel("high", limit),
         ),
     )
 
@@ -84,17 +139,19 @@ PLOT_OPERATION_SPECS = {
     "plot2d": (
         OperationSpec(
             "Subtract Row Mean",
-            lambda data, cancelled_callback=None: subtract_mean(
-                "x", data, cancelled_callback=cancelled_callback
+            lambda data, cancelled_callback=None, in_place=False: subtract_mean(
+                "x", data, cancelled_callback=cancelled_callback, in_place=in_place
                 ),
             None,
+            in_place=True,
             ),
         OperationSpec(
             "Subtract Column Mean",
-            lambda data, cancelled_callback=None: subtract_mean(
-                "y", data, cancelled_callback=cancelled_callback
+            lambda data, cancelled_callback=None, in_place=False: subtract_mean(
+                "y", data, cancelled_callback=cancelled_callback, in_place=in_place
                 ),
             None,
+            in_place=True,
             ),
         OperationSpec(
             "dz/dx",
@@ -114,41 +171,47 @@ PLOT_OPERATION_SPECS = {
             ),
         OperationSpec(
             "Fill Below",
-            lambda value, data, cancelled_callback=None: fill_heatmap(
+            lambda value, data, cancelled_callback=None, in_place=False: fill_heatmap(
                 "below",
                 data,
                 max_depth=value,
                 cancelled_callback=cancelled_callback,
+                in_place=in_place,
                 ),
             int,
             10,
+            in_place=True,
             ),
         OperationSpec(
             "Fill Right",
-            lambda value, data, cancelled_callback=None: fill_heatmap(
+            lambda value, data, cancelled_callback=None, in_place=False: fill_heatmap(
                 "right",
                 data,
                 max_depth=value,
                 cancelled_callback=cancelled_callback,
+                in_place=in_place,
                 ),
             int,
             10,
+            in_place=True,
             ),
         ),
     "sweeper": (
         OperationSpec(
             "Subtract Cut Mean",
-            lambda data, cancelled_callback=None: subtract_mean(
-                "x", data, cancelled_callback=cancelled_callback
+            lambda data, cancelled_callback=None, in_place=False: subtract_mean(
+                "x", data, cancelled_callback=cancelled_callback, in_place=in_place
                 ),
             None,
+            in_place=True,
             ),
         OperationSpec(
             "Subtract Fixed Mean",
-            lambda data, cancelled_callback=None: subtract_mean(
-                "y", data, cancelled_callback=cancelled_callback
+            lambda data, cancelled_callback=None, in_place=False: subtract_mean(
+                "y", data, cancelled_callback=cancelled_callback, in_place=in_place
                 ),
             None,
+            in_place=True,
             ),
         OperationSpec(
             "Differentiate Cut",
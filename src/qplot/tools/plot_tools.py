@@ -16,6 +16,9 @@ used to find which properties to update the keyed value.
 """
 import numpy as np
 
+# Values per block of lines in fill_heatmap, between cancellation checks.
+FILL_BLOCK_CELLS = 1 << 18
+
 
 def _check_cancelled(cancelled_callback):
     if cancelled_callback is not None and cancelled_callback():
@@ -26,6 +29,7 @@ def subtract_mean(
         axis : str,
         data_dict : dict,
         cancelled_callback=None,
+        in_place=False,
         ):
     """
     Subtracts the mean from the dataGrid based on the axis.
@@ -39,6 +43,9 @@ def subtract_mean(
     data_dict : dict{str, np.ndarry}
         This function only uses data_dict["z"] : 
         the 2d numpy array dataGrid of the plot to opperate on
+    in_place : bool
+        Subtract from the floating point dataGrid itself instead of a new
+        array.
         
     Returns
     -------
@@ -53,7 +60,10 @@ def subtract_mean(
     _check_cancelled(cancelled_callback)
     mean = np.nanmean(dataGrid, axis=num_axis, keepdims=True)
     _check_cancelled(cancelled_callback)
-    dataGrid = dataGrid - mean
+    if in_place:
+        np.subtract(dataGrid, mean, out=dataGrid)
+    else:
+        dataGrid = dataGrid - mean
     _check_cancelled(cancelled_callback)
     
     return {"z" : dataGrid}
@@ -93,8 +103,16 @@ def pass_filter(
     # Get y for 1d or z for 2d
     axis = "z" if data_dict["z"] is not None else "y"
     data = data_dict[axis]
+    limit_arr = _pass_filter_bounds(which, limit)
     
-    # Set the bounds
+    _check_cancelled(cancelled_callback)
+    new_data = np.clip(data, *limit_arr)
+    _check_cancelled(cancelled_callback)
+    
+    return {axis : new_data}
+
+
+def _pass_filter_bounds(which, limit):
     limit_arr: tuple[float | None, float | None]
     if which == "low":
         limit_arr = (None, limit)
@@ -102,12 +120,33 @@ def pass_filter(
         limit_arr = (limit, None)
     else:
         raise KeyError(f'Invalid value for which: {which}. Must be: "high" or "low"')
-    
-    _check_cancelled(cancelled_callback)
-    new_data = np.clip(data, *limit_arr)
-    _check_cancelled(cancelled_callback)
-    
-    return {axis : new_data}
+    return limit_arr
+
+
+def pass_filter_kernel(which : str, limit : float):
+    """
+    Elementwise form of pass_filter for fused operation pipelines.
+
+    Parameters
+    ----------
+    which : str
+        Whether to do a low or high pass filter, as for pass_filter.
+    limit : float
+        The boundary value.
+
+    Returns
+    -------
+    kernel : callable
+        kernel(values, out) writes the limited values into out, which may be
+        values itself.
+
+    """
+    limit_arr = _pass_filter_bounds(which, limit)
+
+    def kernel(values, out):
+        np.clip(values, *limit_arr, out=out)
+
+    return kernel
 
 
 def differentiate(
@@ -170,41 +209,80 @@ def fill_heatmap(
         data_dict : dict,
         max_depth : int = 10,
         cancelled_callback=None,
+        in_place=False,
         ):
+    """
+    Fills bounded NaN gaps in the dataGrid with the value before them.
+
+    Parameters
+    ----------
+    which : str
+        Direction to fill in.
+        fill down the cols (which="below")
+        fill along the rows (which="right")
+    data_dict : dict{str, np.ndarry}
+        This function only uses data_dict["z"] :
+        the 2d numpy array dataGrid of the plot to opperate on
+    max_depth : int
+        Longest gap that is filled. Gaps touching the edge of the dataGrid
+        are never filled.
+    in_place : bool
+        Fill the dataGrid itself instead of a copy.
+
+    Returns
+    -------
+    dataGrid : dict{str: np.ndarray}
+        returns the updated dictionary in the the form:
+            {"z": dataGrid}
+
+    Notes
+    -----
+    The lines are filled in blocks of about FILL_BLOCK_CELLS values. For each
+    value the index of the last and the next non-NaN value along its line is
+    found with cumulative maxima and minima, which gives the gap length and
+    the fill value without walking the lines in Python.
+
+    """
     _check_cancelled(cancelled_callback)
-    data = data_dict["z"].copy()
+    data = data_dict["z"] if in_place else data_dict["z"].copy()
     if which == "below":
-        lines = (data[:, column] for column in range(data.shape[1]))
+        lines = data.T
     elif which == "right":
-        lines = (data[row, :] for row in range(data.shape[0]))
+        lines = data
     else:
         raise KeyError(f'Invalid value for which: {which}, must be "below" or "right".')
 
-    if max_depth <= 0:
+    if max_depth <= 0 or lines.ndim != 2 or lines.size == 0:
         return {"z": data}
 
-    for line in lines:
+    line_length = lines.shape[1]
+    positions = np.arange(line_length)
+    block_lines = max(1, FILL_BLOCK_CELLS // line_length)
+    for start in range(0, lines.shape[0], block_lines):
         _check_cancelled(cancelled_callback)
-        position = 0
-        while position < len(line):
-            if not np.isnan(line[position]):
-                position += 1
-                continue
-
-            gap_start = position
-            while position < len(line) and np.isnan(line[position]):
-                if position % 1024 == 0:
-                    _check_cancelled(cancelled_callback)
-                position += 1
-
-            gap_length = position - gap_start
-            bounded = gap_start > 0 and position < len(line)
-            if bounded and gap_length <= max_depth:
-                line[gap_start:position] = line[gap_start - 1]
+        block = lines[start:start + block_lines]
+        missing = np.isnan(block)
+        if not missing.any():
+            continue
+
+        previous = np.where(missing, -1, positions)
+        np.maximum.accumulate(previous, axis=1, out=previous)
+        following = np.where(missing, line_length, positions)
+        following = np.minimum.accumulate(following[:, ::-1], axis=1)[:, ::-1]
+
+        fill = (
+            missing
+            & (previous >= 0)
+            & (following < line_length)
+            & (following - previous - 1 <= max_depth)
+            )
+        if fill.any():
+            values = np.take_along_axis(block, np.maximum(previous, 0), axis=1)
+            block[fill] = values[fill]
 
     _check_cancelled(cancelled_callback)
     return {"z" : data}
-        
+
 
 def integrate(
         dx : str,
@@ -0,0 +1,130 @@
+"""
+Read-only arrays of loaded plot data shared between plot windows.
+
+A heatmap, its cut windows and 1D overlays of the same run would otherwise
+each build and keep their own copy of the same loaded data. Workers publish
+the arrays they build here under the data version they were read from; a
+later worker for the same data takes the published arrays instead of building
+them again.
+
+Entries only hold weak references. The windows displaying the arrays, or
+views of them, keep them alive, and an entry disappears with its last user.
+"""
+
+import threading
+import weakref
+from collections.abc import Hashable
+
+import numpy as np
+
+_shared_store: "SharedArrayStore | None" = None
+_shared_store_lock = threading.Lock()
+
+
+def shared_array_store() -> "SharedArrayStore":
+    """
+    Returns the process-wide store of loaded plot data.
+
+    """
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SharedArrayStore()
+        return _shared_store
+
+
+class _SharedEntry:
+    __slots__ = ("references", "metadata")
+
+    def __init__(self, arrays, metadata):
+        self.references = {name: weakref.ref(values) for name, values in arrays.items()}
+        self.metadata = metadata
+
+
+    def arrays(self):
+        """Return the arrays, or None once any of them has been released."""
+        arrays = {name: reference() for name, reference in self.references.items()}
+        if any(values is None for values in arrays.values()):
+            return None
+        return arrays
+
+
+class SharedArrayStore:
+    """
+    Loaded arrays by data version, kept alive only by their users.
+
+    Published arrays are marked read-only. Their users must take views or
+    copies instead of writing to them.
+    """
+
+    def __init__(self):
+        self._entries: dict[Hashable, _SharedEntry] = {}
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        with self._lock:
+            self._prune()
+            return len(self._entries)
+
+
+    def get(self, key):
+        """
+        Return the arrays published under ``key`` and their metadata.
+
+        Returns
+        -------
+        arrays : dict[str, np.ndarray] | None
+            The read-only arrays, or None if nothing alive is published.
+        metadata : object
+            The metadata given with the arrays, or None.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            arrays = entry.arrays() if entry is not None else None
+            if entry is None or arrays is None:
+                self._entries.pop(key, None)
+                return None, None
+            return arrays, entry.metadata
+
+
+    def publish(self, key, arrays, metadata=None):
+        """
+        Share ``arrays`` under ``key``, unless live arrays already are.
+
+        Parameters
+        ----------
+        key : Hashable
+            The data version the arrays were built from.
+        arrays : dict[str, np.ndarray]
+            The arrays to share. They are marked read-only.
+        metadata : object, optional
+            Small data returned with the arrays by ``get``.
+
+        Returns
+        -------
+        arrays : dict[str, np.ndarray]
+            The shared arrays, which are the earlier ones if still alive.
+        metadata : object
+            Their metadata.
+
+        """
+        arrays = {name: np.asarray(values) for name, values in arrays.items()}
+        with self._lock:
+            self._prune()
+            entry = self._entries.get(key)
+            existing = entry.arrays() if entry is not None else None
+            if entry is not None and existing is not None:
+                return existing, entry.metadata
+
+            for values in arrays.values():
+                values.flags.writeable = False
+            self._entries[key] = _SharedEntry(arrays, metadata)
+            return arrays, metadata
+
+
+    def _prune(self):
+        dead = [key for key, entry in self._entries.items() if entry.arrays() is None]
+        for key in dead:
+            del self._entries[key]
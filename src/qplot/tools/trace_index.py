@@ -0,0 +1,180 @@
+"""
+Nearest-sample lookup on long 1D traces.
+
+Snap-to-trace looks for the sample nearest to the cursor on every mouse move,
+measured in screen pixels so both axes count at their current zoom. Comparing
+the cursor with every sample takes milliseconds per trace with millions of
+samples. A :class:`TraceIndex` orders the finite samples by x, which needs no
+sort for sweeps, and groups them into a hierarchy of bounding boxes. A lookup
+walks down the hierarchy and keeps only the boxes that can still hold a
+nearer sample, so it visits a few hundred samples at any trace length.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+TRACE_INDEX_LEAF_SIZE = 64
+TRACE_INDEX_BRANCHING = 8
+
+
+class TraceIndex:
+    """
+    Bounding-box hierarchy over the finite samples of one trace.
+
+    Parameters
+    ----------
+    x, y : array_like
+        The trace in sample order. Only their first ``min(len(x), len(y))``
+        samples are used. They are kept by reference and must not be
+        modified while the index is in use.
+
+    """
+
+    def __init__(self, x: npt.ArrayLike, y: npt.ArrayLike) -> None:
+        self.source_x = x
+        self.source_y = y
+        x_values = np.asarray(x, dtype=float).ravel()
+        y_values = np.asarray(y, dtype=float).ravel()
+        count = min(x_values.size, y_values.size)
+        x_values = x_values[:count]
+        y_values = y_values[:count]
+
+        # Sample numbers are ``_first + _step * position`` unless a trace
+        # needed compressing or sorting, which keeps them in ``_samples``.
+        self._samples: npt.NDArray[np.intp] | None = None
+        self._first = 0
+        self._step = 1
+        finite = np.isfinite(x_values) & np.isfinite(y_values)
+        if not finite.all():
+            self._samples = np.flatnonzero(finite)
+            x_values = x_values[self._samples]
+            y_values = y_values[self._samples]
+
+        steps = np.diff(x_values)
+        if not np.all(steps >= 0):
+            if np.all(steps <= 0):
+                x_values = x_values[::-1]
+                y_values = y_values[::-1]
+                if self._samples is None:
+                    self._first = count - 1
+                    self._step = -1
+                else:
+                    self._samples = self._samples[::-1]
+            else:
+                order = np.argsort(x_values, kind="stable")
+                x_values = x_values[order]
+                y_values = y_values[order]
+                self._samples = order if self._samples is None else self._samples[order]
+
+        self.x = x_values
+        self.y = y_values
+        self.levels: list[tuple[np.ndarray, ...]] = []
+        if self.size:
+            self._build()
+
+
+    @property
+    def size(self) -> int:
+        """The number of finite samples."""
+        return int(self.x.size)
+
+
+    def matches(self, x: object, y: object) -> bool:
+        """Return whether the index was built from exactly these arrays."""
+        return self.source_x is x and self.source_y is y
+
+
+    def _build(self) -> None:
+        starts = np.arange(0, self.size, TRACE_INDEX_LEAF_SIZE)
+        level = (
+            self.x[starts],
+            self.x[np.minimum(starts + TRACE_INDEX_LEAF_SIZE, self.size) - 1],
+            np.minimum.reduceat(self.y, starts),
+            np.maximum.reduceat(self.y, starts),
+            self.y[starts],
+            )
+        self.levels.append(level)
+        while level[0].size > 1:
+            groups = np.arange(0, level[0].size, TRACE_INDEX_BRANCHING)
+            x_low, x_high, y_low, y_high, y_first = level
+            last = np.minimum(groups + TRACE_INDEX_BRANCHING, x_low.size) - 1
+            level = (
+                x_low[groups],
+                x_high[last],
+                np.minimum.reduceat(y_low, groups),
+                np.maximum.reduceat(y_high, groups),
+                y_first[groups],
+                )
+            self.levels.append(level)
+        self.levels.reverse()
+
+
+    def nearest(
+            self,
+            x: float,
+            y: float,
+            x_scale: float = 1.0,
+            y_scale: float = 1.0,
+            ) -> tuple[int, float] | None:
+        """
+        Return the sample nearest to a point.
+
+        Distances are measured after multiplying x and y offsets by their
+        scales, such as the pixels per data unit of a view.
+
+        Returns
+        -------
+        nearest : tuple[int, float] | None
+            The sample's index in the original arrays and its squared scaled
+            distance, or None for a trace without finite samples. Of equally
+            near samples, the first is returned.
+
+        """
+        if not self.size:
+            return None
+
+        x_scale = abs(float(x_scale))
+        y_scale = abs(float(y_scale))
+        nodes = np.arange(self.levels[0][0].size)
+        for depth, (x_low, x_high, y_low, y_high, y_first) in enumerate(self.levels):
+            x_low = x_low[nodes]
+            y_low = y_low[nodes]
+            # Every box contains its first sample, which bounds the nearest one.
+            reachable = _squared_distance(
+                (x_low - x) * x_scale,
+                (y_first[nodes] - y) * y_scale,
+                ).min()
+            x_gap = np.maximum(np.maximum(x_low - x, x - x_high[nodes]), 0.0) * x_scale
+            y_gap = np.maximum(np.maximum(y_low - y, y - y_high[nodes]), 0.0) * y_scale
+            nodes = nodes[_squared_distance(x_gap, y_gap) <= reachable]
+
+            branching = (
+                TRACE_INDEX_BRANCHING
+                if depth + 1 < len(self.levels)
+                else TRACE_INDEX_LEAF_SIZE
+                )
+            limit = (
+                self.levels[depth + 1][0].size
+                if depth + 1 < len(self.levels)
+                else self.size
+                )
+            nodes = (nodes[:, None] * branching + np.arange(branching)).ravel()
+            nodes = nodes[nodes < limit]
+
+        distances = _squared_distance(
+            (self.x[nodes] - x) * x_scale,
+            (self.y[nodes] - y) * y_scale,
+            )
+        best = distances.min()
+        sample = min(self._sample_number(nodes[distances == best]))
+        return sample, float(best)
+
+
+    def _sample_number(self, positions: np.ndarray) -> list[int]:
+        if self._samples is not None:
+            return self._samples[positions].tolist()
+        return (self._first + self._step * positions).tolist()
+
+
+def _squared_distance(dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+    return np.square(dx) + np.square(dy)
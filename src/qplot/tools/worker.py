@@ -6,9 +6,14 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 from PyQt6 import QtCore
 
-from qplot.datahandling import load_param_data_from_db, load_param_data_from_db_prep
+from qplot.datahandling import (
+    get_result_counts,
+    load_param_data_from_db,
+    load_param_data_from_db_prep,
+)
 from qplot.datahandling.dimensions import ensure_supported_plot_dimensions
 from qplot.datahandling.qcodes_cache import (
+    cache_column_store,
     cache_database_path,
     cache_dataset_completed,
     cache_is_live,
@@ -19,14 +24,30 @@ from qplot.datahandling.qcodes_cache import (
 )
 from qplot.datahandling.readonly import (
     DatabaseInstanceChangedError,
-    qcodes_read_only_connection,
-    sqlite_read_only_connection,
+    pooled_qcodes_read_only_connection,
+    pooled_sqlite_read_only_connection,
 )
 from qplot.diagnostics import log_exception
-from qplot.tools.operation_registry import OperationCall, OperationExecutionError
+from qplot.tools.operation_registry import (
+    OperationCall,
+    OperationExecutionError,
+    plan_operations,
+)
 
 from . import data2matrix
 from .heatmap_geometry import canonicalize_heatmap_data
+from .heatmap_grid import IncrementalHeatmapGrid
+from .heatmap_pyramid import (
+    HEATMAP_PYRAMID_BASE_CELLS,
+    HEATMAP_PYRAMID_BASE_SIDE,
+    HeatmapPyramid,
+    HeatmapPyramidCache,
+    PyramidAxis,
+    shared_heatmap_pyramid_cache,
+)
+from .line_envelope import LineEnvelope, line_envelope
+from .operation_cache import OperationResultCache, shared_operation_cache
+from .shared_arrays import SharedArrayStore, shared_array_store
 
 if TYPE_CHECKING:
     import qcodes
@@ -43,6 +64,10 @@ class PlotWorkCancelled(InterruptedError):
     """Internal control flow used to unwind cancelled plot work safely."""
 
 
+def _is_floating(values):
+    return isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.floating)
+
+
 def _sqlite_identifier(name):
     return '"' + str(name).replace('"', '""') + '"'
 
@@ -66,6 +91,12 @@ class loader(QtCore.QRunnable):
                  heatmap_axis_ranges: dict | None = None,
                  heatmap_full_axis_ranges: dict | None = None,
                  database_identity=None,
+                 dataset_guid: str | None = None,
+                 heatmap_grid: IncrementalHeatmapGrid | None = None,
+                 heatmap_pyramid: HeatmapPyramid | None = None,
+                 heatmap_pyramid_cache: HeatmapPyramidCache | None = None,
+                 operation_cache: OperationResultCache | None = None,
+                 array_store: SharedArrayStore | None = None,
                  ):
         """
         Sets up worker with required data for run()
@@ -89,6 +120,17 @@ class loader(QtCore.QRunnable):
         operations: list
             A list containing functions to perform on the refreshed data
             before returning
+        dataset_guid: str | None
+            The run's GUID, resolved on the main thread. It keys the heatmap
+            pyramid, which is neither reused nor cached without it.
+        heatmap_grid: IncrementalHeatmapGrid | None
+            The plot's persistent grid for unshaped 2D data. When given, only
+            points appended since the previous refresh are placed into it.
+        operation_cache: OperationResultCache | None
+            Cache of operated data. Defaults to the process-wide cache.
+        array_store: SharedArrayStore | None
+            Store sharing loaded plot arrays between windows. Defaults to the
+            process-wide store.
 
         """
         super().__init__()
@@ -114,12 +156,34 @@ class loader(QtCore.QRunnable):
         self.heatmap_axis_ranges = heatmap_axis_ranges
         self.heatmap_full_axis_ranges = heatmap_full_axis_ranges
         self.database_identity = database_identity
+        self.dataset_guid = dataset_guid
+        self.heatmap_grid = heatmap_grid
+        self.heatmap_pyramid = heatmap_pyramid
+        self.heatmap_pyramid_cache = (
+            shared_heatmap_pyramid_cache()
+            if heatmap_pyramid_cache is None
+            else heatmap_pyramid_cache
+            )
+        self.operation_cache = (
+            shared_operation_cache()
+            if operation_cache is None
+            else operation_cache
+            )
+        self.array_store = (
+            shared_array_store()
+            if array_store is None
+            else array_store
+            )
         self.database_replaced = False
         self.sampled_heatmap_source = False
         self.aggregated_heatmap_source = False
         self.loaded_from_sql_heatmap = False
         self.loaded_point_count: int | None = None
+        # Result rows in the read-only view this worker read, if it read one.
+        self.loaded_result_count: int | None = None
         self.heatmap_downsample_info: dict[str, Any] | None = None
+        # Display pyramid of a long 1D trace, built here off the GUI thread.
+        self.line_envelope: LineEnvelope | None = None
         self.heatmap_source_grid_shape: tuple[int, int] | None = None
         self.heatmap_source_axis_ranges: (
             dict[str, tuple[float, float]] | None
@@ -143,12 +207,12 @@ class loader(QtCore.QRunnable):
         self._cancelled.set()
         with self._sql_connection_lock:
             connection = self._sql_connection
-        if connection is not None:
-            try:
-                connection.interrupt()
-            except Exception:
-                # The worker may be closing the connection at the same time.
-                pass
+            if connection is not None:
+                try:
+                    connection.interrupt()
+                except Exception:
+                    # The worker may be closing the connection at the same time.
+                    pass
 
 
     def is_cancelled(self) -> bool:
@@ -173,10 +237,10 @@ class loader(QtCore.QRunnable):
 
 
     def _close_sql_connection(self, connection) -> None:
-        try:
-            connection.close()
-        finally:
-            self._set_sql_connection(None)
+        # Detach first so cancel() cannot interrupt a connection that has
+        # already gone back to the shared pool.
+        self._set_sql_connection(None)
+        connection.close()
 
 
     def _emit_finished(self, finished: bool) -> None:
@@ -190,6 +254,15 @@ class loader(QtCore.QRunnable):
                 raise
 
 
+    def _record_result_count(self, conn) -> None:
+        """Count result rows through the connection data was read from."""
+        self.loaded_result_count = get_result_counts(
+            [self.table_name],
+            database_path=cache_database_path(self.cache),
+            connection=conn,
+            ).get(self.table_name, self.loaded_result_count)
+
+
     def _finish_cancelled(self) -> None:
         self.running = False
         self._emit_finished(False)
@@ -213,7 +286,7 @@ class loader(QtCore.QRunnable):
                     self.dataset_completed = cache_dataset_completed(cache)
                     self.read_data = False
                 else:
-                    completion_conn = qcodes_read_only_connection(
+                    completion_conn = pooled_qcodes_read_only_connection(
                         cache_database_path(cache),
                         expected_database_identity=getattr(
                             self,
@@ -232,6 +305,7 @@ class loader(QtCore.QRunnable):
                             self.param,
                             connection=completion_conn,
                             )
+                        self._record_result_count(completion_conn)
                     finally:
                         self._close_sql_connection(completion_conn)
                     self._check_cancelled()
@@ -251,7 +325,7 @@ class loader(QtCore.QRunnable):
                     write_status, read_status, existing_data = (
                         snapshot_cache_parameter_state(cache, self.param.name)
                         )
-                    conn = qcodes_read_only_connection(
+                    conn = pooled_qcodes_read_only_connection(
                         cache_database_path(cache),
                         expected_database_identity=getattr(
                             self,
@@ -274,7 +348,9 @@ class loader(QtCore.QRunnable):
                             write_status,
                             read_status,
                             existing_data,
+                            column_store=cache_column_store(cache),
                         )
+                        self._record_result_count(conn)
                     finally:
                         self._close_sql_connection(conn)
 
@@ -285,43 +361,7 @@ class loader(QtCore.QRunnable):
                     data = cache_parameter_data(cache, self.param.name)
 
                 self._check_cancelled()
-                depvarData = data[self.param.name]
-
-                # for shaped 2d plots
-                if len(depvarData.shape) == 2:
-                    (
-                        axis_data,
-                        axis_param,
-                        dataGrid
-                    ) = self.for_shaped_2d(
-                        data,
-                        depvarData
-                        )
-
-                else:
-                    #Remove nan values
-                    valid_rows = ~np.isnan(depvarData)
-
-                    # for 1d plots
-                    if len(self.param.depends_on_) == 1:
-                        (
-                            axis_data,
-                            axis_param
-                        ) = self.for_1d(
-                            data,
-                            valid_rows
-                            )
-                    # for >2d plots/unshaped 2d
-                    else:
-                        (
-                            axis_data,
-                            axis_param,
-                            dataGrid
-                        ) = self.for_unshaped_2d(
-                            data,
-                            valid_rows,
-                            depvarData
-                            )
+                axis_data, axis_param, dataGrid = self._shared_plot_arrays(data)
 
                 # Allow main to fetch data
                 self.axis_data = axis_data
@@ -368,6 +408,8 @@ class loader(QtCore.QRunnable):
             self._check_cancelled()
             self._canonicalize_heatmap()
             self._check_cancelled()
+            self._build_line_envelope()
+            self._check_cancelled()
         except PlotWorkCancelled:
             self._finish_cancelled()
             return
@@ -409,6 +451,18 @@ class loader(QtCore.QRunnable):
         self.dataGrid = data_grid
 
 
+    def _build_line_envelope(self) -> None:
+        """Precompute the min/max pyramid plot1d draws long traces from."""
+
+        self.line_envelope = None
+        if hasattr(self, "dataGrid") or len(self.param.depends_on_) != 1:
+            return
+        self.line_envelope = line_envelope(
+            self.axis_data.get("x", []),
+            self.axis_data.get("y", []),
+            )
+
+
     def _should_use_sql_heatmap(self):
         if len(getattr(self.param, "depends_on_", ())) <= 1:
             return False
@@ -448,7 +502,7 @@ class loader(QtCore.QRunnable):
             self.total_point_count_estimate = setpoint_count
             return setpoint_count
 
-        conn = sqlite_read_only_connection(
+        conn = pooled_sqlite_read_only_connection(
             cache_database_path(self.cache),
             expected_database_identity=getattr(self, "database_identity", None),
         )
@@ -488,7 +542,7 @@ class loader(QtCore.QRunnable):
 
 
     def _load_large_heatmap_from_sql(self):
-        conn = sqlite_read_only_connection(
+        conn = pooled_sqlite_read_only_connection(
             cache_database_path(self.cache),
             expected_database_identity=getattr(self, "database_identity", None),
         )
@@ -563,16 +617,15 @@ class loader(QtCore.QRunnable):
                 np.array([], dtype=float),
                 )
 
-        table = _sqlite_identifier(self.table_name)
-        x_column = _sqlite_identifier(self.axes_dict["x"])
-        y_column = _sqlite_identifier(self.axes_dict["y"])
-        z_column = _sqlite_identifier(self.param.name)
-        selected_where_sql = f"{z_column} IS NOT NULL"
-        selected_count = self._selected_parameter_row_count(conn)
-        row_count = selected_count
-        if row_count is None:
-            row_count = rowid_max - rowid_min + 1
-        columns = f"{x_column}, {y_column}, {z_column}"
+        # A pyramid that already covers every result row answers the load
+        # without counting rows again.
+        pyramid = self._ready_heatmap_pyramid()
+        if pyramid is not None:
+            row_count = pyramid.row_count
+        else:
+            row_count = self._selected_parameter_row_count(conn)
+            if row_count is None:
+                row_count = rowid_max - rowid_min + 1
         axis_ranges = self._normalised_heatmap_axis_ranges(self.heatmap_axis_ranges)
         self.total_point_count_estimate = row_count
         self._heatmap_source_info = {
@@ -587,101 +640,157 @@ class loader(QtCore.QRunnable):
             }
 
         axis_where_sql, parameters = self._heatmap_where_clause()
+        if pyramid is None and row_count <= MAX_SQL_HEATMAP_SOURCE_ROWS:
+            return self._read_heatmap_rows(conn, axis_where_sql, parameters)
+
+        if pyramid is None:
+            pyramid = self._heatmap_pyramid_from_sql(conn, rowid_max)
+        self.heatmap_pyramid = pyramid
+        if pyramid is None:
+            self.sampled_heatmap_source = False
+            self.aggregated_heatmap_source = False
+            return self._arrays_from_values([], [], [])
+
+        if axis_where_sql and not pyramid.exact:
+            # Binned base cells are coarser than the source. Once few enough
+            # rows are in view, read them for full resolution instead.
+            range_row_count = pyramid.source_rows(pyramid.visible_cells(axis_ranges))
+            if range_row_count <= MAX_SQL_HEATMAP_SOURCE_ROWS:
+                return self._read_heatmap_rows(conn, axis_where_sql, parameters)
+
+        return self._heatmap_pyramid_arrays(pyramid, axis_ranges)
+
+
+    def _read_heatmap_rows(self, conn, axis_where_sql, parameters):
+        """Read the finite source rows of the selected parameter in view."""
+        table = _sqlite_identifier(self.table_name)
+        x_column = _sqlite_identifier(self.axes_dict["x"])
+        y_column = _sqlite_identifier(self.axes_dict["y"])
+        z_column = _sqlite_identifier(self.param.name)
+        columns = f"{x_column}, {y_column}, {z_column}"
+        where_sql = f"{z_column} IS NOT NULL"
         if axis_where_sql:
-            where_sql = f"{selected_where_sql} AND {axis_where_sql}"
-            spatial_where_sql = (
-                f"{where_sql} AND {x_column} IS NOT NULL "
-                f"AND {y_column} IS NOT NULL"
-                )
-            range_summary = self._heatmap_spatial_summary(
+            where_sql = f"{where_sql} AND {axis_where_sql}"
+            range_row_count = self._heatmap_spatial_summary(
                 conn,
-                spatial_where_sql,
+                (
+                    f"{where_sql} AND {x_column} IS NOT NULL "
+                    f"AND {y_column} IS NOT NULL"
+                    ),
                 parameters,
-                )
-            range_row_count = range_summary[0]
+                )[0]
             self._heatmap_estimated_range_rows = range_row_count
             self._heatmap_source_info.update({
                 "estimated_range_rows": range_row_count,
                 "strategy": "visible range",
                 })
-            if range_row_count > MAX_SQL_HEATMAP_SOURCE_ROWS:
-                return self._spatially_aggregated_heatmap_arrays(
-                    conn,
-                    spatial_where_sql,
-                    parameters,
-                    range_summary,
-                    )
 
-            self.sampled_heatmap_source = False
-            self.aggregated_heatmap_source = False
-            cursor = conn.execute(
-                (
-                    f"SELECT {columns} FROM {table} "
-                    f"WHERE {where_sql} ORDER BY rowid"
-                    ),
-                parameters,
-                )
-            return self._arrays_from_cursor(cursor)
+        self.sampled_heatmap_source = False
+        self.aggregated_heatmap_source = False
+        cursor = conn.execute(
+            f"SELECT {columns} FROM {table} WHERE {where_sql} ORDER BY rowid",
+            parameters,
+            )
+        return self._arrays_from_cursor(cursor)
 
-        if row_count <= MAX_SQL_HEATMAP_SOURCE_ROWS:
-            self.sampled_heatmap_source = False
-            self.aggregated_heatmap_source = False
-            cursor = conn.execute(
-                (
-                    f"SELECT {columns} FROM {table} "
-                    f"WHERE {selected_where_sql} ORDER BY rowid"
-                    ),
-                )
-            return self._arrays_from_cursor(cursor)
 
-        spatial_where_sql = (
-            f"{selected_where_sql} AND {x_column} IS NOT NULL "
-            f"AND {y_column} IS NOT NULL"
-            )
-        summary = self._heatmap_spatial_summary(conn, spatial_where_sql, ())
-        return self._spatially_aggregated_heatmap_arrays(
-            conn,
-            spatial_where_sql,
-            (),
-            summary,
+    def _heatmap_pyramid_key(self):
+        guid = getattr(self, "dataset_guid", None)
+        if not guid:
+            return None
+        return (
+            str(guid),
+            str(self.table_name),
+            str(self.param.name),
+            str(self.axes_dict["x"]),
+            str(self.axes_dict["y"]),
             )
 
 
-    def _heatmap_spatial_summary(self, conn, where_sql, parameters):
-        self._check_cancelled()
-        table = _sqlite_identifier(self.table_name)
+    def _ready_heatmap_pyramid(self) -> HeatmapPyramid | None:
+        """
+        Return a pyramid that covers the run's current results, if one exists.
+
+        The plot's previous pyramid is reused while the result count is
+        unchanged. Completed runs are also looked up in the disk cache.
+
+        """
+        key = self._heatmap_pyramid_key()
+        result_count = getattr(self, "loaded_result_count", None)
+        if key is None or result_count is None:
+            return None
+
+        pyramid = getattr(self, "heatmap_pyramid", None)
+        if (
+                pyramid is not None
+                and pyramid.key == key
+                and pyramid.result_count == result_count
+                ):
+            return pyramid
+
+        disk_cache = getattr(self, "heatmap_pyramid_cache", None)
+        if disk_cache is None or getattr(self, "dataset_completed", None) is not True:
+            return None
+        pyramid = disk_cache.load((*key, result_count))
+        if pyramid is None or pyramid.key != key:
+            return None
+        return pyramid
+
+
+    def _heatmap_pyramid_from_sql(self, conn, rowid_max):
+        """
+        Build the selected parameter's pyramid, or extend the plot's previous one.
+
+        The previous pyramid of the same run is extended with the rows written
+        after it, unless they fall outside its base cells. Pyramids of
+        completed runs are written to the disk cache.
+
+        """
+        key = self._heatmap_pyramid_key()
+        result_count = getattr(self, "loaded_result_count", None)
+        previous = getattr(self, "heatmap_pyramid", None)
+        pyramid = None
+        if (
+                previous is not None
+                and key is not None
+                and previous.key == key
+                and previous.last_rowid is not None
+                and previous.last_rowid <= rowid_max
+                ):
+            pyramid = self._extended_heatmap_pyramid(
+                conn,
+                previous,
+                result_count,
+                rowid_max,
+                )
+        if pyramid is None:
+            pyramid = self._built_heatmap_pyramid(conn, key, result_count, rowid_max)
+
+        disk_cache = getattr(self, "heatmap_pyramid_cache", None)
+        if (
+                pyramid is not None
+                and disk_cache is not None
+                and key is not None
+                and result_count is not None
+                and getattr(self, "dataset_completed", None) is True
+                ):
+            disk_cache.store((*key, result_count), pyramid)
+        return pyramid
+
+
+    def _heatmap_pyramid_where_sql(self):
         x_column = _sqlite_identifier(self.axes_dict["x"])
         y_column = _sqlite_identifier(self.axes_dict["y"])
-        row = conn.execute(
-            (
-                f"SELECT COUNT(*), MIN({x_column}), MAX({x_column}), "
-                f"COUNT(DISTINCT {x_column}), MIN({y_column}), "
-                f"MAX({y_column}), COUNT(DISTINCT {y_column}) "
-                f"FROM {table} WHERE {where_sql}"
-                ),
-            parameters,
-            ).fetchone()
-        if row is None or row[0] is None:
-            return (0, None, None, 0, None, None, 0)
-
+        z_column = _sqlite_identifier(self.param.name)
         return (
-            int(row[0]),
-            row[1],
-            row[2],
-            int(row[3] or 0),
-            row[4],
-            row[5],
-            int(row[6] or 0),
+            f"{z_column} IS NOT NULL AND {x_column} IS NOT NULL "
+            f"AND {y_column} IS NOT NULL"
             )
 
 
-    def _spatially_aggregated_heatmap_arrays(
-            self,
-            conn,
-            where_sql,
-            parameters,
-            summary,
-            ):
+    def _built_heatmap_pyramid(self, conn, key, result_count, rowid_max):
+        where_sql = f"{self._heatmap_pyramid_where_sql()} AND rowid <= ?"
+        summary = self._heatmap_spatial_summary(conn, where_sql, (rowid_max,))
         (
             matching_rows,
             x_min,
@@ -693,118 +802,197 @@ class loader(QtCore.QRunnable):
             ) = summary
         if (
                 matching_rows <= 0
-                or x_min is None
-                or x_max is None
-                or y_min is None
-                or y_max is None
+                or None in (x_min, x_max, y_min, y_max)
                 or x_count <= 0
                 or y_count <= 0
                 ):
-            self.sampled_heatmap_source = False
-            self.aggregated_heatmap_source = False
-            return self._arrays_from_values([], [], [])
-
-        x_bins, y_bins = self._bounded_grid_shape(x_count, y_count)
-        table = _sqlite_identifier(self.table_name)
-        x_column = _sqlite_identifier(self.axes_dict["x"])
-        y_column = _sqlite_identifier(self.axes_dict["y"])
-        z_column = _sqlite_identifier(self.param.name)
+            return None
 
-        x_exact = x_bins >= x_count
-        y_exact = y_bins >= y_count
-        query_parameters: list[float | int] = []
-        if x_exact:
-            x_centres = np.array([], dtype=float)
-            x_group_sql = x_column
-        else:
-            x_centres, x_lower_edge, x_scale = self._spatial_axis_bins(
+        x_cells, y_cells = self._bounded_grid_shape(
+            x_count,
+            y_count,
+            max_cells=HEATMAP_PYRAMID_BASE_CELLS,
+            max_side=HEATMAP_PYRAMID_BASE_SIDE,
+            )
+        # Binned axes get a power-of-two cell count, so every level splits
+        # them into equal cells.
+        x_axis = None
+        if x_cells < x_count:
+            x_axis = PyramidAxis.binned(
                 float(x_min),
                 float(x_max),
                 x_count,
-                x_bins,
+                1 << (x_cells.bit_length() - 1),
                 )
-            x_group_sql = f"MIN(CAST(({x_column} - ?) * ? AS INTEGER), ?)"
-            query_parameters.extend((x_lower_edge, x_scale, x_bins - 1))
-
-        if y_exact:
-            y_centres = np.array([], dtype=float)
-            y_group_sql = y_column
-        else:
-            y_centres, y_lower_edge, y_scale = self._spatial_axis_bins(
+        y_axis = None
+        if y_cells < y_count:
+            y_axis = PyramidAxis.binned(
                 float(y_min),
                 float(y_max),
                 y_count,
-                y_bins,
+                1 << (y_cells.bit_length() - 1),
                 )
-            y_group_sql = f"MIN(CAST(({y_column} - ?) * ? AS INTEGER), ?)"
-            query_parameters.extend((y_lower_edge, y_scale, y_bins - 1))
 
-        if (
-                (not x_exact and x_centres.size == 0)
-                or (not y_exact and y_centres.size == 0)
-                ):
-            self.sampled_heatmap_source = False
-            self.aggregated_heatmap_source = False
-            return self._arrays_from_values([], [], [])
+        groups = self._heatmap_pyramid_groups(
+            conn,
+            x_axis,
+            y_axis,
+            where_sql,
+            (rowid_max,),
+            )
+        # Exact axes have one base cell per distinct coordinate.
+        if x_axis is None:
+            x_axis = PyramidAxis(np.unique(groups[0]))
+        if y_axis is None:
+            y_axis = PyramidAxis(np.unique(groups[1]))
+        self._check_cancelled()
+        return HeatmapPyramid.from_groups(
+            x_axis,
+            y_axis,
+            groups,
+            bounds={
+                "x": (float(x_min), float(x_max)),
+                "y": (float(y_min), float(y_max)),
+                },
+            unique_counts=(x_count, y_count),
+            key=key,
+            result_count=result_count,
+            last_rowid=rowid_max,
+            )
+
+
+    def _extended_heatmap_pyramid(self, conn, previous, result_count, rowid_max):
+        where_sql = (
+            f"{self._heatmap_pyramid_where_sql()} AND rowid > ? AND rowid <= ?"
+            )
+        parameters = (previous.last_rowid, rowid_max)
+        x_column = _sqlite_identifier(self.axes_dict["x"])
+        y_column = _sqlite_identifier(self.axes_dict["y"])
+        table = _sqlite_identifier(self.table_name)
+        row = conn.execute(
+            (
+                f"SELECT MIN({x_column}), MAX({x_column}), MIN({y_column}), "
+                f"MAX({y_column}) FROM {table} WHERE {where_sql}"
+                ),
+            parameters,
+            ).fetchone()
+        if row is None or None in row:
+            bounds = previous.bounds
+        else:
+            bounds = {
+                "x": (float(row[0]), float(row[1])),
+                "y": (float(row[2]), float(row[3])),
+                }
+        groups = self._heatmap_pyramid_groups(
+            conn,
+            previous.x_axis,
+            previous.y_axis,
+            where_sql,
+            parameters,
+            )
+        self._check_cancelled()
+        return previous.extended(
+            groups,
+            bounds=bounds,
+            result_count=result_count,
+            last_rowid=rowid_max,
+            )
+
+
+    def _heatmap_pyramid_groups(self, conn, x_axis, y_axis, where_sql, parameters):
+        """
+        Aggregate matching rows into pyramid base cells with one SQL query.
+
+        Axes that are None or exact are grouped by coordinate; binned axes are
+        grouped by cell index.
+
+        Returns
+        -------
+        groups : tuple of np.ndarray
+            The x group, y group, sum, count, minimum and maximum of every
+            non-empty cell.
+
+        """
+        self._check_cancelled()
+        table = _sqlite_identifier(self.table_name)
+        z_column = _sqlite_identifier(self.param.name)
+        group_sql = []
+        query_parameters: list[float | int] = []
+        for axis, pyramid_axis in (("x", x_axis), ("y", y_axis)):
+            column = _sqlite_identifier(self.axes_dict[axis])
+            if pyramid_axis is None or pyramid_axis.exact:
+                group_sql.append(column)
+                continue
+            group_sql.append(f"MIN(CAST(({column} - ?) * ? AS INTEGER), ?)")
+            query_parameters.extend((
+                pyramid_axis.lower_edge,
+                pyramid_axis.scale,
+                pyramid_axis.size - 1,
+                ))
 
         cursor = conn.execute(
             (
-                "SELECT x_group, y_group, AVG(z_value), COUNT(*) FROM ("
-                f"SELECT {x_group_sql} AS x_group, {y_group_sql} AS y_group, "
+                "SELECT x_group, y_group, SUM(z_value), COUNT(*), "
+                "MIN(z_value), MAX(z_value) FROM ("
+                f"SELECT {group_sql[0]} AS x_group, {group_sql[1]} AS y_group, "
                 f"{z_column} AS z_value FROM {table} WHERE {where_sql}"
-                ") GROUP BY x_group, y_group ORDER BY y_group, x_group"
+                ") GROUP BY x_group, y_group"
                 ),
             (*query_parameters, *parameters),
             )
-        x_groups = []
-        y_groups = []
-        z_values = []
-        aggregated_source_rows = 0
-        for row_number, (x_group, y_group, z_value, bin_rows) in enumerate(cursor):
-            if row_number % 1024 == 0:
-                self._check_cancelled()
-            if z_value is None:
-                continue
-            x_groups.append(x_group)
-            y_groups.append(y_group)
-            z_values.append(z_value)
-            aggregated_source_rows += int(bin_rows)
-
-        x_group_data = np.asarray(x_groups, dtype=float)
-        y_group_data = np.asarray(y_groups, dtype=float)
-        z_data = np.asarray(z_values, dtype=float)
-        finite = (
-            np.isfinite(x_group_data)
-            & np.isfinite(y_group_data)
-            & np.isfinite(z_data)
+        chunks = []
+        while True:
+            self._check_cancelled()
+            rows = cursor.fetchmany(CANCELLATION_CHUNK_SIZE)
+            if not rows:
+                break
+            chunks.append(np.asarray(rows, dtype=float).reshape(-1, 6))
+        groups = np.concatenate(chunks) if chunks else np.empty((0, 6))
+        groups = groups[np.isfinite(groups[:, 0]) & np.isfinite(groups[:, 1])]
+        return (
+            groups[:, 0],
+            groups[:, 1],
+            groups[:, 2],
+            groups[:, 3].astype(np.int64),
+            groups[:, 4],
+            groups[:, 5],
             )
 
-        if x_exact:
-            x_centres = np.unique(x_group_data[np.isfinite(x_group_data)])
-            x_index_data = np.searchsorted(x_centres, x_group_data[finite])
-        else:
-            x_index_data = x_group_data[finite].astype(np.int64)
-        if y_exact:
-            y_centres = np.unique(y_group_data[np.isfinite(y_group_data)])
-            y_index_data = np.searchsorted(y_centres, y_group_data[finite])
-        else:
-            y_index_data = y_group_data[finite].astype(np.int64)
 
-        z_data = z_data[finite]
-        self._spatial_heatmap_axes = (x_centres, y_centres)
+    def _heatmap_pyramid_arrays(self, pyramid, axis_ranges):
+        """Return the pyramid tile for the visible range as aggregated points."""
+        self._check_cancelled()
+        cells = pyramid.visible_cells(axis_ranges)
+        (x_start, x_stop), (y_start, y_stop) = cells
+        view = pyramid.view(
+            cells,
+            self._bounded_grid_shape(max(1, x_stop - x_start), max(1, y_stop - y_start)),
+            )
+        finite = (view.counts > 0) & np.isfinite(view.mean)
+        y_index_data, x_index_data = np.nonzero(finite)
+        z_data = view.mean[finite]
+        matching_rows = int(view.counts[finite].sum())
+        if axis_ranges is not None:
+            matching_rows = pyramid.source_rows(cells)
+            self._heatmap_estimated_range_rows = matching_rows
+
+        self._spatial_heatmap_axes = (view.x, view.y)
         self._spatial_heatmap_indices = (x_index_data, y_index_data)
-        self._spatial_heatmap_source_unique_counts = (x_count, y_count)
-        self._heatmap_aggregated_source_rows = aggregated_source_rows
+        self._spatial_heatmap_source_unique_counts = view.unique_counts
+        self._heatmap_aggregated_source_rows = matching_rows
         full_axis_ranges = self._normalised_heatmap_axis_ranges(
             self.heatmap_full_axis_ranges
             )
         if full_axis_ranges is not None:
             self.heatmap_source_axis_ranges = full_axis_ranges
         elif self.heatmap_axis_ranges is None:
-            self.heatmap_source_axis_ranges = {
-                "x": (float(x_min), float(x_max)),
-                "y": (float(y_min), float(y_max)),
-                }
+            self.heatmap_source_axis_ranges = dict(pyramid.bounds)
+        value_range = None
+        if z_data.size:
+            value_range = (
+                float(np.nanmin(view.minimum)),
+                float(np.nanmax(view.maximum)),
+                )
         self.sampled_heatmap_source = False
         self.aggregated_heatmap_source = True
         self._heatmap_source_info.update({
@@ -814,23 +1002,38 @@ class loader(QtCore.QRunnable):
             "sample_limit": None,
             "sample_stride": None,
             "strategy": "spatial mean",
+            "pyramid_level": view.level,
+            "value_range": value_range,
             })
-        return x_centres[x_index_data], y_centres[y_index_data], z_data
+        return view.x[x_index_data], view.y[y_index_data], z_data
 
 
-    @staticmethod
-    def _spatial_axis_bins(lower, upper, source_count, bin_count):
-        if not np.isfinite(lower) or not np.isfinite(upper):
-            return np.array([], dtype=float), 0.0, 1.0
-        if source_count <= 1 or bin_count <= 1 or lower == upper:
-            return np.array([lower], dtype=float), lower, 1.0
+    def _heatmap_spatial_summary(self, conn, where_sql, parameters):
+        self._check_cancelled()
+        table = _sqlite_identifier(self.table_name)
+        x_column = _sqlite_identifier(self.axes_dict["x"])
+        y_column = _sqlite_identifier(self.axes_dict["y"])
+        row = conn.execute(
+            (
+                f"SELECT COUNT(*), MIN({x_column}), MAX({x_column}), "
+                f"COUNT(DISTINCT {x_column}), MIN({y_column}), "
+                f"MAX({y_column}), COUNT(DISTINCT {y_column}) "
+                f"FROM {table} WHERE {where_sql}"
+                ),
+            parameters,
+            ).fetchone()
+        if row is None or row[0] is None:
+            return (0, None, None, 0, None, None, 0)
 
-        source_step = (upper - lower) / (source_count - 1)
-        lower_edge = lower - source_step / 2
-        upper_edge = upper + source_step / 2
-        bin_width = (upper_edge - lower_edge) / bin_count
-        centres = lower_edge + (np.arange(bin_count, dtype=float) + 0.5) * bin_width
-        return centres, lower_edge, 1.0 / bin_width
+        return (
+            int(row[0]),
+            row[1],
+            row[2],
+            int(row[3] or 0),
+            row[4],
+            row[5],
+            int(row[6] or 0),
+            )
 
 
     def _selected_parameter_row_count(self, conn):
@@ -1122,6 +1325,8 @@ class loader(QtCore.QRunnable):
                 source_info.get("strategy") if source_aggregated else None
                 ),
             "axis_ranges": source_info.get("axis_ranges"),
+            "pyramid_level": source_info.get("pyramid_level"),
+            "source_value_range": source_info.get("value_range"),
             "unique_x_count": grid_info.get("unique_x_count"),
             "unique_y_count": grid_info.get("unique_y_count"),
             "exact_cell_count": grid_info.get("exact_cell_count"),
@@ -1310,10 +1515,11 @@ class loader(QtCore.QRunnable):
         return low, high
 
 
-    def _bounded_grid_shape(self, x_count, y_count, max_cells=None):
+    def _bounded_grid_shape(self, x_count, y_count, max_cells=None, max_side=None):
         max_cells = int(max_cells or MAX_SQL_HEATMAP_GRID_CELLS)
-        x_bins = max(1, min(int(x_count), MAX_SQL_HEATMAP_GRID_SIDE))
-        y_bins = max(1, min(int(y_count), MAX_SQL_HEATMAP_GRID_SIDE))
+        max_side = int(max_side or MAX_SQL_HEATMAP_GRID_SIDE)
+        x_bins = max(1, min(int(x_count), max_side))
+        y_bins = max(1, min(int(y_count), max_side))
 
         if x_bins * y_bins <= max_cells:
             return x_bins, y_bins
@@ -1556,13 +1762,174 @@ class loader(QtCore.QRunnable):
         dataGrid = dataGrid.to_numpy(float)
         
         return axis_data, axis_param, dataGrid
+
+
+    def _can_update_heatmap_grid(self, data, depvarData):
+        if getattr(self, "heatmap_grid", None) is None:
+            return False
+        arrays = [depvarData] + [data[self.axes_dict[axis]] for axis in ["x", "y"]]
+        return all(
+            np.ndim(array) == 1 and np.asarray(array).dtype.kind in "biuf"
+            for array in arrays
+            )
+
+
+    def for_incremental_unshaped_2d(self, data, depvarData):
+        """Place only the points read since the previous refresh into the grid.
+
+        The returned arrays are copies, so later refreshes of the plot's grid
+        never change a result that is already shown.
+        """
+        heatmap_grid = self.heatmap_grid
+        if heatmap_grid is None:
+            return self.for_unshaped_2d(data, ~np.isnan(depvarData), depvarData)
+
+        self._check_cancelled()
+        names = {axis: self.axes_dict[axis] for axis in ["x", "y"]}
+        key = (
+            getattr(self, "database_identity", None),
+            self.table_name,
+            self.param.name,
+            names["x"],
+            names["y"],
+            )
+        (
+            y_data,
+            x_data,
+            dataGrid,
+        ) = heatmap_grid.update(
+            key,
+            data[names["y"]],
+            data[names["x"]],
+            depvarData,
+            check_cancelled=self._check_cancelled,
+            )
+        self._check_cancelled()
+
+        axis_data = {"x": x_data, "y": y_data}
+        axis_param = {axis: self.param_dict[name] for axis, name in names.items()}
+        return axis_data, axis_param, dataGrid
         
     
+    def _shared_plot_arrays(self, data):
+        """
+        Return the plot arrays of the loaded data, shared between windows.
+
+        Arrays another window already built from the same data version are
+        taken from self.array_store instead of being built again; newly built
+        ones are published there. Grids of live unshaped heatmaps are updated
+        in place by their plot and are never shared.
+
+        Returns
+        -------
+        axis_data : dict{str: np.ndarray}
+        axis_param : dict{str: ParamSpec}
+        dataGrid : np.ndarray | None
+            None for 1d plots.
+
+        """
+        depvarData = data[self.param.name]
+        incremental = (
+            len(depvarData.shape) != 2
+            and len(self.param.depends_on_) != 1
+            and self._can_update_heatmap_grid(data, depvarData)
+            )
+        array_store = getattr(self, "array_store", None)
+        key = None
+        if array_store is not None and not incremental:
+            key = self._loaded_data_key()
+        if array_store is not None and key is not None:
+            arrays, names = array_store.get(key)
+            if arrays is not None:
+                axis_param = {axis: self.param_dict[name] for axis, name in names.items()}
+                dataGrid = arrays.pop("z", None)
+                return arrays, axis_param, dataGrid
+
+        axis_data, axis_param, dataGrid = self._build_plot_arrays(data, depvarData)
+        names = {axis: getattr(param, "name", None) for axis, param in axis_param.items()}
+        if (
+                array_store is None
+                or key is None
+                or any(name not in self.param_dict for name in names.values())
+                ):
+            return axis_data, axis_param, dataGrid
+
+        arrays = dict(axis_data)
+        if dataGrid is not None:
+            arrays["z"] = dataGrid
+        arrays, _names = array_store.publish(key, arrays, names)
+        dataGrid = arrays.pop("z", None)
+        return arrays, axis_param, dataGrid
+
+
+    def _build_plot_arrays(self, data, depvarData):
+        dataGrid = None
+        # for shaped 2d plots
+        if len(depvarData.shape) == 2:
+            (
+                axis_data,
+                axis_param,
+                dataGrid
+            ) = self.for_shaped_2d(
+                data,
+                depvarData
+                )
+
+        else:
+            #Remove nan values
+            valid_rows = ~np.isnan(depvarData)
+
+            # for 1d plots
+            if len(self.param.depends_on_) == 1:
+                (
+                    axis_data,
+                    axis_param
+                ) = self.for_1d(
+                    data,
+                    valid_rows
+                    )
+            # for unshaped 2d plots that keep a grid between refreshes
+            elif self._can_update_heatmap_grid(data, depvarData):
+                (
+                    axis_data,
+                    axis_param,
+                    dataGrid
+                ) = self.for_incremental_unshaped_2d(
+                    data,
+                    depvarData
+                    )
+            # for >2d plots/unshaped 2d
+            else:
+                (
+                    axis_data,
+                    axis_param,
+                    dataGrid
+                ) = self.for_unshaped_2d(
+                    data,
+                    valid_rows,
+                    depvarData
+                    )
+
+        return axis_data, axis_param, dataGrid
+
+
     def do_operations(self):
         """
         Runs through all functions in self.operations and performs those on the
         data.
-        Work is performed on copies so a failure cannot return partial output.
+
+        The loaded arrays are never modified, so a failure cannot return
+        partial output. Instead of copying them up front, the pipeline tracks
+        which arrays it owns: results it has allocated itself. Operations that
+        support it overwrite owned dependent data in place, and consecutive
+        elementwise operations are fused into one blocked pass that writes
+        into an owned buffer. One-argument operations get private copies, as
+        they may modify the data they are given.
+
+        When every operation has a key, the output is kept in
+        self.operation_cache. A later chain on the same data returns it
+        directly, or continues from the longest cached prefix of the chain.
+        Cached arrays are read-only.
 
         Returns
         -------
@@ -1578,40 +1945,153 @@ class loader(QtCore.QRunnable):
 
         self._check_cancelled()
         data_dict = {
-            "x" : self.axis_data["x"].copy(),
-            "y" : None,
-            "z" : None,
+            "x" : self.axis_data["x"],
+            "y" : self.axis_data["y"],
+            "z" : self.dataGrid if hasattr(self, "dataGrid") else None,
             }
-        self._check_cancelled()
-        data_dict["y"] = self.axis_data["y"].copy()
-        self._check_cancelled()
-        if hasattr(self, "dataGrid"):
-            data_dict["z"] = self.dataGrid.copy()
-        self._check_cancelled()
-
-        for operation in operations:
+        operation_cache = getattr(self, "operation_cache", None)
+        operation_keys = [getattr(operation, "key", None) for operation in operations]
+        data_key = None
+        if operation_cache is not None and None not in operation_keys:
+            data_key = self._operation_cache_key(data_dict)
+        completed, cached = 0, None
+        if operation_cache is not None and data_key is not None:
+            completed, cached = operation_cache.longest_prefix(data_key, operation_keys)
+            if completed == len(operations):
+                return cached
+            if cached is not None:
+                data_dict["x"], data_dict["y"], data_dict["z"] = cached
+        sources = [value for value in data_dict.values() if value is not None]
+        owned: set[str] = set()
+
+        def is_private(key, value):
+            if not isinstance(value, np.ndarray) or not value.flags.owndata:
+                return False
+            others = sources + [
+                other for other_key, other in data_dict.items()
+                if other_key != key and isinstance(other, np.ndarray)
+                ]
+            return not any(np.may_share_memory(value, other) for other in others)
+
+        for step in plan_operations(operations[completed:]):
             self._check_cancelled()
             try:
-                if isinstance(operation, OperationCall):
-                    results = operation.execute(data_dict, self.is_cancelled)
+                if len(step) > 1 or getattr(step[0], "elementwise", None) is not None:
+                    results = self._run_fused_operations(step, data_dict, owned)
                 else:
-                    # Backwards compatibility: arbitrary operations continue
-                    # to receive exactly one data dictionary argument. Such a
-                    # call can only be cancelled after it returns.
-                    results = operation(data_dict)
+                    results = self._run_operation(step[0], data_dict, owned)
                 self._check_cancelled()
                 for key in results.keys():
                     data_dict[key] = results[key]
+                    owned.discard(key)
+                for key in results.keys():
+                    if is_private(key, data_dict[key]):
+                        owned.add(key)
             except Exception as err:
                 if self.is_cancelled():
                     raise PlotWorkCancelled("Plot load cancelled.") from err
-                name = getattr(operation, "name", None)
+                name = getattr(step[0], "name", None)
                 description = f' "{name}"' if name else ""
                 raise OperationExecutionError(
                     f"Operation{description} failed: {err}"
                     ) from err
 
-        return data_dict["x"], data_dict["y"], data_dict["z"]
+        if operation_cache is None or data_key is None:
+            return data_dict["x"], data_dict["y"], data_dict["z"]
+
+        # Loaded arrays may be views the plot's next refresh overwrites, so
+        # only the chain's own results and earlier cached output are shared.
+        cached_ids = {id(values) for values in cached or () if values is not None}
+        results = [
+            values if key in owned or id(values) in cached_ids or values is None
+            else np.array(values)
+            for key, values in data_dict.items()
+            ]
+        return operation_cache.store(data_key, operation_keys, *results)
+
+
+    def _loaded_data_key(self):
+        """
+        Identify the loaded data version, or return None.
+
+        Result tables only grow, so the database instance, run, parameter,
+        axes and the number of result rows read pin down the loaded data.
+        Live runs held in memory report no row count and have no key.
+
+        """
+        dataset_guid = getattr(self, "dataset_guid", None)
+        result_count = getattr(self, "loaded_result_count", None)
+        if dataset_guid is None or result_count is None:
+            return None
+
+        axes = getattr(self, "axes_dict", None) or {}
+        return (
+            cache_database_path(self.cache),
+            getattr(self, "database_identity", None),
+            dataset_guid,
+            self.param.name,
+            tuple(sorted((str(axis), str(name)) for axis, name in axes.items())),
+            result_count,
+            getattr(self, "loaded_from_sql_heatmap", False),
+            repr(getattr(self, "heatmap_axis_ranges", None)),
+            )
+
+
+    def _operation_cache_key(self, data_dict):
+        """Identify the operation input for the operation cache, or return None."""
+        data_key = self._loaded_data_key()
+        if data_key is None:
+            return None
+        return (*data_key, tuple(np.shape(values) for values in data_dict.values()))
+
+
+    def _run_operation(self, operation, data_dict, owned):
+        if not isinstance(operation, OperationCall):
+            # Backwards compatibility: arbitrary operations continue to
+            # receive exactly one data dictionary argument, holding arrays
+            # they may modify. Such a call can only be cancelled after it
+            # returns.
+            for key, value in data_dict.items():
+                if key not in owned and value is not None:
+                    self._check_cancelled()
+                    data_dict[key] = value.copy()
+                    owned.add(key)
+            return operation(data_dict)
+
+        key = "z" if data_dict["z"] is not None else "y"
+        in_place = key in owned and _is_floating(data_dict[key])
+        return operation.execute(data_dict, self.is_cancelled, in_place=in_place)
+
+
+    def _run_fused_operations(self, operations, data_dict, owned):
+        """
+        Apply consecutive elementwise operations in one pass over the data.
+
+        The dependent data is processed in blocks of rows. Each block goes
+        through every kernel while it is in cache, and the result is written
+        into the owned array, or a new buffer if the data is not owned yet.
+
+        """
+        key = "z" if data_dict["z"] is not None else "y"
+        values = data_dict[key]
+        if not _is_floating(values):
+            for operation in operations:
+                data_dict[key] = operation.execute(data_dict, self.is_cancelled)[key]
+                self._check_cancelled()
+            return {key: data_dict[key]}
+
+        target = values if key in owned else np.empty_like(values)
+        kernels = [operation.elementwise for operation in operations]
+        row_size = max(1, values[:1].size)
+        block_rows = max(1, CANCELLATION_CHUNK_SIZE // row_size)
+        for start in range(0, max(1, len(values)), block_rows):
+            self._check_cancelled()
+            block = values[start:start + block_rows]
+            out = target[start:start + block_rows]
+            kernels[0](block, out)
+            for kernel in kernels[1:]:
+                kernel(out, out)
+        return {key: target}
 
 
     def _apply_operation_metadata(self):
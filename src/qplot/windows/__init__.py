@@ -1,9 +1,31 @@
-from .main import MainWindow
-from .plot1d import plot1d
-from .plot2d import plot2d
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .main import MainWindow
+    from .plot1d import plot1d
+    from .plot2d import plot2d
 
 __all__ = [
     "plot1d",
     "plot2d",
     "MainWindow",
     ]
+
+
+def __getattr__(name):
+    """
+    Import window classes on first use.
+
+    The main window opens without the plot window modules, which import the
+    plotting stack.
+
+    """
+    if name in {"MainWindow", "plot1d", "plot2d"}:
+        import importlib
+
+        module_name = "main" if name == "MainWindow" else name
+        value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
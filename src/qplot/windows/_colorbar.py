@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtCore, QtGui
@@ -228,10 +230,14 @@ def _colorbar_subtype_config_key(group, subtype):
     return f"user_preference.bar_colour_include_{group}_{subtype}"
 
 
-def _build_colorbar_colormap_catalog():
+@functools.cache
+def _colorbar_colormap_catalog():
     """
     Build the colorbar map list and remember which pyqtgraph source owns each.
 
+    Listing the matplotlib maps imports matplotlib, so the catalog is built
+    when a heatmap first needs it rather than when the module is imported.
+
     """
     colormaps = []
     sources = {}
@@ -262,7 +268,12 @@ def _build_colorbar_colormap_catalog():
     return tuple(colormaps), sources
 
 
-_COLORBAR_COLORMAPS, _COLORBAR_COLORMAP_SOURCES = _build_colorbar_colormap_catalog()
+def _colorbar_colormaps():
+    """
+    Return the names of all color maps offered for colorbars.
+
+    """
+    return _colorbar_colormap_catalog()[0]
 
 
 def _colorbar_colormap_group(name):
@@ -270,7 +281,7 @@ def _colorbar_colormap_group(name):
     Return the broad group used for color-map filtering.
 
     """
-    source = _COLORBAR_COLORMAP_SOURCES.get(name)
+    source = _colorbar_colormap_catalog()[1].get(name)
     if source == "custom":
         return "custom"
     if name.startswith("CET-"):
@@ -340,7 +351,7 @@ def _colorbar_colormap_for_name(name):
     Return a color map object, custom map, or special pyqtgraph map name.
 
     """
-    source = _COLORBAR_COLORMAP_SOURCES.get(name)
+    source = _colorbar_colormap_catalog()[1].get(name)
     if source == "custom":
         colors = _CUSTOM_COLORBAR_COLORMAPS.get(name)
         if colors is not None:
@@ -239,6 +239,18 @@ COMMANDS: dict[str, CommandSpec] = {
         "Ctrl+Shift+Return",
         help_section="General",
     ),
+    "run.export_npz": CommandSpec(
+        "run.export_npz",
+        "&Export Run Data as NPZ...",
+        "Export the entered run and measurement to a compressed NumPy archive",
+        object_name="exportRunNpzAction",
+    ),
+    "run.cancel_export": CommandSpec(
+        "run.cancel_export",
+        "&Cancel Export",
+        "Cancel the running CSV and NPZ exports",
+        object_name="cancelRunExportAction",
+    ),
     "run.plot_selected_measurements": CommandSpec(
         "run.plot_selected_measurements",
         "Plot Measurements 1 to 9 in Selected Run",
@@ -8,8 +8,8 @@ from time import perf_counter
 from PyQt6 import QtCore, QtGui
 from PyQt6 import QtWidgets as qtw
 from PyQt6.QtGui import QDesktopServices
-from qcodes.dataset.sqlite.database import get_DB_location
 
+from qplot.datahandling.change_watcher import release_database_change_watcher
 from qplot.datahandling.database import (
     DatabaseDetailWorker,
     DatabaseExpensiveDetailWorker,
@@ -24,8 +24,11 @@ from qplot.datahandling.file_identity import (
     database_publication_guard_path,
     logical_database_path,
 )
+from qplot.datahandling.qcodes_compat import get_DB_location
 from qplot.datahandling.readonly import (
     quarantine_wal_for_replaced_database,
+    release_pooled_connections,
+    release_wal_snapshots,
     replacement_wal_is_quarantined,
     set_qcodes_database_location,
 )
@@ -44,6 +47,7 @@ from ._dataset_handle import (
     database_file_identity,
 )
 from ._export_paths import choose_export_path, write_export_atomically
+from ._run_controls import run_table_count
 from ._widgets.details_tables import (
     CopyableTableWidget,
     copy_to_clipboard,
@@ -332,6 +336,7 @@ class DatabaseActionsMixin:
             "emptyStateRefreshButton",
             "plotRunButton",
             "exportCsvButton",
+            "exportRunNpzAction",
             "run_idBox",
             "measurementBox",
             "RunList",
@@ -856,6 +861,7 @@ class DatabaseActionsMixin:
             self._hide_database_load_panel()
 
         self.monitor.stop()
+        database_path = self.fileTextbox.text()
         self.fileTextbox.setText("")
         self.run_idBox.setText("")
         self.measurementBox.setText("*")
@@ -875,10 +881,17 @@ class DatabaseActionsMixin:
             for holder in self.dataset_holder.values():
                 holder.cancel_delete_timer()
             self.dataset_holder.clear()
+        if database_path:
+            release_database_change_watcher(database_path)
+            release_pooled_connections(database_path)
+            release_wal_snapshots(database_path)
 
         self.RunList.blockSignals(True)
         self.RunList.clearSelection()
         self.RunList.clear()
+        set_search_database = getattr(self.RunList, "set_search_database", None)
+        if callable(set_search_database):
+            set_search_database(None)
         self.RunList.watching = []
         self.RunList.maxRunId = 0
         self.RunList.blockSignals(False)
@@ -1092,7 +1105,7 @@ class DatabaseActionsMixin:
 
         self._sync_empty_state()
         if not new_runs:
-            if self.RunList.topLevelItemCount() == 0:
+            if run_table_count(self.RunList) == 0:
                 self.show_status(self._empty_database_refresh_status(), 3000)
             else:
                 self.show_status("No new runs found.", 3000)
@@ -1602,6 +1615,9 @@ class DatabaseActionsMixin:
 
         self.RunList.clearSelection()
         self.RunList.clear()
+        set_search_database = getattr(self.RunList, "set_search_database", None)
+        if callable(set_search_database):
+            set_search_database(abspath)
         self.RunList.watching = []
         self.RunList.maxRunId = 0
         self.RunList.scrollToTop()
@@ -1848,7 +1864,7 @@ class DatabaseActionsMixin:
 
         elapsed = perf_counter() - load_started_at
         self.remember_loaded_database(abspath)
-        run_count = self.RunList.topLevelItemCount()
+        run_count = run_table_count(self.RunList)
         if state.get("replacement_reload"):
             run_word = "run" if run_count == 1 else "runs"
             status = (
@@ -2157,6 +2173,10 @@ class DatabaseActionsMixin:
             self.show_status(f"Run detail loading failed: {error}", 5000)
             return
 
+        save_search_index = getattr(self.RunList, "save_search_index", None)
+        if callable(save_search_index):
+            save_search_index()
+
         if not getattr(self, "_database_expensive_detail_active", False):
             self.show_status("Run details loaded.", 5000)
 
@@ -60,13 +60,12 @@ def choose_export_path(
     return filename
 
 
-def write_export_atomically(
-    filename: str,
-    writer: Callable[[str], Any],
-    *,
-    before_publish: Callable[[], Any] | None = None,
-) -> bool:
-    """Stage an export beside its target and atomically publish it on success."""
+def stage_export(filename: str, writer: Callable[[str], Any]) -> str | None:
+    """Write an export to a durable staging file beside ``filename``.
+
+    Returns the staging path, or None when ``writer`` returns False. The
+    staging file is removed if ``writer`` fails.
+    """
     destination = os.path.abspath(filename)
     directory = os.path.dirname(destination)
     suffix = os.path.splitext(destination)[1] or ".tmp"
@@ -79,7 +78,7 @@ def write_export_atomically(
 
     try:
         if writer(temporary_path) is False:
-            return False
+            return None
 
         # Windows rejects ``fsync`` on a read-only descriptor with EBADF even
         # though POSIX accepts it.  Reopen the completed staging file writable
@@ -87,14 +86,52 @@ def write_export_atomically(
         with open(temporary_path, "r+b") as temporary:
             os.fsync(temporary.fileno())
 
-        if before_publish is not None:
-            before_publish()
-        os.replace(temporary_path, destination)
+        staged_path = temporary_path
         temporary_path = ""
-        return True
+        return staged_path
     finally:
         if temporary_path:
-            try:
-                os.unlink(temporary_path)
-            except FileNotFoundError:
-                pass
+            discard_staged_export(temporary_path)
+
+
+def publish_staged_export(
+    staged_path: str,
+    filename: str,
+    *,
+    before_publish: Callable[[], Any] | None = None,
+) -> None:
+    """Atomically replace ``filename`` with a staged export.
+
+    The staging file is removed if ``before_publish`` or the replacement fails.
+    """
+    try:
+        if before_publish is not None:
+            before_publish()
+        os.replace(staged_path, os.path.abspath(filename))
+        staged_path = ""
+    finally:
+        if staged_path:
+            discard_staged_export(staged_path)
+
+
+def discard_staged_export(staged_path: str) -> None:
+    """Remove a staging file that will not be published."""
+    try:
+        os.unlink(staged_path)
+    except FileNotFoundError:
+        pass
+
+
+def write_export_atomically(
+    filename: str,
+    writer: Callable[[str], Any],
+    *,
+    before_publish: Callable[[], Any] | None = None,
+) -> bool:
+    """Stage an export beside its target and atomically publish it on success."""
+    staged_path = stage_export(filename, writer)
+    if staged_path is None:
+        return False
+
+    publish_staged_export(staged_path, filename, before_publish=before_publish)
+    return True
@@ -0,0 +1,98 @@
+"""
+Viewport-aware drawing of long 1D traces.
+
+Plot workers attach a :class:`qplot.tools.line_envelope.LineEnvelope` to
+traces longer than ``ENVELOPE_MIN_POINTS``. The line item then only holds
+the envelope points of its visible x range at the view's pixel width, and
+``refresh_line_envelope`` queries the pyramid again when that range or width
+changes. Snapping and marquee statistics read the full trace through
+``line_full_data``.
+"""
+
+from typing import Any
+
+import numpy.typing as npt
+
+from qplot.tools.line_envelope import LineEnvelope
+
+DEFAULT_ENVELOPE_PIXEL_WIDTH = 1920
+ENVELOPE_ATTRIBUTE = "_qplot_line_envelope"
+ENVELOPE_QUERY_ATTRIBUTE = "_qplot_line_envelope_query"
+
+
+def set_line_data(
+        line: Any,
+        x: npt.ArrayLike,
+        y: npt.ArrayLike,
+        envelope: LineEnvelope | None = None,
+        ) -> None:
+    """
+    Show a trace on a line item, drawing only its envelope when given one.
+
+    """
+    clear_line_envelope(line)
+    setattr(line, ENVELOPE_ATTRIBUTE, envelope)
+    if envelope is None:
+        line.setData(x=x, y=y)
+        return
+    refresh_line_envelope(line)
+
+
+def clear_line_envelope(line: Any) -> None:
+    """Stop redrawing a line from its envelope before it is given new data."""
+    setattr(line, ENVELOPE_ATTRIBUTE, None)
+    setattr(line, ENVELOPE_QUERY_ATTRIBUTE, None)
+
+
+def refresh_line_envelope(line: Any) -> None:
+    """
+    Redraw an enveloped line for its view box's current x range and width.
+
+    An x axis that autoranges is queried over the whole trace, so the range
+    it settles on is taken from every sample.
+
+    """
+    envelope = getattr(line, ENVELOPE_ATTRIBUTE, None)
+    if envelope is None:
+        return
+
+    x_range = None
+    pixel_width = DEFAULT_ENVELOPE_PIXEL_WIDTH
+    view_box = line.getViewBox() if callable(getattr(line, "getViewBox", None)) else None
+    if view_box is not None:
+        if not view_box.autoRangeEnabled()[0]:
+            x_range = tuple(view_box.viewRange()[0])
+        width = int(view_box.width())
+        if width > 0:
+            pixel_width = width
+
+    span = envelope.visible_span(x_range)
+    query = (id(envelope), span, pixel_width)
+    if getattr(line, ENVELOPE_QUERY_ATTRIBUTE, None) == query:
+        return
+    setattr(line, ENVELOPE_QUERY_ATTRIBUTE, query)
+    x, y = envelope.query(x_range, pixel_width)
+    line.setData(x=x, y=y)
+
+
+def line_full_data(line: Any) -> tuple[Any, Any] | None:
+    """
+    Return every sample of a line, not only the points currently drawn.
+
+    """
+    envelope = getattr(line, ENVELOPE_ATTRIBUTE, None)
+    if envelope is not None:
+        return envelope.x, envelope.y
+
+    get_data = getattr(line, "getData", None)
+    if not callable(get_data):
+        return None
+    data = get_data()
+    if data is None:
+        return None
+    return data[0], data[1]
+
+
+def envelope_matches(envelope: LineEnvelope | None, x: Any, y: Any) -> bool:
+    """Return whether ``envelope`` was built from exactly these arrays."""
+    return envelope is not None and envelope.x is x and envelope.y is y
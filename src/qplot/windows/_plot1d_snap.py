@@ -7,7 +7,10 @@ import pyqtgraph as pg
 from PyQt6 import QtCore, QtGui
 from PyQt6 import QtWidgets as qtw
 
+from qplot.tools.trace_index import TraceIndex
+
 from ._commands import command_spec, command_with_status, create_action
+from ._plot1d_envelope import line_full_data
 
 if TYPE_CHECKING:
     class _Plot1DSnapBase(qtw.QMainWindow):
@@ -47,6 +50,7 @@ else:
 
 SNAP_TO_TRACE_COMMAND = command_spec("plot.snap_to_trace")
 SNAP_TO_TRACE_SHORTCUT_LABEL = SNAP_TO_TRACE_COMMAND.shortcut_display_text()
+TRACE_INDEX_ATTRIBUTE = "_qplot_trace_index"
 
 
 @dataclass(frozen=True)
@@ -116,16 +120,27 @@ def _line_snap_data(line: object | None) -> _LineData | None:
     if line is None or not _line_is_snap_visible(line):
         return None
 
-    get_data = getattr(line, "getData", None)
-    if not callable(get_data):
-        return None
-
-    data = get_data()
+    data = line_full_data(line)
     if data is None or data[0] is None or data[1] is None:
         return None
     return data[0], data[1]
 
 
+def _line_trace_index(line: object, data: _LineData) -> TraceIndex:
+    """
+    Return the nearest-sample index of a line's data, building it when needed.
+
+    The index is rebuilt once the line holds different arrays, as after
+    ``setData``.
+
+    """
+    index = getattr(line, TRACE_INDEX_ATTRIBUTE, None)
+    if not isinstance(index, TraceIndex) or not index.matches(data[0], data[1]):
+        index = TraceIndex(data[0], data[1])
+        setattr(line, TRACE_INDEX_ATTRIBUTE, index)
+    return index
+
+
 def _scene_distance_squared(
         first: QtCore.QPointF,
         second: QtCore.QPointF,
@@ -314,12 +329,7 @@ class Plot1DSnapMixin(_Plot1DSnapBase):
                 continue
 
             viewbox = self._viewbox_for_line(line)
-            sample, distance = self._nearest_scene_trace_sample(
-                data[0],
-                data[1],
-                scene_pos,
-                viewbox,
-                )
+            sample, distance = self._nearest_line_sample(line, data, scene_pos, viewbox)
             if sample is None:
                 continue
 
@@ -336,6 +346,40 @@ class Plot1DSnapMixin(_Plot1DSnapBase):
         return nearest
 
 
+    def _nearest_line_sample(self, line, data, scene_pos, viewbox):
+        """
+        Return a line's sample nearest to a scene position in screen space.
+
+        Views that only scale and translate their data use the line's
+        TraceIndex. Others compare the cursor with every sample.
+
+        """
+        origin = viewbox.mapViewToScene(QtCore.QPointF(0.0, 0.0))
+        x_basis = viewbox.mapViewToScene(QtCore.QPointF(1.0, 0.0))
+        y_basis = viewbox.mapViewToScene(QtCore.QPointF(0.0, 1.0))
+        x_scale = x_basis.x() - origin.x()
+        y_scale = y_basis.y() - origin.y()
+        if x_basis.y() != origin.y() or y_basis.x() != origin.x() or not x_scale or not y_scale:
+            return self._nearest_scene_trace_sample(data[0], data[1], scene_pos, viewbox)
+
+        nearest = _line_trace_index(line, data).nearest(
+            (scene_pos.x() - origin.x()) / x_scale,
+            (scene_pos.y() - origin.y()) / y_scale,
+            x_scale,
+            y_scale,
+            )
+        if nearest is None:
+            return None, None
+
+        index, distance = nearest
+        sample = _SnapTraceSample(
+            x_value=float(np.ravel(data[0])[index]),
+            y_value=float(np.ravel(data[1])[index]),
+            point_number=index + 1,
+            )
+        return sample, distance
+
+
     @staticmethod
     def _nearest_scene_trace_sample(x_data, y_data, scene_pos, viewbox):
         """Return the trace sample nearest to a scene position in screen space."""
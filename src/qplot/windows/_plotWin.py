@@ -246,6 +246,7 @@ class plotWidget(
         self.initAxes()
         self.initOperations()
         self.initRefresh(refrate)
+        self._init_change_watcher()
         self.initFrame() # See plot1d, plot2d
         
         if self.visible: #dont run non essential GUI functions if not displaying
@@ -1367,6 +1368,7 @@ class plotWidget(
         self.monitor.stop()
         if interval > 0:
             self.monitor.start(max(1, round(interval * 1000)))
+        self._schedule_change_watcher()
             
             
     def add_or_remove_operations(self, key : str, func : callable = None):
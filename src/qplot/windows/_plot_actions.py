@@ -1,9 +1,15 @@
+import importlib
 import os
 
 import numpy as np
-import pandas as pd
 from PyQt6 import QtCore
 
+from qplot.datahandling.column_export import (
+    ColumnExportCancelled,
+    ExportedParameter,
+    export_result_columns,
+    export_result_csv,
+)
 from qplot.datahandling.dimensions import (
     MAX_SUPPORTED_PLOT_DIMENSIONS,
     unsupported_plot_message,
@@ -26,11 +32,38 @@ from ._dataset_handle import (
     close_dataset_connection,
     database_file_identity,
 )
-from ._export_paths import choose_export_path, write_export_atomically
-from ._plot_refresh import plot_refresh_required
-from ._subplots.subplot1d import _subplot_axis_order
-from .plot1d import plot1d
-from .plot2d import plot2d
+from ._export_paths import (
+    choose_export_path,
+    discard_staged_export,
+    publish_staged_export,
+    write_export_atomically,
+)
+from ._run_export import RunExportWorker
+
+
+def _plot_window_class(name):
+    """
+    Return the ``plot1d`` or ``plot2d`` window class, importing it on first use.
+
+    The plot window modules pull in pyqtgraph, pandas and QCoDeS, which the
+    main window does not need before the first plot opens.
+
+    """
+    window_class = globals().get(name)
+    if window_class is None:
+        window_class = getattr(importlib.import_module(f"qplot.windows.{name}"), name)
+        globals()[name] = window_class
+        # Importing the submodule binds its module to the package attribute
+        # that exports the window class.
+        setattr(importlib.import_module("qplot.windows"), name, window_class)
+    return window_class
+
+
+def __getattr__(name):
+    if name in {"plot1d", "plot2d"}:
+        return _plot_window_class(name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _plot_has_trace_window(target, candidate):
@@ -530,7 +563,11 @@ class PlotActionsMixin:
         elif window_type == "sweeper":
             win.merge_compatibility_changed.connect(self.post_admin)
             for item in self.windows:
-                if item.ds == win.ds and item.param == win.param and isinstance(item, plot2d):
+                if (
+                        item.ds == win.ds
+                        and item.param == win.param
+                        and isinstance(item, _plot_window_class("plot2d"))
+                        ):
                     win.sweep_moved.connect(item.update_sweep_line)
                     win.remove_sweep.connect(item.remove_sweep)
                     item.sweep_moved.connect(win.update_sweep_line)
@@ -837,6 +874,16 @@ class PlotActionsMixin:
                 return
 
             try:
+                worker = self._csv_export_worker(
+                    dataset,
+                    [param],
+                    filename,
+                    dataset_key,
+                )
+                if worker is not None:
+                    self._start_run_export(worker)
+                    return
+
                 frame = self._measurement_dataframe(dataset, [param])
                 # The read-only connection intentionally keeps its original
                 # SQLite snapshot readable if the path is replaced.  Reject
@@ -876,6 +923,11 @@ class PlotActionsMixin:
             return
 
         try:
+            worker = self._csv_export_worker(ds, params, filename)
+            if worker is not None:
+                self._start_run_export(worker)
+                return
+
             frame = self._measurement_dataframe(ds, params)
             write_export_atomically(
                 filename,
@@ -920,6 +972,206 @@ class PlotActionsMixin:
         )
 
 
+    @QtCore.pyqtSlot()
+    def exportRunNpz(self):
+        """
+        Exports the requested run and measurement data to a compressed NPZ file.
+
+        """
+        if not PlotActionsMixin._generation_gate_allows_action(
+                self,
+                operation="exporting run data",
+                ):
+            return
+        ds = self._dataset_for_plot_target()
+        if ds is None:
+            return
+        try:
+            params = self._selected_measurement_params(ds)
+            if params is None:
+                return
+            if not params:
+                self.show_status("No plottable measurements to export for this run.", 5000)
+                return
+
+            unsupported = self._unstreamable_export_column(ds, params, ("numeric",))
+            if unsupported is not None:
+                name, paramtype = unsupported
+                self.show_status(
+                    f"NPZ export supports numeric data only; {name} holds "
+                    f"{paramtype} data. Export it to CSV instead.",
+                    8000,
+                )
+                return
+            table_name = ds.table_name
+            dataset_key = self._current_dataset_key(ds.guid)
+            default_name = self._default_export_filename(ds, params, suffix=".npz")
+        finally:
+            self._close_dataset_if_unowned(ds, context="NPZ dataset cleanup failed")
+
+        filename = choose_export_path(
+            self,
+            caption="Export NPZ",
+            suggested_path=default_name,
+            name_filter="NumPy archives (*.npz)",
+            required_suffix=".npz",
+            replace_title="Replace NPZ File?",
+            file_description="NPZ file",
+        )
+        if not filename:
+            self.show_status("NPZ export cancelled.", 3000)
+            return
+
+        self._start_run_export(
+            RunExportWorker(
+                export_result_columns,
+                table_name,
+                self._exported_parameters(params),
+                filename,
+                "NPZ",
+                dataset_key,
+            )
+        )
+
+
+    @QtCore.pyqtSlot()
+    def cancel_run_exports(self):
+        """
+        Cancels the running CSV and NPZ exports.
+
+        """
+        workers = getattr(self, "_run_export_workers", set())
+        if not workers:
+            self.show_status("No export is running.", 3000)
+            return
+
+        for worker in list(workers):
+            worker.cancel()
+        self.show_status("Cancelling export...", 3000)
+
+
+    def _unstreamable_export_column(self, dataset, params, supported_types):
+        """
+        Returns the name and type of the first column that cannot be streamed.
+
+        """
+        specs = {spec.name: spec for spec in dataset.get_parameters()}
+        for param in params:
+            for name in (param.name, *param.depends_on_):
+                spec = specs.get(name, param if name == param.name else None)
+                paramtype = getattr(spec, "type", "unknown")
+                if paramtype not in supported_types:
+                    return name, paramtype
+        return None
+
+
+    def _exported_parameters(self, params):
+        return [
+            ExportedParameter(param.name, tuple(param.depends_on_))
+            for param in params
+        ]
+
+
+    def _csv_export_worker(self, dataset, params, filename, dataset_key=None):
+        """
+        Returns a worker streaming ``params`` to CSV, or None if one cannot stream.
+
+        Array and complex parameters are stored as blobs that only QCoDeS
+        decodes, so they keep the in-memory CSV export. ``dataset_key``
+        defaults to the dataset's run in the loaded database.
+
+        """
+        if self._unstreamable_export_column(dataset, params, ("numeric", "text")):
+            return None
+
+        text_columns = [
+            spec.name for spec in dataset.get_parameters() if spec.type == "text"
+        ]
+        return RunExportWorker(
+            export_result_csv,
+            dataset.table_name,
+            self._exported_parameters(params),
+            filename,
+            "CSV",
+            dataset_key or self._current_dataset_key(dataset.guid),
+            export_options={"text_columns": text_columns},
+        )
+
+
+    def _start_run_export(self, worker):
+        """Run an export on the plot thread pool and report its progress."""
+        workers = getattr(self, "_run_export_workers", None)
+        if workers is None:
+            workers = self._run_export_workers = set()
+        workers.add(worker)
+        worker.signals.progress.connect(
+            lambda percent, worker=worker: self.show_status(
+                f"Exporting {worker.description}... {percent}%",
+                0,
+                )
+            )
+        worker.signals.finished.connect(
+            lambda staged_path, error, worker=worker: self._run_export_finished(
+                worker,
+                staged_path,
+                error,
+                )
+            )
+        worker_registry = getattr(self.threadPool, "_qplot_workers", None)
+        if worker_registry is not None:
+            worker_registry.add(worker)
+            worker.signals.finished.connect(
+                lambda _staged_path, _error, worker=worker, registry=worker_registry: (
+                    registry.discard(worker)
+                    )
+                )
+        self._sync_run_export_controls()
+        self.show_status(f"Exporting {worker.description}...", 0)
+        self.threadPool.start(worker)
+
+
+    def _run_export_finished(self, worker, staged_path, error):
+        """Publish a staged export if its run's database was not replaced."""
+        getattr(self, "_run_export_workers", set()).discard(worker)
+        self._sync_run_export_controls()
+        if error is None and worker.cancelled:
+            error = ColumnExportCancelled("Export cancelled.")
+
+        if error is None and staged_path is not None:
+            try:
+                # The source must still be the captured database instance
+                # immediately before the staged file replaces the destination.
+                publish_staged_export(
+                    staged_path,
+                    worker.filename,
+                    before_publish=lambda: self._ensure_dataset_key_can_be_read(
+                        worker.dataset_key,
+                    ),
+                )
+            except Exception as err:
+                log_exception(f"{worker.description} export failed", err, __name__)
+                error = err
+        elif staged_path is not None:
+            discard_staged_export(staged_path)
+
+        if isinstance(error, ColumnExportCancelled):
+            self.show_status(f"{worker.description} export cancelled.", 3000)
+        elif error is not None:
+            self.show_error(
+                f"{worker.description} Export Failed",
+                "Could not export the selected measurement data.",
+                str(error),
+            )
+        else:
+            self.show_status(f"Exported {worker.description}: {worker.filename}", 5000)
+
+
+    def _sync_run_export_controls(self):
+        action = getattr(self, "cancelRunExportAction", None)
+        if action is not None:
+            action.setEnabled(bool(getattr(self, "_run_export_workers", None)))
+
+
     @QtCore.pyqtSlot(str)
     def openPlot(self, guid: str | DatasetKey = None, params: list = None, show: bool = True):
         """
@@ -996,7 +1248,7 @@ class PlotActionsMixin:
                         if (
                             win._dataset_key == dataset_key
                             and win.param == param
-                            and isinstance(win, plot1d)
+                            and isinstance(win, _plot_window_class("plot1d"))
                         ):
                             skipped += 1
                             skip = True
@@ -1005,7 +1257,7 @@ class PlotActionsMixin:
                         continue
 
                     self.openWin(
-                        plot1d,
+                        _plot_window_class("plot1d"),
                         ds,
                         param,
                         refrate=self.spinBox.value(),
@@ -1019,7 +1271,7 @@ class PlotActionsMixin:
                         if (
                             win._dataset_key == dataset_key
                             and win.param == param
-                            and isinstance(win, plot2d)
+                            and isinstance(win, _plot_window_class("plot2d"))
                         ):
                             skipped += 1
                             skip = True
@@ -1028,7 +1280,7 @@ class PlotActionsMixin:
                         continue
 
                     self.openWin(
-                        plot2d,
+                        _plot_window_class("plot2d"),
                         ds,
                         param,
                         refrate=self.spinBox.value(),
@@ -1301,6 +1553,8 @@ class PlotActionsMixin:
                 continue
             try:
                 if win._dataset_key == source_key and win.param.name == param.name:
+                    from ._plot_refresh import plot_refresh_required
+
                     if plot_refresh_required(win):
                         target_win.toolbarRef.show()
                     return win
@@ -1401,6 +1655,8 @@ class PlotActionsMixin:
         Builds a flat CSV-friendly dataframe for the selected measurement data.
 
         """
+        import pandas as pd
+
         frames = []
         prefix_columns = len(params) > 1
         for param in params:
@@ -1414,14 +1670,14 @@ class PlotActionsMixin:
         return pd.concat(frames, axis=1) if frames else pd.DataFrame()
 
 
-    def _default_export_filename(self, dataset, params):
+    def _default_export_filename(self, dataset, params, suffix=".csv"):
         """
-        Returns a default CSV export path.
+        Returns a default export path, with a CSV suffix unless told otherwise.
 
         """
         database_folder = os.path.dirname(self.fileTextbox.text())
         measurement = "all" if len(params) != 1 else params[0].name
-        filename = self._safe_filename(f"run_{dataset.run_id}_{measurement}.csv")
+        filename = self._safe_filename(f"run_{dataset.run_id}_{measurement}{suffix}")
         return os.path.join(database_folder or os.getcwd(), filename)
 
 
@@ -1564,7 +1820,7 @@ class PlotActionsMixin:
 
         """
         for item in self.windows:
-            if isinstance(item, plot1d):
+            if isinstance(item, _plot_window_class("plot1d")):
                 self.get_1d_wins(item)
 
 
@@ -1573,6 +1829,8 @@ class PlotActionsMixin:
         Finds compatible 1D plot windows for adding secondary traces to win.
 
         """
+        from ._subplots.subplot1d import _subplot_axis_order
+
         wins = []
 
         for item in self.windows:
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 from PyQt6 import QtCore
 from PyQt6 import QtWidgets as qtw
 
+from qplot.datahandling.change_watcher import database_change_watcher
 from qplot.datahandling.file_identity import (
     canonical_database_path,
     database_file_identity,
@@ -152,6 +153,93 @@ class PlotRefreshMixin(_PlotRefreshBase):
             emit(str(database_path))
         return False
 
+    def _init_change_watcher(self) -> None:
+        """Share one background change check among plots of this database."""
+
+        database_path = getattr(self.__dict__.get("_dataset_key"), "database_path", None)
+        table_name = getattr(self.ds, "table_name", None)
+        if not database_path or not isinstance(table_name, str) or not table_name:
+            return
+
+        watcher = database_change_watcher(database_path)
+        self._result_table_name = table_name
+        self._change_watcher = watcher
+        self._observed_result_count = watcher.result_count(table_name)
+        watcher.watch(self, self.threadPool)
+        watcher.resultCountChanged.connect(self._result_count_changed)
+        watcher.checkFinished.connect(self._change_check_finished)
+
+    @QtCore.pyqtSlot(str, int)
+    def _result_count_changed(self, table_name: str, count: int) -> None:
+        """Record a row count observed by the shared watcher for this plot."""
+
+        if table_name == self.__dict__.get("_result_table_name"):
+            self._observed_result_count = count
+
+    @QtCore.pyqtSlot()
+    def _change_check_finished(self) -> None:
+        """Refresh as soon as the shared watcher has counted new rows."""
+
+        if not self._change_watch_interval():
+            return
+        worker = self.__dict__.get("worker")
+        if worker is None or getattr(worker, "running", False):
+            return
+        if not self._can_process_refresh():
+            return
+        if self._result_count_has_changed(self.ds):
+            self.refreshWindow()
+
+    def _current_result_count(self, dataset: Any) -> int:
+        """Return the row count, preferring the watcher's background observation.
+
+        Until the shared watcher has counted this plot's table, or for plots
+        without a watcher, the dataset is asked directly.
+        """
+
+        count = self.__dict__.get("_observed_result_count")
+        if count is not None:
+            return count
+        return dataset.number_of_results
+
+    def _result_count_has_changed(self, dataset: Any) -> bool:
+        """Return whether rows arrived since this plot last loaded."""
+
+        count = self._current_result_count(dataset)
+        if count == self.last_ds_len:
+            return False
+        if self.__dict__.get("_change_watcher") is None:
+            return True
+        # ``last_ds_len`` counts the view the last worker read, which can be
+        # newer than the watcher's most recent background count.
+        if count < self.last_ds_len:
+            return False
+        # Watched counts come from fresh snapshots, which may be ahead of the
+        # dataset handle that produced ``last_ds_len``. Once the terminal
+        # display is committed that difference is not new data.
+        return self._refresh_monitor_required(dataset)
+
+    def _change_watch_interval(self) -> float | None:
+        """Return how often the shared watcher should check for this plot.
+
+        Only plots whose own refresh timer is running, that is plots still
+        monitoring a live run, ask for checks.
+        """
+
+        state = self.__dict__
+        monitor = state.get("monitor")
+        spin_box = state.get("spinBox")
+        if monitor is None or spin_box is None or not monitor.isActive():
+            return None
+        if not self._can_process_refresh():
+            return None
+        return spin_box.value()
+
+    def _schedule_change_watcher(self) -> None:
+        watcher = self.__dict__.get("_change_watcher")
+        if watcher is not None:
+            watcher.schedule()
+
     def _refresh_monitor_required(self, dataset: Any | None = None) -> bool:
         """Keep polling until this plot has committed its terminal display."""
 
@@ -293,6 +381,15 @@ class PlotRefreshMixin(_PlotRefreshBase):
         )
         if database_identity is not None:
             loader_kwargs["database_identity"] = database_identity
+        dataset_guid = getattr(self, "_guid", None)
+        if dataset_guid is not None:
+            loader_kwargs["dataset_guid"] = dataset_guid
+        heatmap_grid = self.__dict__.get("heatmap_grid")
+        if heatmap_grid is not None:
+            loader_kwargs["heatmap_grid"] = heatmap_grid
+        heatmap_pyramid = self.__dict__.get("heatmap_pyramid")
+        if heatmap_pyramid is not None:
+            loader_kwargs["heatmap_pyramid"] = heatmap_pyramid
 
         worker: Any = loader(
             self.ds.cache,
@@ -301,7 +398,7 @@ class PlotRefreshMixin(_PlotRefreshBase):
             self.axis_options,
             **loader_kwargs,
             )
-        worker.dataset_length_at_start = self.ds.number_of_results
+        worker.dataset_length_at_start = self._current_result_count(self.ds)
 
         if status_message is not None:
             message = status_message
@@ -378,7 +475,6 @@ class PlotRefreshMixin(_PlotRefreshBase):
 
         try:
             dataset = self.ds
-            current_ds_len = dataset.number_of_results
 
             # Plot has started, worker first defined in initFrame
             if not hasattr(self, "worker"):
@@ -387,7 +483,7 @@ class PlotRefreshMixin(_PlotRefreshBase):
                 return
 
             # Check if new data has been added to the dataset
-            if current_ds_len != self.last_ds_len or force:
+            if force or self._result_count_has_changed(dataset):
                 if self.worker.running:  # No need to run if already updating
                     self._queue_pending_refresh(force=force)
                     if force:
@@ -587,16 +683,26 @@ class PlotRefreshMixin(_PlotRefreshBase):
                 "y": worker.axis_param["y"],
                 }
             self.display_param = getattr(worker, "display_param", self.param)
+            self.line_envelope = getattr(worker, "line_envelope", None)
 
             # For 2d plots
             if hasattr(worker, "dataGrid"):
                 self.dataGrid = worker.dataGrid
+                # Marquee statistics tables are built on the next query.
+                self.grid_stats = None
 
             # I didnt want to make this a dedicated callback for the few times
             # it is used, as the performace hit is neglible
             # Update text
             self._set_param_axis_labels()
             elapsed = perf_counter() - worker.started_at
+            # Prefer the row count of the view the worker actually read; the
+            # watcher's count may be behind or ahead of that view.
+            dataset_length = getattr(worker, "loaded_result_count", None)
+            if dataset_length is None:
+                dataset_length = getattr(worker, "dataset_length_at_start", None)
+            if dataset_length is None:
+                dataset_length = self._current_result_count(self.ds)
 
             if getattr(worker, "loaded_from_sql_heatmap", False):
                 loaded_points = getattr(worker, "loaded_point_count", None)
@@ -619,13 +725,10 @@ class PlotRefreshMixin(_PlotRefreshBase):
                     )
             else:
                 self.show_status(
-                    f"Loaded {self.ds.number_of_results:,} points for {self.param.name} "
-                    f"in {elapsed:.2f} seconds",
+                    f"Loaded {dataset_length:,} points "
+                    f"for {self.param.name} in {elapsed:.2f} seconds",
                     5000,
                     )
-            dataset_length = getattr(worker, "dataset_length_at_start", None)
-            if dataset_length is None:
-                dataset_length = self.ds.number_of_results
             self.last_ds_len = dataset_length
             self.hide_plot_state()
             if (
@@ -19,8 +19,29 @@ from ._widgets import (
     moreInfo,
 )
 from ._widgets._run_formatting import run_is_complete
+from ._widgets.run_search import RunSearchError
 
 AUTO_PLOT_KEY = "user_preference.auto_plot"
+RUN_FILTER_TOOLTIP = (
+    "Show runs whose experiment, sample, name, parameters or status contain "
+    "words starting with the typed words.\n"
+    "Restrict a word to a field with exp:, sample:, name:, param: or status:.\n"
+    "Compare id, started, completed or size, e.g. id>100, size>=10MB, "
+    "started>=2026-05-04."
+    )
+
+
+def run_table_count(run_list):
+    """
+    Return the number of runs in a run table, including filtered-out ones.
+
+    """
+    run_count = getattr(run_list, "run_count", None)
+    if callable(run_count):
+        return run_count()
+    if run_list is not None and hasattr(run_list, "topLevelItemCount"):
+        return run_list.topLevelItemCount()
+    return 0
 
 
 def _run_timestamp_sort_key(metadata):
@@ -138,6 +159,16 @@ class RunControlsMixin:
         self.exportCsvButton.clicked.connect(self.exportRunCsv)
         sublayout.addWidget(self.exportCsvButton)
 
+        sublayout.addSpacing(12)
+        self.runFilterBox = qtw.QLineEdit()
+        self.runFilterBox.setPlaceholderText("Filter runs")
+        self.runFilterBox.setClearButtonEnabled(True)
+        self.runFilterBox.setMinimumWidth(160)
+        self.runFilterBox.setMaximumWidth(360)
+        self.runFilterBox.setToolTip(RUN_FILTER_TOOLTIP)
+        self.runFilterBox.setAccessibleName("Filter runs")
+        sublayout.addWidget(self.runFilterBox, 1)
+
         sublayout.addStretch()
 
         sublayout.addWidget(qtw.QLabel("Auto-plot"))
@@ -157,6 +188,7 @@ class RunControlsMixin:
         self.RunList.plot.connect(self.openPlot)
         self.RunList.previewPlotRequested.connect(self.open_run_preview_plot)
         self.RunList.previewExportRequested.connect(self.export_run_preview_csv)
+        self.runFilterBox.textChanged.connect(self.update_run_filter)
         self.RunList.verticalScrollBar().valueChanged.connect(
             lambda _: self._run_table_view_changed()
             )
@@ -168,7 +200,7 @@ class RunControlsMixin:
         self.infoBox.preview.previewGenerationChanged.connect(
             self.RunList.set_run_preview_generating
             )
-        if self.fileTextbox.text() and self.RunList.topLevelItemCount():
+        if self.fileTextbox.text() and run_table_count(self.RunList):
             self.infoBox.preview.set_database_runs(
                 self.fileTextbox.text(),
                 self.RunList.all_run_metadata(),
@@ -296,10 +328,7 @@ class RunControlsMixin:
         if hasattr(self, "fileTextbox"):
             database_path = self.fileTextbox.text()
 
-        run_count = 0
-        run_list = getattr(self, "RunList", None)
-        if run_list is not None and hasattr(run_list, "topLevelItemCount"):
-            run_count = run_list.topLevelItemCount()
+        run_count = run_table_count(getattr(self, "RunList", None))
 
         loading = getattr(self, "_database_load_active", False)
         has_runs = run_count > 0
@@ -521,6 +550,25 @@ class RunControlsMixin:
         except ValueError:
             self.selected_run_id = None
 
+    @QtCore.pyqtSlot(str)
+    def update_run_filter(self, text):
+        """
+        Shows only the runs matching the filter typed into the filter box.
+
+        An unreadable filter keeps the previous one applied and explains the
+        problem in the box's tooltip.
+
+        """
+        try:
+            self.RunList.set_search_text(text)
+        except RunSearchError as error:
+            self.runFilterBox.setToolTip(f"{error}\n\n{RUN_FILTER_TOOLTIP}")
+            self.show_status(str(error), 3000)
+            return
+
+        self.runFilterBox.setToolTip(RUN_FILTER_TOOLTIP)
+        self._run_table_view_changed()
+
     @QtCore.pyqtSlot()
     def sync_run_id_selection(self):
         """
@@ -0,0 +1,114 @@
+"""
+Background worker for streamed CSV and NPZ exports of run data.
+
+The worker streams the result table through one of the exports in
+:mod:`qplot.datahandling.column_export` into a staging file beside the
+destination. Publishing the staged file is left to the GUI thread, which
+first checks that the run's database is still the loaded instance.
+"""
+import threading
+
+from PyQt6 import QtCore
+
+from qplot.datahandling.column_export import ColumnExportCancelled
+from qplot.diagnostics import log_exception
+
+from ._export_paths import stage_export
+
+
+class RunExportSignals(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int)
+    finished = QtCore.pyqtSignal(object, object)
+
+
+class RunExportWorker(QtCore.QRunnable):
+    """
+    Stream run columns to a staged export file off the GUI thread.
+
+    Parameters
+    ----------
+    export : Callable
+        ``export_result_csv`` or ``export_result_columns``.
+    table_name : str
+        Result table of the run.
+    parameters : list[ExportedParameter]
+        Measured parameters to export.
+    filename : str
+        Destination the staged file will replace.
+    description : str
+        Export format shown to the user, such as ``"CSV"``.
+    dataset_key : DatasetKey
+        Run the export reads. Its database instance is checked again before
+        the file is published.
+    export_options : dict, optional
+        Further keyword arguments for ``export``.
+
+    """
+
+    def __init__(
+            self,
+            export,
+            table_name,
+            parameters,
+            filename,
+            description,
+            dataset_key,
+            export_options=None,
+            ):
+        super().__init__()
+        self.signals = RunExportSignals()
+        self.export = export
+        self.table_name = table_name
+        self.parameters = list(parameters)
+        self.filename = str(filename)
+        self.description = description
+        self.dataset_key = dataset_key
+        self.export_options = dict(export_options or {})
+        self._cancelled = threading.Event()
+        self._percent = -1
+
+    def cancel(self):
+        """Request cancellation before the next chunk is read or written."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def _emit(self, signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError as err:
+            if "wrapped C/C++ object" not in str(err):
+                raise
+
+    def _report_progress(self, fraction):
+        percent = int(fraction * 100)
+        if percent != self._percent:
+            self._percent = percent
+            self._emit(self.signals.progress, percent)
+
+    def run(self):
+        staged_path = None
+        error: Exception | None = None
+        try:
+            staged_path = stage_export(
+                self.filename,
+                lambda temporary: self.export(
+                    self.dataset_key.database_path,
+                    self.table_name,
+                    self.parameters,
+                    temporary,
+                    expected_database_identity=self.dataset_key.database_identity,
+                    cancelled_callback=self._cancelled.is_set,
+                    progress_callback=self._report_progress,
+                    **self.export_options,
+                    ),
+                )
+        except ColumnExportCancelled as err:
+            error = err
+        except Exception as err:
+            error = err
+            log_exception(f"{self.description} export failed", err, __name__)
+
+        self._emit(self.signals.finished, staged_path, error)
@@ -2,6 +2,9 @@ import pyqtgraph as pg
 from PyQt6 import QtCore
 from PyQt6.QtGui import QColor
 
+from qplot.tools.line_envelope import line_envelope
+
+from .._plot1d_envelope import envelope_matches, set_line_data
 from .._plot_refresh import plot_refresh_required
 
 
@@ -84,7 +87,7 @@ class subplot1d(pg.PlotDataItem):
             source_is_cut=hasattr(from_win, "sweep_id"),
             )
         if self.choose_from is None:
-            self.setData(x=[], y=[])
+            set_line_data(self, [], [])
             return
 
         # Wait for data to finish
@@ -113,7 +116,7 @@ class subplot1d(pg.PlotDataItem):
             self.from_win.axis_options,
             source_is_cut=hasattr(self.from_win, "sweep_id"),
             )
-        self.setData(x=[], y=[])
+        set_line_data(self, [], [])
 
 
     def _disconnect_pending_update(self):
@@ -208,19 +211,21 @@ class subplot1d(pg.PlotDataItem):
 
         choose_from = self.choose_from
         if choose_from is None:
-            self.setData(x=[], y=[])
+            set_line_data(self, [], [])
             self._disconnect_pending_update()
             return
 
         # Assign data to correct axis
         for itr, axis in enumerate(["x", "y"]):
             data[axis] = self.from_win.axis_data[choose_from[itr]]
-                    
+
+        # Reuse the source worker's envelope when the axes are not swapped.
+        envelope = self.from_win.__dict__.get("line_envelope")
+        if not envelope_matches(envelope, data["x"], data["y"]):
+            envelope = line_envelope(data["x"], data["y"])
+
         # Updates display
-        self.setData(
-            x=data["x"], 
-            y=data["y"],
-            )
+        set_line_data(self, data["x"], data["y"], envelope)
         
         self._disconnect_pending_update()
     
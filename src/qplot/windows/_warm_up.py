@@ -0,0 +1,127 @@
+"""
+Warm-up of the modules that plots need, after the main window is shown.
+
+The main window opens without importing QCoDeS, pandas, matplotlib or the plot
+window modules. Shortly after it appears, the libraries are imported on a
+worker thread. The plot window modules and the colorbar catalog follow on the
+GUI thread, one step per event-loop pass, because they build on pyqtgraph's Qt
+classes. The first plot then opens without waiting for these imports.
+"""
+import importlib
+from typing import cast
+
+from PyQt6 import QtCore
+
+from qplot.diagnostics import log_exception
+
+WARM_UP_DELAY_MS = 250
+WARM_UP_LIBRARY_MODULES = ("qcodes.dataset", "pandas", "matplotlib.colors")
+WARM_UP_WINDOW_MODULES = ("qplot.windows.plot1d", "qplot.windows.plot2d")
+
+
+def _import_module(module_name):
+    try:
+        importlib.import_module(module_name)
+    except Exception as err:
+        log_exception(f"Warm-up import of {module_name} failed", err, __name__)
+
+
+def _build_colorbar_catalog():
+    from ._colorbar import _colorbar_colormap_catalog
+
+    try:
+        _colorbar_colormap_catalog()
+    except Exception as err:
+        log_exception("Warm-up of the colorbar catalog failed", err, __name__)
+
+
+class _LibraryImportSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal()
+
+
+class _LibraryImportWorker(QtCore.QRunnable):
+    """Import the libraries without Qt widgets off the GUI thread."""
+
+    def __init__(self, module_names):
+        super().__init__()
+        self.signals = _LibraryImportSignals()
+        self.module_names = tuple(module_names)
+
+    def run(self):
+        for module_name in self.module_names:
+            _import_module(module_name)
+
+        try:
+            self.signals.finished.emit()
+        except RuntimeError as err:
+            if "wrapped C/C++ object" not in str(err):
+                raise
+
+
+class StartupWarmUp(QtCore.QObject):
+    """
+    Imports the plotting stack in the background once the main window is shown.
+
+    Parameters
+    ----------
+    parent : QtCore.QObject, optional
+        Owner of the warm-up. Pending GUI-thread steps stop when the warm-up
+        is destroyed.
+    thread_pool : QtCore.QThreadPool, optional
+        Pool running the library imports. Defaults to Qt's global pool.
+
+    """
+
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, parent=None, thread_pool=None):
+        super().__init__(parent)
+        self._thread_pool = cast(
+            QtCore.QThreadPool,
+            thread_pool or QtCore.QThreadPool.globalInstance(),
+            )
+        self._worker = None
+        self._steps = []
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_next_step)
+
+
+    def start(self, delay_ms=WARM_UP_DELAY_MS):
+        """
+        Starts the warm-up after ``delay_ms`` milliseconds.
+
+        """
+        self._steps = [self._start_library_imports]
+        self._timer.start(delay_ms)
+
+
+    def _start_library_imports(self):
+        self._worker = _LibraryImportWorker(WARM_UP_LIBRARY_MODULES)
+        self._worker.signals.finished.connect(self._library_imports_finished)
+        self._thread_pool.start(self._worker)
+
+
+    @QtCore.pyqtSlot()
+    def _library_imports_finished(self):
+        self._worker = None
+        self._steps = [
+            *(
+                lambda module_name=module_name: _import_module(module_name)
+                for module_name in WARM_UP_WINDOW_MODULES
+                ),
+            _build_colorbar_catalog,
+            ]
+        self._timer.start(0)
+
+
+    @QtCore.pyqtSlot()
+    def _run_next_step(self):
+        if not self._steps:
+            return
+
+        self._steps.pop(0)()
+        if self._steps:
+            self._timer.start(0)
+        elif self._worker is None:
+            self.finished.emit()
@@ -126,6 +126,8 @@ class operations_options_base(qtw.QWidget):
         input_type: OperationInputType,
         default: object = "",
         derivative_axis: str | None = None,
+        in_place: bool = False,
+        elementwise: OperationFunc | None = None,
         ) -> None:
         """
         Adds an option to the list_options with a tickbox.
@@ -146,6 +148,14 @@ class operations_options_base(qtw.QWidget):
                 str, int, float, - Makes Line edit (int/float only allow numbers)
                 None - No input box made
             or a list/tuple of the options - Makes a dropbox with options
+        default : object
+            Value used when the input is left blank.
+        derivative_axis : str | None
+            Axis the operation differentiates along, used to relabel the plot.
+        in_place : bool
+            Whether func accepts in_place=True to overwrite the data.
+        elementwise : callable | None
+            Builds the elementwise kernel of the operation from its input.
 
         """
         row = optionToggleRowItem(name, None, bool) # Option with tick box
@@ -155,6 +165,8 @@ class operations_options_base(qtw.QWidget):
         # create item to add to active box. This data is fetched by self.get_data()
         row.operation_row = rowItem(name, func, input_type, default=default)
         row.operation_row.derivative_axis = derivative_axis
+        row.operation_row.in_place = in_place
+        row.operation_row.elementwise = elementwise
         row.input.stateChanged.connect(lambda state: 
                     self.add_or_remove_operation(state, row.operation_row)
                     )
@@ -205,6 +217,8 @@ class operations_options_base(qtw.QWidget):
                 cast(OperationInputType, spec.input_type),
                 spec.default,
                 spec.derivative_axis,
+                spec.in_place,
+                spec.elementwise,
                 )
         self.list_options.adjustSize()
             
@@ -271,26 +285,33 @@ class operations_options_base(qtw.QWidget):
                         f'{item.label}: a value is required.'
                         )
             
+            elementwise = getattr(item, "elementwise", None)
             if output is None: # No input requried
                 func = item.func
+                kernel = elementwise() if elementwise is not None else None
             else: # Add input
                 # Some weird internal python stuff causes issues with lambda in loops
                 func = func_with_input(item.func, output) 
+                kernel = elementwise(output) if elementwise is not None else None
                 
             operations.append(OperationCall(
                 item.label,
                 func,
                 getattr(item, "derivative_axis", None),
                 cooperative=True,
+                in_place=getattr(item, "in_place", False),
+                elementwise=kernel,
+                key=(item.label, output),
                 ))
         return operations
  
     
 def func_with_input(func: OperationFunc, value: object) -> OperationFunc:
-    return lambda data, cancelled_callback=None: func(
+    return lambda data, cancelled_callback=None, **options: func(
         value,
         data,
         cancelled_callback=cancelled_callback,
+        **options,
         )
  
 
@@ -346,6 +367,8 @@ class rowItem(qtw.QListWidgetItem):
         
         self.func: OperationFunc
         self.derivative_axis: str | None = None
+        self.in_place = False
+        self.elementwise: OperationFunc | None = None
         if callable(func):
             self.func = func
         elif func is not None:
@@ -10,10 +10,11 @@ from qplot.datahandling.dimensions import (
     MAX_SUPPORTED_PLOT_DIMENSIONS,
     unsupported_plot_message,
 )
-from qplot.datahandling.readonly import sqlite_read_only_connection
+from qplot.datahandling.readonly import pooled_sqlite_read_only_connection
 from qplot.diagnostics import log_exception
 
 from .._dragdrop import make_run_preview_mime
+from .preview_cache import shared_preview_disk_cache
 
 PREVIEW_SIZE = 200
 PREVIEW_BACKGROUND_COLOR = "#f4f7fb"
@@ -58,10 +59,13 @@ class PreviewTab(qtw.QWidget):
     previewsReady = QtCore.pyqtSignal(str, object)
     previewGenerationChanged = QtCore.pyqtSignal(str, bool)
 
-    def __init__(self, *args, preview_size=PREVIEW_SIZE):
+    def __init__(self, *args, preview_size=PREVIEW_SIZE, disk_cache=None):
         super().__init__(*args)
 
         self.preview_size = int(preview_size or PREVIEW_SIZE)
+        self.disk_cache = (
+            disk_cache if disk_cache is not None else shared_preview_disk_cache()
+            )
         self._update_minimum_height()
         self.database_path = ""
         self.generation = 0
@@ -269,18 +273,7 @@ class PreviewTab(qtw.QWidget):
 
 
     def _metadata_signature(self, metadata):
-        return tuple(
-            _signature_value(metadata.get(key))
-            for key in (
-                "result_table_name",
-                "result_count",
-                "run_description",
-                "measure_parameters",
-                "sweep_parameters",
-                "setpoint_shape",
-                "point_shape",
-                )
-            )
+        return _metadata_signature(metadata)
 
 
     def prioritize_runs(self, selected_run_ids=None, visible_run_ids=None):
@@ -464,10 +457,36 @@ class PreviewTab(qtw.QWidget):
             return
         if not self.database_path:
             return
+        if guid not in self.queue and self._load_disk_cached(guid):
+            return
 
         self.queue[guid] = max(priority, self.queue.get(guid, priority))
 
 
+    def _load_disk_cached(self, guid):
+        """Show previews of a completed run stored by an earlier session."""
+        if self.disk_cache is None:
+            return False
+
+        metadata = self.run_metadata[guid]
+        previews = self.disk_cache.load(
+            guid,
+            metadata,
+            self.preview_size,
+            self.metadata_signatures.get(guid, _metadata_signature(metadata)),
+            )
+        if previews is None:
+            return False
+
+        self.queue.pop(guid, None)
+        self._explicit_guids.discard(guid)
+        self._store_cached(guid, previews)
+        self.previewsReady.emit(guid, previews)
+        if guid == self.current_guid:
+            self._show_previews(previews)
+        return True
+
+
     def _cancel_workers(self):
         for worker in tuple(self._workers.values()):
             worker.cancel()
@@ -513,6 +532,9 @@ class PreviewTab(qtw.QWidget):
             size_in_bytes = getattr(image, "sizeInBytes", None)
             if callable(size_in_bytes):
                 total += max(0, int(size_in_bytes()))
+            grid = preview.get("grid") if isinstance(preview, dict) else None
+            if grid is not None:
+                total += int(getattr(grid, "nbytes", 0))
         return total
 
 
@@ -602,6 +624,7 @@ class PreviewTab(qtw.QWidget):
             guid,
             self.run_metadata[guid],
             self.preview_size,
+            disk_cache=self.disk_cache,
             )
         worker.signals.finished.connect(self._worker_finished)
         self._workers[active_key] = worker
@@ -904,7 +927,15 @@ class DraggablePreviewImageLabel(PreviewImageLabel):
 
 
 class PreviewWorker(QtCore.QRunnable):
-    def __init__(self, generation, database_path, guid, metadata, preview_size):
+    def __init__(
+            self,
+            generation,
+            database_path,
+            guid,
+            metadata,
+            preview_size,
+            disk_cache=None,
+            ):
         super().__init__()
         self.signals = PreviewSignals()
         self.generation = generation
@@ -912,6 +943,7 @@ class PreviewWorker(QtCore.QRunnable):
         self.guid = guid
         self.metadata = metadata
         self.preview_size = preview_size
+        self.disk_cache = disk_cache
         self._cancelled = threading.Event()
         self._connection_lock = threading.Lock()
         self._connection = None
@@ -921,13 +953,13 @@ class PreviewWorker(QtCore.QRunnable):
         self._cancelled.set()
         with self._connection_lock:
             connection = self._connection
-        if connection is not None:
-            try:
-                connection.interrupt()
-            except Exception:
-                # The worker may have closed the connection between the lock
-                # release and this cross-thread cancellation request.
-                pass
+            if connection is not None:
+                try:
+                    connection.interrupt()
+                except Exception:
+                    # The worker may have closed the connection while this
+                    # cross-thread cancellation request was made.
+                    pass
 
 
     def is_cancelled(self):
@@ -975,6 +1007,14 @@ class PreviewWorker(QtCore.QRunnable):
                 )
             if self._cancelled.is_set():
                 previews = []
+            elif self.disk_cache is not None:
+                self.disk_cache.store(
+                    self.guid,
+                    self.metadata,
+                    self.preview_size,
+                    _metadata_signature(self.metadata),
+                    previews,
+                    )
             self._emit_finished(previews, None)
         except Exception as error:
             if self._cancelled.is_set():
@@ -1007,7 +1047,7 @@ def generate_run_previews(
         return []
 
     previews = []
-    conn = sqlite_read_only_connection(database_path, timeout=10)
+    conn = pooled_sqlite_read_only_connection(database_path, timeout=10)
     if connection_callback is not None:
         connection_callback(conn)
     cursor = None
@@ -1123,12 +1163,12 @@ def _preview_2d(
         is_cancelled=is_cancelled,
         )
     if grid is not None:
-        image = render_heatmap_grid_preview(grid, size=size)
         return {
             "parameter": parameter,
             "axes": list(axes),
             "title": _preview_title(parameter, axes),
-            "image": image,
+            "image": render_heatmap_grid_preview(grid, size=size),
+            "grid": _read_only(_prepare_heatmap_display_grid(grid, size)),
             "downsample_strategy": "spatial mean",
             }
 
@@ -1140,19 +1180,20 @@ def _preview_2d(
         max_rows=_preview_2d_row_limit(grid_shape),
         sampling="stratified",
         )
-    image = render_heatmap_preview(
-        x,
-        y,
-        z,
-        size=size,
-        grid_shape=grid_shape,
-        )
-    return {
+    preview = {
         "parameter": parameter,
         "axes": list(axes),
         "title": _preview_title(parameter, axes),
-        "image": image,
         }
+    grid = _heatmap_preview_grid(x, y, z, size=size, grid_shape=grid_shape)
+    if grid is None:
+        preview["image"] = _render_heatmap_display_grid(None, size)
+        return preview
+
+    grid = _prepare_heatmap_display_grid(grid, size)
+    preview["image"] = _render_heatmap_display_grid(grid, size)
+    preview["grid"] = _read_only(grid)
+    return preview
 
 
 def _preview_title(parameter, axes):
@@ -1228,15 +1269,20 @@ def render_sparkline_preview(x, y, size=PREVIEW_SIZE):
 
 
 def render_heatmap_preview(x, y, z, size=PREVIEW_SIZE, grid_shape=None):
-    image = QtGui.QImage(size, size, QtGui.QImage.Format.Format_RGB32)
-    image.fill(QtGui.QColor(PREVIEW_BACKGROUND_COLOR))
+    grid = _heatmap_preview_grid(x, y, z, size=size, grid_shape=grid_shape)
+    if grid is None:
+        return _render_heatmap_display_grid(None, size)
+    return render_heatmap_grid_preview(grid, size=size)
+
 
+def _heatmap_preview_grid(x, y, z, size=PREVIEW_SIZE, grid_shape=None):
+    """Return the heatmap grid of scattered points, or None without valid points."""
     x = np.asarray(x, dtype=float)
     y = np.asarray(y, dtype=float)
     z = np.asarray(z, dtype=float)
     valid = np.isfinite(x) & np.isfinite(y) & np.isfinite(z)
     if not np.any(valid):
-        return image
+        return None
 
     x = x[valid]
     y = y[valid]
@@ -1258,19 +1304,26 @@ def render_heatmap_preview(x, y, z, size=PREVIEW_SIZE, grid_shape=None):
             )
     if grid is None:
         grid = _binned_heatmap_grid(x, y, z, size=size, grid_shape=grid_shape)
-
-    return render_heatmap_grid_preview(grid, size=size)
+    return grid
 
 
 def render_heatmap_grid_preview(grid, size=PREVIEW_SIZE):
-    image = QtGui.QImage(size, size, QtGui.QImage.Format.Format_RGB32)
-    image.fill(QtGui.QColor(PREVIEW_BACKGROUND_COLOR))
-
     grid = np.asarray(grid, dtype=float)
     if grid.size == 0 or np.all(np.isnan(grid)):
+        return _render_heatmap_display_grid(None, size)
+    return _render_heatmap_display_grid(
+        _prepare_heatmap_display_grid(grid, size),
+        size,
+        )
+
+
+def _render_heatmap_display_grid(grid, size):
+    """Render a grid already reduced by ``_prepare_heatmap_display_grid``."""
+    image = QtGui.QImage(size, size, QtGui.QImage.Format.Format_RGB32)
+    image.fill(QtGui.QColor(PREVIEW_BACKGROUND_COLOR))
+    if grid is None or grid.size == 0 or np.all(np.isnan(grid)):
         return image
 
-    grid = _prepare_heatmap_display_grid(grid, size)
     rgb = _viridis_rgb(grid)
     rgb = np.flipud(rgb)
     rgb_bytes = rgb.tobytes()
@@ -2197,6 +2250,26 @@ def _json_dict(value):
     return decoded if isinstance(decoded, dict) else {}
 
 
+def _metadata_signature(metadata):
+    return tuple(
+        _signature_value(metadata.get(key))
+        for key in (
+            "result_table_name",
+            "result_count",
+            "run_description",
+            "measure_parameters",
+            "sweep_parameters",
+            "setpoint_shape",
+            "point_shape",
+            )
+        )
+
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+
 def _signature_value(value):
     """Freeze nested metadata so in-place mutations cannot hide changes."""
 
@@ -0,0 +1,217 @@
+"""
+Persistent on-disk cache of generated run previews.
+
+``PreviewTab`` keeps previews in an in-memory LRU that is lost on every
+launch, so reopening a database used to aggregate every run again in SQL.
+Completed runs cannot change, so their previews are also written under
+``~/.qplot/preview_cache``. There is one file per run GUID, result count,
+completion state and preview size. Each file holds the PNG thumbnails, the
+reduced heatmap grids they were drawn from, and a digest of the run's
+metadata signature. An entry whose digest no longer matches is discarded.
+
+Files are written atomically by the preview workers and read on the GUI
+thread. The least recently used files are removed once the cache exceeds
+``PREVIEW_DISK_CACHE_MAX_BYTES``.
+"""
+
+import hashlib
+import json
+import threading
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from PyQt6 import QtCore, QtGui
+
+from qplot.diagnostics import get_logger
+from qplot.tools.disk_cache import (
+    NPZ_DISK_CACHE_SUFFIX,
+    NpzDiskCache,
+    qplot_cache_directory,
+)
+
+PREVIEW_DISK_CACHE_VERSION = 1
+PREVIEW_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PREVIEW_DISK_CACHE_FIELDS = (
+    "parameter",
+    "axes",
+    "title",
+    "dimension_count",
+    "unsupported",
+    "downsample_strategy",
+    )
+
+_shared_cache: "PreviewDiskCache | None" = None
+_shared_cache_lock = threading.Lock()
+
+
+def default_preview_cache_directory() -> Path:
+    """
+    Returns qPlot's default preview cache directory.
+
+    """
+    return qplot_cache_directory("preview_cache")
+
+
+def shared_preview_disk_cache() -> "PreviewDiskCache":
+    """
+    Returns the process-wide preview cache in the default directory.
+
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = PreviewDiskCache(default_preview_cache_directory())
+        return _shared_cache
+
+
+def run_is_completed(metadata) -> bool:
+    return bool(metadata.get("completed_timestamp") or metadata.get("is_completed"))
+
+
+class PreviewDiskCache(NpzDiskCache):
+    """
+    Completed-run previews stored as one ``.npz`` file per cache key.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory holding the cache files. It is created on the first store.
+    max_bytes : int
+        Total file size above which the least recently used files are removed.
+
+    """
+
+    temp_prefix = ".preview-"
+
+    def __init__(self, directory, max_bytes=PREVIEW_DISK_CACHE_MAX_BYTES):
+        super().__init__(directory, max_bytes)
+
+
+    def path_for(self, guid, metadata, size) -> Path:
+        key = "\0".join((
+            str(PREVIEW_DISK_CACHE_VERSION),
+            str(guid),
+            str(metadata.get("result_count")),
+            str(int(run_is_completed(metadata))),
+            str(int(size)),
+            ))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{NPZ_DISK_CACHE_SUFFIX}"
+
+
+    def load(self, guid, metadata, size, signature) -> list[dict[str, Any]] | None:
+        """
+        Return the cached previews of a completed run, or None on a miss.
+
+        Entries that cannot be read or whose stored signature differs from
+        ``signature`` are deleted.
+
+        """
+        if not guid or not run_is_completed(metadata):
+            return None
+
+        path = self.path_for(guid, metadata, size)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                header = json.loads(bytes(entry["header"]).decode("utf-8"))
+                if header.get("signature") != _signature_digest(signature):
+                    raise ValueError("preview cache signature mismatch")
+                previews = [
+                    _decode_preview(entry, index, fields)
+                    for index, fields in enumerate(header["previews"])
+                    ]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            self._remove(path)
+            return None
+
+        self.touch(path)
+        return previews
+
+
+    def store(self, guid, metadata, size, signature, previews) -> bool:
+        """
+        Write the previews of a completed run.
+
+        Live runs are skipped because their previews go stale on the next
+        refresh. Write failures are logged and otherwise ignored.
+
+        Returns
+        -------
+        stored : bool
+            Whether an entry was written.
+
+        """
+        if not guid or not run_is_completed(metadata):
+            return False
+
+        path = self.path_for(guid, metadata, size)
+        arrays: dict[str, np.ndarray] = {}
+        header: dict[str, Any] = {
+            "signature": _signature_digest(signature),
+            "previews": [],
+            }
+        try:
+            for index, preview in enumerate(previews or []):
+                header["previews"].append(_encode_preview(preview, index, arrays))
+            arrays["header"] = _json_bytes(header)
+            self.write_entry(path, arrays)
+        except (OSError, ValueError, TypeError) as error:
+            get_logger(__name__).warning("Could not cache preview %s: %s", guid, error)
+            return False
+
+        return True
+
+
+def _signature_digest(signature) -> str:
+    return hashlib.sha256(repr(signature).encode("utf-8")).hexdigest()
+
+
+def _json_bytes(value) -> np.ndarray:
+    return np.frombuffer(json.dumps(value).encode("utf-8"), dtype=np.uint8)
+
+
+def _encode_preview(preview, index, arrays) -> dict[str, Any]:
+    fields = {
+        key: preview[key]
+        for key in PREVIEW_DISK_CACHE_FIELDS
+        if key in preview
+        }
+    image = preview.get("image")
+    if image is not None:
+        arrays[f"image_{index}"] = _png_bytes(image)
+    grid = preview.get("grid")
+    if grid is not None:
+        arrays[f"grid_{index}"] = np.asarray(grid, dtype=float)
+    return fields
+
+
+def _decode_preview(entry, index, fields) -> dict[str, Any]:
+    preview = dict(fields)
+    image_key = f"image_{index}"
+    if image_key in entry.files:
+        image = QtGui.QImage.fromData(bytes(entry[image_key]), "PNG")
+        if image.isNull():
+            raise ValueError("unreadable preview image")
+        preview["image"] = image.convertToFormat(QtGui.QImage.Format.Format_RGB32)
+    grid_key = f"grid_{index}"
+    if grid_key in entry.files:
+        grid = entry[grid_key]
+        grid.flags.writeable = False
+        preview["grid"] = grid
+    return preview
+
+
+def _png_bytes(image) -> np.ndarray:
+    data = QtCore.QByteArray()
+    buffer = QtCore.QBuffer(data)
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    try:
+        if not image.save(buffer, "PNG"):
+            raise ValueError("preview image could not be encoded")
+    finally:
+        buffer.close()
+    return np.frombuffer(bytes(data.data()), dtype=np.uint8)
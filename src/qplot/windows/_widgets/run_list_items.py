@@ -1,7 +1,7 @@
 from PyQt6 import QtCore, QtGui
 from PyQt6 import QtWidgets as qtw
 
-from ._run_formatting import one_dimensional_duplicate_point_count, run_tooltip_text
+from ._run_formatting import one_dimensional_duplicate_point_count
 from .preview import DraggablePreviewImageLabel, unsupported_preview_label
 
 MEASUREMENT_PREVIEW_SIZE = 22
@@ -295,8 +295,8 @@ class EqualsAlignedDelegate(qtw.QStyledItemDelegate):
 
 
     def _max_right_width(self, index, metrics):
-        view = self.parent()
-        if not isinstance(view, qtw.QTreeWidget):
+        model = index.model()
+        if not hasattr(model, "column_texts"):
             return 0
 
         column = index.column()
@@ -305,20 +305,18 @@ class EqualsAlignedDelegate(qtw.QStyledItemDelegate):
             return cached
 
         max_width = 0
-        for row in range(view.topLevelItemCount()):
-            item = view.topLevelItem(row)
-            if item is None:
-                continue
-
-            sections = self._display_sections(item.text(column))
+        for text, metadata in zip(
+                model.column_texts(column),
+                model.iter_metadata(),
+                strict=True,
+                ):
+            sections = self._display_sections(text)
             if sections is None:
                 continue
 
             _, right = sections
             if right is None:
-                right = one_dimensional_duplicate_point_count(
-                    getattr(item, "run_metadata", {})
-                    )
+                right = one_dimensional_duplicate_point_count(metadata)
             if right is None:
                 continue
 
@@ -329,49 +327,3 @@ class EqualsAlignedDelegate(qtw.QStyledItemDelegate):
 
     def _text_color(self, option):
         return option.palette.color(QtGui.QPalette.ColorRole.Text)
-
-
-class SortableTreeWidgetItem(qtw.QTreeWidgetItem):
-    """
-    QTreeWidgetItem with an overridden comparator that sorts numerical values
-    as numbers instead of sorting them alphabetically.
-    """
-    def __init__(self, strings):
-        super().__init__(strings)
-        self.run_metadata = {}
-        self._guid = ""
-
-    def __lt__(self, other: qtw.QTreeWidgetItem) -> bool:
-        tree = self.treeWidget()
-        if tree is None:
-            return super().__lt__(other)
-
-        col = tree.sortColumn()
-        value1 = self.data(col, QtCore.Qt.ItemDataRole.UserRole)
-        value2 = other.data(col, QtCore.Qt.ItemDataRole.UserRole)
-        if value1 is not None and value2 is not None:
-            try:
-                return float(value1) < float(value2)
-            except (TypeError, ValueError):
-                pass
-
-        text1 = self.text(col)
-        text2 = other.text(col)
-        try:
-            return float(text1) < float(text2)
-        except ValueError:
-            return text1 < text2
-
-    @property
-    def guid(self):
-        return self._guid
-
-
-    def set_guid(self, guid):
-        self._guid = guid
-
-
-    def update_tooltip(self):
-        tooltip = run_tooltip_text(self.run_metadata)
-        for col in range(self.columnCount()):
-            self.setToolTip(col, tooltip)
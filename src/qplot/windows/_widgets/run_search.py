@@ -0,0 +1,521 @@
+"""
+In-memory search index over the runs of the run table.
+
+Each text field of a run, such as its experiment or parameter names, is
+dictionary-encoded: rows hold an integer code per field and every distinct
+value is tokenized once. A token index maps the sorted tokens to the values
+containing them, so a prefix selects a contiguous range of tokens and the rows
+are found with one lookup over the code column. Numeric fields are kept with a
+lazily sorted copy for range queries. Filtering 100,000 runs takes a few
+milliseconds and never queries the database.
+
+The token dictionaries are saved next to the database's run catalog, so
+reopening a database indexes its runs with dictionary lookups only.
+
+Query syntax
+------------
+Whitespace separates terms and every term must match.
+
+``word``
+    A word starting any token of the experiment, sample, name, parameter or
+    status, or equal to the run ID.
+``field:word``
+    A word in one field: ``exp``/``experiment``, ``sample``, ``name``,
+    ``param``/``parameter`` or ``status``.
+``id``, ``started``, ``completed``, ``size`` with ``<``, ``<=``, ``>``, ``>=``,
+``=`` or ``:``
+    A range. Sizes take ``B``, ``KB``, ``MB``, ``GB`` or ``TB`` suffixes.
+    Times are local dates or date-times such as ``2026-05``, ``2026-05-04``
+    or ``2026-05-04T13:05``, and cover the whole period they name.
+"""
+
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from qplot.diagnostics import get_logger
+
+from ._run_formatting import format_run_state
+
+RUN_SEARCH_INDEX_VERSION = 1
+TEXT_FIELDS = ("experiment", "sample", "name", "parameter", "status")
+NUMERIC_FIELDS = ("id", "started", "completed", "size")
+FIELD_ALIASES = {
+    "exp": "experiment",
+    "experiment": "experiment",
+    "sample": "sample",
+    "name": "name",
+    "param": "parameter",
+    "parameter": "parameter",
+    "parameters": "parameter",
+    "status": "status",
+    "id": "id",
+    "started": "started",
+    "start": "started",
+    "completed": "completed",
+    "size": "size",
+    }
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_TERM_PATTERN = re.compile(r"^(?P<field>[a-z]+)(?P<operator><=|>=|<|>|=|:)(?P<value>.*)$")
+_SIZE_PATTERN = re.compile(r"^(?P<number>\d+(?:\.\d*)?|\.\d+)(?P<unit>[kmgt]?b?)$")
+_SIZE_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+_TIME_FORMATS = (
+    ("%Y-%m-%dT%H:%M:%S", "second"),
+    ("%Y-%m-%dT%H:%M", "minute"),
+    ("%Y-%m-%d", "day"),
+    ("%Y-%m", "month"),
+    ("%Y", "year"),
+    )
+_LAST_CHARACTER = "\U0010ffff"
+
+
+class RunSearchError(ValueError):
+    """A run filter that cannot be parsed."""
+
+
+def tokenize(text):
+    """Return the lower-case word tokens of ``text``."""
+    return _TOKEN_PATTERN.findall(str(text).casefold())
+
+
+def run_field_values(metadata):
+    """
+    Return the searchable text of a run, by field.
+
+    """
+    parameters = sorted({
+        str(parameter)
+        for key in ("measure_parameters", "sweep_parameters")
+        for parameter in metadata.get(key) or ()
+        if parameter
+        })
+    return (
+        str(metadata.get("exp_name") or ""),
+        str(metadata.get("sample_name") or ""),
+        str(metadata.get("name") or ""),
+        " ".join(parameters),
+        format_run_state(metadata).split(" (", 1)[0],
+        )
+
+
+def _number(value):
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def run_field_numbers(run_id, metadata):
+    """
+    Return the searchable numbers of a run, by field.
+
+    """
+    return (
+        _number(run_id),
+        _number(metadata.get("run_timestamp")),
+        _number(metadata.get("completed_timestamp")),
+        _number(metadata.get("storage_bytes")),
+        )
+
+
+class _ValueDictionary:
+    """
+    Distinct values of one text field and the tokens that find them.
+
+    Tokens are recorded as ``(token, value id)`` pairs as values are added.
+    The sorted token index is rebuilt from the pairs when a query needs it.
+    """
+
+    def __init__(self, values=(), pair_tokens=(), pair_values=()):
+        self.values = list(values)
+        self.ids = {value: index for index, value in enumerate(self.values)}
+        self.pair_tokens = list(pair_tokens)
+        self.pair_values = list(pair_values)
+        self._tokens = None
+        self._offsets = None
+        self._value_ids = None
+
+
+    def code(self, value):
+        """Return the id of ``value``, adding and tokenizing it if it is new."""
+        code = self.ids.get(value)
+        if code is None:
+            code = self.ids[value] = len(self.values)
+            self.values.append(value)
+            for token in set(tokenize(value)):
+                self.pair_tokens.append(token)
+                self.pair_values.append(code)
+            self._tokens = None
+        return code
+
+
+    def matching_values(self, prefix):
+        """Return the ids of the values with a token starting with ``prefix``."""
+        if self._tokens is None:
+            self._build()
+        assert self._tokens is not None and self._offsets is not None
+        assert self._value_ids is not None
+        first, last = np.searchsorted(
+            self._tokens,
+            [prefix, prefix + _LAST_CHARACTER],
+            )
+        return self._value_ids[self._offsets[first]:self._offsets[last]]
+
+
+    def _build(self):
+        tokens = np.asarray(self.pair_tokens, dtype=str)
+        values = np.asarray(self.pair_values, dtype=np.int64)
+        unique_tokens, token_index = np.unique(tokens, return_inverse=True)
+        order = np.argsort(token_index, kind="stable")
+        self._tokens = unique_tokens
+        self._value_ids = values[order]
+        self._offsets = np.concatenate((
+            [0],
+            np.cumsum(np.bincount(token_index, minlength=len(unique_tokens))),
+            ))
+
+
+class RunSearchIndex:
+    """
+    Searchable text and numbers of runs, by row.
+
+    Rows are numbered by the caller, normally as the stored rows of a
+    RunTableModel, and are set with ``set_run``.
+
+    """
+
+    def __init__(self, dictionaries=None):
+        self.dictionaries = dictionaries or {
+            field: _ValueDictionary()
+            for field in TEXT_FIELDS
+            }
+        self._saved_pairs = self._pair_count()
+        self.clear()
+
+
+    def __len__(self):
+        return self._count
+
+
+    @property
+    def modified(self):
+        """Whether values were added since the dictionaries were loaded or saved."""
+        return self._saved_pairs != self._pair_count()
+
+
+    def _pair_count(self):
+        return sum(len(dictionary.pair_tokens) for dictionary in self.dictionaries.values())
+
+
+    def clear(self):
+        """Remove every row, keeping the token dictionaries."""
+        self._count = 0
+        self._capacity = 0
+        self._codes = {field: np.empty(0, dtype=np.int64) for field in TEXT_FIELDS}
+        self._numbers = {field: np.empty(0) for field in NUMERIC_FIELDS}
+        self._sorted: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+
+    def _reserve(self, count):
+        if count <= self._capacity:
+            return
+        capacity = max(count, 2 * self._capacity, 64)
+        for field, codes in self._codes.items():
+            grown_codes = np.full(capacity, -1, dtype=np.int64)
+            grown_codes[:self._count] = codes[:self._count]
+            self._codes[field] = grown_codes
+        for field, numbers in self._numbers.items():
+            grown = np.full(capacity, np.nan)
+            grown[:self._count] = numbers[:self._count]
+            self._numbers[field] = grown
+        self._capacity = capacity
+
+
+    def set_run(self, row, run_id, metadata):
+        """Index or re-index the run at ``row``."""
+        self.set_runs(row, [run_id], [metadata])
+
+
+    def set_runs(self, first, run_ids, metadata_rows):
+        """
+        Index or re-index the runs at consecutive rows starting at ``first``.
+
+        Rows must be set in order the first time; setting earlier rows again
+        replaces their values.
+
+        """
+        last = first + len(metadata_rows)
+        if last > self._count:
+            self._reserve(last)
+            self._count = last
+
+        values = [run_field_values(metadata) for metadata in metadata_rows]
+        for column, field in enumerate(TEXT_FIELDS):
+            code = self.dictionaries[field].code
+            self._codes[field][first:last] = [code(row[column]) for row in values]
+
+        numbers = np.array(
+            [
+                run_field_numbers(run_id, metadata)
+                for run_id, metadata in zip(run_ids, metadata_rows, strict=True)
+                ],
+            dtype=float,
+            ).reshape(len(metadata_rows), len(NUMERIC_FIELDS))
+        for column, field in enumerate(NUMERIC_FIELDS):
+            self._numbers[field][first:last] = numbers[:, column]
+        self._sorted.clear()
+
+
+    def search(self, query):
+        """
+        Return a mask of the rows matching ``query``, or None for no filter.
+
+        Raises
+        ------
+        RunSearchError
+            If a term of the query cannot be parsed.
+
+        """
+        terms = parse_query(query)
+        if not terms:
+            return None
+
+        mask = np.ones(self._count, dtype=bool)
+        for field, _operator, value in terms:
+            if field in NUMERIC_FIELDS:
+                mask &= self._range_mask(field, value)
+            else:
+                mask &= self._text_mask(field, value)
+        return mask
+
+
+    def _text_mask(self, field, text):
+        """Match every token of ``text`` as a prefix of a token in ``field``."""
+        mask = np.ones(self._count, dtype=bool)
+        fields = TEXT_FIELDS if field is None else (field,)
+        for token in tokenize(text):
+            token_mask = np.zeros(self._count, dtype=bool)
+            for name in fields:
+                dictionary = self.dictionaries[name]
+                matches = np.zeros(len(dictionary.values) + 1, dtype=bool)
+                matches[dictionary.matching_values(token) + 1] = True
+                token_mask |= matches[self._codes[name][:self._count] + 1]
+            mask &= token_mask
+
+        if field is None and text.isdigit():
+            mask |= self._numbers["id"][:self._count] == int(text)
+        return mask
+
+
+    def _range_mask(self, field, bounds):
+        order, values = self._sorted_numbers(field)
+        low, low_side, high, high_side = bounds
+        first = 0 if low is None else np.searchsorted(values, low, side=low_side)
+        last = len(values) if high is None else np.searchsorted(values, high, side=high_side)
+
+        mask = np.zeros(self._count, dtype=bool)
+        mask[order[first:max(first, last)]] = True
+        return mask
+
+
+    def _sorted_numbers(self, field):
+        """Return the rows with a value, ordered by value, and their values."""
+        cached = self._sorted.get(field)
+        if cached is None:
+            numbers = self._numbers[field][:self._count]
+            present = np.flatnonzero(~np.isnan(numbers))
+            order = present[np.argsort(numbers[present], kind="stable")]
+            cached = self._sorted[field] = (order, numbers[order])
+        return cached
+
+
+    def save(self, path, database_path, database_identity):
+        """
+        Write the token dictionaries to ``path`` atomically.
+
+        Write failures are logged and otherwise ignored.
+
+        Returns
+        -------
+        saved : bool
+            Whether the file was written.
+
+        """
+        path = Path(path)
+        arrays: dict[str, np.ndarray] = {
+            "header": np.asarray(json.dumps({
+                "version": RUN_SEARCH_INDEX_VERSION,
+                "database_path": str(database_path),
+                "database_identity": list(database_identity),
+                })),
+            }
+        for field, dictionary in self.dictionaries.items():
+            arrays[f"{field}.values"] = np.asarray(dictionary.values, dtype=str)
+            arrays[f"{field}.pair_tokens"] = np.asarray(dictionary.pair_tokens, dtype=str)
+            arrays[f"{field}.pair_values"] = np.asarray(
+                dictionary.pair_values,
+                dtype=np.int64,
+                )
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(
+                dir=path.parent,
+                prefix=".index-",
+                suffix=".tmp",
+                )
+            try:
+                with os.fdopen(handle, "wb") as file:
+                    np.savez(file, allow_pickle=False, **arrays)
+                os.replace(temp_name, path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except (OSError, ValueError) as error:
+            get_logger(__name__).warning(
+                "Could not save the run search index of %s: %s",
+                database_path,
+                error,
+                )
+            return False
+
+        self._saved_pairs = self._pair_count()
+        return True
+
+
+    @classmethod
+    def load(cls, path, database_path, database_identity):
+        """
+        Return an empty index with the dictionaries saved at ``path``.
+
+        A missing, unreadable or stale file gives an index without saved
+        dictionaries.
+
+        """
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                header = json.loads(str(archive["header"]))
+                if (
+                        header.get("version") != RUN_SEARCH_INDEX_VERSION
+                        or header.get("database_path") != str(database_path)
+                        or header.get("database_identity") != list(database_identity)
+                        ):
+                    return cls()
+                dictionaries = {
+                    field: _ValueDictionary(
+                        archive[f"{field}.values"].tolist(),
+                        archive[f"{field}.pair_tokens"].tolist(),
+                        archive[f"{field}.pair_values"].tolist(),
+                        )
+                    for field in TEXT_FIELDS
+                    }
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError) as error:
+            get_logger(__name__).info("Ignoring run search index %s: %s", path, error)
+            return cls()
+        return cls(dictionaries)
+
+
+def parse_query(query):
+    """
+    Split a filter into ``(field, operator, value)`` terms.
+
+    Text terms have a None field when they search every text field. Numeric
+    terms carry the bounds of their matching values as the value.
+
+    Raises
+    ------
+    RunSearchError
+        If a term names an unknown field or has an unreadable value.
+
+    """
+    terms: list[tuple[str | None, str, object]] = []
+    for term in str(query or "").split():
+        match = _TERM_PATTERN.match(term.casefold())
+        if match is None:
+            terms.append((None, ":", term))
+            continue
+
+        field = FIELD_ALIASES.get(match["field"])
+        operator = match["operator"]
+        value = match["value"]
+        if field is None:
+            raise RunSearchError(f"Unknown filter field {match['field']!r}.")
+        if not value:
+            raise RunSearchError(f"Missing value after {term!r}.")
+        if field in TEXT_FIELDS:
+            if operator != ":":
+                raise RunSearchError(f"Use {match['field']}:{value} to filter text.")
+            terms.append((field, operator, value))
+        else:
+            terms.append((field, operator, _numeric_bounds(field, operator, value)))
+    return terms
+
+
+def _numeric_bounds(field, operator, value):
+    """
+    Return the bounds of the values of ``field`` that compare true with ``value``.
+
+    Returns
+    -------
+    bounds : tuple
+        ``(low, low_side, high, high_side)``, where a None bound is open and
+        the sides are the ``searchsorted`` sides that include or exclude it.
+
+    """
+    if field in ("started", "completed"):
+        start, end = _time_period(value)
+        return {
+            ">": (end, "left", None, None),
+            ">=": (start, "left", None, None),
+            "<": (None, None, start, "left"),
+            "<=": (None, None, end, "left"),
+            }.get(operator, (start, "left", end, "left"))
+
+    if field == "size":
+        match = _SIZE_PATTERN.match(value)
+        if match is None:
+            raise RunSearchError(f"Cannot read size {value!r}; use values like 10MB.")
+        number = float(match["number"]) * _SIZE_UNITS[match["unit"][:1].rstrip("b")]
+    else:
+        try:
+            number = float(int(value))
+        except ValueError as error:
+            raise RunSearchError(f"Cannot read run ID {value!r}.") from error
+    return {
+        ">": (number, "right", None, None),
+        ">=": (number, "left", None, None),
+        "<": (None, None, number, "left"),
+        "<=": (None, None, number, "right"),
+        }.get(operator, (number, "left", number, "right"))
+
+
+def _time_period(value):
+    """Return the local ``(start, end)`` timestamps of the period ``value`` names."""
+    for time_format, unit in _TIME_FORMATS:
+        try:
+            start = datetime.strptime(value.upper(), time_format)
+        except ValueError:
+            continue
+        if unit == "year":
+            end = start.replace(year=start.year + 1)
+        elif unit == "month":
+            end = (
+                start.replace(year=start.year + 1, month=1)
+                if start.month == 12
+                else start.replace(month=start.month + 1)
+                )
+        else:
+            seconds = {"day": 86_400, "minute": 60, "second": 1}[unit]
+            return start.timestamp(), start.timestamp() + seconds
+        return start.timestamp(), end.timestamp()
+    raise RunSearchError(f"Cannot read date {value!r}; use values like 2026-05-04.")
@@ -0,0 +1,576 @@
+"""
+Columnar storage of the run table and the Qt model that displays it.
+
+The run table used to build one QTreeWidgetItem per run, holding every
+formatted cell text and a dozen role values. A database with 100,000 runs then
+spent seconds creating, and later comparing, item objects. The model keeps the
+values the table sorts on in NumPy columns and the repeated strings interned,
+and formats a cell's text only when a view first asks for it. Sorting computes
+one permutation over the key columns, and filtering selects the rows of that
+permutation a mask keeps.
+"""
+
+import sys
+
+import numpy as np
+from PyQt6 import QtCore
+
+from ._run_formatting import (
+    complete_cell_sort_value,
+    format_complete_cell,
+    format_point_count,
+    format_storage_size,
+    format_timestamp,
+    measured_parameter_count,
+    run_is_complete,
+    run_tooltip_text,
+    time_taken_seconds,
+)
+from .run_list_items import MEASUREMENT_PREVIEW_SIZE
+
+COMPACT_ROW_HEIGHT = 22
+COMPACT_MEASUREMENTS_TOOLTIP = (
+    "Inline previews are disabled for this large run list. "
+    "Select the run to use the Preview tab."
+    )
+
+_RIGHT_ALIGNED = QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+_COLUMN_ALIGNMENTS = {
+    "ID": _RIGHT_ALIGNED,
+    "Setpoints": _RIGHT_ALIGNED,
+    "Size": _RIGHT_ALIGNED,
+    "Duration": _RIGHT_ALIGNED,
+    "Status": QtCore.Qt.AlignmentFlag.AlignCenter,
+    }
+# Columns shown from interned strings and the metadata field they come from.
+_TEXT_FIELDS = {
+    "Experiment": "exp_name",
+    "Sample": "sample_name",
+    "Name": "name",
+    "GUID": "guid",
+    }
+# Columns sorted by a number, which is also their UserRole value.
+_NUMERIC_COLUMNS = (
+    "ID",
+    "Measurements",
+    "Setpoints",
+    "Started",
+    "Completed",
+    "Status",
+    "Duration",
+    "Size",
+    )
+
+
+def metadata_cell_text(value):
+    return "" if value is None else str(value)
+
+
+def format_completed_timestamp(metadata):
+    completed_timestamp = metadata.get("completed_timestamp")
+    if completed_timestamp:
+        return format_timestamp(completed_timestamp)
+    if run_is_complete(metadata):
+        return "unknown"
+    return "Ongoing"
+
+
+def measurement_accessible_text(metadata, measurement_count):
+    parameters = [
+        str(parameter)
+        for parameter in metadata.get("measure_parameters", [])
+        if parameter
+        ]
+    noun = "measurement" if measurement_count == 1 else "measurements"
+    summary = f"{measurement_count} {noun}"
+    if parameters:
+        summary += f": {', '.join(parameters)}"
+    return summary
+
+
+def _sort_number(value):
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _run_sort_numbers(run_id, metadata):
+    return (
+        run_id,
+        measured_parameter_count(metadata),
+        _sort_number(
+            metadata.get("setpoint_count")
+            or metadata.get("expected_results")
+            or metadata.get("result_count")
+            ),
+        _sort_number(metadata.get("run_timestamp")),
+        _sort_number(metadata.get("completed_timestamp")),
+        _sort_number(complete_cell_sort_value(metadata)),
+        _sort_number(time_taken_seconds(metadata)),
+        _sort_number(metadata.get("storage_bytes")),
+        )
+
+
+class RunRow:
+    """
+    Handle to one run of a RunTableModel.
+
+    Offers the item methods that callers of the former QTreeWidget table use.
+    The handle stays valid across sorting, until the model is cleared.
+    """
+
+    __slots__ = ("model", "row")
+
+    def __init__(self, model, row):
+        self.model = model
+        self.row = row
+
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, RunRow)
+            and other.model is self.model
+            and other.row == self.row
+            )
+
+
+    def __hash__(self):
+        return hash((id(self.model), self.row))
+
+
+    def __repr__(self):
+        return f"RunRow(run_id={self.model.run_id(self.row)!r}, guid={self.guid!r})"
+
+
+    @property
+    def guid(self):
+        return self.model.guid(self.row)
+
+
+    @property
+    def run_metadata(self):
+        return self.model.run_metadata(self.row)
+
+
+    def text(self, column):
+        return self.model.text(self.row, column)
+
+
+    def data(self, column, role):
+        return self.model.row_data(self.row, column, role)
+
+
+    def toolTip(self, column):
+        return self.data(column, QtCore.Qt.ItemDataRole.ToolTipRole) or ""
+
+
+    def textAlignment(self, column):
+        return self.data(column, QtCore.Qt.ItemDataRole.TextAlignmentRole) or 0
+
+
+class RunTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model over runs stored column by column.
+
+    Rows are stored in the order they were added and never move. Sorting only
+    changes the permutation from view rows to stored rows, and filtering only
+    hides stored rows from the view, so stored row numbers identify a run
+    until the model is cleared.
+
+    Parameters
+    ----------
+    columns : Sequence[str]
+        Column labels, in display order.
+
+    """
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self._column_names = {index: name for index, name in enumerate(self.columns)}
+        self._numeric_columns = {
+            self.columns.index(name): name
+            for name in _NUMERIC_COLUMNS
+            if name in self.columns
+            }
+        self.compact_measurements = False
+        self.sort_column = -1
+        self.sort_order = QtCore.Qt.SortOrder.AscendingOrder
+        self._reset_storage()
+
+
+    def _reset_storage(self):
+        self._count = 0
+        self._capacity = 0
+        self._numbers = {name: np.empty(0) for name in _NUMERIC_COLUMNS}
+        self._order = np.empty(0, dtype=np.intp)
+        self._position = np.empty(0, dtype=np.intp)
+        self._view = np.empty(0, dtype=np.intp)
+        self._filter: np.ndarray | None = None
+        self._strings: dict[str, list[str]] = {name: [] for name in _TEXT_FIELDS}
+        self._metadata: list[dict] = []
+        self._guids: list[str] = []
+        self._rows_by_guid: dict[str, int] = {}
+        self._text_cache: dict[int, list[str | None]] = {}
+
+
+    def _reserve(self, count):
+        if count <= self._capacity:
+            return
+        capacity = max(count, 2 * self._capacity, 64)
+        for name, values in self._numbers.items():
+            grown = np.full(capacity, np.nan)
+            grown[:self._count] = values[:self._count]
+            self._numbers[name] = grown
+        for name in ("_order", "_position"):
+            grown_rows = np.empty(capacity, dtype=np.intp)
+            grown_rows[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, grown_rows)
+        self._capacity = capacity
+
+
+    def rowCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self._view)
+
+
+    @property
+    def stored_count(self):
+        """The number of stored rows, including those the filter hides."""
+        return self._count
+
+
+    def columnCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.columns)
+
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if (
+                orientation == QtCore.Qt.Orientation.Horizontal
+                and role == QtCore.Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self.columns)
+                ):
+            return self.columns[section]
+        return super().headerData(section, orientation, role)
+
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._view):
+            return None
+        return self.row_data(int(self._view[index.row()]), index.column(), role)
+
+
+    def row_data(self, row, column, role):
+        """Return the ``role`` data of a stored row's cell."""
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.text(row, column)
+
+        name = self._column_names.get(column, "")
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            if name == "ID" or column not in self._numeric_columns:
+                return None
+            value = float(self._numbers[name][row])
+            if np.isnan(value):
+                return None
+            return int(value) if name == "Measurements" else value
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+            alignment = _COLUMN_ALIGNMENTS.get(name)
+            return None if alignment is None else alignment.value
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            if name == "Measurements" and self.compact_measurements:
+                return COMPACT_MEASUREMENTS_TOOLTIP
+            return run_tooltip_text(self._metadata[row])
+        if name != "Measurements":
+            return None
+        if role == QtCore.Qt.ItemDataRole.AccessibleTextRole:
+            return measurement_accessible_text(
+                self._metadata[row],
+                int(self._numbers["Measurements"][row]),
+                )
+        if role == QtCore.Qt.ItemDataRole.SizeHintRole:
+            height = (
+                COMPACT_ROW_HEIGHT
+                if self.compact_measurements
+                else MEASUREMENT_PREVIEW_SIZE + 6
+                )
+            return QtCore.QSize(0, height)
+        return None
+
+
+    def text(self, row, column):
+        """Return the display text of a stored row's cell, formatting it once."""
+        texts = self._text_cache.get(column)
+        if texts is None:
+            texts = self._text_cache[column] = [None] * self._count
+        text = texts[row]
+        if text is None:
+            text = texts[row] = self._format_text(row, self._column_names.get(column))
+        return text
+
+
+    def column_texts(self, column):
+        """Return the display texts of every stored row of ``column``."""
+        return [self.text(row, column) for row in range(self._count)]
+
+
+    def _format_text(self, row, name):
+        metadata = self._metadata[row]
+        if name in _TEXT_FIELDS:
+            return self._strings[name][row]
+        if name == "ID":
+            return str(int(self._numbers["ID"][row]))
+        if name == "Measurements":
+            if self.compact_measurements:
+                return str(int(self._numbers["Measurements"][row]))
+            return ""
+        if name == "Setpoints":
+            return format_point_count(metadata)
+        if name == "Started":
+            return format_timestamp(metadata.get("run_timestamp"))
+        if name == "Completed":
+            return format_completed_timestamp(metadata)
+        if name == "Status":
+            return format_complete_cell(metadata)
+        if name == "Duration":
+            seconds = self._numbers["Duration"][row]
+            return "unknown" if np.isnan(seconds) else f"{seconds:,.1f} s"
+        if name == "Size":
+            return format_storage_size(metadata.get("storage_bytes"))
+        return ""
+
+
+    def clear(self):
+        self.beginResetModel()
+        self._reset_storage()
+        self.endResetModel()
+
+
+    def append_runs(self, runs):
+        """
+        Append runs as new rows at the end of the view.
+
+        Parameters
+        ----------
+        runs : dict[int, dict]
+            Metadata by run ID, as returned by get_runs_via_sql. Each row keeps
+            its own copy of the metadata.
+
+        Returns
+        -------
+        range
+            The stored rows of the new runs.
+
+        """
+        first = self._count
+        if not runs:
+            return range(first, first)
+
+        metadata_rows = [dict(metadata) for metadata in runs.values()]
+        numbers = np.array(
+            [
+                _run_sort_numbers(run_id, metadata)
+                for run_id, metadata in zip(runs, metadata_rows, strict=True)
+                ],
+            dtype=float,
+            ).reshape(len(metadata_rows), len(_NUMERIC_COLUMNS))
+        last = first + len(metadata_rows)
+        view_first = len(self._view)
+
+        self.beginInsertRows(
+            QtCore.QModelIndex(),
+            view_first,
+            view_first + len(metadata_rows) - 1,
+            )
+        self._reserve(last)
+        for column, name in enumerate(_NUMERIC_COLUMNS):
+            self._numbers[name][first:last] = numbers[:, column]
+        for name, field in _TEXT_FIELDS.items():
+            self._strings[name].extend(
+                sys.intern(metadata_cell_text(metadata.get(field)))
+                for metadata in metadata_rows
+                )
+        for row, metadata in enumerate(metadata_rows, first):
+            guid = str(metadata.get("guid") or "")
+            self._guids.append(guid)
+            self._rows_by_guid[guid] = row
+        self._metadata.extend(metadata_rows)
+        self._order[first:last] = np.arange(first, last)
+        self._position[first:last] = np.arange(view_first, view_first + len(metadata_rows))
+        self._view = np.concatenate((self._view, np.arange(first, last)))
+        if self._filter is not None:
+            self._filter = np.concatenate((self._filter, np.ones(len(metadata_rows), bool)))
+        for texts in self._text_cache.values():
+            texts.extend([None] * len(metadata_rows))
+        self._count = last
+        self.endInsertRows()
+        return range(first, last)
+
+
+    def refresh_row(self, row):
+        """
+        Recompute a stored row's values after its metadata changed.
+
+        """
+        metadata = self._metadata[row]
+        numbers = _run_sort_numbers(self._numbers["ID"][row], metadata)
+        for name, value in zip(_NUMERIC_COLUMNS, numbers, strict=True):
+            self._numbers[name][row] = value
+        for name, field in _TEXT_FIELDS.items():
+            value = metadata.get(field)
+            if name == "GUID":
+                value = value or self._guids[row]
+            self._strings[name][row] = sys.intern(metadata_cell_text(value))
+        for texts in self._text_cache.values():
+            texts[row] = None
+
+        view_row = int(self._position[row])
+        if view_row < 0:
+            return
+        self.dataChanged.emit(
+            self.index(view_row, 0),
+            self.index(view_row, len(self.columns) - 1),
+            )
+
+
+    def set_compact_measurements(self, compact):
+        compact = bool(compact)
+        if compact == self.compact_measurements:
+            return
+        self.compact_measurements = compact
+        column = self.columns.index("Measurements")
+        self._text_cache.pop(column, None)
+        if len(self._view):
+            self.dataChanged.emit(
+                self.index(0, column),
+                self.index(len(self._view) - 1, column),
+                )
+
+
+    def source_row(self, view_row):
+        """Return the stored row shown at ``view_row``."""
+        return int(self._view[view_row])
+
+
+    def view_row(self, row):
+        """Return the view row that shows the stored ``row``, or -1 if hidden."""
+        return int(self._position[row])
+
+
+    def is_visible(self, row):
+        return self._position[row] >= 0
+
+
+    def row_for_guid(self, guid):
+        return self._rows_by_guid.get(guid)
+
+
+    def rows_for_run_id(self, run_id):
+        """Return the stored rows of a run ID, in view order, hidden rows last."""
+        matches = np.flatnonzero(self._numbers["ID"][:self._count] == run_id)
+        return sorted(
+            matches.tolist(),
+            key=lambda row: (not self.is_visible(row), self.view_row(row)),
+            )
+
+
+    def run_id(self, row):
+        return int(self._numbers["ID"][row])
+
+
+    def guid(self, row):
+        return self._guids[row]
+
+
+    def run_metadata(self, row):
+        return self._metadata[row]
+
+
+    def iter_metadata(self):
+        return iter(self._metadata)
+
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        """
+        Sort the view rows by one column.
+
+        Numbers sort numerically and strings lexically. Missing numbers sort
+        after present ones in ascending order. Equal keys keep their current
+        relative order, like the stable item sort this replaces.
+
+        """
+        self.sort_column = column
+        self.sort_order = order
+        if not 0 <= column < len(self.columns) or self._count < 2:
+            return
+
+        current = self._order[:self._count]
+        missing, keys = self._sort_keys(column, current)
+        if order == QtCore.Qt.SortOrder.DescendingOrder:
+            missing, keys = -missing, -keys
+        permutation = np.lexsort((np.arange(self._count), keys, missing))
+        if np.array_equal(permutation, np.arange(self._count)):
+            return
+        self._change_layout(current[permutation], self._filter)
+
+
+    def set_filter(self, mask):
+        """
+        Show only the stored rows ``mask`` keeps.
+
+        Parameters
+        ----------
+        mask : np.ndarray | None
+            A boolean per stored row, or None to show every row. Rows appended
+            later are shown until the next filter.
+
+        """
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (self._count,):
+                raise ValueError(
+                    f"Filter has {mask.size} values for {self._count} runs."
+                    )
+        if mask is None and self._filter is None:
+            return
+        if mask is not None and self._filter is not None and np.array_equal(mask, self._filter):
+            return
+        self._change_layout(self._order[:self._count].copy(), mask)
+
+
+    def _change_layout(self, order, mask):
+        """Show the stored rows ``mask`` keeps in the sorted ``order``."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_rows = [
+            int(self._view[index.row()]) if index.isValid() else None
+            for index in persistent
+            ]
+        self._order[:self._count] = order
+        self._filter = mask
+        self._view = order if mask is None else order[mask[order]]
+        self._position[:self._count] = -1
+        self._position[self._view] = np.arange(len(self._view))
+        self.changePersistentIndexList(
+            persistent,
+            [
+                self.index(self.view_row(row), index.column())
+                if row is not None and self.is_visible(row)
+                else QtCore.QModelIndex()
+                for index, row in zip(persistent, persistent_rows, strict=True)
+                ],
+            )
+        self.layoutChanged.emit()
+
+
+    def _sort_keys(self, column, rows):
+        name = self._numeric_columns.get(column)
+        if name is not None:
+            values = self._numbers[name][rows]
+            missing = np.isnan(values)
+            return missing.astype(float), np.where(missing, 0.0, values)
+
+        texts = np.asarray([self.text(int(row), column) for row in rows], dtype=str)
+        _unique, ranks = np.unique(texts, return_inverse=True)
+        return np.zeros(len(rows)), ranks.astype(float)
@@ -10,13 +10,14 @@ from PyQt6 import (
 from PyQt6 import (
     QtWidgets as qtw,
 )
-from qcodes.dataset.sqlite.database import get_DB_location
 
 from qplot.datahandling import (
     get_run_status,
     get_runs_via_sql,
 )
-from qplot.datahandling.readonly import sqlite_read_only_connection
+from qplot.datahandling.qcodes_compat import get_DB_location
+from qplot.datahandling.readonly import pooled_sqlite_read_only_connection
+from qplot.datahandling.run_catalog import run_catalog
 
 from .._commands import (
     configure_action,
@@ -59,10 +60,15 @@ from .preview import (
     PreviewTab,
 )
 from .run_list_items import (
-    MEASUREMENT_PREVIEW_SIZE,
+    MEASUREMENT_PREVIEW_SIZE,  # noqa: F401 - re-exported for compatibility
     EqualsAlignedDelegate,
     RunPreviewCell,
-    SortableTreeWidgetItem,
+)
+from .run_search import RunSearchIndex
+from .run_table_model import (
+    RunRow,
+    RunTableModel,
+    measurement_accessible_text,
 )
 
 MAX_RUN_PREVIEW_WIDGETS = 500
@@ -71,14 +77,16 @@ RUN_TABLE_COLUMN_WIDTHS_KEY = "GUI.run_table_column_widths"
 RUN_TABLE_VISIBLE_COLUMNS_KEY = "GUI.run_table_visible_columns"
 
 
-class RunList(qtw.QTreeWidget):
+class RunList(qtw.QTreeView):
     """
-    A modified PyQt6.QtWidgets.QTreeWidget, formated as a list which displays
-    all run_ids and other properties found in self.cols.
-    
-    All QTreeWidgetItem are converted to SortableTreeWidgetItem to allow the user to sort
-    by any columns.
-    
+    A PyQt6.QtWidgets.QTreeView, formated as a list which displays all run_ids
+    and other properties found in self.cols.
+
+    Runs are stored column by column in a RunTableModel, which formats cell
+    text on demand and sorts every column without per-row items. Rows are
+    handed to callers as RunRow handles, which keep the QTreeWidgetItem
+    methods the rest of the application uses.
+
     """
     
     column_ids = (
@@ -259,9 +267,12 @@ class RunList(qtw.QTreeWidget):
         if initialize is not None:
             initalize = initialize
         
-        self.watching: list[SortableTreeWidgetItem] = []
+        self.watching: list[RunRow] = []
         self.preview_cells: dict[str, RunPreviewCell] = {}
-        self._items_by_guid: dict[str, SortableTreeWidgetItem] = {}
+        self._run_previews: dict[str, object] = {}
+        self.search_index = RunSearchIndex()
+        self._search_catalog = None
+        self._search_text = ""
         self._resizing_columns = False
         self._manual_column_widths = False
         self._config = config
@@ -274,8 +285,8 @@ class RunList(qtw.QTreeWidget):
         self._preview_widgets_enabled = True
         self.maxRunId = 0
         
-        self.setColumnCount(len(self.cols))
-        self.setHeaderLabels(self.cols)
+        self._model = RunTableModel(self.cols, self)
+        self.setModel(self._model)
         header = self.header()
         if header is not None:
             header.setStretchLastSection(False)
@@ -316,8 +327,10 @@ class RunList(qtw.QTreeWidget):
             self.setRuns()
             
         # Slot connections
-        self.itemSelectionChanged.connect(self.onSelect)
-        self.itemDoubleClicked.connect(self._double_clicked)
+        selection_model = self.selectionModel()
+        if selection_model is not None:
+            selection_model.selectionChanged.connect(self.onSelect)
+        self.doubleClicked.connect(self._double_clicked)
         
         # Setup Context Menu
         self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
@@ -359,94 +372,26 @@ class RunList(qtw.QTreeWidget):
         self.setSortingEnabled(False) # Prevent constant restort on adding items
 
         self.maxRunId = max(self.maxRunId, max(runs, default=0))
-        
-        for run_id, metadata in runs.items():
-            append_to_watching = False
-            measurement_count = measured_parameter_count(metadata)
-            arr = self._run_column_texts(run_id, metadata)
-
-            if not run_is_complete(metadata):
-                append_to_watching = True
-
-            # Convert arr to easy to sort QTreeWidgetItem
-            item = SortableTreeWidgetItem(arr)
-            item.set_guid(str(metadata.get("guid") or ""))
-            item.run_metadata = dict(metadata)
-            self._items_by_guid[item.guid] = item
-            for col_name in ("ID", "Setpoints", "Size"):
-                item.setTextAlignment(
-                    self.cols.index(col_name),
-                    QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
-                    )
-            item.setTextAlignment(
-                self.cols.index("Status"),
-                QtCore.Qt.AlignmentFlag.AlignCenter
-                )
-            item.setTextAlignment(
-                self.cols.index("Duration"),
-                QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
-                )
-            item.setData(
-                self.cols.index("Measurements"),
-                QtCore.Qt.ItemDataRole.UserRole,
-                measurement_count
-                )
-            item.setData(
-                self.cols.index("Measurements"),
-                QtCore.Qt.ItemDataRole.AccessibleTextRole,
-                self._measurement_accessible_text(metadata, measurement_count),
-                )
-            item.setSizeHint(
-                self.cols.index("Measurements"),
-                QtCore.QSize(0, MEASUREMENT_PREVIEW_SIZE + 6)
-                )
-            item.setData(
-                self.cols.index("Setpoints"),
-                QtCore.Qt.ItemDataRole.UserRole,
-                metadata.get("setpoint_count")
-                or metadata.get("expected_results")
-                or metadata.get("result_count")
-                )
-            item.setData(
-                self.cols.index("Started"),
-                QtCore.Qt.ItemDataRole.UserRole,
-                metadata.get("run_timestamp")
-                )
-            item.setData(
-                self.cols.index("Completed"),
-                QtCore.Qt.ItemDataRole.UserRole,
-                metadata.get("completed_timestamp")
-                )
-            item.setData(
-                self.cols.index("Status"),
-                QtCore.Qt.ItemDataRole.UserRole,
-                complete_cell_sort_value(metadata)
-                )
-            item.setData(
-                self.cols.index("Duration"),
-                QtCore.Qt.ItemDataRole.UserRole,
-                time_taken_seconds(metadata)
-                )
-            item.setData(
-                self.cols.index("Size"),
-                QtCore.Qt.ItemDataRole.UserRole,
-                metadata.get("storage_bytes")
-                )
-            item.update_tooltip()
-            
-            # Add to top
-            self.addTopLevelItem(item)
+
+        model = self._model
+        rows = model.append_runs(runs)
+        self.search_index.set_runs(
+            rows.start,
+            [model.run_id(row) for row in rows],
+            [model.run_metadata(row) for row in rows],
+            )
+        for row in rows:
+            item = RunRow(model, row)
             if self._preview_widgets_enabled:
-                self._set_measurement_preview_cell(item, measurement_count)
-            else:
-                self._set_compact_measurement_cell(item, measurement_count)
-            
+                self._set_measurement_preview_cell(item)
+
             # If unfinished run
-            if append_to_watching:
+            if not run_is_complete(item.run_metadata):
                 self.watching.append(item)
-            
+
         self._setpoints_delegate.invalidate_width_cache()
         self.setSortingEnabled(True)
+        self._reapply_search()
 
 
     def updateRuns(self, runs):
@@ -461,27 +406,6 @@ class RunList(qtw.QTreeWidget):
             return {}
 
         updated = {}
-        sorting_enabled = self.isSortingEnabled()
-        sort_column = self.sortColumn()
-        mutable_columns = {
-            self.cols.index(name)
-            for name in (
-                "Measurements",
-                "Setpoints",
-                "Experiment",
-                "Sample",
-                "Name",
-                "Started",
-                "Status",
-                "Duration",
-                "Size",
-                "Completed",
-                "GUID",
-                )
-            }
-        suspend_sorting = sorting_enabled and sort_column in mutable_columns
-        if suspend_sorting:
-            self.setSortingEnabled(False)
         for run_id, metadata in runs.items():
             guid = metadata.get("guid")
             item = self._item_for_guid(guid)
@@ -503,135 +427,30 @@ class RunList(qtw.QTreeWidget):
             updated[run_id] = dict(item.run_metadata)
 
         self._setpoints_delegate.invalidate_width_cache()
-        if suspend_sorting:
-            self.setSortingEnabled(True)
+        self._resort_updated_rows()
+        self._reapply_search()
         return updated
 
 
-    def _refresh_run_item(self, item):
-        metadata = item.run_metadata
-        measurement_count = measured_parameter_count(metadata)
+    def _resort_updated_rows(self):
+        # Run IDs never change, so only sorting by another column can move rows.
+        sort_column = self.sortColumn()
+        if self.isSortingEnabled() and sort_column != self.cols.index("ID"):
+            self._model.sort(sort_column, self._model.sort_order)
 
-        self._refresh_metadata_columns(item)
 
-        measurements_col = self.cols.index("Measurements")
-        item.setData(
-            measurements_col,
-            QtCore.Qt.ItemDataRole.UserRole,
-            measurement_count,
-            )
-        item.setData(
-            measurements_col,
-            QtCore.Qt.ItemDataRole.AccessibleTextRole,
-            self._measurement_accessible_text(metadata, measurement_count),
-            )
-        item.setSizeHint(
-            measurements_col,
-            QtCore.QSize(0, MEASUREMENT_PREVIEW_SIZE + 6),
-            )
+    def _refresh_run_item(self, item):
+        self._model.refresh_row(item.row)
+        self.search_index.set_run(item.row, self._item_run_id(item), item.run_metadata)
+
         cell = self.preview_cells.get(item.guid)
+        measurement_count = measured_parameter_count(item.run_metadata)
         if (
                 self._preview_widgets_enabled
+                and self._model.is_visible(item.row)
                 and (cell is None or cell.placeholder_count != measurement_count)
                 ):
-            self._set_measurement_preview_cell(item, measurement_count)
-        elif not self._preview_widgets_enabled:
-            self._set_compact_measurement_cell(item, measurement_count)
-
-        setpoints_col = self.cols.index("Setpoints")
-        item.setText(setpoints_col, format_point_count(metadata))
-        item.setData(
-            setpoints_col,
-            QtCore.Qt.ItemDataRole.UserRole,
-            metadata.get("setpoint_count")
-            or metadata.get("expected_results")
-            or metadata.get("result_count"),
-            )
-
-        complete_col = self.cols.index("Status")
-        item.setText(complete_col, format_complete_cell(metadata))
-        item.setData(
-            complete_col,
-            QtCore.Qt.ItemDataRole.UserRole,
-            complete_cell_sort_value(metadata),
-            )
-
-        duration_col = self.cols.index("Duration")
-        item.setText(duration_col, format_time_taken_seconds(metadata))
-        item.setData(
-            duration_col,
-            QtCore.Qt.ItemDataRole.UserRole,
-            time_taken_seconds(metadata),
-            )
-
-        size_col = self.cols.index("Size")
-        item.setText(size_col, format_storage_size(metadata.get("storage_bytes")))
-        item.setData(
-            size_col,
-            QtCore.Qt.ItemDataRole.UserRole,
-            metadata.get("storage_bytes"),
-            )
-
-        item.update_tooltip()
-
-
-    @classmethod
-    def _run_column_texts(cls, run_id, metadata):
-        values = {
-            "ID": str(run_id),
-            "Measurements": "",
-            "Setpoints": format_point_count(metadata),
-            "Experiment": cls._metadata_cell_text(metadata.get("exp_name")),
-            "Sample": cls._metadata_cell_text(metadata.get("sample_name")),
-            "Name": cls._metadata_cell_text(metadata.get("name")),
-            "Started": format_timestamp(metadata.get("run_timestamp")),
-            "Status": format_complete_cell(metadata),
-            "Duration": format_time_taken_seconds(metadata),
-            "Size": format_storage_size(metadata.get("storage_bytes")),
-            "Completed": cls._format_completed_timestamp(metadata),
-            "GUID": cls._metadata_cell_text(metadata.get("guid")),
-            }
-        return [values[name] for name in cls.cols]
-
-
-    @staticmethod
-    def _metadata_cell_text(value):
-        return "" if value is None else str(value)
-
-
-    @staticmethod
-    def _format_completed_timestamp(metadata):
-        completed_timestamp = metadata.get("completed_timestamp")
-        if completed_timestamp:
-            return format_timestamp(completed_timestamp)
-        if run_is_complete(metadata):
-            return "unknown"
-        return "Ongoing"
-
-
-    def _refresh_metadata_columns(self, item):
-        metadata = item.run_metadata
-        values = {
-            "Experiment": self._metadata_cell_text(metadata.get("exp_name")),
-            "Sample": self._metadata_cell_text(metadata.get("sample_name")),
-            "Name": self._metadata_cell_text(metadata.get("name")),
-            "Started": format_timestamp(metadata.get("run_timestamp")),
-            "Completed": self._format_completed_timestamp(metadata),
-            "GUID": self._metadata_cell_text(metadata.get("guid") or item.guid),
-            }
-        for name, value in values.items():
-            item.setText(self.cols.index(name), value)
-
-        item.setData(
-            self.cols.index("Started"),
-            QtCore.Qt.ItemDataRole.UserRole,
-            metadata.get("run_timestamp"),
-            )
-        item.setData(
-            self.cols.index("Completed"),
-            QtCore.Qt.ItemDataRole.UserRole,
-            metadata.get("completed_timestamp"),
-            )
+            self._set_measurement_preview_cell(item)
 
 
     def _sync_watching_item(self, item):
@@ -645,19 +464,23 @@ class RunList(qtw.QTreeWidget):
 
     def clear(self):
         self.preview_cells = {}
-        self._items_by_guid = {}
+        self._run_previews = {}
+        self.search_index.clear()
+        self.watching = []
         self._preview_widgets_enabled = True
+        self._model.set_compact_measurements(False)
         self.setUniformRowHeights(False)
         self._setpoints_delegate.invalidate_width_cache()
-        super().clear()
+        self._model.clear()
 
 
-    def _set_measurement_preview_cell(self, item, measurement_count):
+    def _set_measurement_preview_cell(self, item):
         column = self.cols.index("Measurements")
+        measurement_count = measured_parameter_count(item.run_metadata)
         cell = RunPreviewCell(item.guid, measurement_count, self)
         cell.plotRequested.connect(self._preview_plot_requested)
         cell.exportRequested.connect(self._preview_export_requested)
-        accessible_text = self._measurement_accessible_text(
+        accessible_text = measurement_accessible_text(
             item.run_metadata,
             measurement_count,
             )
@@ -666,38 +489,31 @@ class RunList(qtw.QTreeWidget):
             "Measurement previews. Focus a preview for plot and export actions."
             )
         self.preview_cells[item.guid] = cell
-        self.setItemWidget(item, column, cell)
-
-
-    def _set_compact_measurement_cell(self, item, measurement_count):
-        column = self.cols.index("Measurements")
-        item.setText(column, str(measurement_count))
-        item.setSizeHint(column, QtCore.QSize(0, 22))
-        item.setToolTip(
-            column,
-            "Inline previews are disabled for this large run list. "
-            "Select the run to use the Preview tab.",
-            )
+        self.setIndexWidget(self.indexFromItem(item, column), cell)
+        previews = self._run_previews.get(item.guid)
+        if previews is not None:
+            cell.show_previews(previews)
 
 
     def _disable_measurement_preview_widgets(self):
         column = self.cols.index("Measurements")
         for guid, cell in tuple(self.preview_cells.items()):
-            item = self._items_by_guid.get(guid)
+            item = self._item_for_guid(guid)
             if item is not None:
-                self.removeItemWidget(item, column)
-                self._set_compact_measurement_cell(
-                    item,
-                    measured_parameter_count(item.run_metadata),
-                    )
+                self.setIndexWidget(self.indexFromItem(item, column), None)
             cell.deleteLater()
         self.preview_cells.clear()
+        self._run_previews.clear()
         self._preview_widgets_enabled = False
+        self._model.set_compact_measurements(True)
         self.setUniformRowHeights(True)
 
 
     @QtCore.pyqtSlot(str, object)
     def set_run_previews(self, guid, previews):
+        if self._preview_widgets_enabled:
+            # Filtering deletes hidden rows' cells; showing them again restores these.
+            self._run_previews[guid] = previews
         cell = self.preview_cells.get(guid)
         if cell is not None:
             cell.show_previews(previews)
@@ -727,21 +543,206 @@ class RunList(qtw.QTreeWidget):
 
 
     def _item_for_guid(self, guid):
-        return self._items_by_guid.get(guid)
+        row = self._model.row_for_guid(guid)
+        return None if row is None else RunRow(self._model, row)
+
+
+    def set_search_text(self, text):
+        """
+        Show only the runs matching a filter; see ``run_search`` for the syntax.
+
+        Raises
+        ------
+        RunSearchError
+            If the filter cannot be parsed. The previous filter stays applied.
+
+        """
+        mask = self.search_index.search(text)
+        self._search_text = str(text or "")
+        self._apply_search_mask(mask)
+
+
+    def _reapply_search(self):
+        if self._search_text:
+            self._apply_search_mask(self.search_index.search(self._search_text))
+
+
+    def _apply_search_mask(self, mask):
+        # Qt deletes the index widgets of rows a layout change hides.
+        column = self.cols.index("Measurements")
+        for guid, cell in tuple(self.preview_cells.items()):
+            row = self._model.row_for_guid(guid)
+            if row is None or (mask is not None and not mask[row]):
+                if row is not None:
+                    index = self._model.index(self._model.view_row(row), column)
+                    self.setIndexWidget(index, None)
+                cell.deleteLater()
+                del self.preview_cells[guid]
+
+        self._model.set_filter(mask)
+
+        if self._preview_widgets_enabled:
+            for view_row in range(self._model.rowCount()):
+                item = RunRow(self._model, self._model.source_row(view_row))
+                if item.guid not in self.preview_cells:
+                    self._set_measurement_preview_cell(item)
+
+
+    def run_count(self):
+        """Return the number of runs in the table, including filtered-out ones."""
+        return self._model.stored_count
+
+
+    def set_search_database(self, database_path):
+        """
+        Index the runs of ``database_path`` with its saved token dictionaries.
+
+        Call before adding the database's runs.
+
+        """
+        catalog = run_catalog(database_path) if database_path else None
+        self._search_catalog = catalog
+        if catalog is None:
+            self.search_index = RunSearchIndex()
+        else:
+            self.search_index = RunSearchIndex.load(
+                catalog.index_path,
+                catalog.database_path,
+                catalog.database_identity,
+                )
+        rows = range(self._model.stored_count)
+        self.search_index.set_runs(
+            0,
+            [self._model.run_id(row) for row in rows],
+            [self._model.run_metadata(row) for row in rows],
+            )
+
+
+    def save_search_index(self):
+        """Save the token dictionaries next to the database's run catalog."""
+        catalog = self._search_catalog
+        if catalog is None or not self.search_index.modified:
+            return False
+        saved = self.search_index.save(
+            catalog.index_path,
+            catalog.database_path,
+            catalog.database_identity,
+            )
+        if saved:
+            catalog.evict()
+        return saved
+
+
+    def columnCount(self):
+        return self._model.columnCount()
+
+
+    def topLevelItemCount(self):
+        """Return the number of runs shown; see ``run_count`` for all runs."""
+        return self._model.rowCount()
+
+
+    def topLevelItem(self, index):
+        """Return the run shown at view row ``index``, or None."""
+        if not 0 <= index < self._model.rowCount():
+            return None
+        return RunRow(self._model, self._model.source_row(index))
+
+
+    def indexFromItem(self, item, column=0):
+        """Return the index of a run's cell, which is invalid while it is filtered out."""
+        return self._model.index(self._model.view_row(item.row), column)
+
+
+    def itemFromIndex(self, index):
+        if not index.isValid():
+            return None
+        return RunRow(self._model, self._model.source_row(index.row()))
+
+
+    def itemAt(self, pos):
+        return self.itemFromIndex(self.indexAt(pos))
+
+
+    def itemWidget(self, item, column):
+        return self.indexWidget(self.indexFromItem(item, column))
+
+
+    def visualItemRect(self, item):
+        """Return the rectangle of a run's whole row in viewport coordinates."""
+        row = self._model.view_row(item.row)
+        return self.visualRect(self._model.index(row, 0)).united(
+            self.visualRect(self._model.index(row, self._model.columnCount() - 1))
+            )
+
+
+    def currentItem(self):
+        return self.itemFromIndex(self.currentIndex())
+
+
+    def setCurrentItem(self, item):
+        self.setCurrentIndex(self.indexFromItem(item))
+
+
+    def scrollToItem(
+            self,
+            item,
+            hint=qtw.QAbstractItemView.ScrollHint.EnsureVisible,
+            ):
+        self.scrollTo(self.indexFromItem(item), hint)
+
+
+    def selectedItems(self):
+        selection_model = self.selectionModel()
+        if selection_model is None:
+            return []
+        return [
+            RunRow(self._model, self._model.source_row(index.row()))
+            for index in selection_model.selectedRows()
+            ]
 
 
-    @staticmethod
-    def _measurement_accessible_text(metadata, measurement_count):
-        parameters = [
-            str(parameter)
-            for parameter in metadata.get("measure_parameters", [])
-            if parameter
+    def findItems(self, text, flags, column=0):
+        """
+        Return the runs whose ``column`` text matches, in view order.
+
+        Exact run-ID lookups search the ID column array directly.
+
+        """
+        if column == self.cols.index("ID") and flags == QtCore.Qt.MatchFlag.MatchExactly:
+            try:
+                run_id = int(text)
+            except (TypeError, ValueError):
+                return []
+            if str(run_id) != text:
+                return []
+            return [
+                RunRow(self._model, row)
+                for row in self._model.rows_for_run_id(run_id)
+                if self._model.is_visible(row)
+                ]
+
+        return [
+            self.itemFromIndex(index)
+            for index in self._model.match(
+                self._model.index(0, column),
+                QtCore.Qt.ItemDataRole.DisplayRole,
+                text,
+                -1,
+                flags,
+                )
             ]
-        noun = "measurement" if measurement_count == 1 else "measurements"
-        summary = f"{measurement_count} {noun}"
-        if parameters:
-            summary += f": {', '.join(parameters)}"
-        return summary
+
+
+    def sortColumn(self):
+        if self._model.sort_column >= 0:
+            return self._model.sort_column
+        header = self.header()
+        return header.sortIndicatorSection() if header is not None else 0
+
+
+    def sortItems(self, column, order):
+        self.sortByColumn(column, order)
 
 
     def _column_resized(self, column, old_size, new_size):
@@ -1164,20 +1165,11 @@ class RunList(qtw.QTreeWidget):
 
 
     def all_run_metadata(self):
-        runs = {}
-        for index in range(self.topLevelItemCount()):
-            item = self.topLevelItem(index)
-            if item is None:
-                continue
-
-            run_id: int | str
-            try:
-                run_id = int(item.text(0))
-            except ValueError:
-                run_id = item.text(0)
-
-            runs[run_id] = dict(getattr(item, "run_metadata", {}))
-        return runs
+        """Return the metadata of every run, including filtered-out ones."""
+        return {
+            self._model.run_id(row): dict(self._model.run_metadata(row))
+            for row in range(self._model.stored_count)
+            }
 
 
     def visible_run_ids(self, limit=50):
@@ -1187,7 +1179,9 @@ class RunList(qtw.QTreeWidget):
             return run_ids
 
         viewport_rect = viewport.rect()
-        for index in range(self.topLevelItemCount()):
+        first = self.indexAt(QtCore.QPoint(0, viewport_rect.top()))
+        start = first.row() if first.isValid() else 0
+        for index in range(start, self.topLevelItemCount()):
             item = self.topLevelItem(index)
             if item is None:
                 continue
@@ -1198,9 +1192,7 @@ class RunList(qtw.QTreeWidget):
             if rect.bottom() < viewport_rect.top():
                 continue
             if rect.top() > viewport_rect.bottom():
-                if run_ids:
-                    break
-                continue
+                break
 
             run_id = self._item_run_id(item)
             if run_id is None:
@@ -1214,10 +1206,9 @@ class RunList(qtw.QTreeWidget):
     def selected_run_ids(self):
         run_ids = []
         for item in self.selectedItems():
-            if isinstance(item, SortableTreeWidgetItem):
-                run_id = self._item_run_id(item)
-                if run_id is not None:
-                    run_ids.append(run_id)
+            run_id = self._item_run_id(item)
+            if run_id is not None:
+                run_ids.append(run_id)
         return run_ids
 
 
@@ -1229,11 +1220,7 @@ class RunList(qtw.QTreeWidget):
 
 
     def _item_run_id(self, item):
-        try:
-            return int(item.text(0))
-        except (TypeError, ValueError):
-            text = item.text(0)
-            return text if text else None
+        return item.model.run_id(item.row)
 
 
     def checkWatching(self, statuses=None):
@@ -1264,7 +1251,6 @@ class RunList(qtw.QTreeWidget):
             if status.get("is_completed") is not None:
                 run.run_metadata["is_completed"] = bool(status["is_completed"])
 
-            shape_metadata_changed = False
             for field in (
                     "point_shape",
                     "setpoint_shape",
@@ -1276,97 +1262,38 @@ class RunList(qtw.QTreeWidget):
                     ):
                 if field not in status:
                     continue
-                if run.run_metadata.get(field) != status[field]:
-                    shape_metadata_changed = True
                 # None is meaningful here: it clears a stale early inference.
                 run.run_metadata[field] = status[field]
 
             if status.get("result_count") is not None:
                 run.run_metadata["result_count"] = status["result_count"]
 
-            if status.get("result_count") is not None or shape_metadata_changed:
-                points_col = self.cols.index("Setpoints")
-                run.setText(points_col, format_point_count(run.run_metadata))
-                run.setData(
-                    points_col,
-                    QtCore.Qt.ItemDataRole.UserRole,
-                    run.run_metadata.get("setpoint_count")
-                    or run.run_metadata.get("expected_results")
-                    or run.run_metadata.get("result_count"),
-                    )
-                complete_col = self.cols.index("Status")
-                run.setText(complete_col, format_complete_cell(run.run_metadata))
-                run.setData(
-                    complete_col,
-                    QtCore.Qt.ItemDataRole.UserRole,
-                    progress_percent_value(run.run_metadata)
-                    )
-                time_taken_col = self.cols.index("Duration")
-                run.setText(time_taken_col, format_time_taken_seconds(run.run_metadata))
-                run.setData(
-                    time_taken_col,
-                    QtCore.Qt.ItemDataRole.UserRole,
-                    time_taken_seconds(run.run_metadata)
-                    )
-
-            completion_metadata_changed = False
             if status.get("read_setpoint_count") is not None:
                 run.run_metadata["read_setpoint_count"] = status["read_setpoint_count"]
-                completion_metadata_changed = True
 
             if status.get("measurement_exception") is not None:
                 run.run_metadata["measurement_exception"] = status["measurement_exception"]
-                completion_metadata_changed = True
-
-            if completion_metadata_changed:
-                complete_col = self.cols.index("Status")
-                run.setText(complete_col, format_complete_cell(run.run_metadata))
-                run.setData(
-                    complete_col,
-                    QtCore.Qt.ItemDataRole.UserRole,
-                    complete_cell_sort_value(run.run_metadata)
-                    )
 
             if status.get("storage_bytes") is not None:
-                storage_col = self.cols.index("Size")
                 run.run_metadata["storage_bytes"] = status["storage_bytes"]
-                run.setText(storage_col, format_storage_size(status["storage_bytes"]))
-                run.setData(storage_col, QtCore.Qt.ItemDataRole.UserRole, status["storage_bytes"])
 
             completed_timestamp = status.get("completed_timestamp")
             if completed_timestamp is not None:
                 run.run_metadata["completed_timestamp"] = completed_timestamp
 
             if run_is_complete(run.run_metadata):
-                complete_col = self.cols.index("Status")
-                run.setText(complete_col, format_complete_cell(run.run_metadata))
-                run.setData(
-                    complete_col,
-                    QtCore.Qt.ItemDataRole.UserRole,
-                    complete_cell_sort_value(run.run_metadata)
-                    )
-                time_taken_col = self.cols.index("Duration")
-                run.setText(time_taken_col, format_time_taken_seconds(run.run_metadata))
-                run.setData(
-                    time_taken_col,
-                    QtCore.Qt.ItemDataRole.UserRole,
-                    time_taken_seconds(run.run_metadata)
-                    )
                 to_remove.append(run)
 
-            self._refresh_metadata_columns(run)
-            run.update_tooltip()
-            run_id: int | str
-            try:
-                run_id = int(run.text(0))
-            except ValueError:
-                run_id = run.text(0)
-            updated_runs[run_id] = dict(run.run_metadata)
+            self._refresh_run_item(run)
+            updated_runs[self._item_run_id(run)] = dict(run.run_metadata)
         
         # Remove runs outside for loops to prevent interfering with loop indexing
         for run in to_remove:
             self.watching.remove(run)
 
+        if updated_runs:
+            self._resort_updated_rows()
+            self._reapply_search()
         return updated_runs
             
     
@@ -1393,19 +1320,10 @@ class RunList(qtw.QTreeWidget):
         if item is None:
             main.show_status("Right-click a run to open its plot menu.", 3000)
             return
-        item = cast(qtw.QTreeWidgetItem, item)
-        while True:
-            parent = item.parent()
-            if parent is None:
-                break
-            item = parent
-        if not isinstance(item, SortableTreeWidgetItem):
-            return
 
-        if self.currentItem() is not item or item not in self.selectedItems():
+        if self.currentItem() != item or item not in self.selectedItems():
             self.clearSelection()
             self.setCurrentItem(item)
-            item.setSelected(True)
 
         if main.ds is None:
             main.show_status("Select a run before opening the context menu.", 5000)
@@ -1502,12 +1420,11 @@ class RunList(qtw.QTreeWidget):
         """
         if len(self.selectedItems()) == 1: # Check multiple items are not selected
             item = self.selectedItems()[0]
-            if isinstance(item, SortableTreeWidgetItem):
-                self.selected.emit(item.guid)
+            self.selected.emit(item.guid)
 
 
-    @QtCore.pyqtSlot(qtw.QTreeWidgetItem, int)
-    def _double_clicked(self, item, column):
+    @QtCore.pyqtSlot(QtCore.QModelIndex)
+    def _double_clicked(self, index):
         """
         Emits a signal to tell qplot.windows.main.MainWindow to open all params
         of selected row.
@@ -1540,9 +1457,6 @@ class RunList(qtw.QTreeWidget):
         if not selected:
             return
         selected_item = selected[0]
-        if not isinstance(selected_item, SortableTreeWidgetItem):
-            return
-
         main.add_trace_to_plot(
             target_win,
             selected_item.guid,
@@ -1984,7 +1898,7 @@ class moreInfo(qtw.QTabWidget):
         conn = None
         cursor = None
         try:
-            conn = sqlite_read_only_connection(database_path, timeout=2)
+            conn = pooled_sqlite_read_only_connection(database_path, timeout=2)
             cursor = conn.cursor()
             columns = self._result_table_columns(cursor, table_name)
             summaries = {}
@@ -141,6 +141,7 @@ class MainWindow(
         self.threadPool.setMaxThreadCount(self.config.get("runtime_settings.max_threads"))
         self._plot_workers: set[object] = set()
         self.threadPool._qplot_workers = self._plot_workers  # type: ignore[attr-defined]
+        self._run_export_workers: set[object] = set()
         self.databaseLoadThreadPool = QtCore.QThreadPool(self)
         self.databaseLoadThreadPool.setMaxThreadCount(1)
         self.databaseDetailThreadPool = QtCore.QThreadPool(self)
@@ -265,6 +266,16 @@ class MainWindow(
 
         fileMenu.addSeparator()
 
+        self.exportRunNpzAction = create_action("run.export_npz", self)
+        self.exportRunNpzAction.triggered.connect(self.exportRunNpz)
+        fileMenu.addAction(self.exportRunNpzAction)
+        self.cancelRunExportAction = create_action("run.cancel_export", self)
+        self.cancelRunExportAction.triggered.connect(self.cancel_run_exports)
+        self.cancelRunExportAction.setEnabled(False)
+        fileMenu.addAction(self.cancelRunExportAction)
+
+        fileMenu.addSeparator()
+
         test_data_menu = cast(qtw.QMenu, fileMenu.addMenu("Generate &Test Data"))
         create_csv_action = create_action("testdata.create_csv", self)
         create_csv_action.triggered.connect(self.create_test_database_csv)
@@ -6,6 +6,12 @@ from PyQt6 import (
     QtCore,
 )
 
+from ._plot1d_envelope import (
+    clear_line_envelope,
+    line_full_data,
+    refresh_line_envelope,
+    set_line_data,
+)
 from ._plot1d_snap import Plot1DSnapMixin
 from ._plot1d_traces import Plot1DTraceMixin
 from ._plotWin import plotWidget
@@ -53,6 +59,8 @@ class plot1d(Plot1DSnapMixin, Plot1DTraceMixin, plotWidget):
         
         self.line = self.plot.plot(connect="all")
         self._register_main_line()
+        self.vb.sigXRangeChanged.connect(self._refresh_line_envelopes)
+        self.vb.sigResized.connect(self._refresh_line_envelopes)
         
         # Wait for loader to finish to enure needed data is collected.
         self.load_data()
@@ -88,8 +96,8 @@ class plot1d(Plot1DSnapMixin, Plot1DTraceMixin, plotWidget):
         """
         x_data = None
         line = self.__dict__.get("line")
-        if line is not None and hasattr(line, "getData"):
-            data = line.getData()
+        if line is not None:
+            data = line_full_data(line)
             if data is not None:
                 x_data = data[0]
 
@@ -128,7 +136,7 @@ class plot1d(Plot1DSnapMixin, Plot1DTraceMixin, plotWidget):
 
         line = self.__dict__.get("line")
         if line is not None and hasattr(line, "getData"):
-            data = line.getData()
+            data = line_full_data(line)
             if data is not None:
                 x_data, y_data = data
             else:
@@ -182,6 +190,7 @@ class plot1d(Plot1DSnapMixin, Plot1DTraceMixin, plotWidget):
 
         try:
             if not self._has_plottable_line_data():
+                clear_line_envelope(self.line)
                 self.line.setData([], [])
                 self.show_status(
                     f"Waiting for plottable data for {self.param.name}...",
@@ -196,10 +205,12 @@ class plot1d(Plot1DSnapMixin, Plot1DTraceMixin, plotWidget):
                 self._mark_display_synchronized(plot_worker)
                 return
 
-            # Main line
-            self.line.setData(
-                x=self.axis_data["x"],
-                y=self.axis_data["y"],
+            # Main line; long traces only draw the envelope of the view.
+            set_line_data(
+                self.line,
+                self.axis_data["x"],
+                self.axis_data["y"],
+                self.__dict__.get("line_envelope"),
                 )
             if self.marquee is not None:
                 self.set_marquee_rect(self.marquee)
@@ -212,6 +223,20 @@ class plot1d(Plot1DSnapMixin, Plot1DTraceMixin, plotWidget):
             self._ensure_refresh_monitor()
 
 
+    def _refresh_line_envelopes(self, *_args: Any) -> None:
+        """
+        Re-query the envelope of every long trace after a pan, zoom or resize.
+
+        """
+        lines = list(self.__dict__.get("lines", {}).values())
+        line = self.__dict__.get("line")
+        if line is not None and line not in lines:
+            lines.append(line)
+        for item in lines:
+            if item is not None:
+                refresh_line_envelope(item)
+
+
     def _has_plottable_line_data(self) -> bool:
         x_data = np.asarray(self.axis_data.get("x", []), dtype=float)
         y_data = np.asarray(self.axis_data.get("y", []), dtype=float)
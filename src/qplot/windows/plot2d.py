@@ -6,20 +6,23 @@ import pyqtgraph as pg
 from PyQt6 import QtCore, QtGui
 from PyQt6 import QtWidgets as qtw
 
+from qplot.tools.grid_stats import BlockStats, GridStats
 from qplot.tools.heatmap_geometry import (
     AxisGeometry,
     HeatmapGeometry,
     canonicalize_heatmap_data,
 )
+from qplot.tools.heatmap_grid import IncrementalHeatmapGrid
 
-from . import _colorbar
 from ._commands import command_spec, create_action
 from ._plot2d_colorbar import Plot2DColorbarMixin
 from ._plot2d_sweeps import Plot2DSweepMixin
 from ._plotWin import plotWidget
 
-_COLORBAR_COLORMAPS = _colorbar._COLORBAR_COLORMAPS
 _HEATMAP_VIEW_RELOAD_DEBOUNCE_MS = 450
+# Reloads served from a heatmap pyramid are lookups, so they follow the view
+# more closely than reloads that aggregate the result table.
+_HEATMAP_PYRAMID_RELOAD_DEBOUNCE_MS = 120
 _HEATMAP_VIEW_RELOAD_MIN_FRACTION = 0.95
 
 
@@ -49,6 +52,8 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
         self.active_sweep_line_id = None
         self.__dict__["rotate"] = None # FOR SUBPLOT CURSOR
         self.__dict__["_colorbar_manual_levels"] = None
+        self.__dict__["heatmap_grid"] = IncrementalHeatmapGrid()
+        self.__dict__["heatmap_pyramid"] = None
 
         
     def initFrame(self) -> None:
@@ -266,6 +271,7 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
     def _update_large_heatmap_state(self, worker: Any) -> None:
         self._update_heatmap_downsample_state(worker)
         if not getattr(worker, "loaded_from_sql_heatmap", False):
+            self.__dict__["heatmap_pyramid"] = None
             self._large_heatmap_sql_mode = False
             self._heatmap_full_axis_ranges = None
             self._heatmap_full_view_ranges = None
@@ -276,6 +282,9 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
             return
 
         self._large_heatmap_sql_mode = True
+        pyramid = getattr(worker, "heatmap_pyramid", None)
+        if pyramid is not None:
+            self.__dict__["heatmap_pyramid"] = pyramid
         worker_ranges = getattr(worker, "heatmap_axis_ranges", None)
         if worker_ranges is None or self._heatmap_full_axis_ranges is None:
             source_ranges = self._normalise_axis_ranges(
@@ -769,6 +778,20 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
                 "source rows contributed to "
                 f"{self._format_heatmap_count(loaded_count)} spatial mean cells."
                 )
+            pyramid_level = info.get("pyramid_level")
+            if pyramid_level is not None:
+                x_level, y_level = pyramid_level
+                lines.append(
+                    "Cells were read from the precomputed heatmap pyramid, "
+                    f"merging {self._format_heatmap_count(2 ** x_level)} x "
+                    f"{self._format_heatmap_count(2 ** y_level)} base cells each."
+                    )
+            value_range = info.get("source_value_range")
+            if value_range is not None:
+                lines.append(
+                    "Source values in view range from "
+                    f"{value_range[0]:.6g} to {value_range[1]:.6g}."
+                    )
         elif loaded_count is not None and source_count is not None:
             lines.append(
                 "Loaded "
@@ -907,8 +930,8 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
             return None
 
         return {
-            "x": (float(geometry.x.edges[0]), float(geometry.x.edges[-1])),
-            "y": (float(geometry.y.edges[0]), float(geometry.y.edges[-1])),
+            "x": geometry.x.bounds,
+            "y": geometry.y.bounds,
             }
 
 
@@ -956,7 +979,13 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
         if not self._has_plottable_heatmap_data():
             return
 
-        self._heatmap_view_reload_timer.start(_HEATMAP_VIEW_RELOAD_DEBOUNCE_MS)
+        self._heatmap_view_reload_timer.start(self._heatmap_view_reload_delay())
+
+
+    def _heatmap_view_reload_delay(self) -> int:
+        if self.__dict__.get("heatmap_pyramid") is not None:
+            return _HEATMAP_PYRAMID_RELOAD_DEBOUNCE_MS
+        return _HEATMAP_VIEW_RELOAD_DEBOUNCE_MS
 
 
     def _reload_visible_heatmap_data(self) -> None:
@@ -1095,7 +1124,7 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
     def _update_heatmap_geometry(self) -> HeatmapGeometry:
         """Build and install geometry from the current setpoint centres."""
 
-        self.__dict__.pop("heatmap_geometry", None)
+        previous = self.__dict__.pop("heatmap_geometry", None)
         self.__dict__.pop("rect", None)
         self._reset_heatmap_hover()
         x_centres, y_centres, data_grid = canonicalize_heatmap_data(
@@ -1103,7 +1132,12 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
             self.axis_data["y"],
             self.dataGrid,
             )
-        geometry = HeatmapGeometry.from_centres(x_centres, y_centres)
+        # Live sweeps usually only append cells, which keeps the recorded edges.
+        geometry = (
+            previous.grown(x_centres, y_centres)
+            if isinstance(previous, HeatmapGeometry)
+            else HeatmapGeometry.from_centres(x_centres, y_centres)
+            )
 
         axis_data = dict(self.axis_data)
         axis_data["x"] = x_centres
@@ -1144,11 +1178,13 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
             self.image.show()
             return
 
-        mesh_data = np.asarray(data_grid, dtype=float).copy()
-        mesh_data[~np.isfinite(mesh_data)] = np.nan
+        mesh_data = np.asarray(data_grid, dtype=float)
+        infinite = np.isinf(mesh_data)
+        if infinite.any():
+            mesh_data = np.where(infinite, np.nan, mesh_data)
         x_vertices, y_vertices = np.meshgrid(
-            geometry.x.edges,
-            geometry.y.edges,
+            geometry.x.edge_array,
+            geometry.y.edge_array,
             indexing="xy",
             )
         self.heatmap_mesh.setData(
@@ -1394,7 +1430,7 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
             start = max(0, stop - cell_count)
             stop = min(axis.count, start + cell_count)
 
-        return axis.edges[start], axis.edges[stop]
+        return float(axis.edge_array[start]), float(axis.edge_array[stop])
 
 
     def _add_marquee_color_context_action(self, menu: qtw.QMenu) -> QtGui.QAction:
@@ -1418,37 +1454,51 @@ class plot2d(Plot2DSweepMixin, Plot2DColorbarMixin, plotWidget):
 
 
     def _marquee_stats_text(self) -> str | None:
-        selected = self._marquee_selected_data()
-        if selected is None:
+        stats = self._marquee_block_stats()
+        if stats is None or self.marquee is None:
             return None
 
-        values = selected[np.isfinite(selected)]
-        if values.size == 0:
+        rows, cols = stats.shape
+        rect = self._snap_marquee_rect(self.marquee.normalized())
+        return self._format_marquee_stats_text(f"{cols}×{rows} points", stats, rect)
+
+
+    def _marquee_color_levels(self) -> tuple[float, float] | None:
+        stats = self._marquee_block_stats()
+        if stats is None:
             return None
 
-        if self.marquee is None:
+        vmin = stats.min()
+        vmax = stats.max()
+        if not np.isfinite(vmin) or not np.isfinite(vmax) or vmin >= vmax:
             return None
 
-        rows, cols = selected.shape
-        rect = self._snap_marquee_rect(self.marquee.normalized())
-        return self._format_marquee_stats_text(f"{cols}×{rows} points", values, rect)
+        return vmin, vmax
 
 
-    def _marquee_color_levels(self) -> tuple[float, float] | None:
-        selected = self._marquee_selected_data()
-        if selected is None:
+    def _marquee_block_stats(self) -> BlockStats | None:
+        if (
+                self.__dict__.get("marquee") is None
+                or self._heatmap_geometry() is None
+                or "dataGrid" not in self.__dict__
+                ):
             return None
 
-        values = selected[np.isfinite(selected)]
-        if values.size == 0:
+        slices = self._marquee_cell_slices()
+        if slices is None:
             return None
 
-        vmin = float(values.min())
-        vmax = float(values.max())
-        if not np.isfinite(vmin) or not np.isfinite(vmax) or vmin >= vmax:
-            return None
+        return self._heatmap_grid_stats().block(*slices)
 
-        return vmin, vmax
+
+    def _heatmap_grid_stats(self) -> GridStats:
+        """Return statistics tables of the current grid, built on first use."""
+
+        stats = self.__dict__.get("grid_stats")
+        if not isinstance(stats, GridStats) or not stats.matches(self.dataGrid):
+            stats = GridStats(self.dataGrid)
+            self.__dict__["grid_stats"] = stats
+        return stats
 
 
     def _marquee_selected_data(self) -> npt.NDArray[np.float64] | None:
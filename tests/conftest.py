@@ -19,3 +19,44 @@ def ensure_qapplication():
 @pytest.fixture(scope="session", autouse=True)
 def qapplication():
     return ensure_qapplication()
+
+
+@pytest.fixture(autouse=True)
+def preview_disk_cache_directory(tmp_path, monkeypatch):
+    """Give each test its own preview cache instead of the user's ~/.qplot."""
+    from qplot.windows._widgets import preview_cache
+
+    directory = tmp_path / "preview_cache"
+    monkeypatch.setattr(
+        preview_cache,
+        "default_preview_cache_directory",
+        lambda: directory,
+        )
+    monkeypatch.setattr(preview_cache, "_shared_cache", None)
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def heatmap_pyramid_cache_directory(tmp_path, monkeypatch):
+    """Give each test its own heatmap pyramid cache instead of ~/.qplot."""
+    from qplot.tools import heatmap_pyramid
+
+    directory = tmp_path / "heatmap_pyramids"
+    monkeypatch.setattr(
+        heatmap_pyramid,
+        "default_heatmap_pyramid_directory",
+        lambda: directory,
+        )
+    monkeypatch.setattr(heatmap_pyramid, "_shared_cache", None)
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def run_catalog_directory(tmp_path, monkeypatch):
+    """Give each test its own run catalog instead of the user's ~/.qplot."""
+    from qplot.datahandling import run_catalog
+
+    directory = tmp_path / "run_catalog"
+    monkeypatch.setattr(run_catalog, "default_run_catalog_directory", lambda: directory)
+    monkeypatch.setattr(run_catalog, "_catalogs", {})
+    return directory
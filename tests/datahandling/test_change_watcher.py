@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from qplot.datahandling import change_watcher, readSQL
+
+
+class _Subscriber:
+    def __init__(self, table_name, can_refresh=True, interval=None):
+        self._result_table_name = table_name
+        self._can_refresh = can_refresh
+        self.interval = interval
+
+    def _can_process_refresh(self):
+        return self._can_refresh
+
+    def _change_watch_interval(self):
+        return self.interval
+
+
+class _ImmediateThreadPool:
+    def __init__(self):
+        self.started = []
+
+    def start(self, worker):
+        self.started.append(worker)
+        worker.run()
+
+
+class DatabaseChangeWatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.database_path = os.path.join(self._temp_dir.name, "watched.db")
+        conn = sqlite3.connect(self.database_path)
+        try:
+            conn.execute("CREATE TABLE results_1 (x REAL)")
+            conn.execute("CREATE TABLE results_2 (x REAL)")
+            conn.executemany(
+                "INSERT INTO results_1 VALUES (?)",
+                ((index, ) for index in range(3)),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        patcher = patch.object(
+            readSQL,
+            "pooled_qcodes_read_only_connection",
+            side_effect=lambda path: sqlite3.connect(
+                f"file:{path}?mode=ro",
+                uri=True,
+                ),
+            )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _append_rows(self, table_name, count):
+        conn = sqlite3.connect(self.database_path)
+        try:
+            conn.executemany(
+                f"INSERT INTO {table_name} VALUES (?)",
+                ((index, ) for index in range(count)),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def test_result_counts_are_read_through_one_connection(self):
+        counts = readSQL.get_result_counts(
+            ["results_1", "results_2", "results_1", "missing"],
+            database_path=self.database_path,
+            )
+
+        self.assertEqual(counts, {"results_1": 3, "results_2": 0})
+        self.assertEqual(
+            readSQL.pooled_qcodes_read_only_connection.call_count,
+            1,
+            )
+
+    def test_result_counts_can_use_the_connection_data_was_read_from(self):
+        conn = sqlite3.connect(self.database_path)
+        try:
+            counts = readSQL.get_result_counts(
+                ["results_1"],
+                database_path=self.database_path,
+                connection=conn,
+                )
+            self.assertEqual(conn.execute("SELECT 1").fetchone(), (1, ))
+        finally:
+            conn.close()
+
+        self.assertEqual(counts, {"results_1": 3})
+        readSQL.pooled_qcodes_read_only_connection.assert_not_called()
+
+    def test_one_check_fans_out_counts_to_every_watching_plot(self):
+        watcher = change_watcher.DatabaseChangeWatcher(self.database_path)
+        pool = _ImmediateThreadPool()
+        subscribers = [
+            _Subscriber("results_1"),
+            _Subscriber("results_1"),
+            _Subscriber("results_2"),
+            ]
+        for subscriber in subscribers:
+            watcher.watch(subscriber, pool)
+        changed = Mock()
+        finished = Mock()
+        watcher.resultCountChanged.connect(changed)
+        watcher.checkFinished.connect(finished)
+
+        self.assertTrue(watcher.poll())
+
+        self.assertEqual(len(pool.started), 1)
+        self.assertEqual(
+            pool.started[0].table_names,
+            frozenset({"results_1", "results_2"}),
+            )
+        self.assertEqual(watcher.result_count("results_1"), 3)
+        self.assertEqual(watcher.result_count("results_2"), 0)
+        self.assertEqual(changed.call_count, 2)
+        finished.assert_called_once_with()
+
+    def test_unchanged_files_skip_sqlite_and_recent_checks_are_coalesced(self):
+        watcher = change_watcher.DatabaseChangeWatcher(self.database_path)
+        pool = _ImmediateThreadPool()
+        subscriber = _Subscriber("results_1")
+        watcher.watch(subscriber, pool)
+
+        watcher.poll()
+        self.assertFalse(watcher.poll())
+        self.assertEqual(len(pool.started), 1)
+
+        self._append_rows("results_1", 2)
+        self.assertFalse(watcher.poll(max_age=3600))
+        self.assertEqual(len(pool.started), 1)
+
+        self.assertTrue(watcher.poll())
+        self.assertEqual(len(pool.started), 2)
+        self.assertEqual(watcher.result_count("results_1"), 5)
+
+    def test_plots_that_cannot_refresh_are_not_counted(self):
+        watcher = change_watcher.DatabaseChangeWatcher(self.database_path)
+        pool = _ImmediateThreadPool()
+        watcher.watch(_Subscriber("results_1", can_refresh=False), pool)
+
+        self.assertFalse(watcher.poll())
+        self.assertEqual(pool.started, [])
+
+    def test_one_timer_polls_at_the_shortest_live_plot_interval(self):
+        watcher = change_watcher.DatabaseChangeWatcher(self.database_path)
+        pool = _ImmediateThreadPool()
+        fast = _Subscriber("results_1", interval=0.5)
+        slow = _Subscriber("results_2", interval=2.0)
+        watcher.watch(slow, pool)
+        watcher.watch(fast, pool)
+
+        self.assertTrue(watcher._timer.isActive())
+        self.assertEqual(watcher._timer.interval(), 500)
+
+        watcher._tick()
+        self.assertEqual(len(pool.started), 1)
+        self.assertEqual(watcher.result_count("results_1"), 3)
+
+        fast.interval = None
+        watcher.schedule()
+        self.assertEqual(watcher._timer.interval(), 2000)
+
+        slow.interval = None
+        watcher.schedule()
+        self.assertFalse(watcher._timer.isActive())
+        watcher.cancel()
+
+    def test_watchers_are_shared_per_database_and_released_on_close(self):
+        first = change_watcher.database_change_watcher(self.database_path)
+        second = change_watcher.database_change_watcher(self.database_path)
+        self.assertIs(first, second)
+
+        change_watcher.release_database_change_watcher(self.database_path)
+
+        self.assertIsNot(
+            change_watcher.database_change_watcher(self.database_path),
+            first,
+            )
+        change_watcher.release_database_change_watcher(self.database_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+from qcodes.dataset.data_set_cache import _merge_data
+
+from qplot.datahandling import LoadFromDB as load_from_db
+from qplot.datahandling.column_buffer import (
+    MIN_COLUMN_CAPACITY,
+    ColumnStore,
+    GrowableColumn,
+)
+
+
+def test_growable_column_doubles_capacity_and_keeps_earlier_views():
+    column = GrowableColumn(np.arange(3.0))
+    first = column.view()
+
+    column.extend(np.array([3.0]))
+    assert column.capacity == MIN_COLUMN_CAPACITY
+
+    buffer_capacity = column.capacity
+    column.extend(np.arange(4.0, buffer_capacity))
+    assert column.capacity == buffer_capacity
+    view = column.extend(np.array([-1.0]))
+
+    assert column.capacity == 2 * buffer_capacity
+    np.testing.assert_array_equal(first, [0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(view[:buffer_capacity], np.arange(buffer_capacity))
+    assert view[-1] == -1.0
+
+
+def test_appends_reuse_one_buffer_while_the_view_is_current():
+    store = ColumnStore()
+    first = store.adopt("signal", "x", np.arange(4.0))
+    second = store.append("signal", "x", first, np.arange(4.0, 6.0))
+    third = store.append("signal", "x", second, np.arange(6.0, 9.0))
+
+    assert np.shares_memory(second, third)
+    np.testing.assert_array_equal(third, np.arange(9.0))
+    assert third.flags.writeable
+
+
+def test_append_to_a_stale_view_starts_a_new_buffer():
+    store = ColumnStore()
+    base = store.adopt("signal", "x", np.arange(4.0))
+    won = store.append("signal", "x", base, np.arange(4.0, 6.0))
+
+    # A refresh that lost its commit race appends to the older view again.
+    lost = store.append("signal", "x", base, np.array([40.0]))
+
+    np.testing.assert_array_equal(won, [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    np.testing.assert_array_equal(lost, [0.0, 1.0, 2.0, 3.0, 40.0])
+    assert not np.shares_memory(won, lost)
+
+
+def test_mismatched_dtypes_are_left_to_qcodes():
+    store = ColumnStore()
+    base = store.adopt("signal", "x", np.arange(4.0))
+
+    assert store.append("signal", "x", base, np.arange(2)) is None
+
+
+def _as_dict(values):
+    return {name: None if array is None else np.asarray(array) for name, array in values.items()}
+
+
+@pytest.mark.parametrize(
+    ("existing", "new", "write_status"),
+    [
+        ({"signal": [], "x": []}, {"signal": [1.0, 2.0], "x": [0.0, 1.0]}, 0),
+        ({"signal": [1.0], "x": [0.0]}, {"signal": [2.0, 3.0], "x": [1.0, 2.0]}, 1),
+        ({"signal": [1.0], "x": [0.0]}, {"signal": [], "x": []}, 1),
+        ({"signal": [1.0], "x": [0.0]}, {"signal": [2.0]}, 1),
+        ({"signal": [1.0], "x": [0.0], "y": []}, {"signal": [2.0], "x": [3.0], "y": [4.0]}, 0),
+    ],
+    ids=["empty-existing", "append", "empty-new", "missing-column", "mixed"],
+)
+def test_unshaped_append_matches_qcodes_merge(existing, new, write_status):
+    existing = _as_dict(existing)
+    new = _as_dict(new)
+    expected_data, expected_status = _merge_data(
+        {name: values.copy() for name, values in existing.items()},
+        new,
+        None,
+        single_tree_write_status=write_status,
+        meas_parameter="signal",
+        )
+
+    merged, status = load_from_db._append_unshaped_tree(
+        ColumnStore(),
+        "signal",
+        write_status,
+        existing,
+        new,
+        )
+
+    assert status == expected_status
+    assert merged.keys() == expected_data.keys()
+    for name, values in expected_data.items():
+        np.testing.assert_array_equal(merged[name], values)
+
+
+def test_unshaped_refresh_appends_through_the_column_store():
+    class RunDescriber:
+        shapes = None
+
+    store = ColumnStore()
+    existing = {"signal": {"signal": store.adopt("signal", "signal", np.arange(3.0))}}
+
+    def refresh(existing, values):
+        return load_from_db.append_shaped_parameter_data_to_existing_arrays(
+            RunDescriber(),
+            "signal",
+            {"signal": 0},
+            existing,
+            {"signal": {"signal": values}},
+            column_store=store,
+            )
+
+    # The adopted read fills its buffer, so the first append grows it.
+    _write_status, first = refresh(existing, np.array([3.0]))
+    write_status, second = refresh(first, np.array([4.0, 5.0]))
+
+    np.testing.assert_array_equal(first["signal"]["signal"], np.arange(4.0))
+    np.testing.assert_array_equal(second["signal"]["signal"], np.arange(6.0))
+    assert np.shares_memory(first["signal"]["signal"], second["signal"]["signal"])
+    assert write_status["signal"] == 0
@@ -0,0 +1,229 @@
+import os
+import sqlite3
+
+import numpy as np
+import pytest
+import qcodes
+from qcodes.dataset import (
+    Measurement,
+    initialise_or_create_database_at,
+    load_or_create_experiment,
+)
+from qcodes.parameters import ManualParameter
+
+from qplot.datahandling import column_export
+from qplot.datahandling.column_export import (
+    ColumnExportCancelled,
+    ExportedParameter,
+    export_result_columns,
+    export_result_csv,
+)
+
+
+@pytest.fixture
+def interleaved_run(tmp_path):
+    """A completed run whose two measurements are stored on separate rows."""
+    original_database_path = qcodes.config.core.db_location
+    try:
+        database_path = str(tmp_path / "export.db")
+        initialise_or_create_database_at(database_path)
+        experiment = load_or_create_experiment("export", sample_name="sample")
+        x = ManualParameter("x")
+        y = ManualParameter("y")
+        current = ManualParameter("current")
+        voltage = ManualParameter("voltage")
+        measurement = Measurement(exp=experiment, name="export")
+        measurement.register_parameter(x)
+        measurement.register_parameter(y)
+        measurement.register_parameter(current, setpoints=(x, y))
+        measurement.register_parameter(voltage, setpoints=(x,))
+        with measurement.run(write_in_background=False) as datasaver:
+            for index in range(250):
+                datasaver.add_result((x, index), (y, index % 7), (current, index * 0.5))
+                if index % 3 == 0:
+                    datasaver.add_result((x, index), (voltage, -index))
+        dataset = datasaver.dataset
+        yield database_path, dataset
+        dataset.conn.close()
+        experiment.conn.close()
+    finally:
+        qcodes.config.core.db_location = original_database_path
+
+
+def _parameters(dataset):
+    return [
+        ExportedParameter(param.name, tuple(param.depends_on_))
+        for param in dataset.get_parameters()
+        if param.depends_on
+        ]
+
+
+def test_streamed_archive_matches_the_parameter_data(interleaved_run, tmp_path):
+    database_path, dataset = interleaved_run
+    destination = str(tmp_path / "run.npz")
+    progress = []
+
+    lengths = export_result_columns(
+        database_path,
+        dataset.table_name,
+        _parameters(dataset),
+        destination,
+        chunk_rows=16,
+        progress_callback=progress.append,
+        )
+
+    expected = dataset.get_parameter_data()
+    with np.load(destination) as archive:
+        assert sorted(archive.files) == sorted(lengths)
+        for name, columns in expected.items():
+            for column, values in columns.items():
+                exported = archive[f"{name}.{column}"]
+                assert exported.dtype == np.float64
+                np.testing.assert_array_equal(exported, values.ravel())
+    assert lengths["current.current"] == 250
+    assert lengths["voltage.voltage"] == 84
+    assert progress == sorted(progress)
+    assert progress[-1] == 1.0
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(".qplot-export-")]
+
+
+def test_rows_are_read_in_bounded_rowid_chunks(interleaved_run, tmp_path, monkeypatch):
+    database_path, dataset = interleaved_run
+    statements = []
+    traced = []
+    pooled = column_export.pooled_sqlite_read_only_connection
+
+    def tracing_connection(*args, **kwargs):
+        conn = pooled(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        traced.append(conn)
+        return conn
+
+    monkeypatch.setattr(
+        column_export,
+        "pooled_sqlite_read_only_connection",
+        tracing_connection,
+        )
+    parameter = next(p for p in _parameters(dataset) if p.name == "current")
+
+    try:
+        lengths = export_result_columns(
+            database_path,
+            dataset.table_name,
+            [parameter],
+            str(tmp_path / "current.npz"),
+            chunk_rows=100,
+            )
+    finally:
+        # The connection goes back to the shared pool.
+        for conn in traced:
+            conn.set_trace_callback(None)
+
+    chunk_reads = [sql for sql in statements if "ORDER BY rowid LIMIT 100" in sql]
+    assert len(chunk_reads) == 3
+    assert lengths == {"x": 250, "y": 250, "current": 250}
+
+
+def test_cancelled_export_stops_between_chunks_and_removes_spill_files(
+        interleaved_run,
+        tmp_path,
+        ):
+    database_path, dataset = interleaved_run
+    export_directory = tmp_path / "out"
+    export_directory.mkdir()
+    progress = []
+
+    with pytest.raises(ColumnExportCancelled):
+        export_result_columns(
+            database_path,
+            dataset.table_name,
+            _parameters(dataset),
+            str(export_directory / "run.npz"),
+            chunk_rows=16,
+            cancelled_callback=lambda: len(progress) >= 2,
+            progress_callback=progress.append,
+            )
+
+    assert len(progress) == 2
+    assert [path.name for path in export_directory.iterdir()] == []
+
+
+def test_streamed_csv_places_parameters_side_by_side(interleaved_run, tmp_path):
+    database_path, dataset = interleaved_run
+    destination = tmp_path / "run.csv"
+    progress = []
+
+    row_count = export_result_csv(
+        database_path,
+        dataset.table_name,
+        _parameters(dataset),
+        str(destination),
+        chunk_rows=16,
+        progress_callback=progress.append,
+        )
+
+    lines = destination.read_text(encoding="utf-8").splitlines()
+    assert row_count == 250
+    assert lines[0] == "current.current,current.x,current.y,voltage.voltage,voltage.x"
+    assert lines[1:3] == ["0.0,0.0,0.0,0.0,0.0", "0.5,1.0,1.0,-3.0,3.0"]
+    assert lines[85] == "42.0,84.0,0.0,,"
+    assert len(lines) == 251
+    assert progress == sorted(progress)
+    assert progress[-1] == 1.0
+
+
+def test_streamed_csv_writes_text_and_leaves_nan_empty(tmp_path):
+    database_path = str(tmp_path / "text.db")
+    conn = sqlite3.connect(database_path)
+    try:
+        conn.execute(
+            'CREATE TABLE "results-1" '
+            "(id INTEGER PRIMARY KEY, x NUMERIC, signal NUMERIC, label TEXT)"
+            )
+        conn.executemany(
+            'INSERT INTO "results-1" (x, signal, label) VALUES (?, ?, ?)',
+            [(1, "nan", 'on, "high"'), (2, 1 / 3, "off"), (3, None, None)],
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+    export_result_csv(
+        database_path,
+        "results-1",
+        [ExportedParameter("signal", ("x",)), ExportedParameter("label", ("x",))],
+        str(tmp_path / "text.csv"),
+        text_columns={"label"},
+        )
+
+    assert (tmp_path / "text.csv").read_text(encoding="utf-8").splitlines() == [
+        "signal.signal,signal.x,label.label,label.x",
+        ',1.0,"on, ""high""",1.0',
+        "0.3333333333333333,2.0,off,2.0",
+        ]
+
+
+def test_non_numeric_values_are_rejected(tmp_path):
+    database_path = str(tmp_path / "text.db")
+    conn = sqlite3.connect(database_path)
+    try:
+        conn.execute('CREATE TABLE "results-1" (id INTEGER PRIMARY KEY, x REAL, label TEXT)')
+        conn.execute("""INSERT INTO "results-1" (x, label) VALUES (1, 'on')""")
+        conn.commit()
+    finally:
+        conn.close()
+
+    with pytest.raises(ValueError, match="not numeric"):
+        export_result_columns(
+            database_path,
+            "results-1",
+            [ExportedParameter("label", ("x",))],
+            str(tmp_path / "text.npz"),
+            )
+    with pytest.raises(ValueError, match="has no column missing"):
+        export_result_columns(
+            database_path,
+            "results-1",
+            [ExportedParameter("missing", ("x",))],
+            str(tmp_path / "text.npz"),
+            )
@@ -102,7 +102,7 @@ class RunSizeTestCase(unittest.TestCase):
             with (
                 patch.object(
                     readSQL,
-                    "qcodes_read_only_connection",
+                    "pooled_qcodes_read_only_connection",
                     side_effect=self._read_only_sqlite_connection,
                     ),
                 patch.object(
@@ -139,7 +139,7 @@ class RunSizeTestCase(unittest.TestCase):
 
             with patch.object(
                     readSQL,
-                    "qcodes_read_only_connection",
+                    "pooled_qcodes_read_only_connection",
                     side_effect=self._read_only_sqlite_connection,
                     ):
                 status = readSQL.get_run_status(
@@ -152,6 +152,77 @@ class RunSizeTestCase(unittest.TestCase):
         self.assertEqual(status["setpoint_count"], 4)
         self.assertEqual(status["read_setpoint_count"], 4)
 
+    def test_run_statuses_share_one_pass_and_count_only_appended_rows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "watched.db")
+            self._create_completed_status_database(
+                database_path,
+                row_count=4,
+                is_completed=False,
+                )
+            conn = sqlite3.connect(database_path)
+            try:
+                conn.execute(
+                    "INSERT INTO runs "
+                    "SELECT 'second-guid', run_timestamp, completed_timestamp, "
+                    "is_completed, result_table_name, run_description, parameters "
+                    "FROM runs"
+                    )
+                conn.commit()
+            finally:
+                conn.close()
+            statements = []
+
+            def trace_connection(connection):
+                if connection is not None:
+                    connection.set_trace_callback(statements.append)
+
+            def read_statuses():
+                statements.clear()
+                return readSQL.get_run_statuses(
+                    ["completed-guid", "second-guid", "missing-guid"],
+                    database_path=database_path,
+                    include_storage_bytes=False,
+                    connection_callback=trace_connection,
+                    )
+
+            with patch.object(
+                    readSQL,
+                    "pooled_qcodes_read_only_connection",
+                    side_effect=self._read_only_sqlite_connection,
+                    ) as open_connection:
+                first = read_statuses()
+                self.assertEqual(open_connection.call_count, 1)
+                self.assertEqual(
+                    sum("WHERE GUID IN" in sql.upper() for sql in statements),
+                    1,
+                    )
+
+                conn = sqlite3.connect(database_path)
+                try:
+                    conn.executemany(
+                        "INSERT INTO results_1 VALUES (?, ?)",
+                        ((index, index + 1) for index in range(4, 6)),
+                        )
+                    conn.commit()
+                finally:
+                    conn.close()
+                appended = read_statuses()
+                appended_statements = list(statements)
+                unchanged = read_statuses()
+
+        self.assertEqual(set(first), {"completed-guid", "second-guid"})
+        self.assertEqual(first["second-guid"]["result_count"], 4)
+        self.assertEqual(appended["completed-guid"]["result_count"], 6)
+        self.assertEqual(appended["second-guid"]["read_setpoint_count"], 6)
+        self.assertTrue(any("ROWID >" in sql.upper() for sql in appended_statements))
+        self.assertFalse(any(
+            sql.upper().strip() == 'SELECT COUNT(*) FROM "RESULTS_1"'
+            for sql in appended_statements
+            ))
+        self.assertEqual(unchanged, appended)
+        self.assertFalse(any("COUNT(DISTINCT" in sql.upper() for sql in statements))
+
     def test_status_includes_storage_calculation_when_requested(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             database_path = os.path.join(temp_dir, "completed.db")
@@ -160,7 +231,7 @@ class RunSizeTestCase(unittest.TestCase):
             with (
                 patch.object(
                     readSQL,
-                    "qcodes_read_only_connection",
+                    "pooled_qcodes_read_only_connection",
                     side_effect=self._read_only_sqlite_connection,
                     ),
                 patch.object(
@@ -181,41 +252,202 @@ class RunSizeTestCase(unittest.TestCase):
         self.assertEqual(status["storage_bytes"], 4096)
         self.assertFalse(status["storage_bytes_estimated"])
 
+    def _create_storage_database(self, database_path, live_rows=0):
+        conn = sqlite3.connect(database_path)
+        try:
+            conn.execute(
+                "CREATE TABLE runs (run_id INTEGER PRIMARY KEY, "
+                "result_table_name TEXT, "
+                "completed_timestamp REAL, is_completed INTEGER)"
+                )
+            conn.executemany("INSERT INTO runs VALUES (?, ?, ?, ?)", [
+                (1, "results_1", 123, 1),
+                (2, "results_2", None, 0),
+                ])
+            conn.execute("CREATE TABLE results_1 (signal REAL)")
+            conn.execute("CREATE TABLE results_2 (signal REAL)")
+            conn.executemany(
+                "INSERT INTO results_1 VALUES (?)",
+                ((float(index), ) for index in range(5000)),
+                )
+            conn.executemany(
+                "INSERT INTO results_2 VALUES (?)",
+                ((float(index), ) for index in range(live_rows)),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _dbstat_size(self, database_path, table_name):
+        conn = sqlite3.connect(database_path)
+        try:
+            return conn.execute(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name = ?",
+                (table_name, ),
+                ).fetchone()[0]
+        finally:
+            conn.close()
+
     def test_successful_dbstat_storage_size_is_exact(self):
-        cursor = Mock()
-        cursor.fetchone.return_value = (8192, )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "storage.db")
+            self._create_storage_database(database_path)
+            expected = self._dbstat_size(database_path, "results_1")
+            conn = self._read_only_sqlite_connection(database_path)
+            try:
+                storage_size = readSQL._table_storage_bytes(conn.cursor(), "results_1")
+            finally:
+                conn.close()
 
-        storage_size = readSQL._table_storage_bytes(cursor, "results_1")
         metadata = {}
         readSQL._add_storage_size_fields(metadata, storage_size)
-
-        self.assertEqual(storage_size, readSQL._StorageSize(8192, "exact"))
+        self.assertEqual(storage_size, readSQL._StorageSize(expected, "exact"))
         self.assertEqual(metadata, {
-            "storage_bytes": 8192,
+            "storage_bytes": expected,
             "storage_bytes_estimated": False,
             })
-        cursor.execute.assert_called_once_with(
-            "SELECT SUM(pgsize) FROM dbstat WHERE name = ?",
-            ("results_1", ),
-            )
-
-    def test_missing_and_failing_dbstat_storage_sizes_are_estimated(self):
-        for dbstat_failure in (None, sqlite3.OperationalError("no such table: dbstat")):
-            with self.subTest(dbstat_failure=dbstat_failure):
-                cursor = Mock()
-                if dbstat_failure is None:
-                    cursor.fetchone.return_value = (None, )
-                else:
-                    cursor.execute.side_effect = [dbstat_failure, None]
-                cursor.fetchall.return_value = [
-                    (0, "signal", "REAL", 0, None, 0),
-                    ]
 
-                storage_size = readSQL._table_storage_bytes(
+    def test_storage_sizes_share_one_dbstat_pass_per_database_state(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "storage.db")
+            self._create_storage_database(database_path)
+            statements = []
+            conn = self._read_only_sqlite_connection(database_path)
+            try:
+                conn.set_trace_callback(statements.append)
+                cursor = conn.cursor()
+                sizes = readSQL._table_storage_bytes_by_name(
                     cursor,
-                    "results_1",
-                    result_count=10,
+                    ["results_1", "results_2"],
+                    )
+                first = readSQL._table_storage_bytes(cursor, "results_1")
+                second = readSQL._table_storage_bytes(cursor, "results_2")
+            finally:
+                conn.close()
+
+            self.assertEqual(
+                sum("DBSTAT" in sql.upper() for sql in statements),
+                1,
+                )
+            self.assertEqual(sizes, {
+                "results_1": readSQL._StorageSize(
+                    self._dbstat_size(database_path, "results_1"),
+                    "exact",
+                    ),
+                "results_2": readSQL._StorageSize(
+                    self._dbstat_size(database_path, "results_2"),
+                    "exact",
+                    ),
+                })
+            self.assertEqual(first, sizes["results_1"])
+            self.assertEqual(second, sizes["results_2"])
+
+    def test_live_table_sizes_grow_from_page_count_deltas(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "storage.db")
+            self._create_storage_database(database_path, live_rows=10)
+
+            def read_sizes():
+                statements = []
+                conn = self._read_only_sqlite_connection(database_path)
+                try:
+                    conn.set_trace_callback(statements.append)
+                    sizes = readSQL._table_storage_bytes_by_name(
+                        conn.cursor(),
+                        ["results_1", "results_2"],
+                        )
+                finally:
+                    conn.close()
+                return sizes, statements
+
+            before, _statements = read_sizes()
+            self._append_live_rows(database_path)
+            after, statements = read_sizes()
+
+        self.assertFalse(any("DBSTAT" in sql.upper() for sql in statements))
+        self.assertFalse(any("results_1" in sql for sql in statements))
+        self.assertEqual(after["results_1"], before["results_1"])
+        self.assertGreater(after["results_2"].bytes, before["results_2"].bytes)
+        self.assertEqual(after["results_2"].bytes % 4096, 0)
+
+    def test_grown_table_sizes_are_estimated_until_the_run_completes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "storage.db")
+            self._create_storage_database(database_path, live_rows=10)
+
+            def read_sizes():
+                statements = []
+                conn = self._read_only_sqlite_connection(database_path)
+                try:
+                    conn.set_trace_callback(statements.append)
+                    cursor = conn.cursor()
+                    sizes = {
+                        table_name: readSQL._table_storage_bytes(cursor, table_name)
+                        for table_name in ("results_1", "results_2")
+                        }
+                finally:
+                    conn.close()
+                return sizes, sum("DBSTAT" in sql.upper() for sql in statements)
+
+            read_sizes()
+            self._append_live_rows(database_path)
+            grown, grown_scans = read_sizes()
+            metadata = {}
+            readSQL._add_storage_size_fields(metadata, grown["results_2"])
+
+            conn = sqlite3.connect(database_path)
+            try:
+                conn.execute(
+                    "UPDATE runs SET completed_timestamp = 456, is_completed = 1 "
+                    "WHERE run_id = 2"
                     )
+                conn.commit()
+            finally:
+                conn.close()
+            completed, completed_scans = read_sizes()
+            _settled, settled_scans = read_sizes()
+            expected = self._dbstat_size(database_path, "results_2")
+
+        self.assertEqual(grown_scans, 0)
+        self.assertEqual(grown["results_1"].accuracy, "exact")
+        self.assertEqual(grown["results_2"].accuracy, "estimated")
+        self.assertTrue(metadata["storage_bytes_estimated"])
+        self.assertEqual(completed_scans, 1)
+        self.assertEqual(settled_scans, 0)
+        self.assertEqual(
+            completed["results_2"],
+            readSQL._StorageSize(expected, "exact"),
+            )
+
+    def _append_live_rows(self, database_path):
+        conn = sqlite3.connect(database_path)
+        try:
+            conn.executemany(
+                "INSERT INTO results_2 VALUES (?)",
+                ((float(index), ) for index in range(5000)),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def test_missing_and_failing_dbstat_storage_sizes_are_estimated(self):
+        for sizes in (readSQL._StorageSizes(4096, 1, {}, {}, frozenset(), {}), None):
+            with (
+                self.subTest(sizes=sizes),
+                tempfile.TemporaryDirectory() as temp_dir,
+                patch.object(readSQL, "_storage_sizes", return_value=sizes),
+                ):
+                database_path = os.path.join(temp_dir, "storage.db")
+                self._create_storage_database(database_path)
+                conn = self._read_only_sqlite_connection(database_path)
+                try:
+                    storage_size = readSQL._table_storage_bytes(
+                        conn.cursor(),
+                        "results_1",
+                        result_count=10,
+                        )
+                finally:
+                    conn.close()
                 metadata = {}
                 readSQL._add_storage_size_fields(metadata, storage_size)
 
@@ -229,18 +461,21 @@ class RunSizeTestCase(unittest.TestCase):
                     })
 
     def test_unavailable_storage_sizes_have_consistent_metadata(self):
-        cursor = Mock()
-        cursor.execute.side_effect = [
-            sqlite3.OperationalError("no such table: dbstat"),
-            None,
-            ]
-        cursor.fetchall.return_value = []
-
-        storage_size = readSQL._table_storage_bytes(
-            cursor,
-            "missing_results",
-            result_count=10,
-            )
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            patch.object(readSQL, "_storage_sizes", return_value=None),
+            ):
+            database_path = os.path.join(temp_dir, "storage.db")
+            self._create_storage_database(database_path)
+            conn = self._read_only_sqlite_connection(database_path)
+            try:
+                storage_size = readSQL._table_storage_bytes(
+                    conn.cursor(),
+                    "missing_results",
+                    result_count=10,
+                    )
+            finally:
+                conn.close()
         metadata = {}
         readSQL._add_storage_size_fields(metadata, storage_size)
 
@@ -269,7 +504,7 @@ class RunSizeTestCase(unittest.TestCase):
 
             with patch.object(
                     readSQL,
-                    "qcodes_read_only_connection",
+                    "pooled_qcodes_read_only_connection",
                     side_effect=self._read_only_sqlite_connection,
                     ):
                 status = readSQL.get_run_status(
@@ -307,8 +542,8 @@ class RunSizeTestCase(unittest.TestCase):
                 cursor.close()
                 conn.close()
 
-            old_connection = readSQL.qcodes_read_only_connection
-            readSQL.qcodes_read_only_connection = (
+            old_connection = readSQL.pooled_qcodes_read_only_connection
+            readSQL.pooled_qcodes_read_only_connection = (
                 lambda _database_path: sqlite3.connect(database_path)
                 )
             try:
@@ -316,7 +551,7 @@ class RunSizeTestCase(unittest.TestCase):
                 self.assertIsNone(readSQL.has_finished("unfinished-guid"))
                 self.assertIsNone(readSQL.has_finished("missing-guid"))
             finally:
-                readSQL.qcodes_read_only_connection = old_connection
+                readSQL.pooled_qcodes_read_only_connection = old_connection
 
     def test_find_new_runs_uses_run_id_when_timestamps_are_missing_or_equal(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -362,14 +597,14 @@ class RunSizeTestCase(unittest.TestCase):
             finally:
                 conn.close()
 
-            old_connection = readSQL.qcodes_read_only_connection
-            readSQL.qcodes_read_only_connection = (
+            old_connection = readSQL.pooled_qcodes_read_only_connection
+            readSQL.pooled_qcodes_read_only_connection = (
                 lambda _database_path: sqlite3.connect(database_path)
                 )
             try:
                 runs = readSQL.find_new_runs(1)
             finally:
-                readSQL.qcodes_read_only_connection = old_connection
+                readSQL.pooled_qcodes_read_only_connection = old_connection
 
         self.assertEqual(set(runs), {2, 3})
 
@@ -671,6 +906,22 @@ class RunSizeTestCase(unittest.TestCase):
         finally:
             conn.close()
 
+    def test_run_basic_fields_cache_only_text_and_null_columns(self):
+        run_description = json.dumps({"shapes": {"signal": [3, 4]}})
+        cached = {"run_description": run_description, "parameters": "x,y,signal"}
+        uncached = {
+            "run_description": run_description.encode(),
+            "parameters": "x,y,signal",
+            }
+        readSQL._cached_run_basic_fields.cache_clear()
+
+        readSQL._add_run_basic_fields(cached)
+        readSQL._add_run_basic_fields(uncached)
+
+        self.assertEqual(readSQL._cached_run_basic_fields.cache_info().currsize, 1)
+        self.assertEqual(cached["point_shape"], [3, 4])
+        self.assertEqual(uncached["point_shape"], [3, 4])
+
     def test_point_shape_uses_largest_measured_parameter_shape(self):
         self.assertEqual(
             readSQL._point_shape(
@@ -761,8 +1012,8 @@ class RunSizeTestCase(unittest.TestCase):
                 cursor.execute("INSERT INTO results_1 VALUES (0, 1)")
                 conn.commit()
 
-                old_connection = readSQL.qcodes_read_only_connection
-                readSQL.qcodes_read_only_connection = (
+                old_connection = readSQL.pooled_qcodes_read_only_connection
+                readSQL.pooled_qcodes_read_only_connection = (
                     lambda _database_path: sqlite3.connect(database_path)
                     )
                 try:
@@ -779,7 +1030,7 @@ class RunSizeTestCase(unittest.TestCase):
                     conn.commit()
                     completed_status = readSQL.get_run_status("guid")
                 finally:
-                    readSQL.qcodes_read_only_connection = old_connection
+                    readSQL.pooled_qcodes_read_only_connection = old_connection
 
                 self.assertEqual(first_status["setpoint_shape"], [1])
                 self.assertEqual(first_status["run_timestamp"], 100)
@@ -802,6 +1053,77 @@ class RunSizeTestCase(unittest.TestCase):
             finally:
                 conn.close()
 
+    def _observe_live_setpoints(self, cursor, incremental=True):
+        return readSQL._run_setpoint_observation(
+            cursor,
+            "results_1",
+            {"interdependencies_": {"dependencies": {"signal": ["x", "y"]}}},
+            ["signal"],
+            ["x", "y"],
+            incremental=incremental,
+            )
+
+    def test_live_setpoints_are_observed_from_appended_rows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "live.db")
+            conn = sqlite3.connect(database_path)
+            try:
+                conn.execute("CREATE TABLE results_1 (x REAL, y REAL, signal REAL)")
+                conn.executemany(
+                    "INSERT INTO results_1 VALUES (?, ?, ?)",
+                    [(x, y, x + y) for x in range(2) for y in range(3)],
+                    )
+                conn.commit()
+                statements = []
+                conn.set_trace_callback(statements.append)
+                cursor = conn.cursor()
+
+                with patch.dict(readSQL._SETPOINT_OBSERVERS, clear=True):
+                    first = self._observe_live_setpoints(cursor)
+                    conn.executemany(
+                        "INSERT INTO results_1 VALUES (?, ?, ?)",
+                        [(2, y, 2 + y) for y in range(3)] + [(3, 0, None)],
+                        )
+                    conn.commit()
+                    statements.clear()
+                    second = self._observe_live_setpoints(cursor)
+                    appended_statements = list(statements)
+                    conn.execute("INSERT INTO results_1 VALUES (3, 1, 4)")
+                    conn.commit()
+                    partial = self._observe_live_setpoints(cursor)
+                    full_scan = self._observe_live_setpoints(cursor, incremental=False)
+            finally:
+                conn.close()
+
+        self.assertEqual(first, {"shape": [2, 3], "count": 6})
+        self.assertEqual(second, {"shape": [3, 3], "count": 9})
+        self.assertTrue(any("ROWID > 6" in sql.upper() for sql in appended_statements))
+        self.assertFalse(any("DISTINCT" in sql.upper() for sql in appended_statements))
+        self.assertEqual(partial, {"shape": None, "count": 10})
+        self.assertEqual(partial, full_scan)
+
+    def test_unobservable_live_setpoints_fall_back_to_distinct_counts(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "live.db")
+            conn = sqlite3.connect(database_path)
+            try:
+                conn.execute("CREATE TABLE results_1 (x TEXT, y REAL, signal REAL)")
+                conn.executemany(
+                    "INSERT INTO results_1 VALUES (?, ?, ?)",
+                    [("a", 0, 1), ("b", 0, 2), ("a", 1, 3), ("b", 1, 4)],
+                    )
+                conn.commit()
+
+                with patch.dict(readSQL._SETPOINT_OBSERVERS, clear=True):
+                    observation = self._observe_live_setpoints(conn.cursor())
+                    observers = list(readSQL._SETPOINT_OBSERVERS.values())
+            finally:
+                conn.close()
+
+        self.assertEqual(observation, {"shape": [2, 2], "count": 4})
+        self.assertEqual(len(observers), 1)
+        self.assertTrue(observers[0].exhausted)
+
     def test_heterogeneous_dependencies_do_not_form_a_cartesian_shape(self):
         conn = sqlite3.connect(":memory:")
         try:
@@ -923,8 +1245,8 @@ class RunSizeTestCase(unittest.TestCase):
                     )
                 conn.commit()
 
-                old_connection = readSQL.qcodes_read_only_connection
-                readSQL.qcodes_read_only_connection = (
+                old_connection = readSQL.pooled_qcodes_read_only_connection
+                readSQL.pooled_qcodes_read_only_connection = (
                     lambda _database_path: sqlite3.connect(database_path)
                     )
                 try:
@@ -933,7 +1255,7 @@ class RunSizeTestCase(unittest.TestCase):
                         [1],
                         ))
                 finally:
-                    readSQL.qcodes_read_only_connection = old_connection
+                    readSQL.pooled_qcodes_read_only_connection = old_connection
 
                 self.assertEqual(len(batches), 1)
                 self.assertIsNone(batches[0][1]["setpoint_shape"])
@@ -3,6 +3,7 @@ import json
 import os
 import shutil
 import sqlite3
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -27,8 +28,11 @@ from qplot.datahandling.readonly import (
     ReadOnlyDatabaseAccessError,
     load_by_guid_read_only,
     load_by_id_read_only,
+    pooled_qcodes_read_only_connection,
+    pooled_sqlite_read_only_connection,
     qcodes_read_only_connection,
     quarantine_wal_for_replaced_database,
+    release_pooled_connections,
     replacement_wal_is_quarantined,
     set_qcodes_database_location,
     sqlite_read_only_connection,
@@ -984,3 +988,415 @@ def test_unstable_live_wal_fails_instead_of_using_immutable_data(
         assert _directory_state(tmp_path) == original_state
     finally:
         writer.close()
+
+
+def _count_rows(conn, table_name="live_rows"):
+    return conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+
+def test_live_wal_snapshots_copy_only_new_wal_frames(tmp_path, monkeypatch):
+    from qplot.datahandling import readonly
+
+    database_path = tmp_path / "incremental.db"
+    writer = sqlite3.connect(database_path)
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE live_rows (value INTEGER)")
+        writer.execute("INSERT INTO live_rows VALUES (1)")
+        writer.commit()
+
+        conn = sqlite_read_only_connection(database_path)
+        try:
+            assert _count_rows(conn) == 1
+        finally:
+            conn.close()
+        entry = readonly._WAL_SNAPSHOT_STORE[database_path.resolve()]
+        stored_mains = [main.path for main in entry._main_copies]
+        copied_ranges = []
+        real_copy = readonly._copy_file_range
+
+        def tracked_copy(source_file, target_file, start, stop):
+            copied_ranges.append((Path(source_file.name).name, start, stop))
+            return real_copy(source_file, target_file, start, stop)
+
+        monkeypatch.setattr(readonly, "_copy_file_range", tracked_copy)
+        wal_size = Path(f"{database_path}-wal").stat().st_size
+        writer.execute("INSERT INTO live_rows VALUES (2)")
+        writer.commit()
+        source_state = _directory_state(tmp_path)
+
+        conn = sqlite_read_only_connection(database_path)
+        try:
+            assert _count_rows(conn) == 2
+        finally:
+            conn.close()
+        assert [main.path for main in entry._main_copies] == stored_mains
+        assert copied_ranges == [
+            (
+                "incremental.db-wal",
+                wal_size,
+                Path(f"{database_path}-wal").stat().st_size,
+            )
+        ]
+        assert _directory_state(tmp_path) == source_state
+    finally:
+        writer.close()
+        readonly.release_wal_snapshots(database_path)
+
+
+def test_restarted_wal_refreshes_private_main_without_disturbing_views(tmp_path):
+    from qplot.datahandling import readonly
+
+    database_path = tmp_path / "restarted.db"
+    writer = sqlite3.connect(database_path)
+    held = None
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE live_rows (value INTEGER)")
+        writer.execute("INSERT INTO live_rows VALUES (1)")
+        writer.commit()
+
+        held = sqlite_read_only_connection(database_path)
+        assert _count_rows(held) == 1
+        entry = readonly._WAL_SNAPSHOT_STORE[database_path.resolve()]
+
+        for value in (2, 3):
+            writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            writer.execute("INSERT INTO live_rows VALUES (?)", (value,))
+            writer.commit()
+            first = sqlite_read_only_connection(database_path)
+            second = sqlite_read_only_connection(database_path)
+            try:
+                assert _count_rows(first) == value
+                assert _count_rows(second) == value
+            finally:
+                first.close()
+                second.close()
+            assert len(entry._main_copies) <= readonly.WAL_SNAPSHOT_MAIN_COPIES + 1
+
+        assert _count_rows(held) == 1
+    finally:
+        if held is not None:
+            held.close()
+        writer.close()
+        readonly.release_wal_snapshots(database_path)
+
+
+def test_autocheckpointed_wal_patches_only_pages_named_in_the_log(
+        tmp_path,
+        monkeypatch,
+        ):
+    from qplot.datahandling import readonly
+
+    database_path = tmp_path / "autocheckpoint.db"
+    writer = sqlite3.connect(database_path)
+    compared = []
+    patched = []
+    real_patch_pages = readonly._patch_pages
+
+    def tracked_patch_pages(source_path, target_path, size, page_size, pages):
+        patched.append(len(pages))
+        return real_patch_pages(source_path, target_path, size, page_size, pages)
+
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("CREATE TABLE live_rows (value INTEGER, payload BLOB)")
+        writer.commit()
+        conn = sqlite_read_only_connection(database_path)
+        conn.close()
+        monkeypatch.setattr(
+            readonly,
+            "_patch_changed_blocks",
+            lambda *args: compared.append(args),
+            )
+        monkeypatch.setattr(readonly, "_patch_pages", tracked_patch_pages)
+
+        for value in range(1, 1601):
+            writer.execute(
+                "INSERT INTO live_rows VALUES (?, ?)",
+                (value, os.urandom(3000)),
+                )
+            writer.commit()
+            if value % 20:
+                continue
+            conn = sqlite_read_only_connection(database_path)
+            try:
+                assert conn.execute(
+                    "SELECT COUNT(*), SUM(value) FROM live_rows"
+                    ).fetchone() == (value, value * (value + 1) // 2)
+                assert conn.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+            finally:
+                conn.close()
+
+        assert patched
+        assert compared == []
+    finally:
+        writer.close()
+        readonly.release_wal_snapshots(database_path)
+
+
+def test_releasing_a_view_does_not_wait_for_the_store_lock(tmp_path):
+    from qplot.datahandling import readonly
+
+    database_path = tmp_path / "finalized.db"
+    writer = sqlite3.connect(database_path)
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE live_rows (value INTEGER)")
+        writer.commit()
+        conn = sqlite_read_only_connection(database_path)
+        entry = readonly._WAL_SNAPSHOT_STORE[database_path.resolve()]
+        assert entry.views == 1
+
+        # A garbage collection inside ``open_view`` can finalize a view.
+        with entry.lock:
+            conn.close()
+            assert entry.views == 0
+    finally:
+        writer.close()
+        readonly.release_wal_snapshots(database_path)
+
+
+def test_full_store_of_busy_snapshots_still_opens_a_new_database(
+        tmp_path,
+        monkeypatch,
+        ):
+    from qplot.datahandling import readonly
+
+    monkeypatch.setattr(readonly, "WAL_SNAPSHOT_STORE_MAX_DATABASES", 1)
+    writers = []
+    views = []
+    try:
+        for name in ("busy.db", "new.db"):
+            database_path = tmp_path / name
+            writer = sqlite3.connect(database_path)
+            writers.append(writer)
+            writer.execute("PRAGMA journal_mode=WAL")
+            writer.execute("PRAGMA wal_autocheckpoint=0")
+            writer.execute("CREATE TABLE live_rows (value INTEGER)")
+            writer.execute("INSERT INTO live_rows VALUES (1)")
+            writer.commit()
+            # The first view stays open, so its entry is busy when the
+            # second database needs the only store slot.
+            views.append(sqlite_read_only_connection(database_path))
+
+        assert _count_rows(views[-1]) == 1
+        assert list(readonly._WAL_SNAPSHOT_STORE) == [
+            (tmp_path / "new.db").resolve(),
+            ]
+    finally:
+        for conn in views:
+            conn.close()
+        for writer in writers:
+            writer.close()
+        readonly.release_wal_snapshots()
+
+
+def test_released_wal_snapshots_remove_private_copies(tmp_path):
+    from qplot.datahandling import readonly
+
+    database_path = tmp_path / "released.db"
+    writer = sqlite3.connect(database_path)
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE live_rows (value INTEGER)")
+        writer.execute("INSERT INTO live_rows VALUES (1)")
+        writer.commit()
+
+        conn = sqlite_read_only_connection(database_path)
+        entry = readonly._WAL_SNAPSHOT_STORE[database_path.resolve()]
+        store_directory = Path(entry.directory.name)
+        readonly.release_wal_snapshots(database_path)
+        try:
+            assert _count_rows(conn) == 1
+        finally:
+            conn.close()
+
+        assert not store_directory.exists()
+        assert database_path.resolve() not in readonly._WAL_SNAPSHOT_STORE
+    finally:
+        writer.close()
+
+
+def test_pooled_connections_are_reused_until_the_live_source_changes(tmp_path):
+    database_path = tmp_path / "pooled.db"
+    writer = sqlite3.connect(database_path)
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE live_rows (value INTEGER)")
+        writer.execute("INSERT INTO live_rows VALUES (1)")
+        writer.commit()
+
+        first = pooled_sqlite_read_only_connection(database_path)
+        assert _count_rows(first) == 1
+        first.close()
+        reused = pooled_sqlite_read_only_connection(database_path)
+        assert reused is first
+        assert _count_rows(reused) == 1
+        reused.close()
+
+        writer.execute("INSERT INTO live_rows VALUES (2)")
+        writer.commit()
+        refreshed = pooled_sqlite_read_only_connection(database_path)
+        try:
+            assert refreshed is not first
+            assert _count_rows(refreshed) == 2
+            _assert_connection_closed(first)
+        finally:
+            refreshed.close()
+    finally:
+        writer.close()
+        release_pooled_connections(database_path)
+        readonly_module.release_wal_snapshots(database_path)
+
+
+def test_pooled_wal_view_survives_a_checkpoint_without_new_commits(tmp_path):
+    database_path = tmp_path / "checkpointed.db"
+    writer = sqlite3.connect(database_path)
+    try:
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE live_rows (value INTEGER)")
+        writer.execute("INSERT INTO live_rows VALUES (1)")
+        writer.commit()
+
+        first = pooled_sqlite_read_only_connection(database_path)
+        assert _count_rows(first) == 1
+        first.close()
+        main_signature = readonly_module._file_signature(database_path)
+        writer.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        assert readonly_module._file_signature(database_path) != main_signature
+
+        reused = pooled_sqlite_read_only_connection(database_path)
+        try:
+            assert reused is first
+            assert _count_rows(reused) == 1
+        finally:
+            reused.close()
+    finally:
+        writer.close()
+        release_pooled_connections(database_path)
+        readonly_module.release_wal_snapshots(database_path)
+
+
+def test_pooled_qcodes_connection_is_opened_once(tmp_path, monkeypatch):
+    database_path = tmp_path / "pooled_qcodes.db"
+    _create_qcodes_run(database_path)
+
+    def fail_thread_bound_connect(*_args, **_kwargs):
+        raise AssertionError("pooled views must not open a thread-bound connection")
+
+    monkeypatch.setattr(readonly_module, "connect", fail_thread_bound_connect)
+    conn = pooled_qcodes_read_only_connection(database_path)
+    try:
+        results = {}
+
+        def read_in_worker():
+            results["runs"] = conn.execute("SELECT COUNT(*) FROM runs").fetchone()
+
+        worker = threading.Thread(target=read_in_worker)
+        worker.start()
+        worker.join()
+        assert results["runs"] == (1,)
+        assert isinstance(conn, AtomicConnection)
+    finally:
+        conn.close()
+        release_pooled_connections(database_path)
+
+
+def test_pooled_connection_is_closed_when_the_database_is_replaced(tmp_path):
+    database_path = tmp_path / "replaced.db"
+    replacement_path = tmp_path / "replacement.db"
+    for path, value in ((database_path, 1), (replacement_path, 2)):
+        writable = sqlite3.connect(path)
+        try:
+            writable.execute("CREATE TABLE live_rows (value INTEGER)")
+            writable.executemany(
+                "INSERT INTO live_rows VALUES (?)",
+                [(row,) for row in range(value)],
+            )
+            writable.commit()
+        finally:
+            writable.close()
+
+    try:
+        original = pooled_sqlite_read_only_connection(database_path)
+        assert _count_rows(original) == 1
+        original.close()
+
+        os.replace(replacement_path, database_path)
+        replacement = pooled_sqlite_read_only_connection(database_path)
+        try:
+            assert replacement is not original
+            assert _count_rows(replacement) == 2
+            _assert_connection_closed(original)
+        finally:
+            replacement.close()
+    finally:
+        release_pooled_connections(database_path)
+
+
+def test_interrupted_pooled_connection_is_not_reused(tmp_path):
+    database_path = tmp_path / "interrupted.db"
+    writable = sqlite3.connect(database_path)
+    try:
+        writable.execute("CREATE TABLE live_rows (value INTEGER)")
+        writable.commit()
+    finally:
+        writable.close()
+
+    try:
+        interrupted = pooled_sqlite_read_only_connection(database_path)
+        interrupted.interrupt()
+        interrupted.close()
+        _assert_connection_closed(interrupted)
+
+        fresh = pooled_sqlite_read_only_connection(database_path)
+        try:
+            assert fresh is not interrupted
+            assert _count_rows(fresh) == 0
+        finally:
+            fresh.close()
+    finally:
+        release_pooled_connections(database_path)
+
+
+def test_pooled_connection_moves_between_threads(tmp_path):
+    database_path = tmp_path / "threads.db"
+    original_database_path = qcodes.config.core.db_location
+    try:
+        initialise_or_create_database_at(str(database_path))
+    finally:
+        qcodes.config.core.db_location = original_database_path
+
+    borrowed = []
+
+    def read_in_worker():
+        conn = pooled_qcodes_read_only_connection(database_path)
+        borrowed.append((conn, _count_rows(conn, "runs")))
+        conn.close()
+
+    try:
+        worker = threading.Thread(target=read_in_worker)
+        worker.start()
+        worker.join()
+        worker_connection, worker_count = borrowed[0]
+        assert isinstance(worker_connection, AtomicConnection)
+        assert worker_count == 0
+
+        conn = pooled_qcodes_read_only_connection(database_path)
+        try:
+            assert conn is worker_connection
+            assert _count_rows(conn, "runs") == 0
+        finally:
+            conn.close()
+
+        release_pooled_connections(database_path)
+        _assert_connection_closed(worker_connection)
+    finally:
+        release_pooled_connections(database_path)
@@ -0,0 +1,150 @@
+import json
+import sqlite3
+
+import pytest
+
+from qplot.datahandling import database as database_module
+from qplot.datahandling import readSQL, run_catalog
+from qplot.datahandling.database import (
+    DatabaseDetailWorker,
+    DatabaseExpensiveDetailWorker,
+)
+from qplot.datahandling.run_catalog import RunCatalog
+
+
+def _create_runs_database(database_path):
+    conn = sqlite3.connect(database_path)
+    try:
+        conn.execute("CREATE TABLE experiments (exp_id INTEGER, name TEXT, sample_name TEXT)")
+        conn.execute(
+            """
+            CREATE TABLE runs (
+                run_id INTEGER,
+                exp_id INTEGER,
+                name TEXT,
+                run_timestamp REAL,
+                completed_timestamp REAL,
+                is_completed INTEGER,
+                guid TEXT,
+                result_table_name TEXT,
+                parameters TEXT,
+                run_description TEXT
+            )
+            """
+            )
+        conn.execute("INSERT INTO experiments VALUES (1, 'exp', 'sample')")
+        run_description = json.dumps({
+            "interdependencies_": {"dependencies": {"signal": ["x", "y"]}},
+            })
+        for run_id, completed in ((1, True), (2, True), (3, False)):
+            table_name = f"results_{run_id}"
+            conn.execute(f"CREATE TABLE {table_name} (x REAL, y REAL, signal REAL)")
+            conn.executemany(
+                f"INSERT INTO {table_name} VALUES (?, ?, ?)",
+                [(x, y, x + y) for x in range(run_id + 1) for y in range(3)],
+                )
+            conn.execute(
+                "INSERT INTO runs VALUES (?, 1, 'run', 100, ?, ?, ?, ?, 'x,y,signal', ?)",
+                (
+                    run_id,
+                    123 if completed else None,
+                    int(completed),
+                    f"guid-{run_id}",
+                    table_name,
+                    run_description,
+                    ),
+                )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def runs_database(tmp_path, monkeypatch):
+    database_path = str(tmp_path / "runs.db")
+    _create_runs_database(database_path)
+    monkeypatch.setattr(
+        readSQL,
+        "pooled_qcodes_read_only_connection",
+        lambda path: sqlite3.connect(f"file:{path}?mode=ro", uri=True),
+        )
+    return database_path
+
+
+def _run_worker(worker_type, database_path, run_ids):
+    worker = worker_type(1, database_path, run_ids, batch_size=10)
+    batches = []
+    finished = []
+    worker.signals.batch_ready.connect(lambda *args: batches.append(args[2]))
+    worker.signals.finished.connect(lambda *args: finished.append(args[2]))
+    worker.run()
+    assert finished == [None]
+    merged: dict = {}
+    for batch in batches:
+        for run_id, metadata in batch.items():
+            merged.setdefault(run_id, {}).update(metadata)
+    return merged
+
+
+def test_completed_run_rowids_skip_live_runs(runs_database):
+    completed = readSQL.get_completed_run_rowids(runs_database, [1, 2, 3])
+
+    assert completed == {1: ("guid-1", 6), 2: ("guid-2", 9)}
+
+
+def test_catalog_entries_follow_result_rowids_and_file_identity(tmp_path):
+    directory = tmp_path / "catalog"
+    catalog = RunCatalog(directory, "/data/runs.db", (1, 2))
+    completed = {1: ("guid-1", 6), 2: ("guid-2", 9)}
+    catalog.record(completed, "details", [1, 2, 3], {
+        1: {"guid": "guid-1", "name": "run", "result_count": 6},
+        3: {"guid": "guid-3", "result_count": 1},
+        })
+    assert catalog.save()
+
+    reopened = RunCatalog(directory, "/data/runs.db", (1, 2))
+    assert reopened.lookup(completed, "details") == {
+        1: {"guid": "guid-1", "result_count": 6},
+        2: {"guid": "guid-2"},
+        }
+    assert reopened.lookup(completed, "shapes") == {}
+    assert reopened.lookup({1: ("guid-1", 7)}, "details") == {}
+
+    replaced = RunCatalog(directory, "/data/runs.db", (1, 3))
+    assert replaced.lookup(completed, "details") == {}
+
+
+def test_reopening_a_database_reads_only_live_runs(runs_database, monkeypatch):
+    first_details = _run_worker(DatabaseDetailWorker, runs_database, [3, 2, 1])
+    first_expensive = _run_worker(DatabaseExpensiveDetailWorker, runs_database, [3, 2, 1])
+    assert first_details[1]["result_count"] == 6
+    assert first_expensive[2]["setpoint_count"] == 9
+
+    # A new session starts without the in-memory catalogs.
+    monkeypatch.setattr(run_catalog, "_catalogs", {})
+    read_run_ids = []
+
+    def recording(iterate):
+        def iterate_and_record(database_path, run_ids, *args, **kwargs):
+            read_run_ids.append(list(run_ids))
+            yield from iterate(database_path, run_ids, *args, **kwargs)
+        return iterate_and_record
+
+    for name in (
+            "iter_run_detail_batches_via_sql",
+            "iter_run_shape_batches_via_sql",
+            "iter_run_storage_batches_via_sql",
+            ):
+        monkeypatch.setattr(database_module, name, recording(getattr(database_module, name)))
+
+    details = _run_worker(DatabaseDetailWorker, runs_database, [3, 2, 1])
+    expensive = _run_worker(DatabaseExpensiveDetailWorker, runs_database, [3, 2, 1])
+
+    assert read_run_ids == [[3], [3], [3]]
+    for run_id in (1, 2):
+        for field, value in first_details[run_id].items():
+            if field in run_catalog.RUN_CATALOG_FIELDS:
+                assert details[run_id][field] == value
+        for field, value in first_expensive[run_id].items():
+            if field in run_catalog.RUN_CATALOG_FIELDS:
+                assert expensive[run_id][field] == value
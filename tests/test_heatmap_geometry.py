@@ -1,4 +1,5 @@
 import math
+from time import perf_counter
 
 import numpy as np
 import pytest
@@ -147,6 +148,70 @@ class TestAxisGeometry:
         with pytest.raises(ValueError, match="precision"):
             AxisGeometry([left, adjacent])
 
+    def test_coordinates_are_read_only_arrays_matching_the_tuples(self):
+        centres = np.array([0.0, 1.0, 4.0])
+        axis = AxisGeometry(centres)
+        centres[0] = -10.0
+
+        np.testing.assert_array_equal(axis.centre_array, [0.0, 1.0, 4.0])
+        assert axis.edges == tuple(axis.edge_array)
+        assert axis == AxisGeometry(value for value in [0.0, 1.0, 4.0])
+        assert hash(axis) == hash(AxisGeometry([0.0, 1.0, 4.0]))
+        with pytest.raises(ValueError):
+            axis.edge_array[0] = 1.0
+        with pytest.raises(AttributeError):
+            axis.is_uniform = False
+
+    @pytest.mark.parametrize(
+        "added",
+        [[3.0], [3.0, 4.0, 5.0], [3.0, 4.0, 4.5]],
+    )
+    def test_grown_axis_matches_an_axis_built_from_scratch(self, added):
+        axis = AxisGeometry([0.0, 1.0, 2.0])
+
+        grown = axis.grown([0.0, 1.0, 2.0, *added])
+        built = AxisGeometry([0.0, 1.0, 2.0, *added])
+
+        assert grown == built
+        assert grown.is_uniform == built.is_uniform
+        assert grown.index_at(2.6) == built.index_at(2.6)
+
+    def test_grown_axis_is_unchanged_or_rebuilt_for_other_centres(self):
+        axis = AxisGeometry([0.0, 1.0, 2.0], uniform_rel_tol=0.0)
+
+        assert axis.grown([0.0, 1.0, 2.0]) is axis
+        rebuilt = axis.grown([0.0, 1.5, 2.0, 3.0])
+        assert rebuilt == AxisGeometry([0.0, 1.5, 2.0, 3.0])
+        assert not axis.grown([0.0, 1.0, 2.0, 3.0 + 1e-12]).is_uniform
+        assert axis.grown([5.0]).edges == (4.5, 5.5)
+
+    @pytest.mark.parametrize(
+        ("added", "message"),
+        [
+            ([math.nan], "finite"),
+            ([2.0], "strictly increasing"),
+            ([3.0, 2.5], "strictly increasing"),
+        ],
+    )
+    def test_grown_axis_rejects_invalid_centres(self, added, message):
+        axis = AxisGeometry([0.0, 1.0, 2.0])
+
+        with pytest.raises(ValueError, match=message):
+            axis.grown([0.0, 1.0, 2.0, *added])
+
+    def test_long_axes_are_built_and_grown_without_per_cell_work(self):
+        centres = np.cumsum(np.random.default_rng(8).uniform(1.0, 2.0, 1_000_001))
+
+        started = perf_counter()
+        axis = AxisGeometry(centres[:-1])
+        grown = axis.grown(centres)
+        elapsed = perf_counter() - started
+
+        assert grown.count == centres.size
+        assert grown.index_at(centres[-1]) == centres.size - 1
+        # Typically tens of milliseconds; per-cell Python work takes seconds.
+        assert elapsed < 1.0
+
 
 class TestHeatmapGeometry:
     def test_geometry_exposes_qt_free_rect_shape_and_bounds(self):
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+from qplot.tools.general import data2matrix
+from qplot.tools.heatmap_grid import IncrementalHeatmapGrid
+
+
+def _sweep(row_count, column_count, rng):
+    rows = np.repeat(np.arange(row_count, dtype=float), column_count)
+    columns = np.tile(np.arange(column_count, dtype=float)[::-1], row_count)
+    values = rng.normal(size=rows.size)
+    values[::7] = np.nan
+    return rows, columns, values
+
+
+def _assert_matches_data2matrix(result, rows, columns, values):
+    expected = data2matrix(rows, columns, values)
+    np.testing.assert_array_equal(result[0], expected.index.to_numpy(float))
+    np.testing.assert_array_equal(result[1], expected.columns.to_numpy(float))
+    np.testing.assert_allclose(result[2], expected.to_numpy(float), rtol=1e-12)
+
+
+def test_incremental_updates_match_a_full_rebuild():
+    rng = np.random.default_rng(1)
+    rows, columns, values = _sweep(12, 9, rng)
+    # Revisit earlier cells so duplicates are averaged across updates.
+    rows = np.concatenate([rows, rows[:20]])
+    columns = np.concatenate([columns, columns[:20]])
+    values = np.concatenate([values, rng.normal(size=20)])
+    grid = IncrementalHeatmapGrid()
+
+    for end in (0, 1, 5, 9, 40, 41, 100, rows.size):
+        result = grid.update("run", rows[:end], columns[:end], values[:end])
+        _assert_matches_data2matrix(
+            result,
+            rows[:end],
+            columns[:end],
+            values[:end],
+            )
+        assert grid.point_count == end
+
+
+def test_new_coordinates_grow_axes_in_sorted_order():
+    grid = IncrementalHeatmapGrid()
+    rows = np.array([5.0, 5.0, 1.0, 3.0])
+    columns = np.array([2.0, 0.0, 1.0, 2.0])
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+
+    grid.update("run", rows[:2], columns[:2], values[:2])
+    result = grid.update("run", rows, columns, values)
+
+    _assert_matches_data2matrix(result, rows, columns, values)
+
+
+def test_only_appended_points_are_placed():
+    grid = IncrementalHeatmapGrid()
+    rows, columns, values = _sweep(4, 4, np.random.default_rng(2))
+    grid.update("run", rows[:8], columns[:8], values[:8])
+
+    placed = []
+    original_insert = grid._insert
+
+    def record_insert(row_values, column_values, cell_values, *args):
+        placed.append(cell_values.size)
+        original_insert(row_values, column_values, cell_values, *args)
+
+    grid._insert = record_insert
+    grid.update("run", rows, columns, values)
+    grid.update("run", rows, columns, values)
+
+    assert placed == [8]
+
+
+@pytest.mark.parametrize("change", ["key", "shrink", "rewrite"])
+def test_grid_is_rebuilt_when_points_do_not_continue(change):
+    grid = IncrementalHeatmapGrid()
+    rows, columns, values = _sweep(5, 5, np.random.default_rng(3))
+    grid.update("run", rows, columns, values)
+
+    key = "run"
+    if change == "key":
+        key = "other run"
+    elif change == "shrink":
+        rows, columns, values = rows[:10], columns[:10], values[:10]
+    else:
+        values = values + 1.0
+
+    result = grid.update(key, rows, columns, values)
+
+    _assert_matches_data2matrix(result, rows, columns, values)
+
+
+def test_returned_grid_is_a_copy_later_updates_leave_alone():
+    grid = IncrementalHeatmapGrid()
+    rows, columns, means = grid.update("run", [1.0], [1.0], [1.0])
+
+    grid.update("run", [1.0, 0.0, 1.0], [1.0, 0.0, 1.0], [1.0, 5.0, 3.0])
+
+    assert not np.shares_memory(means, grid._means)
+    np.testing.assert_array_equal(rows, [1.0])
+    np.testing.assert_array_equal(columns, [1.0])
+    np.testing.assert_array_equal(means, [[1.0]])
+
+
+def test_cancelled_update_leaves_the_previous_result_and_rebuilds():
+    rows, columns, values = _sweep(6, 6, np.random.default_rng(5))
+    grid = IncrementalHeatmapGrid()
+    first = grid.update("run", rows[:12], columns[:12], values[:12])
+    shown = [array.copy() for array in first]
+    calls = []
+
+    def cancel_on_second_check():
+        calls.append(None)
+        if len(calls) == 2:
+            raise RuntimeError("cancelled")
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        grid.update("run", rows, columns, values, check_cancelled=cancel_on_second_check)
+
+    for array, expected in zip(first, shown, strict=True):
+        np.testing.assert_array_equal(array, expected)
+    assert grid.point_count == 0
+    result = grid.update("run", rows, columns, values)
+    _assert_matches_data2matrix(result, rows, columns, values)
+
+
+def test_jittering_coordinates_do_not_reallocate_on_every_refresh():
+    rng = np.random.default_rng(4)
+    grid = IncrementalHeatmapGrid()
+    rows = np.empty(0)
+    columns = np.empty(0)
+    values = np.empty(0)
+    reallocations = []
+    original_reserve = grid._reserve
+
+    def record_reserve(axis, capacity):
+        reallocations.append((axis, capacity))
+        original_reserve(axis, capacity)
+
+    grid._reserve = record_reserve
+
+    for line in range(60):
+        # Each sweep line lands on slightly different column setpoints, so
+        # every refresh brings new rows and interleaved new columns.
+        line_columns = np.linspace(0.0, 1.0, 8) + rng.normal(scale=1e-6, size=8)
+        rows = np.concatenate([rows, np.full(8, float(line))])
+        columns = np.concatenate([columns, line_columns])
+        values = np.concatenate([values, rng.normal(size=8)])
+        result = grid.update("run", rows, columns, values)
+
+    _assert_matches_data2matrix(result, rows, columns, values)
+    # 60 rows and 480 columns fit after a handful of capacity doublings.
+    assert len(reallocations) <= 6
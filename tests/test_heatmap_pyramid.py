@@ -0,0 +1,309 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from qplot.tools import worker as worker_module
+from qplot.tools.heatmap_pyramid import (
+    HeatmapPyramid,
+    HeatmapPyramidCache,
+    PyramidAxis,
+)
+from qplot.tools.worker import loader
+
+
+def _grid_groups(x_values, y_values, values):
+    columns, rows = np.meshgrid(x_values, y_values)
+    values = np.asarray(values, dtype=float)
+    return (
+        columns.ravel(),
+        rows.ravel(),
+        values.ravel(),
+        np.ones(values.size, dtype=np.int64),
+        values.ravel(),
+        values.ravel(),
+        )
+
+
+def _exact_pyramid(columns, rows, **kwargs):
+    x_values = np.arange(columns, dtype=float)
+    y_values = np.arange(rows, dtype=float)
+    values = x_values[None, :] + 1000 * y_values[:, None]
+    kwargs.setdefault("bounds", {"x": (0.0, columns - 1.0), "y": (0.0, rows - 1.0)})
+    kwargs.setdefault("unique_counts", (columns, rows))
+    return HeatmapPyramid.from_groups(
+        PyramidAxis(x_values),
+        PyramidAxis(y_values),
+        _grid_groups(x_values, y_values, values),
+        **kwargs,
+        )
+
+
+def test_levels_merge_aligned_blocks_into_mean_min_and_max():
+    pyramid = _exact_pyramid(5, 3)
+
+    sums, counts, minima, maxima = pyramid.level(1, 1)
+
+    np.testing.assert_array_equal(counts, [[4, 4, 2], [2, 2, 1]])
+    np.testing.assert_array_equal(minima, [[0.0, 2.0, 4.0], [2000.0, 2002.0, 2004.0]])
+    np.testing.assert_array_equal(maxima, [[1001.0, 1003.0, 1004.0], [2001.0, 2003.0, 2004.0]])
+    np.testing.assert_array_equal(sums[0, 0], 0.0 + 1.0 + 1000.0 + 1001.0)
+    np.testing.assert_array_equal(pyramid.x_axis.level_centres(1), [0.5, 2.5, 4.0])
+    assert pyramid.level(1, 1) is pyramid.level(1, 1)
+
+
+def test_view_picks_the_finest_level_that_fits_and_slices_the_visible_tile():
+    pyramid = _exact_pyramid(64, 64)
+
+    full = pyramid.view(pyramid.visible_cells(None), (16, 16))
+    assert full.level == (2, 2)
+    assert full.mean.shape == (16, 16)
+    assert full.mean[0, 0] == pytest.approx(1.5 + 1000 * 1.5)
+    assert full.minimum[0, 0] == 0.0
+    assert full.maximum[0, 0] == 3003.0
+
+    cells = pyramid.visible_cells({"x": (10.0, 19.0), "y": (20.0, 23.0)})
+    assert cells == ((10, 20), (20, 24))
+    zoomed = pyramid.view(cells, (16, 16))
+    assert zoomed.level == (0, 0)
+    np.testing.assert_array_equal(zoomed.x, np.arange(10.0, 20.0))
+    np.testing.assert_array_equal(zoomed.mean[0], np.arange(10.0, 20.0) + 20_000)
+    assert pyramid.source_rows(cells) == 40
+
+
+def test_x_and_y_levels_are_chosen_independently():
+    pyramid = _exact_pyramid(4, 1000)
+
+    view = pyramid.view(pyramid.visible_cells(None), (4, 100))
+
+    assert view.level == (0, 4)
+    assert view.mean.shape == (63, 4)
+
+
+def test_extension_adds_appended_groups_and_rejects_new_coordinates():
+    pyramid = _exact_pyramid(4, 4, result_count=16, last_rowid=16)
+    appended = (
+        np.array([1.0]),
+        np.array([2.0]),
+        np.array([10.0]),
+        np.array([1]),
+        np.array([10.0]),
+        np.array([10.0]),
+        )
+
+    extended = pyramid.extended(
+        appended,
+        bounds={"x": (1.0, 1.0), "y": (2.0, 2.0)},
+        result_count=17,
+        last_rowid=17,
+        )
+
+    assert extended is not None
+    assert extended.row_count == 17
+    assert extended.base[0][2, 1] == 2001.0 + 10.0
+    assert extended.base[2][2, 1] == 10.0
+    assert pyramid.row_count == 16
+    outside = (np.array([7.0]), *appended[1:])
+    assert pyramid.extended(
+        outside,
+        bounds={"x": (7.0, 7.0), "y": (2.0, 2.0)},
+        result_count=17,
+        last_rowid=17,
+        ) is None
+
+
+def test_binned_axes_only_extend_within_their_cells():
+    axis = PyramidAxis.binned(0.0, 99.0, 100, 8)
+
+    assert not axis.exact
+    assert axis.covers(-0.5, 99.4)
+    assert not axis.covers(-1.0, 50.0)
+    assert not axis.covers(0.0, 100.0)
+    np.testing.assert_array_equal(axis.indices([0, 7, 8, -1]), [0, 7, -1, -1])
+
+
+def test_cache_round_trips_pyramids_and_discards_corrupt_entries(tmp_path):
+    cache = HeatmapPyramidCache(tmp_path)
+    key = ("guid", "results", "signal", "x", "y", 16)
+    pyramid = _exact_pyramid(4, 4, key=key[:-1], result_count=16, last_rowid=16)
+
+    assert cache.store(key, pyramid)
+    loaded = cache.load(key)
+
+    assert loaded.key == key[:-1]
+    assert loaded.result_count == 16
+    assert loaded.bounds == pyramid.bounds
+    for stored, original in zip(loaded.base, pyramid.base, strict=True):
+        np.testing.assert_array_equal(stored, original)
+    assert cache.load((*key[:-1], 17)) is None
+
+    cache.path_for(key).write_bytes(b"not a pyramid")
+    assert cache.load(key) is None
+    assert not cache.path_for(key).exists()
+
+
+def _create_heatmap_table(database_path, rows):
+    conn = sqlite3.connect(database_path)
+    try:
+        conn.execute("CREATE TABLE IF NOT EXISTS results (x REAL, y REAL, signal REAL)")
+        conn.executemany("INSERT INTO results (x, y, signal) VALUES (?, ?, ?)", rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _grid_rows(columns, rows):
+    return [
+        (float(x), float(y), float(x + y * 100))
+        for y in range(rows)
+        for x in range(columns)
+        ]
+
+
+def _heatmap_worker(result_count, *, pyramid=None, cache=None, completed=True):
+    class Param:
+        def __init__(self, name):
+            self.name = name
+            self.depends_on_ = ("y", "x") if name == "signal" else ()
+
+    class Rundescriber:
+        shapes = None
+
+    class Cache:
+        rundescriber = Rundescriber()
+
+    worker = loader.__new__(loader)
+    worker.cache = Cache()
+    worker.dataset_guid = "run-guid"
+    worker.table_name = "results"
+    worker.param = Param("signal")
+    worker.param_dict = {"x": Param("x"), "y": Param("y"), "signal": worker.param}
+    worker.axes_dict = {"x": "x", "y": "y"}
+    worker.read_data = True
+    worker.heatmap_axis_ranges = None
+    worker.heatmap_full_axis_ranges = None
+    worker.loaded_result_count = result_count
+    worker.dataset_completed = completed
+    worker.heatmap_pyramid = pyramid
+    worker.heatmap_pyramid_cache = cache
+    return worker
+
+
+@pytest.fixture
+def heatmap_database(tmp_path, monkeypatch):
+    database_path = tmp_path / "heatmap.db"
+    monkeypatch.setattr(worker_module, "cache_database_path", lambda _cache: database_path)
+    monkeypatch.setattr(worker_module, "MAX_SQL_HEATMAP_SOURCE_ROWS", 60)
+    monkeypatch.setattr(worker_module, "MAX_SQL_HEATMAP_GRID_CELLS", 16)
+    monkeypatch.setattr(worker_module, "MAX_SQL_HEATMAP_GRID_SIDE", 4)
+    return database_path
+
+
+def _forbid_table_scans(worker):
+    def scan(*_args, **_kwargs):
+        raise AssertionError("the pyramid should answer without scanning rows")
+
+    worker._heatmap_pyramid_groups = scan
+    worker._selected_parameter_row_count = scan
+    worker._heatmap_spatial_summary = scan
+
+
+def test_zooming_a_large_heatmap_reuses_the_pyramid_without_scanning(heatmap_database):
+    _create_heatmap_table(heatmap_database, _grid_rows(40, 30))
+    first = _heatmap_worker(1200)
+    loader._load_large_heatmap_from_sql(first)
+    pyramid = first.heatmap_pyramid
+    assert pyramid is not None and pyramid.exact
+
+    zoomed = _heatmap_worker(1200, pyramid=pyramid)
+    zoomed.heatmap_axis_ranges = {"x": (10.0, 13.0), "y": (5.0, 7.0)}
+    zoomed.heatmap_full_axis_ranges = {"x": (0.0, 39.0), "y": (0.0, 29.0)}
+    _forbid_table_scans(zoomed)
+    loader._load_large_heatmap_from_sql(zoomed)
+    loader._canonicalize_heatmap(zoomed)
+
+    assert zoomed.heatmap_pyramid is pyramid
+    np.testing.assert_array_equal(zoomed.axis_data["x"], [10.0, 11.0, 12.0, 13.0])
+    np.testing.assert_array_equal(zoomed.axis_data["y"], [5.0, 6.0, 7.0])
+    np.testing.assert_array_equal(
+        zoomed.dataGrid,
+        [[510.0, 511.0, 512.0, 513.0],
+         [610.0, 611.0, 612.0, 613.0],
+         [710.0, 711.0, 712.0, 713.0]],
+        )
+    info = zoomed.heatmap_downsample_info
+    assert info["estimated_range_rows"] == 12
+    assert info["pyramid_level"] == (0, 0)
+    assert info["source_value_range"] == (510.0, 713.0)
+
+
+def test_completed_run_pyramids_are_loaded_from_the_disk_cache(heatmap_database, tmp_path):
+    _create_heatmap_table(heatmap_database, _grid_rows(40, 30))
+    cache = HeatmapPyramidCache(tmp_path / "pyramids")
+    first = _heatmap_worker(1200, cache=cache)
+    loader._load_large_heatmap_from_sql(first)
+    assert cache.path_for(("run-guid", "results", "signal", "x", "y", 1200)).exists()
+
+    reopened = _heatmap_worker(1200, cache=cache)
+    _forbid_table_scans(reopened)
+    loader._load_large_heatmap_from_sql(reopened)
+
+    np.testing.assert_array_equal(reopened.dataGrid, first.dataGrid)
+    assert reopened.heatmap_downsample_info["pyramid_level"] == (4, 3)
+
+
+def test_live_runs_extend_their_pyramid_with_appended_rows(heatmap_database, tmp_path):
+    cache = HeatmapPyramidCache(tmp_path / "pyramids")
+    _create_heatmap_table(heatmap_database, _grid_rows(40, 30)[:600])
+    first = _heatmap_worker(600, cache=cache, completed=False)
+    loader._load_large_heatmap_from_sql(first)
+    assert first.heatmap_pyramid.last_rowid == 600
+
+    # A second pass over the first sweep line lands on existing cells.
+    _create_heatmap_table(heatmap_database, [(float(x), 0.0, -1.0) for x in range(40)])
+    grouped = []
+    refreshed = _heatmap_worker(640, pyramid=first.heatmap_pyramid, cache=cache, completed=False)
+    original_groups = refreshed._heatmap_pyramid_groups
+
+    def record_groups(conn, x_axis, y_axis, where_sql, parameters):
+        grouped.append(tuple(parameters))
+        return original_groups(conn, x_axis, y_axis, where_sql, parameters)
+
+    refreshed._heatmap_pyramid_groups = record_groups
+    loader._load_large_heatmap_from_sql(refreshed)
+
+    assert grouped == [(600, 640)]
+    assert refreshed.heatmap_pyramid.row_count == 640
+    assert refreshed.heatmap_pyramid.result_count == 640
+    assert refreshed.heatmap_pyramid.base[2][0].tolist() == [-1.0] * 40
+    assert first.heatmap_pyramid.row_count == 600
+    assert not any(cache.directory.glob("*.npz"))
+
+
+def test_zooming_into_binned_cells_reads_the_few_rows_in_view(heatmap_database, monkeypatch):
+    monkeypatch.setattr(worker_module, "HEATMAP_PYRAMID_BASE_SIDE", 16)
+    monkeypatch.setattr(worker_module, "HEATMAP_PYRAMID_BASE_CELLS", 256)
+    _create_heatmap_table(heatmap_database, _grid_rows(40, 30))
+    first = _heatmap_worker(1200)
+    loader._load_large_heatmap_from_sql(first)
+    assert not first.heatmap_pyramid.exact
+
+    zoomed = _heatmap_worker(1200, pyramid=first.heatmap_pyramid)
+    zoomed.heatmap_axis_ranges = {"x": (10.0, 13.0), "y": (5.0, 7.0)}
+    loader._load_large_heatmap_from_sql(zoomed)
+
+    assert not zoomed.aggregated_heatmap_source
+    assert zoomed.loaded_point_count == 12
+
+
+def test_rows_at_new_coordinates_rebuild_the_pyramid(heatmap_database):
+    _create_heatmap_table(heatmap_database, _grid_rows(40, 30)[:600])
+    first = _heatmap_worker(600, completed=False)
+    loader._load_large_heatmap_from_sql(first)
+
+    _create_heatmap_table(heatmap_database, _grid_rows(40, 30)[600:])
+    refreshed = _heatmap_worker(1200, pyramid=first.heatmap_pyramid, completed=False)
+    loader._load_large_heatmap_from_sql(refreshed)
+
+    assert refreshed.heatmap_pyramid.y_axis.size == 30
+    assert refreshed.heatmap_pyramid.row_count == 1200
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from qplot.tools import line_envelope as envelope_module
+from qplot.tools.line_envelope import (
+    ENVELOPE_MIN_POINTS,
+    LineEnvelope,
+    line_envelope,
+)
+
+
+def _trace(size, rng):
+    x = np.linspace(0.0, 1.0, size)
+    y = rng.normal(size=size)
+    return x, y
+
+
+def test_envelope_keeps_every_pixel_columns_extremes():
+    rng = np.random.default_rng(1)
+    x, y = _trace(200_000, rng)
+    y[123_457] = 50.0
+    y[7] = -50.0
+    envelope = LineEnvelope(x, y)
+
+    shown_x, shown_y = envelope.query(None, 500)
+
+    assert shown_x.size <= 8 * 500
+    assert shown_y.max() == 50.0
+    assert shown_y.min() == -50.0
+    # Each drawn point is a real sample, drawn in sample order.
+    assert np.all(np.diff(shown_x) >= 0)
+    assert np.isin(shown_y, y).all()
+    # Every bin of the chosen level contributes its own minimum and maximum,
+    # and there are at least as many bins as pixel columns.
+    bins = shown_y.size // 2
+    assert bins >= 500
+    bin_size = -(-y.size // bins)
+    pairs = shown_y.reshape(bins, 2)
+    for index in range(bins):
+        samples = y[index * bin_size:(index + 1) * bin_size]
+        assert pairs[index].max() == samples.max()
+        assert pairs[index].min() == samples.min()
+
+
+def test_zooming_in_returns_raw_samples_of_the_visible_range():
+    x, y = _trace(100_000, np.random.default_rng(2))
+    envelope = LineEnvelope(x, y)
+
+    shown_x, shown_y = envelope.query((x[5_000], x[5_400]), 1_000)
+
+    np.testing.assert_array_equal(shown_x, x[4_999:5_402])
+    np.testing.assert_array_equal(shown_y, y[4_999:5_402])
+
+
+def test_decreasing_sweeps_are_clipped_to_the_view():
+    x, y = _trace(100_000, np.random.default_rng(3))
+    envelope = LineEnvelope(x[::-1], y)
+
+    assert envelope.visible_span((x[10], x[20])) == (
+        x.size - 21 - 1,
+        x.size - 10 + 1,
+        )
+
+
+def test_unsorted_traces_are_decimated_over_their_whole_length():
+    rng = np.random.default_rng(4)
+    x = rng.permutation(100_000).astype(float)
+    y = rng.normal(size=x.size)
+    envelope = LineEnvelope(x, y)
+
+    assert envelope.visible_span((10.0, 20.0)) == (0, x.size)
+    assert envelope.query((10.0, 20.0), 100)[1].max() == y.max()
+
+
+def test_nan_samples_are_not_chosen_as_extremes():
+    y = np.full(1_000, np.nan)
+    y[::10] = np.arange(100.0)
+    envelope = LineEnvelope(np.arange(y.size, dtype=float), y)
+
+    shown_y = envelope.query(None, 10)[1]
+
+    assert np.nanmax(shown_y) == 99.0
+    assert np.nanmin(shown_y) == 0.0
+
+
+def test_short_or_non_numeric_traces_have_no_envelope():
+    x, y = _trace(ENVELOPE_MIN_POINTS, np.random.default_rng(5))
+
+    assert line_envelope(x[:-1], y[:-1]) is None
+    assert line_envelope(x.astype(object), y) is None
+    assert isinstance(line_envelope(x, y), LineEnvelope)
+
+
+def test_mismatched_arrays_are_rejected():
+    with pytest.raises(ValueError):
+        LineEnvelope(np.arange(3.0), np.arange(4.0))
+
+
+def test_pyramid_levels_shrink_by_the_envelope_factor():
+    x, y = _trace(1_000, np.random.default_rng(6))
+    envelope = LineEnvelope(x, y)
+
+    sizes = [lows.size for lows, _highs in envelope.levels]
+    factor = envelope_module.ENVELOPE_FACTOR
+    assert sizes[0] == -(-x.size // factor)
+    assert sizes[-1] == 1
+    assert all(
+        later == -(-earlier // factor)
+        for earlier, later in zip(sizes[:-1], sizes[1:], strict=True)
+        )
@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from qplot.tools.operation_cache import OperationResultCache
+from qplot.tools.operation_registry import OperationCall
+from qplot.tools.worker import loader
+
+
+def _arrays(cells):
+    return np.arange(2.0), np.arange(3.0), np.zeros(cells)
+
+
+def test_longest_cached_prefix_is_returned():
+    cache = OperationResultCache()
+    cache.store("data", [("a",)], *_arrays(4))
+    cache.store("data", [("a",), ("b",)], *_arrays(5))
+
+    length, arrays = cache.longest_prefix("data", [("a",), ("b",), ("c",)])
+
+    assert length == 2
+    assert arrays[2].size == 5
+    assert cache.longest_prefix("data", [("b",)]) == (0, None)
+    assert cache.longest_prefix("other", [("a",)]) == (0, None)
+
+
+def test_cached_arrays_are_read_only():
+    cache = OperationResultCache()
+
+    x, _y, z = cache.store("data", [("a",)], *_arrays(4))
+
+    with pytest.raises(ValueError):
+        z[0] = 1.0
+    assert not x.flags.writeable
+
+
+def test_least_recently_used_outputs_are_evicted_by_size():
+    entry_bytes = sum(values.nbytes for values in _arrays(100))
+    cache = OperationResultCache(max_bytes=2 * entry_bytes)
+    cache.store("data", [("a",)], *_arrays(100))
+    cache.store("data", [("b",)], *_arrays(100))
+    cache.longest_prefix("data", [("a",)])
+
+    cache.store("data", [("c",)], *_arrays(100))
+    cache.store("data", [("huge",)], *_arrays(1_000))
+
+    assert len(cache) == 2
+    assert cache.total_bytes == 2 * entry_bytes
+    assert cache.longest_prefix("data", [("b",)]) == (0, None)
+    assert cache.longest_prefix("data", [("huge",)]) == (0, None)
+    assert cache.longest_prefix("data", [("a",)])[0] == 1
+
+
+def _worker(operations, operation_cache, result_count=10):
+    worker = loader.__new__(loader)
+    worker.cache = SimpleNamespace(_dataset=SimpleNamespace(path_to_db="run.db"))
+    worker.param = SimpleNamespace(name="signal")
+    worker.axes_dict = {"x": "gate", "y": "bias"}
+    worker.dataset_guid = "guid"
+    worker.loaded_result_count = result_count
+    worker.axis_data = {"x": np.array([0.0, 1.0]), "y": np.array([0.0, 1.0])}
+    worker.dataGrid = np.array([[1.0, 2.0], [3.0, 4.0]])
+    worker.operations = operations
+    worker.operation_cache = operation_cache
+    return worker
+
+
+def _counted(name, calls, offset):
+    def operation(data, cancelled_callback=None):
+        calls.append(name)
+        return {"z": data["z"] + offset}
+
+    return OperationCall(name, operation, cooperative=True, key=(name, offset))
+
+
+def test_unchanged_data_reuses_the_operated_output():
+    calls = []
+    cache = OperationResultCache()
+    add, subtract = _counted("add", calls, 1.0), _counted("subtract", calls, -3.0)
+
+    first = loader.do_operations(_worker([add, subtract], cache))
+    again = loader.do_operations(_worker([add, subtract], cache))
+
+    assert calls == ["add", "subtract"]
+    assert again[2] is first[2]
+    np.testing.assert_array_equal(again[2], [[-1.0, 0.0], [1.0, 2.0]])
+
+
+def test_extended_chain_runs_only_the_new_operations():
+    calls = []
+    cache = OperationResultCache()
+    add, subtract = _counted("add", calls, 1.0), _counted("subtract", calls, -3.0)
+    worker = _worker([add], cache)
+    loaded_grid = worker.dataGrid
+
+    loader.do_operations(worker)
+    _x, _y, data_grid = loader.do_operations(_worker([add, subtract], cache))
+
+    assert calls == ["add", "subtract"]
+    np.testing.assert_array_equal(data_grid, [[-1.0, 0.0], [1.0, 2.0]])
+    assert loaded_grid.flags.writeable
+    assert worker.axis_data["x"].flags.writeable
+
+
+def test_new_rows_or_unkeyed_operations_are_not_served_from_the_cache():
+    calls = []
+    cache = OperationResultCache()
+    add = _counted("add", calls, 1.0)
+
+    loader.do_operations(_worker([add], cache))
+    loader.do_operations(_worker([add], cache, result_count=11))
+    unkeyed = OperationCall("add", add.func, cooperative=True)
+    loader.do_operations(_worker([unkeyed], cache))
+    loader.do_operations(_worker([unkeyed], cache))
+
+    assert calls == ["add"] * 4
+    assert len(cache) == 2
@@ -0,0 +1,91 @@
+import gc
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from qplot.tools.shared_arrays import SharedArrayStore
+from qplot.tools.worker import loader
+
+
+def test_published_arrays_are_read_only_and_reused():
+    store = SharedArrayStore()
+    grid = np.zeros((2, 3))
+
+    arrays, names = store.publish("data", {"z": grid}, {"x": "gate"})
+    again, again_names = store.publish("data", {"z": np.ones((2, 3))})
+
+    assert again["z"] is grid
+    assert names == again_names == {"x": "gate"}
+    assert store.get("data") == (arrays, names)
+    with pytest.raises(ValueError):
+        arrays["z"][0, 0] = 1.0
+
+
+def test_entries_disappear_with_their_last_user():
+    store = SharedArrayStore()
+    arrays, _names = store.publish("data", {"z": np.zeros((4, 4))})
+    view = arrays["z"][1:3]
+    del arrays
+    gc.collect()
+
+    assert store.get("data")[0]["z"].base is None
+    del view
+    gc.collect()
+
+    assert store.get("data") == (None, None)
+    assert len(store) == 0
+
+
+class _Param:
+    def __init__(self, name, depends_on=()):
+        self.name = name
+        self.depends_on_ = depends_on
+
+
+def _worker(store, result_count=10):
+    worker = loader.__new__(loader)
+    worker.cache = SimpleNamespace(_dataset=SimpleNamespace(path_to_db="run.db"))
+    worker.param = _Param("signal", ("gate", "bias"))
+    worker.param_dict = {
+        "gate": _Param("gate"),
+        "bias": _Param("bias"),
+        "signal": worker.param,
+        }
+    worker.axes_dict = {"x": "gate", "y": "bias"}
+    worker.dataset_guid = "guid"
+    worker.loaded_result_count = result_count
+    worker.heatmap_grid = None
+    worker.array_store = store
+    return worker
+
+
+def _scan():
+    gate, bias = np.meshgrid(np.arange(3.0), np.arange(2.0))
+    return {
+        "gate": gate.ravel(),
+        "bias": bias.ravel(),
+        "signal": (gate + 10 * bias).ravel(),
+        }
+
+
+def test_windows_of_the_same_data_share_one_grid(monkeypatch):
+    store = SharedArrayStore()
+    built = []
+    build = loader._build_plot_arrays
+
+    def counted_build(self, data, depvar):
+        built.append(True)
+        return build(self, data, depvar)
+
+    monkeypatch.setattr(loader, "_build_plot_arrays", counted_build)
+
+    first_axes, first_params, first_grid = _worker(store)._shared_plot_arrays(_scan())
+    axes, params, grid = _worker(store)._shared_plot_arrays(_scan())
+    _worker(store, result_count=11)._shared_plot_arrays(_scan())
+
+    assert len(built) == 2
+    assert grid is first_grid
+    assert axes["x"] is first_axes["x"]
+    assert params["x"].name == "gate"
+    np.testing.assert_array_equal(grid, [[0.0, 1.0, 2.0], [10.0, 11.0, 12.0]])
@@ -6,16 +6,19 @@ from time import perf_counter
 from unittest.mock import patch
 
 import numpy as np
+import pandas as pd
 
 import qplot.tools.worker as worker_module
 from qplot.configuration.scripts import try_as_num
 from qplot.tools.general import data2matrix
 from qplot.tools.heatmap_geometry import HeatmapGeometry
-from qplot.tools.operation_registry import OperationCall
+from qplot.tools.heatmap_grid import IncrementalHeatmapGrid
+from qplot.tools.operation_registry import OperationCall, plan_operations
 from qplot.tools.plot_tools import (
     differentiate,
     fill_heatmap,
     pass_filter,
+    pass_filter_kernel,
     subtract_mean,
 )
 from qplot.tools.worker import OperationExecutionError, PlotWorkCancelled, loader
@@ -23,6 +26,31 @@ from qplot.windows._dataset_handle import DatasetHandle, DatasetKey
 from qplot.windows._plotWin import plotWidget
 
 
+def _looped_fill_heatmap(which, data, max_depth):
+    """The line-by-line gap filling that fill_heatmap replaced."""
+    data = data.copy()
+    if which == "below":
+        lines = (data[:, column] for column in range(data.shape[1]))
+    else:
+        lines = (data[row, :] for row in range(data.shape[0]))
+    if max_depth <= 0:
+        return data
+
+    for line in lines:
+        position = 0
+        while position < len(line):
+            if not np.isnan(line[position]):
+                position += 1
+                continue
+            gap_start = position
+            while position < len(line) and np.isnan(line[position]):
+                position += 1
+            bounded = gap_start > 0 and position < len(line)
+            if bounded and position - gap_start <= max_depth:
+                line[gap_start:position] = line[gap_start - 1]
+    return data
+
+
 class ToolFunctionTestCase(unittest.TestCase):
     def test_cancel_interrupts_plot_worker_while_loading_database(self):
         started = threading.Event()
@@ -57,7 +85,7 @@ class ToolFunctionTestCase(unittest.TestCase):
                 patch.object(worker_module, "cache_is_live", return_value=False),
                 patch.object(
                     worker_module,
-                    "qcodes_read_only_connection",
+                    "pooled_qcodes_read_only_connection",
                     return_value=connection,
                     ),
                 patch.object(
@@ -178,6 +206,68 @@ class ToolFunctionTestCase(unittest.TestCase):
         self.assertEqual(matrix.loc[0, 0], 10)
         self.assertEqual(matrix.loc[1, 1], 13)
 
+    def test_data2matrix_matches_pandas_pivot_table_semantics(self):
+        rng = np.random.default_rng(5)
+        indep1 = rng.integers(0, 5, 200).astype(float)
+        indep2 = rng.integers(0, 7, 200).astype(float)
+        depvar = rng.normal(size=200)
+        indep1[::17] = np.nan
+        indep2[::19] = np.nan
+        depvar[::3] = np.nan
+        depvar[5] = np.inf
+        # A cell whose only value is NaN drops its row and column entirely.
+        indep1[:2] = 9.0
+        indep2[:2] = 11.0
+        depvar[:2] = np.nan
+
+        matrix = data2matrix(indep1, indep2, depvar)
+        expected = pd.DataFrame({
+            "indep1": indep1,
+            "indep2": indep2,
+            "depvar": depvar,
+            }).pivot_table(
+                index="indep1",
+                columns="indep2",
+                values="depvar",
+                fill_value=np.nan,
+                )
+
+        pd.testing.assert_frame_equal(matrix, expected, rtol=1e-12)
+        self.assertNotIn(9.0, matrix.index)
+        self.assertNotIn(11.0, matrix.columns)
+
+    def test_unshaped_2d_loader_reuses_the_plot_heatmap_grid(self):
+        worker = loader.__new__(loader)
+        worker.axes_dict = {"x": "fast", "y": "slow"}
+        worker.table_name = "results_1"
+        worker.param = type("Param", (), {"name": "signal"})()
+        worker.param_dict = {
+            "slow": type("Param", (), {"name": "slow"})(),
+            "fast": type("Param", (), {"name": "fast"})(),
+            }
+        worker.heatmap_grid = IncrementalHeatmapGrid()
+        data = {
+            "slow": np.array([0.0, 0.0, 1.0, 1.0]),
+            "fast": np.array([0.0, 1.0, 0.0, 1.0]),
+            }
+        signal = np.array([10.0, 11.0, 12.0, 13.0])
+
+        worker.for_incremental_unshaped_2d(
+            {name: values[:2] for name, values in data.items()},
+            signal[:2],
+            )
+        self.assertTrue(worker._can_update_heatmap_grid(data, signal))
+        axis_data, axis_param, data_grid = worker.for_incremental_unshaped_2d(
+            data,
+            signal,
+            )
+
+        self.assertEqual(worker.heatmap_grid.point_count, 4)
+        np.testing.assert_array_equal(axis_data["x"], [0.0, 1.0])
+        np.testing.assert_array_equal(axis_data["y"], [0.0, 1.0])
+        np.testing.assert_array_equal(data_grid, [[10.0, 11.0], [12.0, 13.0]])
+        self.assertIs(axis_param["y"], worker.param_dict["slow"])
+
     def test_shaped_2d_loader_handles_sparse_live_grids(self):
         worker = loader.__new__(loader)
         worker.axes_dict = {"x": "fast", "y": "slow"}
@@ -506,23 +596,25 @@ class ToolFunctionTestCase(unittest.TestCase):
             )
         self.assertEqual(forward_info["source_grid_columns"], 40)
         self.assertEqual(forward_info["source_grid_rows"], 30)
+        # Pyramid cells merge aligned blocks of 16 columns and 8 rows; the
+        # last block along each axis holds the remaining setpoints.
+        np.testing.assert_array_equal(forward_x, [7.5, 23.5, 35.5])
+        np.testing.assert_array_equal(forward_y, [3.5, 11.5, 19.5, 26.5])
         np.testing.assert_array_equal(
             forward_grid,
-            [[304.5, 314.5, 324.5, 334.5],
-             [1054.5, 1064.5, 1074.5, 1084.5],
-             [1804.5, 1814.5, 1824.5, 1834.5],
-             [2554.5, 2564.5, 2574.5, 2584.5]],
+            [[357.5, 373.5, 385.5],
+             [1157.5, 1173.5, 1185.5],
+             [1957.5, 1973.5, 1985.5],
+             [2657.5, 2673.5, 2685.5]],
             )
+        self.assertEqual(forward_info["pyramid_level"], (4, 3))
+        self.assertEqual(forward_info["source_value_range"], (0.0, 2939.0))
 
         geometry = HeatmapGeometry.from_centres(forward_x, forward_y)
-        np.testing.assert_allclose(
-            [geometry.x.edges[0], geometry.x.edges[-1]],
-            [-0.5, 39.5],
-            )
-        np.testing.assert_allclose(
-            [geometry.y.edges[0], geometry.y.edges[-1]],
-            [-0.5, 29.5],
-            )
+        self.assertEqual(geometry.x.edges[0], -0.5)
+        self.assertEqual(geometry.y.edges[0], -0.5)
+        self.assertGreaterEqual(geometry.x.edges[-1], 39.5)
+        self.assertGreaterEqual(geometry.y.edges[-1], 29.5)
 
     def test_small_heatmap_sql_loader_preserves_exact_grid(self):
         rows = [
@@ -822,6 +914,37 @@ class ToolFunctionTestCase(unittest.TestCase):
             ]),
         )
 
+    def test_fill_heatmap_matches_the_line_by_line_fill(self):
+        rng = np.random.default_rng(17)
+        for _ in range(200):
+            shape = tuple(rng.integers(1, 40, size=2))
+            data_grid = rng.normal(size=shape)
+            data_grid[rng.random(shape) < rng.random()] = np.nan
+            max_depth = int(rng.integers(-1, 12))
+            for which in ("below", "right"):
+                with self.subTest(shape=shape, which=which, max_depth=max_depth):
+                    np.testing.assert_array_equal(
+                        fill_heatmap(which, {"z": data_grid}, max_depth=max_depth)["z"],
+                        _looped_fill_heatmap(which, data_grid, max_depth),
+                    )
+
+    def test_fill_heatmap_checks_cancellation_between_blocks(self):
+        data_grid = np.full((64, 64), np.nan)
+        data_grid[:, (0, -1)] = 1.0
+        checks = []
+
+        with patch("qplot.tools.plot_tools.FILL_BLOCK_CELLS", 64 * 8):
+            result = fill_heatmap(
+                "right",
+                {"z": data_grid},
+                max_depth=64,
+                cancelled_callback=lambda: checks.append(True) and False,
+                )
+
+        np.testing.assert_array_equal(result["z"], np.ones((64, 64)))
+        self.assertTrue(np.isnan(data_grid[:, 1:-1]).all())
+        self.assertEqual(len(checks), 10)
+
     def test_worker_operation_pipeline_fails_atomically(self):
         def failing_operation(_data):
             raise ValueError("bad operation")
@@ -842,6 +965,67 @@ class ToolFunctionTestCase(unittest.TestCase):
         np.testing.assert_array_equal(worker.axis_data["x"], [1.0, 2.0])
         np.testing.assert_array_equal(worker.axis_data["y"], [3.0, 4.0])
 
+    def test_operation_pipeline_reuses_its_own_buffers_without_touching_inputs(self):
+        calls = []
+
+        def subtract(data, cancelled_callback=None, in_place=False):
+            calls.append(("subtract", in_place))
+            return subtract_mean(
+                "x", data, cancelled_callback=cancelled_callback, in_place=in_place
+                )
+
+        def fill(data, cancelled_callback=None, in_place=False):
+            calls.append(("fill", in_place))
+            return fill_heatmap(
+                "right", data, 1, cancelled_callback=cancelled_callback, in_place=in_place
+                )
+
+        worker = loader.__new__(loader)
+        worker.axis_data = {"x": np.array([0.0, 1.0, 2.0]), "y": np.array([0.0, 1.0])}
+        worker.dataGrid = np.array([[1.0, np.nan, 5.0], [2.0, 4.0, 9.0]])
+        loaded = worker.dataGrid.copy()
+        worker.operations = [
+            OperationCall("subtract", subtract, cooperative=True, in_place=True),
+            OperationCall(
+                "max", None, elementwise=pass_filter_kernel("low", 2.0)
+                ),
+            OperationCall(
+                "min", None, elementwise=pass_filter_kernel("high", -2.0)
+                ),
+            OperationCall("fill", fill, cooperative=True, in_place=True),
+            ]
+
+        x, y, data_grid = loader.do_operations(worker)
+
+        self.assertEqual(calls, [("subtract", False), ("fill", True)])
+        np.testing.assert_array_equal(data_grid, [[-2.0, -2.0, 2.0], [-2.0, -1.0, 2.0]])
+        np.testing.assert_array_equal(worker.dataGrid, loaded)
+        self.assertIs(x, worker.axis_data["x"])
+        self.assertIs(y, worker.axis_data["y"])
+
+    def test_one_argument_operations_receive_private_copies(self):
+        def scale(data):
+            data["z"] *= 2
+            return {"z": data["z"]}
+
+        worker = loader.__new__(loader)
+        worker.axis_data = {"x": np.array([0.0, 1.0]), "y": np.array([0.0])}
+        worker.dataGrid = np.array([[1.0, 2.0]])
+        worker.operations = [scale, scale]
+
+        _x, _y, data_grid = loader.do_operations(worker)
+
+        np.testing.assert_array_equal(data_grid, [[4.0, 8.0]])
+        np.testing.assert_array_equal(worker.dataGrid, [[1.0, 2.0]])
+
+    def test_consecutive_elementwise_operations_share_one_plan_step(self):
+        clip = OperationCall("clip", None, elementwise=pass_filter_kernel("low", 1.0))
+        gradient = OperationCall("gradient", None)
+
+        steps = plan_operations([clip, clip, gradient, clip, print])
+
+        self.assertEqual([len(step) for step in steps], [2, 1, 1, 1])
+
     def test_large_heatmap_with_operations_is_rejected_before_full_load(self):
         worker = self._sql_heatmap_worker(None)
         worker.max_full_heatmap_points = 10
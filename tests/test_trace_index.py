@@ -0,0 +1,80 @@
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from qplot.tools.trace_index import TraceIndex
+
+
+def _scan(x, y, cursor_x, cursor_y, x_scale, y_scale):
+    finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    distances = (
+        np.square((x[finite] - cursor_x) * x_scale)
+        + np.square((y[finite] - cursor_y) * y_scale)
+        )
+    index = int(np.argmin(distances))
+    return int(finite[index]), float(distances[index])
+
+
+@pytest.mark.parametrize("shape", ["increasing", "decreasing", "unsorted", "repeated"])
+def test_nearest_sample_matches_a_full_scan(shape):
+    rng = np.random.default_rng(4)
+    x = rng.normal(size=5_000)
+    if shape == "increasing":
+        x.sort()
+    elif shape == "decreasing":
+        x = np.sort(x)[::-1].copy()
+    elif shape == "repeated":
+        x = np.round(x, 1)
+    y = rng.normal(size=x.size)
+    x[rng.integers(0, x.size, size=200)] = np.nan
+    y[rng.integers(0, x.size, size=200)] = np.inf
+    index = TraceIndex(x, y)
+
+    for cursor_x, cursor_y, x_scale, y_scale in zip(
+            rng.normal(scale=3.0, size=50),
+            rng.normal(scale=3.0, size=50),
+            10 ** rng.uniform(-3, 3, size=50),
+            10 ** rng.uniform(-3, 3, size=50),
+            strict=True,
+            ):
+        sample, distance = index.nearest(cursor_x, cursor_y, x_scale, y_scale)
+        expected_sample, expected_distance = _scan(x, y, cursor_x, cursor_y, x_scale, y_scale)
+        assert sample == expected_sample
+        assert distance == pytest.approx(expected_distance)
+
+
+def test_equally_near_samples_resolve_to_the_first():
+    index = TraceIndex([2.0, 1.0, 1.0, 0.0], [0.0, 5.0, 5.0, 0.0])
+
+    assert index.nearest(1.0, 5.0) == (1, 0.0)
+
+
+def test_traces_without_finite_samples_have_no_nearest_sample():
+    assert TraceIndex([], []).nearest(0.0, 0.0) is None
+    assert TraceIndex([np.nan], [1.0]).nearest(0.0, 0.0) is None
+
+
+def test_index_knows_its_source_arrays():
+    x = np.arange(3.0)
+    y = np.arange(3.0)
+    index = TraceIndex(x, y)
+
+    assert index.matches(x, y)
+    assert not index.matches(x.copy(), y)
+
+
+def test_lookup_time_does_not_grow_with_trace_length():
+    rng = np.random.default_rng(5)
+    x = np.linspace(0.0, 1.0, 5_000_000)
+    y = np.sin(50.0 * x) + rng.normal(scale=0.1, size=x.size)
+    index = TraceIndex(x, y)
+
+    elapsed = []
+    for cursor_x, cursor_y in zip(rng.uniform(size=50), rng.uniform(-2, 2, size=50), strict=True):
+        started = perf_counter()
+        index.nearest(cursor_x, cursor_y, 1_000.0, 300.0)
+        elapsed.append(perf_counter() - started)
+
+    # Typically a fraction of a millisecond; a full scan takes about 50 ms.
+    assert np.median(elapsed) < 0.01
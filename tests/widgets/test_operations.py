@@ -111,3 +111,27 @@ class OperationsPanelTestCase(unittest.TestCase):
             np.testing.assert_array_equal(result["y"], [5.0, 10.0])
         finally:
             main.deleteLater()
+
+    def test_operations_carry_in_place_and_elementwise_metadata(self):
+        main, widget = self._panel(operations_options_2d)
+        try:
+            for name in ("Limit Minimum", "Subtract Row Mean", "Fill Right"):
+                self._option(widget, name).input.setChecked(True)
+            self._option(widget, "Limit Minimum").operation_row.input.setText("2")
+
+            limit, subtract, fill = widget.get_data()
+
+            self.assertFalse(limit.in_place)
+            self.assertEqual(limit.key, ("Limit Minimum", 2.0))
+            self.assertEqual(subtract.key, ("Subtract Row Mean", None))
+            values = np.array([1.0, 3.0])
+            limit.elementwise(values, values)
+            np.testing.assert_array_equal(values, [2.0, 3.0])
+            self.assertTrue(subtract.in_place)
+            self.assertIsNone(subtract.elementwise)
+            grid = np.array([[1.0, np.nan, 3.0]])
+            result = fill.execute({"z": grid}, lambda: False, in_place=True)
+            self.assertIs(result["z"], grid)
+            np.testing.assert_array_equal(grid, [[1.0, 1.0, 3.0]])
+        finally:
+            main.deleteLater()
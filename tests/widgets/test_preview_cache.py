@@ -0,0 +1,207 @@
+import os
+import sqlite3
+
+import numpy as np
+from PyQt6 import QtGui
+
+from qplot.windows._widgets import preview as preview_module
+from qplot.windows._widgets.preview import PreviewTab, PreviewWorker
+from qplot.windows._widgets.preview_cache import PreviewDiskCache
+
+RUN_DESCRIPTION = """
+{
+  "interdependencies_": {
+    "dependencies": {
+      "signal_1d": ["x"],
+      "signal_2d": ["x", "y"]
+    }
+  }
+}
+"""
+
+
+def _metadata(**overrides):
+    metadata = {
+        "guid": "run-guid",
+        "run_id": 7,
+        "result_table_name": "results",
+        "result_count": 4,
+        "completed_timestamp": 1700000000.0,
+        "is_completed": True,
+        "measure_parameters": ["signal_1d", "signal_2d"],
+        "sweep_parameters": ["x", "y"],
+        "run_description": RUN_DESCRIPTION,
+        }
+    metadata.update(overrides)
+    return metadata
+
+
+def _database(tmp_path):
+    database_path = os.path.join(tmp_path, "previews.db")
+    conn = sqlite3.connect(database_path)
+    try:
+        conn.execute("CREATE TABLE results (x REAL, y REAL, signal_1d REAL, signal_2d REAL)")
+        conn.executemany(
+            "INSERT INTO results VALUES (?, ?, ?, ?)",
+            [
+                (0.0, 0.0, 1.0, 1.0),
+                (1.0, 0.0, 2.0, 2.0),
+                (0.0, 1.0, 3.0, 3.0),
+                (1.0, 1.0, 4.0, 4.0),
+                ],
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    return database_path
+
+
+def _image(color):
+    image = QtGui.QImage(8, 8, QtGui.QImage.Format.Format_RGB32)
+    image.fill(QtGui.QColor(color))
+    return image
+
+
+def _signature(metadata):
+    return preview_module._metadata_signature(metadata)
+
+
+def test_completed_run_previews_round_trip_with_images_and_grids(tmp_path):
+    cache = PreviewDiskCache(tmp_path)
+    metadata = _metadata()
+    grid = np.arange(6, dtype=float).reshape(2, 3)
+    previews = [
+        {"parameter": "a", "axes": ["x"], "title": "a vs x", "image": _image("red")},
+        {
+            "parameter": "b",
+            "axes": ["x", "y"],
+            "title": "b vs x and y",
+            "image": _image("blue"),
+            "grid": grid,
+            },
+        {"parameter": "c", "axes": ["x", "y", "z"], "title": "c", "unsupported": True},
+        ]
+
+    assert cache.store("run-guid", metadata, 100, _signature(metadata), previews)
+    loaded = cache.load("run-guid", metadata, 100, _signature(metadata))
+
+    assert [preview["parameter"] for preview in loaded] == ["a", "b", "c"]
+    assert loaded[0]["image"].pixelColor(4, 4) == QtGui.QColor("red")
+    assert loaded[1]["image"].pixelColor(4, 4) == QtGui.QColor("blue")
+    np.testing.assert_array_equal(loaded[1]["grid"], grid)
+    assert not loaded[1]["grid"].flags.writeable
+    assert loaded[2]["unsupported"] is True
+    assert "image" not in loaded[2]
+
+
+def test_entries_are_keyed_by_count_completion_and_size(tmp_path):
+    cache = PreviewDiskCache(tmp_path)
+    metadata = _metadata()
+    cache.store("run-guid", metadata, 100, _signature(metadata), [{"image": _image("red")}])
+
+    grown = _metadata(result_count=5)
+    assert cache.load("run-guid", metadata, 120, _signature(metadata)) is None
+    assert cache.load("run-guid", grown, 100, _signature(grown)) is None
+    assert cache.load("other-guid", metadata, 100, _signature(metadata)) is None
+    assert cache.load("run-guid", metadata, 100, _signature(metadata)) is not None
+
+
+def test_live_runs_are_not_written(tmp_path):
+    cache = PreviewDiskCache(tmp_path)
+    metadata = _metadata(completed_timestamp=None, is_completed=False)
+
+    assert not cache.store(
+        "run-guid",
+        metadata,
+        100,
+        _signature(metadata),
+        [{"image": _image("red")}],
+        )
+    assert not tmp_path.exists() or not any(tmp_path.iterdir())
+
+
+def test_signature_mismatch_and_corrupt_entries_are_discarded(tmp_path):
+    cache = PreviewDiskCache(tmp_path)
+    metadata = _metadata()
+    cache.store("run-guid", metadata, 100, _signature(metadata), [{"image": _image("red")}])
+    path = cache.path_for("run-guid", metadata, 100)
+
+    changed = _signature({**metadata, "setpoint_shape": [2, 2]})
+    assert cache.load("run-guid", metadata, 100, changed) is None
+    assert not path.exists()
+
+    cache.store("run-guid", metadata, 100, _signature(metadata), [{"image": _image("red")}])
+    path.write_bytes(b"not a preview cache entry")
+    assert cache.load("run-guid", metadata, 100, _signature(metadata)) is None
+    assert not path.exists()
+
+
+def test_least_recently_used_entries_are_evicted_by_size(tmp_path):
+    image = QtGui.QImage(64, 64, QtGui.QImage.Format.Format_RGB32)
+    for row in range(64):
+        for column in range(64):
+            image.setPixel(column, row, (row * 7919 + column * 104729) & 0xFFFFFF)
+    metadata = {guid: _metadata(guid=guid) for guid in ("a", "b", "c")}
+    probe = PreviewDiskCache(tmp_path / "probe")
+    probe.store("a", metadata["a"], 100, _signature(metadata["a"]), [{"image": image}])
+    entry_size = probe.path_for("a", metadata["a"], 100).stat().st_size
+
+    cache = PreviewDiskCache(tmp_path / "cache", max_bytes=int(entry_size * 2.5))
+    for guid in ("a", "b"):
+        cache.store(guid, metadata[guid], 100, _signature(metadata[guid]), [{"image": image}])
+    os.utime(cache.path_for("a", metadata["a"], 100), (1, 1))
+    os.utime(cache.path_for("b", metadata["b"], 100), (2, 2))
+    assert cache.load("a", metadata["a"], 100, _signature(metadata["a"])) is not None
+
+    cache.store("c", metadata["c"], 100, _signature(metadata["c"]), [{"image": image}])
+
+    assert cache.path_for("a", metadata["a"], 100).exists()
+    assert not cache.path_for("b", metadata["b"], 100).exists()
+    assert cache.path_for("c", metadata["c"], 100).exists()
+
+
+def test_worker_stores_generated_previews_for_the_next_session(tmp_path):
+    database_path = _database(tmp_path)
+    cache = PreviewDiskCache(tmp_path / "cache")
+    metadata = _metadata()
+    worker = PreviewWorker(1, database_path, "run-guid", metadata, 60, disk_cache=cache)
+    finished = []
+    worker.signals.finished.connect(lambda *args: finished.append(args))
+
+    worker.run()
+
+    generated = finished[0][2]
+    assert [preview["parameter"] for preview in generated] == ["signal_1d", "signal_2d"]
+    assert "grid" in generated[1]
+
+    reopened = PreviewTab(preview_size=60, disk_cache=cache)
+    ready = []
+    reopened.previewsReady.connect(lambda guid, previews: ready.append((guid, previews)))
+    reopened.set_database_runs(database_path, {7: metadata})
+    reopened._start_worker = lambda guid: (_ for _ in ()).throw(AssertionError(guid))
+
+    reopened.prioritize_runs(visible_run_ids=[7])
+
+    assert reopened.queue == {}
+    assert [guid for guid, _previews in ready] == ["run-guid"]
+    loaded = ready[0][1]
+    assert [preview["title"] for preview in loaded] == [
+        preview["title"] for preview in generated
+        ]
+    assert loaded[1]["image"] == generated[1]["image"]
+    np.testing.assert_array_equal(loaded[1]["grid"], generated[1]["grid"])
+    assert "run-guid" in reopened.cache
+    reopened.deleteLater()
+
+
+def test_preview_tab_queues_runs_the_disk_cache_cannot_serve(tmp_path):
+    cache = PreviewDiskCache(tmp_path)
+    live = _metadata(guid="live-guid", completed_timestamp=None, is_completed=False)
+    preview = PreviewTab(preview_size=60, disk_cache=cache)
+    preview.set_database_runs("previews.db", {7: live})
+    preview._start_next = lambda: None
+
+    preview.prioritize_runs(visible_run_ids=[7])
+
+    assert preview.queue == {"live-guid": preview_module.PREVIEW_VISIBLE_PRIORITY}
+    preview.deleteLater()
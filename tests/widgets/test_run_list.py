@@ -893,12 +893,12 @@ class RunListTooltipTestCase(unittest.TestCase):
                 })
             item = run_list.topLevelItem(0)
 
-            self.assertIs(run_list._item_for_guid("indexed-guid"), item)
+            self.assertEqual(run_list._item_for_guid("indexed-guid"), item)
 
             run_list.clear()
 
             self.assertIsNone(run_list._item_for_guid("indexed-guid"))
-            self.assertEqual(run_list._items_by_guid, {})
+            self.assertEqual(run_list.topLevelItemCount(), 0)
         finally:
             treeWidgets.isfile = old_isfile
 
@@ -993,7 +993,10 @@ class RunListTooltipTestCase(unittest.TestCase):
                 })
 
             self.assertEqual(
-                [run_list.headerItem().text(col) for col in range(run_list.columnCount())],
+                [
+                    run_list.model().headerData(col, QtCore.Qt.Orientation.Horizontal)
+                    for col in range(run_list.columnCount())
+                    ],
                 [
                     "ID",
                     "Experiment",
@@ -1181,7 +1184,7 @@ class RunListTooltipTestCase(unittest.TestCase):
                 })
 
             self.assertEqual(run_list.topLevelItemCount(), 1)
-            self.assertIs(run_list.topLevelItem(0), item)
+            self.assertEqual(run_list.topLevelItem(0), item)
             self.assertEqual(updated[1]["result_count"], 10)
             self.assertEqual(item.text(run_list.cols.index("Setpoints")), "10")
             self.assertEqual(item.text(run_list.cols.index("Status")), "Completed")
@@ -1579,7 +1582,7 @@ class RunListTooltipTestCase(unittest.TestCase):
             qtw.QApplication.sendEvent(images[0], event)
 
             self.assertEqual(requested, [("run-guid", "signal")])
-            self.assertIs(run_list.currentItem(), item)
+            self.assertEqual(run_list.currentItem(), item)
 
             export_requested = []
             run_list.previewExportRequested.connect(
@@ -1588,7 +1591,7 @@ class RunListTooltipTestCase(unittest.TestCase):
             images[0].exportRequested.emit("signal")
 
             self.assertEqual(export_requested, [("run-guid", "signal")])
-            self.assertIs(run_list.currentItem(), item)
+            self.assertEqual(run_list.currentItem(), item)
 
             run_list.set_run_previews("run-guid", [{
                 "parameter": "signal",
@@ -1716,7 +1719,8 @@ class RunListTooltipTestCase(unittest.TestCase):
             metrics = QtGui.QFontMetrics(run_list.font())
 
             first_width = delegate._max_right_width(index, metrics)
-            item.setText(column, "100 = 1000000 × 1000000")
+            item.run_metadata["setpoint_shape"] = [1000000, 1000000]
+            run_list.model().refresh_row(item.row)
             cached_width = delegate._max_right_width(index, metrics)
             delegate.invalidate_width_cache()
             refreshed_width = delegate._max_right_width(index, metrics)
@@ -0,0 +1,218 @@
+import os
+from datetime import datetime
+from time import perf_counter
+
+import numpy as np
+import pytest
+from PyQt6 import QtCore
+from PyQt6 import QtWidgets as qtw
+
+from qplot.datahandling.run_catalog import RUN_CATALOG_MAX_FILES, RunCatalog
+from qplot.windows._widgets import treeWidgets
+from qplot.windows._widgets.run_search import RunSearchError, RunSearchIndex
+
+
+def _run(run_id, **metadata):
+    return {
+        "run_timestamp": datetime(2026, 5, run_id).timestamp(),
+        "completed_timestamp": datetime(2026, 5, run_id, 1).timestamp(),
+        "is_completed": True,
+        "guid": f"guid-{run_id}",
+        "exp_name": "cooldown",
+        "sample_name": "chip_A",
+        "name": "sweep",
+        "sweep_parameters": ["dac_ch1"],
+        "measure_parameters": ["lockin_x"],
+        **metadata,
+        }
+
+
+RUNS = {
+    1: _run(1, name="pinch off", storage_bytes=512),
+    2: _run(2, name="Coulomb diamonds", storage_bytes=20 * 1024**2),
+    3: _run(
+        3,
+        exp_name="warmup",
+        measure_parameters=["current"],
+        measurement_exception="Traceback",
+        storage_bytes=3 * 1024,
+        ),
+    4: _run(
+        4,
+        sample_name="chip_B",
+        is_completed=False,
+        completed_timestamp=None,
+        ),
+    }
+
+
+def _indexed(runs=RUNS):
+    index = RunSearchIndex()
+    index.set_runs(0, list(runs), list(runs.values()))
+    return index
+
+
+def _matches(index, query):
+    mask = index.search(query)
+    return None if mask is None else [row + 1 for row in np.flatnonzero(mask)]
+
+
+@pytest.mark.parametrize(("query", "run_ids"), [
+    ("", None),
+    ("   ", None),
+    ("co", [1, 2, 4]),
+    ("coul DIA", [2]),
+    ("chip", [1, 2, 3, 4]),
+    ("chip_b", [4]),
+    ("param:curr", [3]),
+    ("name:cool", []),
+    ("exp:warm", [3]),
+    ("status:failed", [3]),
+    ("status:running", [4]),
+    ("3", [3]),
+    ("id>=2 id<4", [2, 3]),
+    ("size>1KB", [2, 3]),
+    ("size<=512b", [1]),
+    ("started>2026-05-02", [3, 4]),
+    ("started<=2026-05-02", [1, 2]),
+    ("started:2026-05-03", [3]),
+    ("completed>=2026-05", [1, 2, 3]),
+    ])
+def test_queries_combine_prefix_words_and_ranges(query, run_ids):
+    assert _matches(_indexed(), query) == run_ids
+
+
+@pytest.mark.parametrize("query", [
+    "owner:me",
+    "name:",
+    "name>sweep",
+    "size>lots",
+    "started>yesterday",
+    "id=1.5",
+    ])
+def test_unreadable_terms_raise(query):
+    with pytest.raises(RunSearchError):
+        _indexed().search(query)
+
+
+def test_reindexed_runs_are_found_by_their_new_values():
+    index = _indexed()
+    index.set_run(3, 4, {**RUNS[4], "is_completed": True, "storage_bytes": 1})
+
+    assert _matches(index, "status:running") == []
+    assert _matches(index, "size<2") == [4]
+
+
+def test_saved_dictionaries_are_reused_for_the_same_database_only(tmp_path):
+    path = tmp_path / "runs.index.npz"
+    index = _indexed()
+    assert index.modified
+    assert index.save(path, "/data/runs.db", (1, 2))
+    assert not index.modified
+
+    reopened = RunSearchIndex.load(path, "/data/runs.db", (1, 2))
+    assert len(reopened) == 0
+    assert not reopened.modified
+    reopened.set_runs(0, list(RUNS), list(RUNS.values()))
+    assert not reopened.modified
+    assert _matches(reopened, "coul") == [2]
+
+    replaced = RunSearchIndex.load(path, "/data/runs.db", (1, 3))
+    assert replaced.dictionaries["name"].values == []
+    assert RunSearchIndex.load(tmp_path / "missing.npz", "/data/runs.db", (1, 2)).dictionaries[
+        "name"
+        ].values == []
+
+
+def test_catalog_eviction_removes_search_indexes_with_their_catalogs(tmp_path):
+    catalogs = [
+        RunCatalog(tmp_path, f"/data/runs-{number}.db", (1, number))
+        for number in range(RUN_CATALOG_MAX_FILES + 1)
+        ]
+    for number, catalog in enumerate(catalogs):
+        catalog.index_path.write_bytes(b"index")
+        catalog.path.write_text("{}")
+        for path in (catalog.index_path, catalog.path):
+            os.utime(path, (1_700_000_000 + number, 1_700_000_000 + number))
+
+    catalogs[-1].evict()
+
+    assert not catalogs[0].path.exists()
+    assert not catalogs[0].index_path.exists()
+    assert catalogs[1].path.exists()
+    assert catalogs[1].index_path.exists()
+
+
+def test_run_list_filter_keeps_sorting_and_restores_preview_cells():
+    run_list = treeWidgets.RunList()
+    run_list.addRuns(RUNS)
+    run_list.sortItems(0, QtCore.Qt.SortOrder.DescendingOrder)
+    measurements = run_list.cols.index("Measurements")
+    run_list.set_run_previews("guid-2", [{"unsupported": True, "parameter": "lockin_x"}])
+
+    run_list.set_search_text("co")
+
+    assert run_list.topLevelItemCount() == 3
+    assert run_list.run_count() == 4
+    assert [run_list.topLevelItem(row).guid for row in range(3)] == [
+        "guid-4",
+        "guid-2",
+        "guid-1",
+        ]
+    assert set(run_list.preview_cells) == {"guid-1", "guid-2", "guid-4"}
+    assert run_list.findItems("3", QtCore.Qt.MatchFlag.MatchExactly, 0) == []
+    assert len(run_list.all_run_metadata()) == 4
+
+    run_list.set_search_text("warm")
+    run_list.set_search_text("")
+
+    assert run_list.topLevelItemCount() == 4
+    cell = run_list.itemWidget(run_list._item_for_guid("guid-2"), measurements)
+    assert cell is run_list.preview_cells["guid-2"]
+    assert cell.findChildren(qtw.QLabel, "measurementPreviewUnsupported")
+
+
+def test_new_runs_are_filtered_with_the_active_filter():
+    run_list = treeWidgets.RunList()
+    run_list.addRuns({1: RUNS[1]})
+    run_list.set_search_text("coul")
+    assert run_list.topLevelItemCount() == 0
+
+    run_list.addRuns({2: RUNS[2], 3: RUNS[3]})
+
+    assert [run_list.topLevelItem(0).guid] == ["guid-2"]
+    with pytest.raises(RunSearchError):
+        run_list.set_search_text("size>")
+    assert run_list.topLevelItemCount() == 1
+
+
+def test_filtering_one_hundred_thousand_runs_per_keystroke():
+    run_count = 100_000
+    index = RunSearchIndex()
+    index.set_runs(
+        0,
+        list(range(1, run_count + 1)),
+        [
+            {
+                "exp_name": f"experiment-{run_id % 13}",
+                "sample_name": f"sample-{run_id % 5}",
+                "name": f"sweep {run_id}",
+                "run_timestamp": 1_700_000_000.0 + 60 * run_id,
+                "is_completed": True,
+                "storage_bytes": run_id,
+                }
+            for run_id in range(1, run_count + 1)
+            ],
+        )
+    index.search("x")  # Builds the token index once.
+
+    elapsed = []
+    for query in ("s", "sw", "swe", "sweep 12345", "exp:experiment-3 size>50000"):
+        started = perf_counter()
+        mask = index.search(query)
+        elapsed.append(perf_counter() - started)
+        assert mask is not None
+
+    assert np.flatnonzero(index.search("sweep 12345")).tolist() == [12344]
+    # Generous for slow CI machines; typically a few milliseconds.
+    assert min(elapsed) < 0.1
@@ -0,0 +1,136 @@
+from PyQt6 import QtCore
+
+from qplot.windows._widgets import treeWidgets
+from qplot.windows._widgets.run_table_model import RunRow, RunTableModel
+
+ASCENDING = QtCore.Qt.SortOrder.AscendingOrder
+DESCENDING = QtCore.Qt.SortOrder.DescendingOrder
+
+
+def _run(run_id, **metadata):
+    return {
+        "run_timestamp": 100.0 + run_id,
+        "completed_timestamp": 110.0 + run_id,
+        "is_completed": True,
+        "guid": f"guid-{run_id}",
+        "sweep_parameters": ["x"],
+        "measure_parameters": ["signal"],
+        **metadata,
+        }
+
+
+def _model(runs):
+    model = RunTableModel(treeWidgets.RunList.cols)
+    model.append_runs(runs)
+    return model
+
+
+def _view_ids(model):
+    return [model.run_id(model.source_row(row)) for row in range(model.rowCount())]
+
+
+def test_numbers_sort_numerically_with_missing_values_last():
+    model = _model({
+        1: _run(1, storage_bytes=900),
+        2: _run(2, storage_bytes=None),
+        3: _run(3, storage_bytes=10_000),
+        4: _run(4, storage_bytes=900),
+        })
+    size = model.columns.index("Size")
+
+    model.sort(size, ASCENDING)
+    assert _view_ids(model) == [1, 4, 3, 2]
+
+    model.sort(size, DESCENDING)
+    assert _view_ids(model) == [2, 3, 1, 4]
+
+
+def test_strings_sort_lexically_and_ties_keep_their_order():
+    model = _model({
+        1: _run(1, name="beta"),
+        2: _run(2, name="alpha"),
+        3: _run(3, name="beta"),
+        })
+    name = model.columns.index("Name")
+
+    model.sort(model.columns.index("ID"), DESCENDING)
+    model.sort(name, ASCENDING)
+
+    assert _view_ids(model) == [2, 3, 1]
+
+
+def test_rows_keep_their_handles_and_indexes_across_sorting():
+    model = _model({run_id: _run(run_id) for run_id in range(1, 5)})
+    row = RunRow(model, 1)
+    persistent = QtCore.QPersistentModelIndex(model.index(1, 0))
+
+    model.sort(0, DESCENDING)
+
+    assert row.text(0) == "2"
+    assert model.view_row(row.row) == 2
+    assert persistent.row() == 2
+    assert model.index(2, 0).data() == "2"
+
+
+def test_cell_text_is_formatted_when_first_read_and_after_refresh():
+    model = _model({1: _run(1, storage_bytes=1536)})
+    size = model.columns.index("Size")
+
+    assert model._text_cache == {}
+    assert model.index(0, size).data() == "1.5 KB"
+
+    model.run_metadata(0)["storage_bytes"] = 3 * 1024 * 1024
+    model.refresh_row(0)
+
+    assert model.index(0, size).data() == "3.0 MB"
+    assert model.index(0, size).data(QtCore.Qt.ItemDataRole.UserRole) == 3 * 1024 * 1024
+
+
+def test_filter_hides_stored_rows_and_keeps_the_sort_order():
+    model = _model({run_id: _run(run_id) for run_id in range(1, 6)})
+    hidden = QtCore.QPersistentModelIndex(model.index(1, 0))
+    kept = QtCore.QPersistentModelIndex(model.index(2, 0))
+
+    model.set_filter([True, False, True, False, True])
+    assert _view_ids(model) == [1, 3, 5]
+    assert not hidden.isValid()
+    assert kept.row() == 1
+    assert model.view_row(1) == -1
+
+    model.sort(0, DESCENDING)
+    assert _view_ids(model) == [5, 3, 1]
+    assert kept.row() == 1
+
+    model.append_runs({6: _run(6)})
+    assert _view_ids(model) == [5, 3, 1, 6]
+    assert model.stored_count == 6
+
+    model.set_filter(None)
+    assert _view_ids(model) == [5, 4, 3, 2, 1, 6]
+
+
+def test_one_hundred_thousand_runs_populate_and_sort():
+    run_count = 100_000
+    run_list = treeWidgets.RunList()
+    run_list.addRuns({
+        run_id: _run(
+            run_id,
+            exp_name=f"experiment-{run_id % 7}",
+            storage_bytes=(run_id * 7919) % 100_003,
+            )
+        for run_id in range(1, run_count + 1)
+        })
+    size = run_list.cols.index("Size")
+
+    run_list.sortItems(size, ASCENDING)
+
+    assert run_list.topLevelItemCount() == run_count
+    assert run_list.preview_cells == {}
+    sizes = [
+        run_list.topLevelItem(row).data(size, QtCore.Qt.ItemDataRole.UserRole)
+        for row in (0, 1, run_count - 1)
+        ]
+    assert sizes == sorted(sizes)
+    assert run_list.findItems("54321", QtCore.Qt.MatchFlag.MatchExactly, 0)[0].guid == (
+        "guid-54321"
+        )
@@ -107,7 +107,10 @@ class PreviewExportLifecycleTestCase(unittest.TestCase):
             self.closed = True
 
     class Param:
+        # Array data keeps the in-memory export, which reads the fresh dataset.
         name = "signal"
+        type = "array"
+        depends_on_ = ["gate"]
 
     class Dataset:
         guid = "preview-guid"
@@ -1296,6 +1299,7 @@ class OptionsMenuTestCase(unittest.TestCase):
             self.config = OptionsMenuTestCase.FakeConfig()
             self.preview_size = 200
             self.close_database_commands = 0
+            self.npz_export_commands = 0
             self.quit_commands = 0
 
         def refresh_recent_database_menu(self):
@@ -1313,6 +1317,12 @@ class OptionsMenuTestCase(unittest.TestCase):
         def refreshMain(self):
             pass
 
+        def exportRunNpz(self):
+            self.npz_export_commands += 1
+
+        def cancel_run_exports(self):
+            pass
+
         def create_test_database_csv(self):
             pass
 
@@ -1415,9 +1425,12 @@ class OptionsMenuTestCase(unittest.TestCase):
             }
 
             actions["Close Database"].trigger()
+            actions["Export Run Data as NPZ..."].trigger()
+            self.assertFalse(actions["Cancel Export"].isEnabled())
             actions["Quit qPlot"].trigger()
 
             self.assertEqual(window.close_database_commands, 1)
+            self.assertEqual(window.npz_export_commands, 1)
             self.assertEqual(window.quit_commands, 1)
             self.assertEqual(
                 actions["Quit qPlot"].shortcuts(),
@@ -4173,9 +4186,12 @@ class DatabaseRefreshWorkerTestCase(unittest.TestCase):
         results = []
         seen_status_calls = []
 
-        def get_status(guid, **kwargs):
-            seen_status_calls.append((guid, kwargs))
-            return {"is_completed": True, "result_count": 12}
+        def get_statuses(guids, **kwargs):
+            seen_status_calls.append((list(guids), kwargs))
+            return {
+                guid: {"is_completed": True, "result_count": 12}
+                for guid in guids
+                }
 
         worker = database_module.DatabaseRefreshWorker(
             4,
@@ -4191,7 +4207,11 @@ class DatabaseRefreshWorkerTestCase(unittest.TestCase):
                 "find_new_runs",
                 return_value={11: {"guid": "guid-11"}},
                 ) as find_runs,
-            patch.object(database_module, "get_run_status", side_effect=get_status),
+            patch.object(
+                database_module,
+                "get_run_statuses",
+                side_effect=get_statuses,
+                ),
             ):
             worker.run()
 
@@ -4202,13 +4222,7 @@ class DatabaseRefreshWorkerTestCase(unittest.TestCase):
             connection_callback=ANY,
             )
         self.assertEqual(seen_status_calls, [
-            ("guid-1", {
-                "database_path": "example.db",
-                "include_storage_bytes": False,
-                "cancelled_callback": ANY,
-                "connection_callback": ANY,
-                }),
-            ("guid-2", {
+            (["guid-1", "guid-2"], {
                 "database_path": "example.db",
                 "include_storage_bytes": False,
                 "cancelled_callback": ANY,
@@ -6,8 +6,15 @@ import pyqtgraph as pg
 from PyQt6 import QtCore, QtGui
 from PyQt6 import QtWidgets as qtw
 
+from qplot.tools.line_envelope import ENVELOPE_MIN_POINTS, LineEnvelope
+from qplot.tools.worker import loader
 from qplot.windows import _plotWin as plotwin_module
 from qplot.windows._dataset_handle import DatasetKey, TraceKey
+from qplot.windows._plot1d_envelope import (
+    line_full_data,
+    refresh_line_envelope,
+    set_line_data,
+)
 from qplot.windows._plot1d_snap import _nearest_trace_sample
 from qplot.windows._plot1d_traces import (
     TRACE_COLOR_PALETTE,
@@ -253,6 +260,29 @@ class SnapToTraceTestCase(unittest.TestCase):
         self.assertIs(viewbox, plot_item.vb)
         self.assertEqual(point_number, 1)
 
+    def test_nearest_trace_point_reuses_the_trace_index_until_data_changes(self):
+        widget = pg.GraphicsLayoutWidget()
+        plot_item = widget.addPlot()
+        line = plot_item.plot(x=[0.0, 1.0, 2.0], y=[0.0, 1.0, 4.0])
+        window = plot1d.__new__(plot1d)
+        window.plot = plot_item
+        window.right_vb = None
+        window.lines = {"main": line}
+        scene_pos = plot_item.vb.mapViewToScene(QtCore.QPointF(1.9, 0.1))
+
+        window._nearest_trace_point(scene_pos)
+        index = line._qplot_trace_index
+        window._nearest_trace_point(scene_pos)
+        self.assertIs(line._qplot_trace_index, index)
+
+        line.setData(x=[0.0, 1.0, 2.0], y=[4.0, 1.0, 0.0])
+        _label, x_value, y_value, _viewbox, point_number = (
+            window._nearest_trace_point(scene_pos)
+            )
+
+        self.assertIsNot(line._qplot_trace_index, index)
+        self.assertEqual((x_value, y_value, point_number), (2.0, 0.0, 3))
+
     def test_mouse_moved_shows_nearest_1d_array_index(self):
         widget = pg.GraphicsLayoutWidget()
         plot_item = widget.addPlot()
@@ -1774,3 +1804,74 @@ class SnapToTraceTestCase(unittest.TestCase):
         self.assertEqual(rect.right(), 4.0)
         self.assertEqual(rect.top(), 7.25)
         self.assertEqual(rect.bottom(), 9.75)
+
+
+class LineEnvelopeTestCase(unittest.TestCase):
+    def _enveloped_line(self, size=200_000):
+        widget = pg.GraphicsLayoutWidget()
+        widget.resize(600, 400)
+        plot_item = widget.addPlot()
+        line = plot_item.plot()
+        x = np.linspace(0.0, 100.0, size)
+        y = np.sin(x)
+        y[size // 3] = 25.0
+        set_line_data(line, x, y, LineEnvelope(x, y))
+        return widget, plot_item, line, x, y
+
+    def test_long_trace_draws_a_screen_sized_envelope_that_keeps_peaks(self):
+        widget, plot_item, line, x, y = self._enveloped_line()
+
+        drawn_x, drawn_y = line.getData()
+
+        self.assertLess(drawn_x.size, x.size // 10)
+        self.assertEqual(drawn_y.max(), 25.0)
+        self.assertEqual(drawn_x[0], x[0])
+        self.assertEqual(drawn_x[-1], x[-1])
+        full_x, full_y = line_full_data(line)
+        self.assertIs(full_x, x)
+        self.assertIs(full_y, y)
+        widget.close()
+
+    def test_zooming_requeries_the_envelope_for_the_view(self):
+        widget, plot_item, line, x, _y = self._enveloped_line()
+        window = plot1d.__new__(plot1d)
+        window.line = line
+
+        plot_item.vb.setXRange(10.0, 10.5, padding=0)
+        window._refresh_line_envelopes()
+
+        drawn_x, _drawn_y = line.getData()
+        visible = (x >= 10.0) & (x <= 10.5)
+        self.assertLessEqual(drawn_x[0], 10.0)
+        self.assertGreaterEqual(drawn_x[-1], 10.5)
+        self.assertLess(drawn_x.size, int(visible.sum()) + 3)
+        widget.close()
+
+    def test_new_short_data_stops_envelope_redraws(self):
+        widget, plot_item, line, _x, _y = self._enveloped_line()
+
+        set_line_data(line, [0.0, 1.0], [2.0, 3.0])
+        plot_item.vb.setXRange(0.0, 0.5, padding=0)
+        refresh_line_envelope(line)
+
+        drawn_x, drawn_y = line.getData()
+        np.testing.assert_array_equal(drawn_x, [0.0, 1.0])
+        np.testing.assert_array_equal(drawn_y, [2.0, 3.0])
+        widget.close()
+
+    def test_worker_builds_envelopes_only_for_long_1d_traces(self):
+        worker = loader.__new__(loader)
+        worker.param = type("Param", (), {"depends_on_": ("x", )})()
+        worker.axis_data = {"x": np.arange(10.0), "y": np.arange(10.0)}
+        worker._build_line_envelope()
+        self.assertIsNone(worker.line_envelope)
+
+        size = ENVELOPE_MIN_POINTS
+        worker.axis_data = {"x": np.arange(float(size)), "y": np.zeros(size)}
+        worker._build_line_envelope()
+        self.assertIsInstance(worker.line_envelope, LineEnvelope)
+        self.assertIs(worker.line_envelope.x, worker.axis_data["x"])
+
+        worker.dataGrid = np.zeros((2, 2))
+        worker._build_line_envelope()
+        self.assertIsNone(worker.line_envelope)
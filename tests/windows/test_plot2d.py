@@ -7,17 +7,23 @@ from PyQt6 import QtCore
 from PyQt6 import QtWidgets as qtw
 
 from qplot.datahandling.qcodes_cache import cache_parameter_is_synchronized
+from qplot.tools.grid_stats import GridStats
 from qplot.tools.heatmap_geometry import HeatmapGeometry
 from qplot.windows._colorbar import (
     _CET_COLORBAR_SUBTYPES,
     _MATPLOTLIB_COLORBAR_SUBTYPES,
+    _colorbar_colormaps,
     _colorbar_subtype_config_key,
 )
 from qplot.windows._dataset_handle import DatasetHandle, DatasetKey, TraceKey
 from qplot.windows._plot2d_sweeps import Plot2DSweepMixin
 from qplot.windows._plotWin import plotWidget
 from qplot.windows._subplots.subplot2d import sweeper
-from qplot.windows.plot2d import _COLORBAR_COLORMAPS, plot2d
+from qplot.windows.plot2d import (
+    _HEATMAP_PYRAMID_RELOAD_DEBOUNCE_MS,
+    _HEATMAP_VIEW_RELOAD_DEBOUNCE_MS,
+    plot2d,
+)
 
 
 def _colorbar_config_values(overrides=None):
@@ -456,6 +462,41 @@ class Plot2dLiveRefreshTestCase(unittest.TestCase):
 
         self.assertIsNone(window._heatmap_last_view_ranges)
 
+    def test_large_heatmap_keeps_worker_pyramid_for_quicker_view_reloads(self):
+        pyramid = object()
+
+        class Worker:
+            loaded_from_sql_heatmap = True
+            heatmap_axis_ranges = None
+            heatmap_source_axis_ranges = {"x": (0.0, 1.0), "y": (0.0, 1.0)}
+            heatmap_pyramid = pyramid
+
+        window = plot2d.__new__(plot2d)
+        window.axis_data = {"x": np.array([0.0, 1.0]), "y": np.array([0.0, 1.0])}
+        window._heatmap_full_axis_ranges = None
+        window._heatmap_full_view_ranges = None
+        window._heatmap_last_view_ranges = None
+        window._heatmap_view_reload_timer = QtCore.QTimer()
+        window._update_heatmap_downsample_state = lambda _worker: None
+        self.assertEqual(
+            window._heatmap_view_reload_delay(),
+            _HEATMAP_VIEW_RELOAD_DEBOUNCE_MS,
+            )
+
+        window._update_large_heatmap_state(Worker())
+
+        self.assertIs(window.__dict__["heatmap_pyramid"], pyramid)
+        self.assertEqual(
+            window._heatmap_view_reload_delay(),
+            _HEATMAP_PYRAMID_RELOAD_DEBOUNCE_MS,
+            )
+
+        window._update_large_heatmap_state(
+            type("Worker", (), {"loaded_from_sql_heatmap": False})()
+            )
+
+        self.assertIsNone(window.__dict__["heatmap_pyramid"])
+
     def test_full_resolution_refresh_clears_large_heatmap_sql_state(self):
         class Timer:
             def __init__(self):
@@ -1109,6 +1150,28 @@ class HeatmapHoverOutlineTestCase(unittest.TestCase):
             [[10.0, 20.0, 30.0], [40.0, 50.0, 60.0]],
             )
 
+    def test_growing_axes_extend_the_previous_geometry(self):
+        window = plot2d.__new__(plot2d)
+        self.configure_geometry(
+            window,
+            x_centres=[0.0, 1.0, 2.0],
+            y_centres=[10.0, 11.0],
+            )
+        y_axis = window.heatmap_geometry.y
+
+        self.configure_geometry(
+            window,
+            x_centres=[0.0, 1.0, 2.0, 3.0],
+            y_centres=[10.0, 11.0],
+            )
+
+        self.assertIs(window.heatmap_geometry.y, y_axis)
+        self.assertEqual(
+            window.heatmap_geometry,
+            HeatmapGeometry.from_centres([0.0, 1.0, 2.0, 3.0], [10.0, 11.0]),
+            )
+        self.assertEqual(window.heatmap_geometry.x.bounds, (-0.5, 3.5))
+
     def test_shape_mismatch_invalidates_installed_geometry(self):
         window = plot2d.__new__(plot2d)
         self.configure_geometry(
@@ -1391,6 +1454,35 @@ class HeatmapHoverOutlineTestCase(unittest.TestCase):
         self.assertEqual(window._colorbar_manual_levels, (5.0, 10.0))
         self.assertEqual(window.bar.values, (5.0, 10.0))
 
+    def test_marquee_stats_reuse_grid_tables_until_the_grid_changes(self):
+        window = plot2d.__new__(plot2d)
+        window.marquee = QtCore.QRectF(1.0, 1.0, 2.0, 2.0)
+        data_grid = np.arange(16.0).reshape(4, 4)
+        self.configure_geometry(
+            window,
+            x_centres=np.arange(0.5, 4.0),
+            y_centres=np.arange(0.5, 4.0),
+            data_grid=data_grid,
+            )
+        window.__dict__["grid_stats"] = None
+
+        self.assertEqual(window._marquee_color_levels(), (5.0, 10.0))
+        first_stats = window.__dict__["grid_stats"]
+        self.assertIsInstance(first_stats, GridStats)
+        self.assertEqual(window._marquee_color_levels(), (5.0, 10.0))
+        self.assertIs(window.__dict__["grid_stats"], first_stats)
+
+        self.configure_geometry(
+            window,
+            x_centres=np.arange(0.5, 4.0),
+            y_centres=np.arange(0.5, 4.0),
+            data_grid=data_grid + 1.0,
+            )
+
+        self.assertEqual(window._marquee_color_levels(), (6.0, 11.0))
+        self.assertIsNot(window.__dict__["grid_stats"], first_stats)
+        self.assertTrue(window.__dict__["grid_stats"].matches(window.dataGrid))
+
     def test_stats_action_opens_dialog_and_clears_marquee(self):
         window = plot2d.__new__(plot2d)
         window.marquee = QtCore.QRectF(1.0, 1.0, 2.0, 2.0)
@@ -2358,6 +2450,51 @@ class HeatmapHoverOutlineTestCase(unittest.TestCase):
         finally:
             host.deleteLater()
 
+    def test_pyramid_heatmap_explains_merged_cells_and_value_range(self):
+        class Worker:
+            heatmap_downsample_info = {
+                "source_row_count": 2_000_000,
+                "estimated_range_rows": 2_000_000,
+                "loaded_point_count": 131_072,
+                "source_sampled": False,
+                "source_aggregated": True,
+                "aggregated_source_row_count": 2_000_000,
+                "source_aggregation_strategy": "spatial mean",
+                "axis_ranges": None,
+                "pyramid_level": (2, 1),
+                "source_value_range": (-1.5, 42.0),
+                "unique_x_count": 2_000,
+                "unique_y_count": 1_000,
+                "source_grid_columns": 2_000,
+                "source_grid_rows": 1_000,
+                "source_grid_cell_count": 2_000_000,
+                "grid_columns": 512,
+                "grid_rows": 256,
+                "grid_cell_count": 131_072,
+                "grid_binned": True,
+                "grid_cell_limit": 250_000,
+                "full_resolution_point_limit": 1_000_000,
+                "empty_bins_filled": False,
+                }
+
+        host = plot2d.__new__(plot2d)
+        qtw.QMainWindow.__init__(host)
+        host.toolbarCo_ord = qtw.QToolBar(host)
+        host.widget = qtw.QWidget(host)
+        host._heatmap_worker_downsample_info = None
+        host._heatmap_downsample_info = None
+
+        try:
+            host._init_heatmap_downsample_warning_button()
+            host._update_heatmap_downsample_state(Worker())
+
+            text = host._heatmap_downsample_dialog_text()
+            self.assertIn("precomputed heatmap pyramid", text)
+            self.assertIn("merging 4 x 2 base cells each", text)
+            self.assertIn("range from -1.5 to 42", text)
+        finally:
+            host.deleteLater()
+
     def test_grid_reduced_heatmap_shows_warning_without_worker_info(self):
         class Worker:
             heatmap_downsample_info = None
@@ -2427,7 +2564,7 @@ class HeatmapHoverOutlineTestCase(unittest.TestCase):
         applied = window.setColorbarColorMap("none")
 
         self.assertFalse(applied)
-        self.assertNotIn("none", _COLORBAR_COLORMAPS)
+        self.assertNotIn("none", _colorbar_colormaps())
         self.assertEqual(window.status_messages, [("Unknown color map.", 5000)])
 
     def test_colorbar_colormap_config_filters_names_prefixes_and_groups(self):
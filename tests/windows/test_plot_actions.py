@@ -3,6 +3,7 @@
 import time
 from pathlib import Path
 
+import numpy as np
 import pytest
 import qcodes
 from PyQt6 import QtCore
@@ -14,6 +15,7 @@ from qcodes.dataset import (
 )
 from qcodes.parameters import ManualParameter
 
+from qplot.windows import _plot_actions as plot_actions_module
 from qplot.windows import main as main_window
 from qplot.windows._plot_actions import PlotActionsMixin
 
@@ -239,3 +241,142 @@ def test_run_preview_loads_its_requested_dataset_without_a_selection(tmp_path):
     assert len(harness.load_calls) == 1
     assert harness.ds is dataset
     assert harness.plot_calls[0][1]["params"] == [dataset.parameter]
+
+
+class _RunExportHarness(_ActionHarness):
+    def __init__(self, database_path, dataset, measurement):
+        super().__init__(database_path, dataset)
+        self.ds = None
+        self.measurementBox = _Field(measurement)
+        self.threadPool = QtCore.QThreadPool()
+        self._run_export_workers = set()
+        self.target = dataset
+        self.errors = []
+
+    def _dataset_for_plot_target(self):
+        return self.target
+
+    def _close_dataset_if_unowned(self, dataset, context=""):
+        return False
+
+    def show_error(self, *args):
+        self.errors.append(args)
+
+    def wait_for_exports(self):
+        assert self.threadPool.waitForDone(30000)
+        deadline = time.monotonic() + 10
+        while self._run_export_workers and time.monotonic() < deadline:
+            QtCore.QCoreApplication.processEvents()
+        assert not self._run_export_workers
+
+
+@pytest.fixture
+def text_and_numeric_run(tmp_path):
+    original_database_path = qcodes.config.core.db_location
+    try:
+        database_path = tmp_path / "export.db"
+        initialise_or_create_database_at(str(database_path))
+        experiment = load_or_create_experiment("run_export", sample_name="sample")
+        x = ManualParameter("x")
+        y = ManualParameter("y")
+        label = ManualParameter("label")
+        measurement = Measurement(exp=experiment, name="run_export")
+        measurement.register_parameter(x)
+        measurement.register_parameter(y, setpoints=(x,))
+        measurement.register_parameter(label, setpoints=(x,), paramtype="text")
+        with measurement.run(write_in_background=False) as datasaver:
+            for index in range(5):
+                datasaver.add_result((x, index), (y, 2.0 * index), (label, f"p,{index}"))
+        dataset = datasaver.dataset
+        yield database_path, dataset
+        dataset.conn.close()
+        experiment.conn.close()
+    finally:
+        qcodes.config.core.db_location = original_database_path
+
+
+def test_npz_export_streams_numeric_measurements_and_rejects_text(
+        text_and_numeric_run,
+        tmp_path,
+        monkeypatch,
+        ):
+    database_path, dataset = text_and_numeric_run
+    export_path = tmp_path / "run.npz"
+    monkeypatch.setattr(
+        plot_actions_module,
+        "choose_export_path",
+        lambda *_args, **_kwargs: str(export_path),
+    )
+
+    harness = _RunExportHarness(database_path, dataset, "*")
+    harness.exportRunNpz()
+    assert "numeric data only" in harness.status_messages[-1][0]
+    assert not harness._run_export_workers
+
+    harness = _RunExportHarness(database_path, dataset, "1")
+    harness.exportRunNpz()
+    assert len(harness._run_export_workers) == 1
+    harness.wait_for_exports()
+
+    assert harness.errors == []
+    assert harness.status_messages[-1][0] == f"Exported NPZ: {export_path}"
+    with np.load(export_path) as archive:
+        assert archive.files == ["y", "x"]
+        assert archive["y"].tolist() == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+def test_csv_export_streams_in_the_background(text_and_numeric_run, tmp_path, monkeypatch):
+    database_path, dataset = text_and_numeric_run
+    export_path = tmp_path / "run.csv"
+    monkeypatch.setattr(
+        plot_actions_module,
+        "choose_export_path",
+        lambda *_args, **_kwargs: str(export_path),
+    )
+
+    def in_memory_export(*_args):
+        raise AssertionError("numeric and text runs must be streamed")
+
+    harness = _RunExportHarness(database_path, dataset, "*")
+    harness._measurement_dataframe = in_memory_export  # type: ignore[method-assign]
+    harness.exportRunCsv()
+    assert len(harness._run_export_workers) == 1
+    harness.wait_for_exports()
+
+    assert harness.errors == []
+    assert harness.status_messages[-1][0] == f"Exported CSV: {export_path}"
+    assert export_path.read_text(encoding="utf-8").splitlines() == [
+        "y.y,y.x,label.label,label.x",
+        *(f'{2.0 * index},{float(index)},"p,{index}",{float(index)}' for index in range(5)),
+    ]
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith(".run.csv")]
+
+
+def test_cancelled_export_leaves_the_destination_untouched(
+        text_and_numeric_run,
+        tmp_path,
+        monkeypatch,
+        ):
+    database_path, dataset = text_and_numeric_run
+    export_path = tmp_path / "run.csv"
+    export_path.write_text("previous export", encoding="utf-8")
+    monkeypatch.setattr(
+        plot_actions_module,
+        "choose_export_path",
+        lambda *_args, **_kwargs: str(export_path),
+    )
+    harness = _RunExportHarness(database_path, dataset, "1")
+    # Hold the only pool thread so the export is cancelled before it starts.
+    harness.threadPool.setMaxThreadCount(1)
+    release = QtCore.QSemaphore()
+    harness.threadPool.start(release.acquire)
+
+    harness.exportRunCsv()
+    harness.cancel_run_exports()
+    release.release()
+    harness.wait_for_exports()
+
+    assert harness.errors == []
+    assert harness.status_messages[-1] == ("CSV export cancelled.", 3000)
+    assert export_path.read_text(encoding="utf-8") == "previous export"
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith(".run.csv")]
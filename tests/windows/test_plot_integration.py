@@ -27,6 +27,7 @@ import qplot.tools.worker as worker_module
 from qplot.configuration.config import config
 from qplot.datahandling import database as database_module
 from qplot.datahandling import readonly as readonly_module
+from qplot.datahandling import run_catalog
 from qplot.datahandling.file_identity import (
     canonical_database_path,
     database_instance,
@@ -557,6 +558,44 @@ def test_main_window_opens_real_1d_and_2d_plots(tmp_path, monkeypatch):
         close_main_window(window)
 
 
+def test_main_window_filter_box_filters_loaded_runs(tmp_path, monkeypatch):
+    configure_temp_qplot(monkeypatch, tmp_path)
+    database_path = Path(tmp_path) / "qplot-integration.db"
+    _line_run_id, heatmap_run_id = build_synthetic_database(database_path)
+
+    window = main_window.MainWindow()
+    try:
+        window.startupDatabaseTimer.stop()
+        window.config.config["user_preference"]["confirm_close"] = False
+        window.config.config["user_preference"]["confirm_close_all"] = False
+        window.close_database(status=False)
+
+        assert window.load_file(str(database_path))
+        wait_for(
+            lambda: (
+                not window._database_load_active
+                and not window._database_detail_active
+                and window.RunList.topLevelItemCount() >= 2
+            )
+        )
+
+        window.runFilterBox.setText("heat param:cond")
+        assert window.RunList.topLevelItemCount() == 1
+        shown = window.RunList.topLevelItem(0)
+        assert window.RunList.run_id_for_guid(shown.guid) == heatmap_run_id
+
+        window.runFilterBox.setText("size>")
+        assert window.RunList.topLevelItemCount() == 1
+        assert window.runFilterBox.toolTip().startswith("Missing value")
+
+        window.runFilterBox.clear()
+        assert window.RunList.topLevelItemCount() == window.RunList.run_count()
+        catalog = run_catalog.run_catalog(str(database_path))
+        assert catalog is not None and catalog.index_path.exists()
+    finally:
+        close_main_window(window)
+
+
 def test_atomic_replacement_reloads_every_real_qcodes_runtime_object(
     tmp_path,
     monkeypatch,
@@ -579,7 +618,7 @@ def test_atomic_replacement_reloads_every_real_qcodes_runtime_object(
     release_refresh = threading.Event()
     status_messages = []
     original_show_status = window.show_status
-    original_get_run_status = database_module.get_run_status
+    original_get_run_statuses = database_module.get_run_statuses
     replacement_loads = []
     original_load_file = window.load_file
 
@@ -588,7 +627,7 @@ def test_atomic_replacement_reloads_every_real_qcodes_runtime_object(
         return original_show_status(message, timeout)
 
     def block_completed_status(*args, **kwargs):
-        status = original_get_run_status(*args, **kwargs)
+        status = original_get_run_statuses(*args, **kwargs)
         refresh_sql_finished.set()
         if not release_refresh.wait(10):
             raise TimeoutError("Test did not release the database refresh worker")
@@ -637,7 +676,7 @@ def test_atomic_replacement_reloads_every_real_qcodes_runtime_object(
 
         monkeypatch.setattr(
             database_module,
-            "get_run_status",
+            "get_run_statuses",
             block_completed_status,
         )
         window.refreshMain()
@@ -1342,6 +1381,7 @@ def test_live_wal_preview_exports_use_fresh_action_local_datasets(
                 )
                 window.export_preview_csv("signal")
                 window.export_run_preview_csv(guid, "signal")
+                wait_for(lambda: not window._run_export_workers)
 
             for export_path in (selected_export_path, run_export_path):
                 frame = pd.read_csv(export_path)
@@ -1559,23 +1599,23 @@ def test_preview_export_extraction_replacement_preserves_existing_csv(
         replacement_state = None
         replacement_entries = None
         real_loader = plot_actions_module.load_by_guid_read_only
-        real_extraction = window._measurement_dataframe
+        real_export_finished = window._run_export_finished
 
         def record_action_dataset(*args, **kwargs):
             dataset = real_loader(*args, **kwargs)
             action_datasets.append(dataset)
             return dataset
 
-        def replace_during_extraction(dataset, params):
+        def replace_after_extraction(worker, staged_path, error):
             nonlocal replacement_entries
             nonlocal replacement_state
-            frame = real_extraction(dataset, params)
-            assert frame["signal"].tolist() == [10.0]
-            release_windows_database_locks(window, database_path, dataset)
+            assert error is None
+            assert pd.read_csv(staged_path)["signal"].tolist() == [10.0]
+            release_windows_database_locks(window, database_path)
             os.replace(replacement_path, database_path)
             replacement_state = database_artifact_state(database_path)
             replacement_entries = set(source_directory.iterdir())
-            return frame
+            real_export_finished(worker, staged_path, error)
 
         def record_load(*args, **kwargs):
             replacement_loads.append((args, kwargs))
@@ -1589,8 +1629,8 @@ def test_preview_export_extraction_replacement_preserves_existing_csv(
             )
             scoped_monkeypatch.setattr(
                 window,
-                "_measurement_dataframe",
-                replace_during_extraction,
+                "_run_export_finished",
+                replace_after_extraction,
             )
             scoped_monkeypatch.setattr(window, "load_file", record_load)
             scoped_monkeypatch.setattr(
@@ -1612,6 +1652,7 @@ def test_preview_export_extraction_replacement_preserves_existing_csv(
                 lambda *_args, **_kwargs: qtw.QMessageBox.StandardButton.Yes,
             )
             window.export_run_preview_csv(guid, "signal")
+            wait_for(lambda: not window._run_export_workers)
 
         wait_for(
             lambda: (
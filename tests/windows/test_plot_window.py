@@ -314,6 +314,7 @@ class PlotWindowRefreshTestCase(unittest.TestCase):
                     max_full_heatmap_points,
                     heatmap_axis_ranges,
                     heatmap_full_axis_ranges,
+                    dataset_guid=None,
                     ):
                 self.cache = cache
                 self.param = param
@@ -325,6 +326,7 @@ class PlotWindowRefreshTestCase(unittest.TestCase):
                 self.max_full_heatmap_points = max_full_heatmap_points
                 self.heatmap_axis_ranges = heatmap_axis_ranges
                 self.heatmap_full_axis_ranges = heatmap_full_axis_ranges
+                self.dataset_guid = dataset_guid
                 self.emitter = Emitter()
                 self.checked_large_heatmap = False
 
@@ -410,6 +412,7 @@ class PlotWindowRefreshTestCase(unittest.TestCase):
         self.assertFalse(worker.force_sql_heatmap)
         self.assertEqual(worker.operations, ["operation"])
         self.assertEqual(window.worker, worker)
+        self.assertEqual(worker.dataset_guid, "guid")
         self.assertFalse(window._qplot_display_synchronized)
         self.assertIn("Loading data for signal", window.show_statuses[-1][0])
 
@@ -1018,6 +1021,55 @@ class PlotStateOverlayTestCase(unittest.TestCase):
         self.assertEqual(trace_updates, [True])
 
 
+    def test_refresh_records_the_row_count_the_worker_loaded(self):
+        class Signal:
+            def emit(self):
+                pass
+
+        class Line:
+            def setData(self, *args, **kwargs):
+                pass
+
+        class Worker:
+            read_data = False
+            running = True
+            dataset_length_at_start = 5
+            loaded_result_count = 7
+            axis_data = {"x": [0.0, 1.0], "y": [10.0, 20.0]}
+            axis_param = {"x": object(), "y": object()}
+            started_at = 0
+
+        class Dataset:
+            number_of_results = 2
+
+        class Param:
+            name = "signal"
+
+        window = plot1d.__new__(plot1d)
+        qtw.QMainWindow.__init__(window)
+        worker = Worker()
+        statuses = []
+        window.worker = worker
+        window.line = Line()
+        window.marquee = None
+        window._guid = "guid"
+        window._dataset_key = DatasetKey("database.db", "guid")
+        window._dataset_holder = {window._dataset_key: DatasetHandle(Dataset())}
+        window._observed_result_count = 5
+        window.param = Param()
+        window.end_wait = Signal()
+        window._set_param_axis_labels = lambda: None
+        window.show_status = lambda *args: statuses.append(args)
+        window.show_plot_state = lambda *_args, **_kwargs: None
+        window.hide_plot_state = lambda: None
+        window.refresh_secondary_lines = lambda: None
+
+        plot1d.refreshPlot(window, True, worker=worker)
+
+        self.assertEqual(window.last_ds_len, 7)
+        self.assertTrue(any("Loaded 7 points" in args[0] for args in statuses))
+
+
 class RunListParentLookupTestCase(unittest.TestCase):
     def test_main_window_lookup_works_through_splitter(self):
         old_isfile = treeWidgets.isfile
@@ -0,0 +1,130 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+from PyQt6 import QtCore
+
+from qplot.windows import _colorbar
+from qplot.windows._warm_up import StartupWarmUp
+
+PLOTTING_STACK_MODULES = (
+    "pandas",
+    "matplotlib",
+    "qplot.windows.plot1d",
+    "qplot.windows.plot2d",
+)
+# QCoDeS may be imported on the first event-loop pass to find the startup
+# database, but not while the window is built.
+DEFERRED_STARTUP_MODULES = ("qcodes", *PLOTTING_STACK_MODULES)
+
+_STARTUP_SCRIPT = textwrap.dedent(
+    """
+    import time
+
+    started = time.perf_counter()
+
+    import importlib.abc
+    import json
+    import os
+    import sys
+
+    from PyQt6 import QtCore, QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    deferred = json.loads(sys.argv[1])
+    plotting_stack = json.loads(sys.argv[2])
+    plotting_import = []
+
+
+    class ImportWatcher(importlib.abc.MetaPathFinder):
+        def find_spec(self, name, path=None, target=None):
+            if name in plotting_stack and not plotting_import:
+                plotting_import.append(time.perf_counter() - started)
+            return None
+
+
+    sys.meta_path.insert(0, ImportWatcher())
+
+    from qplot.windows import MainWindow
+    from qplot.windows._warm_up import StartupWarmUp
+
+    painted = []
+    warmed_up = []
+
+
+    class PaintWatcher(QtCore.QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QtCore.QEvent.Type.Paint and not painted:
+                painted.append(time.perf_counter() - started)
+            return False
+
+
+    watcher = PaintWatcher()
+    app.installEventFilter(watcher)
+    window = MainWindow()
+    loaded_before_events = sorted(name for name in deferred if name in sys.modules)
+    warm_up = StartupWarmUp()
+    warm_up.finished.connect(lambda: warmed_up.append(True))
+    warm_up.start()
+    while not warmed_up and time.perf_counter() - started < 60:
+        app.processEvents()
+    print(json.dumps({
+        "first_paint": painted[0] if painted else None,
+        "plotting_import": plotting_import[0] if plotting_import else None,
+        "loaded_before_events": loaded_before_events,
+    }), flush=True)
+    # Skip interpreter teardown, where Qt objects can outlive their owners.
+    os._exit(0)
+    """
+)
+
+
+def test_main_window_paints_before_the_plotting_stack_loads(tmp_path):
+    env = os.environ.copy()
+    env["HOME"] = str(tmp_path)
+    env["USERPROFILE"] = str(tmp_path)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _STARTUP_SCRIPT,
+            json.dumps(DEFERRED_STARTUP_MODULES),
+            json.dumps(PLOTTING_STACK_MODULES),
+        ],
+        capture_output=True,
+        env=env,
+        text=True,
+        timeout=120,
+    )
+    assert result.stdout, result.stderr
+    startup = json.loads(result.stdout.splitlines()[-1])
+
+    assert startup["loaded_before_events"] == []
+    assert startup["first_paint"] is not None
+    assert startup["plotting_import"] is not None
+    assert startup["first_paint"] < startup["plotting_import"], startup
+
+
+def test_warm_up_imports_plot_modules_and_builds_the_colorbar_catalog():
+    owner = QtCore.QObject()
+    warm_up = StartupWarmUp(owner)
+    finished = []
+    warm_up.finished.connect(lambda: finished.append(True))
+    _colorbar._colorbar_colormap_catalog.cache_clear()
+
+    warm_up.start(0)
+    deadline = time.perf_counter() + 60
+    while not finished and time.perf_counter() < deadline:
+        QtCore.QCoreApplication.processEvents(
+            QtCore.QEventLoop.ProcessEventsFlag.AllEvents,
+            50,
+        )
+
+    assert finished == [True]
+    assert all(name in sys.modules for name in DEFERRED_STARTUP_MODULES)
+    assert _colorbar._colorbar_colormap_catalog.cache_info().currsize == 1